@@ -0,0 +1,74 @@
+"""
+Filename: benchmark_adaptive_pipeflow.py
+Author: Dipl.-Ing. (FH) Jonas Pfeiffer
+Date: 2026-10-18
+Description: Benchmarks the adaptive, warm-started pipeflow on the Görlitz project (Variante 1):
+             one March and one July week with the fixed settings (iter=100, alpha=0.5) and
+             with AdaptivePipeflow — Newton iterations, solve time, max. deviation and the
+             most expensive hours.
+"""
+
+import time
+
+import numpy as np
+import pandapipes as pp
+from benchmark_state_dedup import COMPARED, load_goerlitz, prepare
+from pandapipes.timeseries import run_time_series
+from pandapower.timeseries import OutputWriter
+
+from districtheatingsim.net_simulation_pandapipes.adaptive_pipeflow import AdaptivePipeflow
+from districtheatingsim.net_simulation_pandapipes.pp_net_time_series_simulation import create_log_variables
+
+WEEKS = {"March": (1416, 1584), "July": (4344, 4512)}
+
+
+class CountingPipeflow:
+    """``pp.pipeflow`` with the fixed settings, counting the Newton iterations."""
+
+    def __init__(self):
+        self.iterations = 0
+
+    def __call__(self, net, **kwargs):
+        try:
+            pp.pipeflow(net, **kwargs)
+        finally:
+            self.iterations += net["_internal_results"]["iterations_bidirectional"]
+
+
+def run_week(name, start_time_step, end_time_step):
+    data = load_goerlitz(start_time_step, end_time_step)
+    results = {}
+    for label, solver in (("fixed", CountingPipeflow()), ("adaptive", AdaptivePipeflow())):
+        net, time_steps, _, _ = prepare(data)
+        if isinstance(solver, AdaptivePipeflow):
+            solver.attach(net)
+        ow = OutputWriter(net, time_steps, output_path=None, log_variables=create_log_variables(net))
+        start = time.perf_counter()
+        run_time_series.run_timeseries(
+            net, time_steps, mode="bidirectional", iter=100, alpha=0.5, verbose=False, run=solver
+        )
+        seconds = time.perf_counter() - start
+        results[label] = ow.np_results
+        if isinstance(solver, AdaptivePipeflow):
+            solver.detach(net)
+            report = solver.report()
+            iterations = report.total_iterations
+            expensive = ", ".join(
+                f"{start_time_step + step} ({report.iterations[report.time_steps == step][0]})"
+                for step in report.expensive_steps(5)
+            )
+            extra = f", {report.fallbacks.sum()} fallbacks, most expensive hours: {expensive}"
+        else:
+            iterations, extra = solver.iterations, ""
+        print(f"{name:>6} {label:>9}: {seconds:6.1f} s, {iterations:6d} iterations{extra}")
+
+    deviation = ", ".join(
+        f"{key} {np.max(np.abs(results['adaptive'][key] - results['fixed'][key])):.2g} {unit}"
+        for key, unit in COMPARED.items()
+    )
+    print(f"{name:>6} max |Δ|: {deviation}")
+
+
+if __name__ == "__main__":
+    for week, (start, end) in WEEKS.items():
+        run_week(week, start, end)
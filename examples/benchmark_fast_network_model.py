@@ -0,0 +1,125 @@
+"""
+Filename: benchmark_fast_network_model.py
+Author: Dipl.-Ing. (FH) Jonas Pfeiffer
+Date: 2026-10-18
+Description: Benchmarks the quasi-static network model of the simplified time series:
+             (1) a full year on a synthetic radial network with 1000 pipes (timing),
+             (2) the Görlitz project (Variante 1) in March against the controlled pipeflow
+             and the former design scaling.
+"""
+
+import copy
+import time
+
+import numpy as np
+import pandapipes as pp
+from benchmark_state_dedup import load_goerlitz, prepare
+from pandapipes.timeseries import run_time_series
+from pandapower.timeseries import OutputWriter
+
+from districtheatingsim.constants import KELVIN_OFFSET
+from districtheatingsim.net_simulation_pandapipes.controllers import BadPointPressureLiftController
+from districtheatingsim.net_simulation_pandapipes.fast_network_model import FastNetworkModel
+from districtheatingsim.net_simulation_pandapipes.pp_net_time_series_simulation import (
+    calculate_results,
+    create_log_variables,
+    simplified_time_series_net,
+)
+
+N_BRANCH_JUNCTIONS = 500  # supply and return tree each -> 1000 pipes
+N_CONSUMERS = 250
+DESIGN_LOAD_W = 40e3
+# DN and inner diameter [m] of the pipe types used for the synthetic network
+PIPE_TYPES = [
+    (dn, d / 1000) for dn, d in [(32, 36.0), (50, 53.9), (80, 82.5), (125, 132.5), (200, 210.1), (300, 312.7)]
+]
+# March: heating season with a sliding supply temperature (744 h)
+START_TIME_STEP, END_TIME_STEP = 1416, 2160
+COMPARED = {"mass_flow": "kg/s", "deltap": "bar", "return_temp": "°C", "qext_kW": "kW"}
+
+
+def synthetic_network(seed=0):
+    """Random radial network, pipes sized for ≤ 1.5 m/s at design load, solved once, with bad point control."""
+    rng = np.random.default_rng(seed)
+    parent = np.array([-1] + [int(rng.integers(0, i)) for i in range(1, N_BRANCH_JUNCTIONS)])
+    consumer_nodes = rng.choice(np.arange(1, N_BRANCH_JUNCTIONS), N_CONSUMERS, replace=False)
+    design_flow = np.zeros(N_BRANCH_JUNCTIONS)
+    for node in consumer_nodes:
+        while node >= 0:
+            design_flow[node] += DESIGN_LOAD_W / (4180 * 30)
+            node = parent[node]
+
+    net = pp.create_empty_network(fluid="water")
+    supply = pp.create_junctions(net, N_BRANCH_JUNCTIONS + 1, pn_bar=1.05, tfluid_k=358.15)
+    ret = pp.create_junctions(net, N_BRANCH_JUNCTIONS + 1, pn_bar=1.05, tfluid_k=328.15)
+    pp.create_circ_pump_const_pressure(net, ret[-1], supply[-1], p_flow_bar=6, plift_bar=4, t_flow_k=358.15)
+    for node in range(N_BRANCH_JUNCTIONS):
+        upstream = -1 if parent[node] < 0 else parent[node]
+        diameter = next(
+            (d for d in PIPE_TYPES if design_flow[node] / (1000 * np.pi * d[1] ** 2 / 4) < 1.5), PIPE_TYPES[-1]
+        )
+        std_type = f"ISOPLUS_DRE{diameter[0]}_2x"
+        length_km = rng.uniform(0.02, 0.08)
+        pp.create_pipe(
+            net, supply[upstream], supply[node], std_type=std_type, length_km=length_km, k_mm=0.1, text_k=283
+        )
+        pp.create_pipe(net, ret[node], ret[upstream], std_type=std_type, length_km=length_km, k_mm=0.1, text_k=283)
+    for node in consumer_nodes:
+        pp.create_heat_consumer(net, supply[node], ret[node], qext_w=DESIGN_LOAD_W, treturn_k=55 + KELVIN_OFFSET)
+    pp.pipeflow(net, mode="bidirectional", iter=100)
+    dp_controller = BadPointPressureLiftController(net)
+    net.controller.loc[len(net.controller)] = [dp_controller, True, -1, -1, False, False]
+    return net
+
+
+def run_synthetic_year():
+    net = synthetic_network()
+    hours = np.arange(8760)
+    season = 0.55 + 0.45 * np.cos(2 * np.pi * hours / 8760)
+    rng = np.random.default_rng(1)
+    qext = DESIGN_LOAD_W * np.clip(season[:, None] * rng.uniform(0.6, 1.2, (8760, N_CONSUMERS)), 0.02, 1.0)
+    supply = 70.0 + 15.0 * season
+
+    start = time.perf_counter()
+    model = FastNetworkModel(net)
+    build_seconds = time.perf_counter() - start
+    results = model.simulate(qext, supply)
+    pump = results.pump_results["Heizentrale Haupteinspeisung"][0]
+    print(
+        f"synthetic network: {len(net.pipe)} pipes, {len(net.heat_consumer)} consumers, 8760 h — "
+        f"model build {build_seconds * 1000:.0f} ms, year {results.seconds * 1000:.0f} ms"
+    )
+    print(
+        f"  heat losses {results.heat_loss_kW.sum() / 1000:.0f} MWh "
+        f"({results.heat_loss_kW.sum() / pump['qext_kW'].sum():.1%} of generation), "
+        f"pump lift {pump['deltap'].min():.2f}–{pump['deltap'].max():.2f} bar"
+    )
+
+
+def run_goerlitz_comparison():
+    data = load_goerlitz(START_TIME_STEP, END_TIME_STEP)
+
+    net, time_steps, _, _ = prepare(data)
+    ow = OutputWriter(net, time_steps, output_path=None, log_variables=create_log_variables(net))
+    start = time.perf_counter()
+    run_time_series.run_timeseries(net, time_steps, mode="bidirectional", iter=100, alpha=0.5, verbose=False)
+    full_seconds = time.perf_counter() - start
+    reference = calculate_results(net, ow.np_results)["Heizentrale Haupteinspeisung"][0]
+    print(f"Görlitz full run: {len(time_steps)} steps in {full_seconds:.1f} s")
+
+    print(f"{'mode':>16} {'time [s]':>9}" + "".join(f" {'max |Δ| ' + name:>20}" for name in COMPARED) + " Σ heat error")
+    for name, fast in (("design scaling", False), ("network model", True)):
+        start = time.perf_counter()
+        result = simplified_time_series_net(copy.deepcopy(data), fast_network_model=fast)
+        seconds = time.perf_counter() - start
+        pump = result.pump_results["Heizentrale Haupteinspeisung"][0]
+        deviations = "".join(
+            f" {abs(pump[key] - reference[key]).max():>14.3g} {unit:<5}" for key, unit in COMPARED.items()
+        )
+        heat_error = pump["qext_kW"].sum() / reference["qext_kW"].sum() - 1.0
+        print(f"{name:>16} {seconds:>9.2f}" + deviations + f" {heat_error:>11.2%}")
+
+
+if __name__ == "__main__":
+    run_synthetic_year()
+    run_goerlitz_comparison()
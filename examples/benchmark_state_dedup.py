@@ -0,0 +1,125 @@
+"""
+Filename: benchmark_state_dedup.py
+Author: Dipl.-Ing. (FH) Jonas Pfeiffer
+Date: 2026-10-18
+Description: Benchmarks the load-state deduplication of the thermohydraulic time series
+             on the Görlitz project (Variante 1): full run vs. deduplicated runs with
+             several quantization steps — hit rate, solve time and max. deviation.
+"""
+
+import copy
+import json
+import os
+import time
+
+import pandapipes as pp
+import pandas as pd
+from pandapipes.timeseries import run_time_series
+from pandapower.timeseries import OutputWriter
+
+from districtheatingsim.net_simulation_pandapipes.net_migration import migrate_loaded_net
+from districtheatingsim.net_simulation_pandapipes.NetworkDataClass import NetworkGenerationData
+from districtheatingsim.net_simulation_pandapipes.pp_net_time_series_simulation import (
+    create_log_variables,
+    install_heat_consumer_profile_controller,
+    time_series_preprocessing,
+    update_heat_generator_supply_temperature_controller,
+)
+from districtheatingsim.net_simulation_pandapipes.state_dedup import (
+    StateDedupSettings,
+    max_result_deviation,
+    run_time_series_deduplicated,
+)
+
+PROJECT_DIR = os.path.join("src", "districtheatingsim", "project_data", "Görlitz")
+NET_DIR = os.path.join(PROJECT_DIR, "Variante 1", "Wärmenetz")
+TRY_FILENAME = os.path.join(PROJECT_DIR, "Klimadaten", "TRY2015_511676144222_Jahr.dat")
+
+# One summer week (July): DHW-dominated, many hours at the 2 % minimum load.
+START_TIME_STEP, END_TIME_STEP = 4344, 4512
+SETTINGS = [
+    StateDedupSettings(qext_step_w=0.0, temperature_step_k=0.0),
+    StateDedupSettings(qext_step_w=500.0, temperature_step_k=0.25),
+    StateDedupSettings(qext_step_w=1000.0, temperature_step_k=0.5),
+    StateDedupSettings(qext_step_w=2500.0, temperature_step_k=1.0),
+]
+# Logged quantities compared against the full run.
+COMPARED = {"res_junction.p_bar": "bar", "res_junction.t_k": "K", "res_heat_consumer.vdot_m3_per_s": "m³/s"}
+
+
+def load_goerlitz(start_time_step=START_TIME_STEP, end_time_step=END_TIME_STEP):
+    """Initialised Görlitz network without the GUI (same steps as NetSimulationTab.loadNet)."""
+    net = migrate_loaded_net(pp.from_pickle(os.path.join(NET_DIR, "Ergebnisse Netzinitialisierung.p")))
+    profiles = pd.read_csv(os.path.join(NET_DIR, "Ergebnisse Netzinitialisierung.csv"), sep=";")
+    with open(os.path.join(NET_DIR, "Konfiguration Netzinitialisierung.json"), encoding="utf-8") as f:
+        data = NetworkGenerationData.from_dict(json.load(f))
+
+    data.net = net
+    data.waerme_hast_ges_W = profiles.filter(like="waerme_hast_ges_W").to_numpy().T
+    data.strombedarf_hast_ges_W = profiles.filter(like="strombedarf_hast_ges_W").to_numpy().T
+    data.TRY_filename = TRY_FILENAME
+    data.COP_filename = None
+    data.start_time_step, data.end_time_step = start_time_step, end_time_step
+    return time_series_preprocessing(data)
+
+
+def prepare(data):
+    """Fresh copy of the network with the time-series controllers installed."""
+    data = copy.deepcopy(data)
+    n_steps = data.end_time_step - data.start_time_step
+    time_steps = range(n_steps)
+    controller = install_heat_consumer_profile_controller(
+        data.net,
+        data.waerme_hast_ges_W,
+        time_steps,
+        data.start_time_step,
+        data.end_time_step,
+        return_temperature_heat_consumer=data.return_temperature_heat_consumer,
+    )
+    update_heat_generator_supply_temperature_controller(
+        data.net, data.supply_temperature_heat_generator, time_steps, data.start_time_step, data.end_time_step
+    )
+    supply = data.supply_temperature_heat_generator[data.start_time_step : data.end_time_step]
+    return data.net, time_steps, controller, supply
+
+
+def run_benchmark():
+    data = load_goerlitz()
+
+    net, time_steps, _, _ = prepare(data)
+    log_variables = create_log_variables(net)
+    ow = OutputWriter(net, time_steps, output_path=None, log_variables=log_variables)
+    start = time.perf_counter()
+    run_time_series.run_timeseries(net, time_steps, mode="bidirectional", iter=100, alpha=0.5, verbose=False)
+    full_seconds = time.perf_counter() - start
+    reference = ow.np_results
+    print(f"full run: {len(time_steps)} steps in {full_seconds:.1f} s")
+
+    header = f"{'qext step [W]':>14} {'T step [K]':>10} {'solved':>7} {'hit rate':>9} {'time [s]':>9} {'speed-up':>9}"
+    print(header + "".join(f" {'max |Δ| ' + key.split('.')[-1]:>22}" for key in COMPARED))
+    for settings in SETTINGS:
+        net, time_steps, controller, supply = prepare(data)
+        results, report = run_time_series_deduplicated(
+            net,
+            time_steps,
+            log_variables,
+            controller.qext_w,
+            supply,
+            return_temperature=controller.treturn_k,
+            settings=settings,
+            mode="bidirectional",
+            iter=100,
+            alpha=0.5,
+            verbose=False,
+        )
+        report.max_deviation = max_result_deviation(results, reference)
+        deviations = "".join(f" {report.max_deviation[key]:>17.3g} {unit:<4}" for key, unit in COMPARED.items())
+        print(
+            f"{settings.qext_step_w:>14.0f} {settings.temperature_step_k:>10.2f} {report.n_solved:>7d} "
+            f"{report.hit_rate:>9.1%} {report.solve_seconds:>9.1f} {full_seconds / report.solve_seconds:>8.1f}x"
+            + deviations
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,79 @@
+"""
+Filename: benchmark_surrogate_time_series.py
+Author: Dipl.-Ing. (FH) Jonas Pfeiffer
+Date: 2026-10-18
+Description: Benchmarks the representative-hour surrogate on the Görlitz project (Variante 1):
+             full thermohydraulic run vs. surrogates with k representative hours — solve time,
+             hold-out error and deviation of the reconstructed producer results from the full run.
+"""
+
+import time
+
+from benchmark_state_dedup import load_goerlitz, prepare
+from pandapipes.timeseries import run_time_series
+from pandapower.timeseries import OutputWriter
+
+from districtheatingsim.net_simulation_pandapipes.pp_net_time_series_simulation import (
+    calculate_results,
+    create_log_variables,
+)
+from districtheatingsim.net_simulation_pandapipes.state_dedup import max_result_deviation
+from districtheatingsim.net_simulation_pandapipes.surrogate_time_series import (
+    PIPE_LOG_VARIABLES,
+    SurrogateSettings,
+    run_time_series_surrogate,
+)
+
+# March: heating season with a sliding supply temperature (744 h).
+START_TIME_STEP, END_TIME_STEP = 1416, 2160
+N_STATES = [12, 24, 48, 96]
+# Producer quantities that feed the energy system and the KPIs.
+COMPARED = {"mass_flow": "kg/s", "deltap": "bar", "return_temp": "°C", "qext_kW": "kW"}
+
+
+def run_benchmark():
+    data = load_goerlitz(START_TIME_STEP, END_TIME_STEP)
+
+    net, time_steps, _, _ = prepare(data)
+    log_variables = create_log_variables(net) + PIPE_LOG_VARIABLES
+    ow = OutputWriter(net, time_steps, output_path=None, log_variables=log_variables)
+    start = time.perf_counter()
+    run_time_series.run_timeseries(net, time_steps, mode="bidirectional", iter=100, alpha=0.5, verbose=False)
+    full_seconds = time.perf_counter() - start
+    reference = ow.np_results
+    reference_pump = calculate_results(net, reference)["Heizentrale Haupteinspeisung"][0]
+    print(f"full run: {len(time_steps)} steps in {full_seconds:.1f} s")
+
+    header = f"{'k':>4} {'solved':>7} {'time [s]':>9} {'speed-up':>9} {'max hold-out err (pipe mdot)':>30}"
+    print(header + "".join(f" {'max |Δ| ' + name:>20}" for name in COMPARED) + f" {'Σ heat error':>13}")
+    for n_states in N_STATES:
+        net, time_steps, controller, supply = prepare(data)
+        results, report = run_time_series_surrogate(
+            net,
+            time_steps,
+            log_variables,
+            controller.qext_w,
+            supply,
+            settings=SurrogateSettings(n_states=n_states),
+            mode="bidirectional",
+            iter=100,
+            alpha=0.5,
+            verbose=False,
+        )
+        report.max_deviation = max_result_deviation(results, reference)
+        pump = calculate_results(net, results)["Heizentrale Haupteinspeisung"][0]
+        deviations = "".join(
+            f" {abs(pump[name] - reference_pump[name]).max():>14.3g} {unit:<5}" for name, unit in COMPARED.items()
+        )
+        heat_error = pump["qext_kW"].sum() / reference_pump["qext_kW"].sum() - 1.0
+        seconds = report.solve_seconds + report.fit_seconds
+        print(
+            f"{n_states:>4d} {report.n_solved:>7d} {seconds:>9.1f} {full_seconds / seconds:>8.1f}x "
+            f"{report.validation_error['res_pipe.mdot_from_kg_per_s']:>25.3g} kg/s"
+            + deviations
+            + f" {heat_error:>12.2%}"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,52 @@
+"""
+Filename: benchmark_try_cache.py
+Author: Dipl.-Ing. (FH) Jonas Pfeiffer
+Date: 2026-10-18
+Description: Benchmarks import_TRY uncached (pd.read_fwf), cold (parse + write the
+             .npy cache), warm from disk (new process, .npy present) and warm in memory.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+
+from districtheatingsim.utilities.test_reference_year import TRY_CACHE_DIRNAME, clear_TRY_cache, import_TRY
+
+TRY_FILENAME = os.path.join("examples", "data", "TRY", "TRY_511676144222", "TRY2015_511676144222_Jahr.dat")
+REPEATS = 20
+
+
+def _timed(label, func, repeats=1):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    elapsed_ms = (time.perf_counter() - start) / repeats * 1000
+    print(f"{label:<32} {elapsed_ms:10.3f} ms")
+    return elapsed_ms
+
+
+def run_benchmark():
+    # Work on a copy so the benchmark never leaves a cache folder in examples/data.
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename = os.path.join(tmp_dir, os.path.basename(TRY_FILENAME))
+        shutil.copy(TRY_FILENAME, filename)
+
+        uncached = _timed("uncached (pd.read_fwf)", lambda: import_TRY(filename, use_cache=False), REPEATS)
+
+        clear_TRY_cache()
+        shutil.rmtree(os.path.join(tmp_dir, TRY_CACHE_DIRNAME), ignore_errors=True)
+        cold = _timed("cold (parse + write .npy)", lambda: import_TRY(filename))
+
+        def from_disk():
+            clear_TRY_cache()  # simulates a fresh process: only the .npy is left
+            import_TRY(filename)
+
+        disk = _timed("warm, disk (.npy)", from_disk, REPEATS)
+        memory = _timed("warm, process cache", lambda: import_TRY(filename), REPEATS)
+
+    print(f"\nSpeed-up vs. uncached: disk {uncached / disk:.0f}x, memory {uncached / memory:.0f}x (cold {cold:.0f} ms)")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -42,6 +42,7 @@ from districtheatingsim.gui.ComparisonTab.comparison_data import (
     process_variant_results,
     variant_has_results,
 )
+from districtheatingsim.gui.ComparisonTab.kpi_index import KPIIndex, open_kpi_index
 from districtheatingsim.gui.MainTab.project_structure import discover_variants
 
 # Re-exported so existing importers (`from ...comparison_tab import format_kpi_range`)
@@ -175,11 +176,21 @@ class ProjectExplorer(QWidget):
             parent_dir = os.path.dirname(self.base_path)
             variant_names = discover_variants(parent_dir)
             variant_count = 0
-            for variant_name in variant_names:
+            index = open_kpi_index(parent_dir)
+            try:
+                variant_configs = {}
+                for name in variant_names:
+                    variant_path = os.path.join(parent_dir, name)
+                    if not variant_has_results(variant_path):
+                        continue
+                    variant_configs[name] = (
+                        index.variant_configs(variant_path) if index else discover_variant_configs(variant_path)
+                    )
+            finally:
+                if index:
+                    index.close()
+            for variant_name, configs in variant_configs.items():
                 variant_path = os.path.join(parent_dir, variant_name)
-                if not variant_has_results(variant_path):
-                    continue
-                configs = discover_variant_configs(variant_path)
                 if not configs:
                     continue
 
@@ -959,43 +970,50 @@ class ComparisonTab(QWidget):
         """
         Load data for selected (variant, config) combinations.
 
-        Network KPIs are cached per variant path since they are shared across configs.
+        KPIs are served from the per-project :class:`KPIIndex`; only configs whose
+        result file changed since it was indexed are re-read. Without an index
+        (read-only project folder) the result files are read directly.
 
         :param selected_variants: List of item data dicts from ProjectExplorer
         :type selected_variants: list
         """
         self.variant_data = []
-        network_cache: dict = {}
+        indexes: dict[str, KPIIndex | None] = {}
 
-        for item in selected_variants:
-            try:
-                variant_path = item["variant_path"]
-                variant_name = item["variant_name"]
-                config_name = item["config_name"]
-                config_file = item["config_file"]
-                display_name = item["display_name"]
-
-                results_path = os.path.join(variant_path, "Ergebnisse", config_file)
-                with open(results_path, encoding="utf-8") as f:
-                    data = json.load(f)
-
-                results = data.get("results", {})
-                processed_data = process_variant_results(results)
-                processed_data["name"] = display_name
-                processed_data["variant_name"] = variant_name
-                processed_data["config_name"] = config_name
-                processed_data["path"] = variant_path
-
-                # Network KPIs: load once per variant, share across configs
-                if variant_path not in network_cache:
-                    network_cache[variant_path] = load_network_kpis(variant_path)
-                processed_data.update(network_cache[variant_path])
-
-                self.variant_data.append(processed_data)
-
-            except Exception as e:
-                QMessageBox.warning(
-                    self, "Ladefehler", f"Fehler beim Laden von '{item.get('display_name', '?')}':\n{str(e)}"
-                )
+        try:
+            for item in selected_variants:
+                try:
+                    variant_path = item["variant_path"]
+                    project_path = os.path.dirname(os.path.normpath(variant_path))
+                    if project_path not in indexes:
+                        indexes[project_path] = open_kpi_index(project_path)
+                    index = indexes[project_path]
+
+                    if index:
+                        processed_data = index.config_kpis(variant_path, item["config_file"])
+                        network_data = index.network_kpis(variant_path)
+                    else:
+                        results_path = os.path.join(variant_path, "Ergebnisse", item["config_file"])
+                        with open(results_path, encoding="utf-8") as f:
+                            processed_data = process_variant_results(json.load(f).get("results", {}))
+                        network_data = load_network_kpis(variant_path)
+                    processed_data["name"] = item["display_name"]
+                    processed_data["variant_name"] = item["variant_name"]
+                    processed_data["config_name"] = item["config_name"]
+                    processed_data["path"] = variant_path
+
+                    # Network KPIs are shared across a variant's configs
+                    processed_data.update(network_data)
+
+                    self.variant_data.append(processed_data)
+
+                except Exception as e:
+                    QMessageBox.warning(
+                        self, "Ladefehler", f"Fehler beim Laden von '{item.get('display_name', '?')}':\n{str(e)}"
+                    )
+        finally:
+            for index in indexes.values():
+                if index:
+                    index.close()
 
         self.dashboard.update_dashboard(self.variant_data)
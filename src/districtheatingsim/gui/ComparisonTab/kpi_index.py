@@ -0,0 +1,318 @@
+"""
+Per-project KPI index for the variant comparison tab (GUI-free, stdlib ``sqlite3``).
+
+Opening the comparison tab used to ``json.load`` every selected variant's full
+``Ergebnisse/<config>.json`` (hourly profiles, tech objects, …) just to run
+:func:`process_variant_results` on a handful of scalars, and re-listed every
+variant's ``Ergebnisse`` folder on each refresh. With many variants × configs the
+tab took tens of seconds to open.
+
+:class:`KPIIndex` keeps the *processed* dashboard values in a small SQLite file in
+the project folder (:data:`INDEX_FILENAME`):
+
+* ``config_kpis`` — one row per ``(variant, config file)`` with the processed
+  energy-system KPIs.
+* ``network_kpis`` — one row per variant with the network KPI block.
+* ``variant_configs`` — the ``(config_name, filename)`` listing of each variant's
+  ``Ergebnisse`` folder.
+
+Every row stores the ``(st_mtime_ns, st_size)`` of its source (file or folder). A
+lookup ``stat``s the source and serves the row only if both match, so an index
+entry can never be staler than the file it summarises; a miss re-reads the source
+once and refreshes the row. The save paths (energy-system JSON, network config)
+call :func:`record_energy_system_save` / :func:`record_network_save` so the next
+comparison is served from the index straight away.
+
+The index is a pure cache: deleting the file is always safe, and a failure to
+update it is logged, never raised into a save. Where it cannot be created at all
+(read-only or network share), :func:`open_kpi_index` returns ``None`` and the
+comparison tab reads the source files directly.
+
+:author: Dipl.-Ing. (FH) Jonas Pfeiffer
+"""
+
+import json
+import logging
+import os
+import sqlite3
+
+from districtheatingsim.gui.ComparisonTab.comparison_data import (
+    discover_variant_configs,
+    load_network_kpis,
+    process_variant_results,
+)
+
+#: Index file created in the project folder (next to the variant folders).
+INDEX_FILENAME = ".kpi_index.sqlite"
+
+#: Bump when the stored row layout or the processed-KPI format changes; an index
+#: written with another version is dropped and rebuilt lazily.
+INDEX_SCHEMA_VERSION = 1
+
+#: Network config carrying ``kpi_results`` (relative to the variant folder).
+NETWORK_CONFIG_RELPATH = os.path.join("Wärmenetz", "Konfiguration Netzinitialisierung.json")
+
+_TABLES = (
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)",
+    "CREATE TABLE IF NOT EXISTS config_kpis ("
+    " variant TEXT, config_file TEXT, mtime_ns INTEGER, size INTEGER, kpis TEXT,"
+    " PRIMARY KEY (variant, config_file))",
+    "CREATE TABLE IF NOT EXISTS network_kpis (variant TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, kpis TEXT)",
+    "CREATE TABLE IF NOT EXISTS variant_configs (variant TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, configs TEXT)",
+)
+
+
+def _signature(path: str) -> tuple[int, int] | None:
+    """``(st_mtime_ns, st_size)`` of ``path``, or ``None`` if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class KPIIndex:
+    """
+    SQLite-backed cache of the comparison-dashboard KPIs of one project.
+
+    Rows are keyed by the variant *folder name* (not its absolute path), so the
+    index stays valid when the whole project folder is moved or synced elsewhere.
+
+    :param project_path: Project folder (the parent of the ``Variante *`` folders).
+    :type project_path: str
+
+    :ivar hits: Lookups served from the index since construction.
+    :vartype hits: int
+    :ivar misses: Lookups that had to read the source file.
+    :vartype misses: int
+
+    .. note::
+       Usable as a context manager; :meth:`close` releases the SQLite connection.
+    """
+
+    def __init__(self, project_path: str):
+        self.project_path = project_path
+        self.path = os.path.join(project_path, INDEX_FILENAME)
+        self.hits = 0
+        self.misses = 0
+        self._conn = sqlite3.connect(self.path)
+        self._init_schema()
+
+    @classmethod
+    def for_variant(cls, variant_path: str) -> "KPIIndex":
+        """Open the index of the project that contains ``variant_path``."""
+        return cls(os.path.dirname(os.path.normpath(variant_path)))
+
+    def __enter__(self) -> "KPIIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _init_schema(self) -> None:
+        with self._conn:
+            for statement in _TABLES:
+                self._conn.execute(statement)
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if row is None or int(row[0]) != INDEX_SCHEMA_VERSION:
+                for table in ("config_kpis", "network_kpis", "variant_configs"):
+                    self._conn.execute(f"DELETE FROM {table}")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                    (str(INDEX_SCHEMA_VERSION),),
+                )
+
+    # ------------------------------------------------------------------
+    # Generic row access
+    # ------------------------------------------------------------------
+
+    def _lookup(self, table: str, column: str, key: tuple, signature: tuple[int, int]):
+        where = " AND ".join(f"{k} = ?" for k in self._key_columns(table))
+        row = self._conn.execute(f"SELECT mtime_ns, size, {column} FROM {table} WHERE {where}", key).fetchone()
+        if row is not None and (row[0], row[1]) == signature:
+            self.hits += 1
+            return json.loads(row[2])
+        self.misses += 1
+        return None
+
+    def _store(self, table: str, column: str, key: tuple, signature: tuple[int, int], value) -> None:
+        columns = (*self._key_columns(table), "mtime_ns", "size", column)
+        placeholders = ", ".join("?" for _ in columns)
+        try:
+            with self._conn:
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+                    (*key, *signature, json.dumps(value)),
+                )
+        except sqlite3.Error as e:
+            # Read-only index (e.g. a project on a write-protected share): serve the value uncached
+            logging.warning("KPI-Index %s nicht beschreibbar: %s", self.path, e)
+
+    @staticmethod
+    def _key_columns(table: str) -> tuple[str, ...]:
+        return ("variant", "config_file") if table == "config_kpis" else ("variant",)
+
+    @staticmethod
+    def _variant_key(variant_path: str) -> str:
+        return os.path.basename(os.path.normpath(variant_path))
+
+    # ------------------------------------------------------------------
+    # Energy-system configs
+    # ------------------------------------------------------------------
+
+    def variant_configs(self, variant_path: str) -> list[tuple[str, str]]:
+        """
+        ``(config_name, filename)`` pairs of a variant, served from the index.
+
+        Keyed by the ``Ergebnisse`` folder's own mtime, which changes whenever a
+        result file is added, removed or renamed.
+
+        :param variant_path: Path to the variant folder.
+        :return: Same as :func:`discover_variant_configs`.
+        :rtype: list[tuple[str, str]]
+        """
+        signature = _signature(os.path.join(variant_path, "Ergebnisse"))
+        if signature is None:
+            return []
+        key = (self._variant_key(variant_path),)
+        cached = self._lookup("variant_configs", "configs", key, signature)
+        if cached is not None:
+            return [tuple(c) for c in cached]
+        configs = discover_variant_configs(variant_path)
+        self._store("variant_configs", "configs", key, signature, configs)
+        return configs
+
+    def config_kpis(self, variant_path: str, config_file: str) -> dict:
+        """
+        Processed dashboard KPIs of one energy-system config.
+
+        :param variant_path: Path to the variant folder.
+        :param config_file: Result filename inside ``Ergebnisse`` (e.g. ``Ergebnisse.json``).
+        :return: The output of :func:`process_variant_results` for that file.
+        :rtype: dict
+        :raises FileNotFoundError: If the result file does not exist.
+        :raises ValueError: If the result file cannot be processed.
+        """
+        results_path = os.path.join(variant_path, "Ergebnisse", config_file)
+        signature = _signature(results_path)
+        if signature is None:
+            raise FileNotFoundError(results_path)
+        key = (self._variant_key(variant_path), config_file)
+        cached = self._lookup("config_kpis", "kpis", key, signature)
+        if cached is not None:
+            return cached
+        return self._refresh_config(results_path, key, signature)
+
+    def update_config(self, variant_path: str, config_file: str) -> dict:
+        """
+        Re-read one config file into the index (called right after it is saved).
+
+        :param variant_path: Path to the variant folder.
+        :param config_file: Result filename inside ``Ergebnisse``.
+        :return: The freshly processed KPIs.
+        :rtype: dict
+        """
+        results_path = os.path.join(variant_path, "Ergebnisse", config_file)
+        signature = _signature(results_path)
+        if signature is None:
+            raise FileNotFoundError(results_path)
+        return self._refresh_config(results_path, (self._variant_key(variant_path), config_file), signature)
+
+    def _refresh_config(self, results_path: str, key: tuple, signature: tuple[int, int]) -> dict:
+        with open(results_path, encoding="utf-8") as f:
+            data = json.load(f)
+        kpis = process_variant_results(data.get("results", {}))
+        self._store("config_kpis", "kpis", key, signature, kpis)
+        return kpis
+
+    # ------------------------------------------------------------------
+    # Network KPIs
+    # ------------------------------------------------------------------
+
+    def network_kpis(self, variant_path: str) -> dict:
+        """
+        Network KPI block of a variant (same keys as :func:`load_network_kpis`).
+
+        :param variant_path: Path to the variant folder.
+        :return: Network KPI dict; zeros if the variant has no network config.
+        :rtype: dict
+        """
+        signature = _signature(os.path.join(variant_path, NETWORK_CONFIG_RELPATH))
+        if signature is None:
+            return load_network_kpis(variant_path)
+        key = (self._variant_key(variant_path),)
+        cached = self._lookup("network_kpis", "kpis", key, signature)
+        if cached is not None:
+            return cached
+        return self.update_network(variant_path)
+
+    def update_network(self, variant_path: str) -> dict:
+        """
+        Re-read a variant's network config into the index (called after it is saved).
+
+        :param variant_path: Path to the variant folder.
+        :return: The network KPI dict.
+        :rtype: dict
+        """
+        signature = _signature(os.path.join(variant_path, NETWORK_CONFIG_RELPATH))
+        kpis = load_network_kpis(variant_path)
+        if signature is not None:
+            self._store("network_kpis", "kpis", (self._variant_key(variant_path),), signature, kpis)
+        return kpis
+
+
+def open_kpi_index(project_path: str) -> KPIIndex | None:
+    """
+    Open the KPI index of a project, or ``None`` if it cannot be created there.
+
+    :param project_path: Project folder (the parent of the ``Variante *`` folders).
+    :return: The opened index, or ``None`` on a read-only or unreachable folder (logged).
+    :rtype: KPIIndex | None
+
+    .. note::
+       Callers fall back to reading the source files directly when ``None`` is returned.
+    """
+    try:
+        return KPIIndex(project_path)
+    except (sqlite3.Error, OSError) as e:
+        logging.warning("KPI-Index in %s nicht verfügbar, lese Ergebnisse direkt: %s", project_path, e)
+        return None
+
+
+def record_energy_system_save(json_path: str) -> None:
+    """
+    Refresh the KPI index after an energy-system result JSON was written.
+
+    :param json_path: The saved ``<variant>/Ergebnisse/<config>.json``.
+
+    .. note::
+       Never raises — the index is a cache and must not fail the save.
+    """
+    try:
+        variant_path = os.path.dirname(os.path.dirname(os.path.abspath(json_path)))
+        with KPIIndex.for_variant(variant_path) as index:
+            index.update_config(variant_path, os.path.basename(json_path))
+    except Exception as e:
+        logging.warning("KPI-Index konnte nicht aktualisiert werden (%s): %s", json_path, e)
+
+
+def record_network_save(variant_path: str) -> None:
+    """
+    Refresh the KPI index after a variant's network configuration was written.
+
+    :param variant_path: Path to the variant folder.
+
+    .. note::
+       Never raises — the index is a cache and must not fail the save.
+    """
+    try:
+        with KPIIndex.for_variant(variant_path) as index:
+            index.update_network(variant_path)
+    except Exception as e:
+        logging.warning("KPI-Index konnte nicht aktualisiert werden (%s): %s", variant_path, e)
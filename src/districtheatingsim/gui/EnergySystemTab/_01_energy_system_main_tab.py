@@ -29,6 +29,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from districtheatingsim.gui.ComparisonTab.kpi_index import record_energy_system_save
 from districtheatingsim.gui.EnergySystemTab._02_energy_system_dialogs import EconomicParametersDialog, WeightDialog
 from districtheatingsim.gui.EnergySystemTab._03_technology_tab import TechnologyTab
 from districtheatingsim.gui.EnergySystemTab._05_cost_tab import CostTab
@@ -40,7 +41,8 @@ from districtheatingsim.gui.EnergySystemTab.config_naming import config_name_to_
 from districtheatingsim.gui.utilities import stop_qthreads
 from districtheatingsim.heat_generators.energy_system import EnergySystem
 from districtheatingsim.heat_generators.thermal_storage import ThermalStorageAdapter
-from districtheatingsim.net_simulation_pandapipes.pp_net_time_series_simulation import import_results_csv
+from districtheatingsim.net_simulation_pandapipes.resource_registry import load_cop_table
+from districtheatingsim.net_simulation_pandapipes.results_store import load_results
 from districtheatingsim.utilities.test_reference_year import import_TRY
 
 
@@ -489,9 +491,9 @@ class EnergySystemTab(QWidget):
         self.load_scale_factor = float(self.techTab.load_scale_factorInput.text())
 
         # Import data from the CSV file
-        time_steps, waerme_ges_kW, strom_wp_kW, pump_results = import_results_csv(self.csv_filename)
+        time_steps, waerme_ges_kW, strom_wp_kW, pump_results = load_results(self.csv_filename)
         self.TRY_data = import_TRY(self.TRY_filename)
-        self.COP_data = np.genfromtxt(self.COP_filename, delimiter=";")
+        self.COP_data = load_cop_table(self.COP_filename)
 
         # Collect qext_kW values from pump results
         flow_temp_circ_pump = None
@@ -854,6 +856,7 @@ class EnergySystemTab(QWidget):
                 pass
             json_filename = self._active_json_path()
             self.energy_system.save_to_json(json_filename)
+            record_energy_system_save(json_filename)
             # Refresh combo in case a new file was created
             self._refresh_config_combo()
             if show_dialog:
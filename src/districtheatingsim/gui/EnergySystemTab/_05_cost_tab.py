@@ -30,7 +30,7 @@ from PyQt6.QtWidgets import (
 
 from districtheatingsim.gui.EnergySystemTab._02_energy_system_dialogs import KostenBerechnungDialog
 from districtheatingsim.gui.EnergySystemTab._10_utilities import CollapsibleHeader
-from districtheatingsim.heat_generators.annuity import infrastructure_annuity
+from districtheatingsim.utilities.annuity import infrastructure_annuity
 
 
 class CostTab(QWidget):
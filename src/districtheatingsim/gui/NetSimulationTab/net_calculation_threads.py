@@ -13,6 +13,7 @@ from PyQt6.QtCore import QThread, pyqtSignal
 from districtheatingsim.net_simulation_pandapipes.pp_net_initialisation_geojson import initialize_geojson
 from districtheatingsim.net_simulation_pandapipes.pp_net_time_series_simulation import (
     simplified_time_series_net,
+    surrogate_time_series_net,
     thermohydraulic_time_series_net,
     time_series_preprocessing,
 )
@@ -44,8 +45,12 @@ class NetInitializationThread(QThread):
         try:
             self.NetworkGenerationData = initialize_geojson(self.NetworkGenerationData)
 
-            # Diameter optimization if enabled
-            if self.NetworkGenerationData.diameter_optimization_pipe_checked:
+            # Diameter optimization if enabled (a patched net keeps its sized pipes; toggling the option
+            # changes the geometry digest, so the net is rebuilt and optimized)
+            if (
+                self.NetworkGenerationData.diameter_optimization_pipe_checked
+                and not self.NetworkGenerationData.incremental_update
+            ):
                 self.NetworkGenerationData.net = optimize_diameter_types(
                     self.NetworkGenerationData.net,
                     self.NetworkGenerationData.max_velocity_pipe,
@@ -109,7 +114,16 @@ class NetCalculationThread(QThread):
     calculation_done = pyqtSignal(object)
     calculation_error = pyqtSignal(str)
 
-    def __init__(self, NetworkGenerationData, simplified=False):
+    def __init__(
+        self,
+        NetworkGenerationData,
+        simplified=False,
+        surrogate=False,
+        checkpoint_dir=None,
+        resume=True,
+        cache=None,
+        force_recompute=False,
+    ):
         """
         Initialize calculation thread.
 
@@ -117,10 +131,25 @@ class NetCalculationThread(QThread):
         :type NetworkGenerationData: object
         :param simplified: Use simplified fast calculation instead of detailed simulation.
         :type simplified: bool
+        :param surrogate: Simulate representative hours only and approximate the others.
+        :type surrogate: bool
+        :param checkpoint_dir: Checkpoint directory of the detailed simulation, None does not checkpoint.
+        :type checkpoint_dir: str
+        :param resume: Continue the detailed simulation from the checkpoint in checkpoint_dir.
+        :type resume: bool
+        :param cache: Result cache of the detailed simulation, None always simulates.
+        :type cache: ResultCache
+        :param force_recompute: Simulate even if the cache holds results of the same inputs.
+        :type force_recompute: bool
         """
         super().__init__()
         self.NetworkGenerationData = NetworkGenerationData
         self.simplified = simplified
+        self.surrogate = surrogate
+        self.checkpoint_dir = checkpoint_dir
+        self.resume = resume
+        self.cache = cache
+        self.force_recompute = force_recompute
 
     def run(self):
         """
@@ -132,9 +161,19 @@ class NetCalculationThread(QThread):
             if self.simplified:
                 # Use simplified fast calculation
                 self.NetworkGenerationData = simplified_time_series_net(self.NetworkGenerationData)
+            elif self.surrogate:
+                # Use representative-hour surrogate (pipeflow for representative hours only)
+                self.NetworkGenerationData = surrogate_time_series_net(self.NetworkGenerationData)
             else:
                 # Use detailed hydraulic simulation
-                self.NetworkGenerationData = thermohydraulic_time_series_net(self.NetworkGenerationData)
+                self.NetworkGenerationData = thermohydraulic_time_series_net(
+                    self.NetworkGenerationData,
+                    adaptive_solver=True,
+                    checkpoint_dir=self.checkpoint_dir,
+                    resume=self.resume,
+                    cache=self.cache,
+                    force_recompute=self.force_recompute,
+                )
 
             # Compute KPIs here (off the UI thread) so the info panel just renders them.
             self.NetworkGenerationData.calculate_results()
@@ -32,6 +32,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from districtheatingsim.gui.ComparisonTab.kpi_index import record_network_save
 from districtheatingsim.gui.NetSimulationTab.net_calculation_threads import (
     NetCalculationThread,
     NetInitializationThread,
@@ -49,10 +50,16 @@ from districtheatingsim.net_simulation_pandapipes.NetworkDataClass import (
     NetworkGenerationData,
     json_default,
 )
-from districtheatingsim.net_simulation_pandapipes.pp_net_time_series_simulation import (
-    import_results_csv,
-    save_results_csv,
+from districtheatingsim.net_simulation_pandapipes.pp_net_time_series_simulation import save_results_csv
+from districtheatingsim.net_simulation_pandapipes.result_cache import RESULT_CACHE_DIRNAME, ResultCache
+from districtheatingsim.net_simulation_pandapipes.results_store import (
+    load_results,
+    results_parquet_path,
+    save_results_parquet,
 )
+from districtheatingsim.net_simulation_pandapipes.surrogate_time_series import SurrogateReport, surrogate_report_path
+from districtheatingsim.net_simulation_pandapipes.time_series_checkpoint import checkpoint_path, read_checkpoint
+from districtheatingsim.net_simulation_pandapipes.time_series_telemetry import TimeSeriesTelemetry, telemetry_path
 from districtheatingsim.net_simulation_pandapipes.utilities import export_net_geojson
 
 
@@ -89,6 +96,7 @@ class NetSimulationTab(QWidget):
         self._init_thread = None
         self._calc_thread = None
         self._recalc_thread = None
+        self._force_recompute = False
 
         self._init_ui()
         self._sync_crs()
@@ -249,6 +257,8 @@ class NetSimulationTab(QWidget):
 
         :param network_data: NetworkGenerationData instance.
         """
+        # Keep the current net: if only loads or temperatures changed, it is patched instead of rebuilt
+        network_data.reuse_network(self.NetworkGenerationData)
         self.NetworkGenerationData = network_data
         if self.NetworkGenerationData.import_type == "GeoJSON":
             self._create_and_initialize_net_geojson()
@@ -262,6 +272,8 @@ class NetSimulationTab(QWidget):
             self.NetworkGenerationData.end_time_step = inputs["end"]
             self.NetworkGenerationData.results_csv_filename = inputs["results_filename"]
             self.NetworkGenerationData.simplified_calculation = inputs["simplified"]
+            self.NetworkGenerationData.surrogate_calculation = inputs["surrogate"]
+            self._force_recompute = inputs["force_recompute"]
             self._time_series_simulation()
 
     # ------------------------------------------------------------------
@@ -302,7 +314,26 @@ class NetSimulationTab(QWidget):
 
         try:
             simplified = getattr(self.NetworkGenerationData, "simplified_calculation", False)
-            self._calc_thread = NetCalculationThread(self.NetworkGenerationData, simplified=simplified)
+            surrogate = getattr(self.NetworkGenerationData, "surrogate_calculation", False)
+            checkpoint_dir, resume, cache = None, True, None
+            results_filename = getattr(self.NetworkGenerationData, "results_csv_filename", None)
+            if not simplified and not surrogate and results_filename:
+                checkpoint_dir = checkpoint_path(results_filename)
+                resume = self._ask_resume(checkpoint_dir)
+            project_folder = getattr(self.folder_manager, "project_folder", None)
+            if not simplified and not surrogate and project_folder:
+                # One cache per project: variants with identical networks share their runs
+                cache = ResultCache(os.path.join(project_folder, RESULT_CACHE_DIRNAME))
+            self._calc_thread = NetCalculationThread(
+                self.NetworkGenerationData,
+                simplified=simplified,
+                surrogate=surrogate,
+                checkpoint_dir=checkpoint_dir,
+                resume=resume,
+                cache=cache,
+                force_recompute=self._force_recompute,
+            )
+            self._force_recompute = False
             self._calc_thread.calculation_done.connect(self._on_time_series_done)
             self._calc_thread.calculation_error.connect(self._on_simulation_error)
             self._calc_thread.start()
@@ -310,26 +341,84 @@ class NetSimulationTab(QWidget):
         except ValueError as e:
             QMessageBox.warning(self, "Ungültige Eingabe", str(e))
 
+    def _ask_resume(self, checkpoint_dir: str) -> bool:
+        """Offer to continue an interrupted detailed simulation from its checkpoint."""
+        manifest = read_checkpoint(checkpoint_dir)
+        if manifest is None:
+            return True
+        answer = QMessageBox.question(
+            self,
+            "Berechnung fortsetzen",
+            f"Eine unterbrochene Berechnung wurde gefunden ({manifest['done']} von {manifest['n_steps']} "
+            f"Zeitschritten, Stand {manifest.get('saved_at', '?')}).\n\n"
+            "Berechnung ab dem Zwischenstand fortsetzen? Bei geänderten Eingaben wird neu gestartet.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.Yes,
+        )
+        return answer == QMessageBox.StandardButton.Yes
+
     def _on_time_series_done(self, network_data):
         self._progress_bar.setRange(0, 1)
         self.NetworkGenerationData = network_data
         self._refresh_all_widgets()
 
+        nd = self.NetworkGenerationData
+        period = slice(nd.start_time_step, nd.end_time_step)
         save_results_csv(
-            self.NetworkGenerationData.yearly_time_steps[
-                self.NetworkGenerationData.start_time_step : self.NetworkGenerationData.end_time_step
-            ],
-            self.NetworkGenerationData.waerme_ges_kW[
-                self.NetworkGenerationData.start_time_step : self.NetworkGenerationData.end_time_step
-            ],
-            self.NetworkGenerationData.strombedarf_ges_kW[
-                self.NetworkGenerationData.start_time_step : self.NetworkGenerationData.end_time_step
-            ],
-            self.NetworkGenerationData.pump_results,
-            self.NetworkGenerationData.results_csv_filename,
+            nd.yearly_time_steps[period],
+            nd.waerme_ges_kW[period],
+            nd.strombedarf_ges_kW[period],
+            nd.pump_results,
+            nd.results_csv_filename,
         )
+        # Columnar store next to the CSV: selective column reads + the raw per-element results.
+        try:
+            save_results_parquet(
+                results_parquet_path(nd.results_csv_filename),
+                nd.yearly_time_steps[period],
+                nd.waerme_ges_kW[period],
+                nd.strombedarf_ges_kW[period],
+                nd.pump_results,
+                net_results=nd.net_results,
+            )
+        except Exception as e:
+            logging.warning(f"Parquet-Ergebnisspeicher konnte nicht geschrieben werden: {e}")
+        self._save_telemetry()
+        self._save_surrogate_report()
+
+    def _save_surrogate_report(self) -> None:
+        """Write the hold-out accuracy of a surrogate run next to the results CSV (a stale one is removed)."""
+        nd = self.NetworkGenerationData
+        if not getattr(nd, "results_csv_filename", None):
+            return
+        path = surrogate_report_path(nd.results_csv_filename)
+        try:
+            if isinstance(nd.time_series_report, SurrogateReport):
+                nd.time_series_report.save(path)
+            elif os.path.exists(path):
+                os.remove(path)
+        except OSError as e:
+            logging.warning(f"Genauigkeitsbericht der Ersatzmodell-Zeitreihe konnte nicht geschrieben werden: {e}")
+
+    def _save_telemetry(self) -> str | None:
+        """Write the convergence/timing telemetry of the last run next to the results CSV."""
+        nd = self.NetworkGenerationData
+        telemetry = getattr(nd, "telemetry", None)
+        if not isinstance(telemetry, TimeSeriesTelemetry) or not getattr(nd, "results_csv_filename", None):
+            return None
+        path = telemetry_path(nd.results_csv_filename)
+        try:
+            telemetry.save(path)
+        except Exception as e:
+            logging.warning(f"Telemetrie der Zeitreihenberechnung konnte nicht geschrieben werden: {e}")
+            return None
+        return path
 
     def _on_simulation_error(self, error_message):
+        # A failed run keeps the telemetry up to the failing time step
+        path = self._save_telemetry() if self.NetworkGenerationData is not None else None
+        if path:
+            error_message = f"{error_message}\n\nTelemetrie der Zeitschritte: {path}"
         QMessageBox.critical(self, "Berechnungsfehler", str(error_message))
         self._progress_bar.setRange(0, 1)
 
@@ -486,10 +575,16 @@ class NetSimulationTab(QWidget):
                 "yearly_time_steps",
                 "pump_results",
                 "plot_data",
+                # Run reports: a FastNetworkResults holds time steps × pipes arrays (~100 MB for a year)
+                "time_series_report",
+                "solver_report",
+                # Exported to its own table next to the results CSV
+                "telemetry",
             ):
                 meta.pop(key, None)
             with open(json_path, "w") as jf:
                 json.dump(meta, jf, indent=4, default=json_default)
+            record_network_save(self.base_path)
 
             nd.COP_filename = orig_cop
             nd.TRY_filename = orig_try
@@ -598,7 +693,7 @@ class NetSimulationTab(QWidget):
                 self.NetworkGenerationData.waerme_ges_kW,
                 self.NetworkGenerationData.strombedarf_ges_kW,
                 self.NetworkGenerationData.pump_results,
-            ) = import_results_csv(results_path)
+            ) = load_results(results_path)
 
             self.NetworkGenerationData.prepare_plot_data()
             self._ts_widget.update(self.NetworkGenerationData)
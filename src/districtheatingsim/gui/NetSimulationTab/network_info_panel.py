@@ -12,6 +12,8 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QScrollArea, QVBoxLayout, QWidget
 
+from districtheatingsim.net_simulation_pandapipes.time_series_telemetry import TimeSeriesTelemetry
+
 
 class NetworkInfoPanel(QWidget):
     """
@@ -114,6 +116,13 @@ class NetworkInfoPanel(QWidget):
             if key not in self._PRIORITY_KEYS and value is not None:
                 self._cards_layout.addWidget(self._make_card(key, value))
 
+        # Convergence and timing of the last time series run (absent for loaded projects)
+        telemetry = getattr(network_data, "telemetry", None)
+        if isinstance(telemetry, TimeSeriesTelemetry):
+            offset = getattr(network_data, "start_time_step", None) or 0
+            for key, value in telemetry.summary(offset).items():
+                self._cards_layout.addWidget(self._make_card(key, value))
+
         self._cards_layout.addStretch()
 
     # ------------------------------------------------------------------
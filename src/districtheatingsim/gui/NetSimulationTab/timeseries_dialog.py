@@ -10,6 +10,7 @@ import os
 
 from PyQt6.QtWidgets import (
     QButtonGroup,
+    QCheckBox,
     QDialog,
     QFileDialog,
     QGroupBox,
@@ -58,14 +59,26 @@ class TimeSeriesCalculationDialog(QDialog):
 
         self.detailedCalcRadio = QRadioButton("Ausführliche Berechnung mit pandapipes (detailliert, langsamer)", self)
         self.simplifiedCalcRadio = QRadioButton("Vereinfachte Berechnung (schnell, basierend auf Auslegung)", self)
+        self.surrogateCalcRadio = QRadioButton(
+            "Repräsentative Stunden mit pandapipes, übrige Stunden approximiert (mittel)", self
+        )
         self.detailedCalcRadio.setChecked(True)
 
         self.calculationMethodGroup = QButtonGroup(self)
         self.calculationMethodGroup.addButton(self.detailedCalcRadio, 0)
         self.calculationMethodGroup.addButton(self.simplifiedCalcRadio, 1)
+        self.calculationMethodGroup.addButton(self.surrogateCalcRadio, 2)
 
         calculationMethodLayout.addWidget(self.detailedCalcRadio)
         calculationMethodLayout.addWidget(self.simplifiedCalcRadio)
+        calculationMethodLayout.addWidget(self.surrogateCalcRadio)
+
+        self.forceRecomputeCheckBox = QCheckBox(
+            "Neuberechnung erzwingen (gespeicherte Ergebnisse gleicher Eingaben nicht verwenden)", self
+        )
+        self.forceRecomputeCheckBox.setEnabled(self.detailedCalcRadio.isChecked())
+        self.detailedCalcRadio.toggled.connect(self.forceRecomputeCheckBox.setEnabled)
+        calculationMethodLayout.addWidget(self.forceRecomputeCheckBox)
         calculationMethodGroup.setLayout(calculationMethodLayout)
 
         self.layout.addWidget(calculationMethodGroup)
@@ -154,7 +167,9 @@ class TimeSeriesCalculationDialog(QDialog):
         """
         Get dialog values.
 
-        :return: Dictionary containing results filename, start and end time steps, and calculation method.
+        :return: Dictionary containing results filename, start and end time steps, and calculation method
+            (``simplified`` / ``surrogate`` flags, both False for the detailed calculation) and whether the
+            detailed calculation bypasses the result cache (``force_recompute``).
         :rtype: dict
         """
         return {
@@ -162,4 +177,6 @@ class TimeSeriesCalculationDialog(QDialog):
             "start": int(self.StartTimeStepInput.text()),
             "end": int(self.EndTimeStepInput.text()),
             "simplified": self.simplifiedCalcRadio.isChecked(),
+            "surrogate": self.surrogateCalcRadio.isChecked(),
+            "force_recompute": self.forceRecomputeCheckBox.isChecked(),
         }
@@ -12,7 +12,7 @@ from typing import Any
 
 import numpy as np
 
-from districtheatingsim.heat_generators.annuity import annuity
+from districtheatingsim.utilities.annuity import annuity
 
 
 class BaseHeatGenerator:
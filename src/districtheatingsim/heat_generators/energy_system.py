@@ -25,6 +25,7 @@ from districtheatingsim.heat_generators import (
 from districtheatingsim.heat_generators.json_encoder import CustomJSONEncoder
 from districtheatingsim.heat_generators.results import TechnologyResult
 from districtheatingsim.utilities.schema import add_meta, check_version
+from districtheatingsim.utilities.table_export import DEFAULT_CHUNK_ROWS, write_columns
 
 logging.basicConfig(level=logging.INFO)
 
@@ -882,33 +883,34 @@ class EnergySystem:
 
         return obj
 
-    def save_to_csv(self, file_path: str) -> None:
+    def save_to_csv(self, file_path: str, compression: str | None = None, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> None:
         """
         Save energy system results to CSV file.
 
-        :param file_path: Path for CSV output
+        :param file_path: Path for CSV output (``.csv.gz``/``.csv.zst`` compress, ``.parquet`` writes Parquet)
         :type file_path: str
+        :param compression: Explicit CSV compression (``"gzip"``/``"zstd"``); inferred from the path if None
+        :type compression: str or None
+        :param chunk_rows: Rows written per chunk
+        :type chunk_rows: int
         """
         if not self.results:
             raise ValueError("No results available to save.")
 
-        # Initialize the DataFrame with the timestamps
-        df = pd.DataFrame({"time_steps": self.results["time_steps"]})
-
-        # Add the load data
-        df["Last_L"] = self.results["Last_L"]
+        # Timestamps and load data
+        columns = {"time_steps": self.results["time_steps"], "Last_L": self.results["Last_L"]}
 
         # Add the heat generation data for each technology
         for tech_results, techs in zip(self.results["Wärmeleistung_L"], self.results["techs"], strict=False):
-            df[techs] = tech_results
+            columns[techs] = tech_results
 
         # Add the electrical power data
-        df["el_Leistungsbedarf_L"] = self.results["el_Leistungsbedarf_L"]
-        df["el_Leistung_L"] = self.results["el_Leistung_L"]
-        df["el_Leistung_ges_L"] = self.results["el_Leistung_ges_L"]
+        columns["el_Leistungsbedarf_L"] = self.results["el_Leistungsbedarf_L"]
+        columns["el_Leistung_L"] = self.results["el_Leistung_L"]
+        columns["el_Leistung_ges_L"] = self.results["el_Leistung_ges_L"]
 
-        # Save the DataFrame as a CSV file
-        df.to_csv(file_path, index=False, sep=";", encoding="utf-8-sig")
+        # Stream the columns to disk chunk by chunk
+        write_columns(columns, file_path, compression=compression, chunk_rows=chunk_rows)
 
     def save_to_json(self, file_path: str) -> None:
         """
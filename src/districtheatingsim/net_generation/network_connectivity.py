@@ -18,21 +18,35 @@ This module reproduces that exact-match topology *before* generation and reports
   equal, i.e. the usual root cause after editing — which :func:`snap_network_endpoints`
   can repair by collapsing each cluster onto a single shared coordinate.
 
+The same clustering (:func:`merge_near_points`) merges coordinates within a small
+``DEFAULT_JUNCTION_TOLERANCE_M`` into one junction during generation, and
+:func:`check_network_connectivity` can evaluate the topology with that merge
+(``merge_tolerance``), so the pre-generation check and the generated net agree.
+
 It is deliberately PyQt- and geopandas-free (plain coordinate sequences) so it can
 be unit-tested without a display; the Leaflet tab adapts its features to/from here.
 
 :author: Dipl.-Ing. (FH) Jonas Pfeiffer
 """
 
-import math
 from collections import Counter
 from dataclasses import dataclass, field
 
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
+
 # Default snap / near-miss tolerance in CRS units (metres for the project's EPSG:25833).
 # Endpoints closer than this that are not exactly equal are treated as "meant to be one
 # junction" — small enough not to merge genuinely distinct nodes of a DH network.
 DEFAULT_TOLERANCE_M = 0.5
 
+# Coordinates closer than this are merged into one junction during network generation.
+# Absorbs floating-point noise from CRS transforms and imports; far below the 0.5 m offset
+# between flow and return lines, so supply and return points are never merged.
+DEFAULT_JUNCTION_TOLERANCE_M = 0.01
+
 Coord = tuple[float, float]
 
 
@@ -138,34 +152,19 @@ def _cluster_near_points(points: list[Coord], tolerance: float) -> dict[Coord, C
     """
     counts = Counter(points)
     distinct = list(counts)
+    if not distinct:
+        return {}
 
-    # Grid-bucket by tolerance so only nearby points are compared (3x3 neighbourhood).
-    buckets: dict[tuple[int, int], list[Coord]] = {}
-    cell = tolerance if tolerance > 0 else 1.0
-    for p in distinct:
-        buckets.setdefault((math.floor(p[0] / cell), math.floor(p[1] / cell)), []).append(p)
-
-    uf = _UnionFind()
-    for p in distinct:
-        uf.find(p)
-    tol_sq = tolerance * tolerance
-    for (cx, cy), members in buckets.items():
-        # candidate neighbours: this cell + the 8 surrounding cells
-        neighbours: list[Coord] = []
-        for dx in (-1, 0, 1):
-            for dy in (-1, 0, 1):
-                neighbours.extend(buckets.get((cx + dx, cy + dy), ()))
-        for p in members:
-            for q in neighbours:
-                if p is q:
-                    continue
-                if (p[0] - q[0]) ** 2 + (p[1] - q[1]) ** 2 <= tol_sq:
-                    uf.union(p, q)
+    # All pairs within the tolerance from a KD-tree (O(n log n)); clusters are the
+    # connected components of the pair graph.
+    pairs = cKDTree(np.asarray(distinct, dtype=float)).query_pairs(max(tolerance, 0.0), output_type="ndarray")
+    graph = coo_matrix((np.ones(len(pairs)), (pairs[:, 0], pairs[:, 1])), shape=(len(distinct), len(distinct)))
+    _, labels = connected_components(graph, directed=False)
 
     # Pick a representative per cluster: most frequent coord, then smallest.
-    clusters: dict[Coord, list[Coord]] = {}
-    for p in distinct:
-        clusters.setdefault(uf.find(p), []).append(p)
+    clusters: dict[int, list[Coord]] = {}
+    for p, label in zip(distinct, labels.tolist(), strict=True):
+        clusters.setdefault(label, []).append(p)
 
     mapping: dict[Coord, Coord] = {}
     for members in clusters.values():
@@ -175,6 +174,35 @@ def _cluster_near_points(points: list[Coord], tolerance: float) -> dict[Coord, C
     return mapping
 
 
+def _merged_clusters(mapping: dict[Coord, Coord]) -> list[NearMissCluster]:
+    """Clusters of more than one distinct point in a :func:`_cluster_near_points` mapping, sorted."""
+    grouped: dict[Coord, set[Coord]] = {}
+    for point, rep in mapping.items():
+        grouped.setdefault(rep, set()).add(point)
+    clusters = [
+        NearMissCluster(representative=rep, members=sorted(members))
+        for rep, members in grouped.items()
+        if len(members) > 1
+    ]
+    clusters.sort(key=lambda c: c.representative)
+    return clusters
+
+
+def merge_near_points(
+    points: list[Coord], tolerance: float = DEFAULT_JUNCTION_TOLERANCE_M
+) -> tuple[dict[Coord, Coord], list[NearMissCluster]]:
+    """
+    Merge points within *tolerance* onto one representative each (junction snapping).
+
+    :param points: 2-D points, duplicates allowed (a duplicate counts towards the representative)
+    :param tolerance: Merge distance in CRS units (metres)
+    :return: ``(mapping, clusters)`` — ``{point: representative}`` for every distinct point and the
+        clusters that merged more than one distinct point.
+    """
+    mapping = _cluster_near_points(points, tolerance)
+    return mapping, _merged_clusters(mapping)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -187,18 +215,25 @@ def check_network_connectivity(
     generator_connections,
     *,
     tolerance: float = DEFAULT_TOLERANCE_M,
+    merge_tolerance: float = 0.0,
 ) -> ConnectivityReport:
     """
     Analyse the unified network's connectivity the way pandapipes will see it.
 
     Each argument is a list of coordinate sequences (``[(x, y), …]`` per feature);
     z-coordinates, if any, are ignored. Connectivity is evaluated with **exact**
-    endpoint matching (mirroring generation); *tolerance* is used only to surface
-    near-miss endpoint clusters that explain a split and that
+    endpoint matching after merging endpoints within *merge_tolerance* (mirroring
+    generation with the same junction tolerance; 0 = exact match only); *tolerance*
+    is used only to surface near-miss endpoint clusters that explain a split and that
     :func:`snap_network_endpoints` can repair.
 
     :return: A :class:`ConnectivityReport`.
     """
+    if merge_tolerance > 0:
+        flow_lines, return_lines, building_connections, generator_connections, _ = snap_network_endpoints(
+            flow_lines, return_lines, building_connections, generator_connections, tolerance=merge_tolerance
+        )
+
     flow_nodes = set()
     for line in flow_lines:
         flow_nodes.update(line_endpoints(line))
@@ -221,15 +256,7 @@ def check_network_connectivity(
     mapping = _cluster_near_points(
         _all_endpoints(flow_lines, return_lines, building_connections, generator_connections), tolerance
     )
-    grouped: dict[Coord, set[Coord]] = {}
-    for point, rep in mapping.items():
-        grouped.setdefault(rep, set()).add(point)
-    near_miss_clusters = [
-        NearMissCluster(representative=rep, members=sorted(members))
-        for rep, members in grouped.items()
-        if len(members) > 1
-    ]
-    near_miss_clusters.sort(key=lambda c: c.representative)
+    near_miss_clusters = _merged_clusters(mapping)
 
     messages: list[str] = []
     if flow_components > 1:
@@ -358,9 +385,13 @@ def feature_groups_from_geojson(geojson: dict):
     return groups["flow"], groups["return"], groups["building"], groups["generator"]
 
 
-def check_geojson_connectivity(geojson: dict, *, tolerance: float = DEFAULT_TOLERANCE_M) -> ConnectivityReport:
+def check_geojson_connectivity(
+    geojson: dict, *, tolerance: float = DEFAULT_TOLERANCE_M, merge_tolerance: float = 0.0
+) -> ConnectivityReport:
     """Run :func:`check_network_connectivity` on a unified network GeoJSON dict."""
-    return check_network_connectivity(*feature_groups_from_geojson(geojson), tolerance=tolerance)
+    return check_network_connectivity(
+        *feature_groups_from_geojson(geojson), tolerance=tolerance, merge_tolerance=merge_tolerance
+    )
 
 
 def snap_geojson_endpoints(geojson: dict, *, tolerance: float = DEFAULT_TOLERANCE_M) -> tuple[dict, int]:
@@ -6,18 +6,137 @@ Author: Dipl.-Ing. (FH) Jonas Pfeiffer
 
 import json
 import logging
+import os
+import re
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from typing import Any
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
-from shapely.geometry import LineString
+import shapely
+from shapely.geometry import LineString, shape
 
 from districtheatingsim.utilities.crs_utils import DEFAULT_CRS, crs_to_urn, epsg_from_urn
 
 logger = logging.getLogger(__name__)
 
 
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and np.isnan(value))
+
+
+_WHITESPACE = re.compile(r"\s*")
+
+
+class _JsonStream:
+    """
+    Incremental reader of JSON values from a text file, one value at a time.
+
+    Wraps :meth:`json.JSONDecoder.raw_decode` over a buffer that is refilled from the file
+    on demand, so a FeatureCollection can be walked feature by feature without holding the
+    parsed document in memory. Refills grow with the pending buffer, so a value larger than
+    one chunk is parsed in a logarithmic number of attempts.
+    """
+
+    def __init__(self, file, chunk_size: int = 1 << 20):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        pending = len(self._buffer) - self._pos
+        chunk = self._file.read(max(self._chunk_size, pending))
+        if not chunk:
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of the GeoJSON file")
+
+    def take(self, expected: str) -> str:
+        """Consume the next non-whitespace character, which must be one of ``expected``."""
+        char = self.peek()
+        if char not in expected:
+            raise ValueError(f"Invalid GeoJSON: expected one of {expected!r}, found {char!r}")
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode and consume the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def _geometries_from_geojson(geometries: list[dict | None]):
+    """
+    Build shapely geometries from GeoJSON geometry dicts.
+
+    Layers of plain LineStrings with the same coordinate dimension, the shape of every
+    network layer, are built from one flat coordinate array with ``shapely.from_ragged_array``;
+    anything else falls back to :func:`shapely.geometry.shape` per feature.
+    """
+    if geometries and all(g is not None and g.get("type") == "LineString" for g in geometries):
+        lines = [g["coordinates"] for g in geometries]
+        counts = np.fromiter((len(line) for line in lines), dtype=np.int64, count=len(lines))
+        if counts.min() >= 2:
+            try:
+                coords = np.array([point for line in lines for point in line], dtype=float)
+            except ValueError:
+                coords = None
+            if coords is not None and coords.ndim == 2 and coords.shape[1] in (2, 3):
+                offsets = np.concatenate(([0], np.cumsum(counts)))
+                return shapely.from_ragged_array(shapely.GeometryType.LINESTRING, coords, (offsets,))
+    return [shape(g) if g else None for g in geometries]
+
+
+class _FeatureColumns:
+    """Column-wise accumulator of the GeoJSON features of one layer."""
+
+    def __init__(self):
+        self.geometries: list[dict | None] = []
+        self.columns: dict[str, list] = {}
+
+    def append(self, geometry: dict | None, properties: dict[str, Any]) -> None:
+        n = len(self.geometries)
+        self.geometries.append(geometry)
+        columns = self.columns
+        for key, value in properties.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [None] * n
+            column.append(value)
+        if len(properties) < len(columns):
+            for column in columns.values():
+                if len(column) == n:
+                    column.append(None)
+
+    def to_gdf(self, crs) -> gpd.GeoDataFrame:
+        return gpd.GeoDataFrame(self.columns, geometry=_geometries_from_geojson(self.geometries), crs=crs)
+
+
 class NetworkGeoJSONSchema:
     """
     Unified GeoJSON schema for district heating networks with editable/protected data separation.
@@ -41,6 +160,12 @@ class NetworkGeoJSONSchema:
         "Erzeugeranlagen": FEATURE_TYPE_GENERATOR,
     }
 
+    # Layer order of the split format: flow lines, return lines, building and generator connections
+    SPLIT_FEATURE_TYPES = (FEATURE_TYPE_FLOW, FEATURE_TYPE_RETURN, FEATURE_TYPE_BUILDING, FEATURE_TYPE_GENERATOR)
+
+    # Binary GeoParquet copy written next to the GeoJSON on export (``Wärmenetz.geojson.parquet``)
+    SIDECAR_SUFFIX = ".parquet"
+
     # Edit levels
     EDIT_LEVEL_EDITABLE = "editable"
     EDIT_LEVEL_GENERATED = "generated"
@@ -352,7 +477,7 @@ class NetworkGeoJSONSchema:
         return geojson
 
     @staticmethod
-    def export_to_file(geojson: dict[str, Any], filepath: str) -> None:
+    def export_to_file(geojson: dict[str, Any], filepath: str, write_sidecar: bool = True) -> None:
         """
         Export network GeoJSON to file.
 
@@ -360,10 +485,16 @@ class NetworkGeoJSONSchema:
         :type geojson: Dict[str, Any]
         :param filepath: Output file path
         :type filepath: str
+        :param write_sidecar: Also write the GeoParquet sidecar read by :meth:`read_split_network`
+        :type write_sidecar: bool
         """
         with open(filepath, "w", encoding="utf-8") as f:
             json.dump(geojson, f, indent=2, ensure_ascii=False)
         print(f"✓ Exported unified network GeoJSON: {filepath}")
+        if write_sidecar:
+            crs = NetworkGeoJSONSchema._embedded_crs(geojson)
+            layers = NetworkGeoJSONSchema._split_features(geojson.get("features", []))
+            NetworkGeoJSONSchema.write_sidecar(tuple(layer.to_gdf(crs) for layer in layers), filepath)
 
     @staticmethod
     def validate_version(geojson: dict[str, Any], *, filepath: str = "") -> str | None:
@@ -486,8 +617,7 @@ class NetworkGeoJSONSchema:
         """
         # Determine CRS: explicit override > embedded in file > default
         if crs is None:
-            embedded_urn = geojson.get("crs", {}).get("properties", {}).get("name", "")
-            crs = epsg_from_urn(embedded_urn) if embedded_urn else DEFAULT_CRS
+            crs = NetworkGeoJSONSchema._embedded_crs(geojson)
 
         flow_features = []
         return_features = []
@@ -518,6 +648,201 @@ class NetworkGeoJSONSchema:
 
         return flow_gdf, return_gdf, building_gdf, generator_gdf
 
+    @staticmethod
+    def _embedded_crs(geojson: dict[str, Any]) -> str:
+        """Return the CRS embedded in a GeoJSON (or its top-level members), ``DEFAULT_CRS`` if absent."""
+        embedded_urn = (geojson.get("crs") or {}).get("properties", {}).get("name", "")
+        return epsg_from_urn(embedded_urn) if embedded_urn else DEFAULT_CRS
+
+    @staticmethod
+    def iter_features(filepath: str, header: dict[str, Any] | None = None) -> Iterator[dict[str, Any]]:
+        """
+        Stream the features of a GeoJSON FeatureCollection one at a time.
+
+        Only the current feature is held as a dict; the other top-level members (``crs``,
+        ``metadata``, …) are collected into ``header`` as they are passed, so they are
+        complete once the iterator is exhausted.
+
+        :param filepath: Path to the GeoJSON file
+        :type filepath: str
+        :param header: Dictionary that receives the top-level members other than ``features``
+        :type header: Dict[str, Any] or None
+        :return: Iterator over the feature dicts
+        :rtype: Iterator[Dict[str, Any]]
+        :raises ValueError: If the file is not a JSON object
+        """
+        with open(filepath, encoding="utf-8") as f:
+            stream = _JsonStream(f)
+            stream.take("{")
+            if stream.peek() == "}":
+                return
+            while True:
+                key = stream.value()
+                stream.take(":")
+                if key == "features":
+                    stream.take("[")
+                    if stream.peek() == "]":
+                        stream.take("]")
+                    else:
+                        while True:
+                            yield stream.value()
+                            if stream.take(",]") == "]":
+                                break
+                else:
+                    value = stream.value()
+                    if header is not None:
+                        header[key] = value
+                if stream.take(",}") == "}":
+                    return
+
+    @staticmethod
+    def _split_features(features: Iterable[dict[str, Any]]) -> list[_FeatureColumns]:
+        """
+        Split features by ``feature_type`` into column arrays, one accumulator per layer.
+
+        A missing ``feature_type`` is repaired from ``layer_name`` (see :meth:`ensure_feature_types`);
+        features of any other type are skipped.
+        """
+        layers = {feature_type: _FeatureColumns() for feature_type in NetworkGeoJSONSchema.SPLIT_FEATURE_TYPES}
+        for feature in features:
+            properties = feature.get("properties") or {}
+            feature_type = properties.get("feature_type")
+            if not feature_type:
+                feature_type = NetworkGeoJSONSchema.LAYER_NAME_TO_FEATURE_TYPE.get(properties.get("layer_name"))
+                properties = {**properties, "feature_type": feature_type}
+            layer = layers.get(feature_type)
+            if layer is not None:
+                layer.append(feature.get("geometry"), properties)
+        return list(layers.values())
+
+    @staticmethod
+    def sidecar_path(filepath: str) -> str:
+        """
+        Path of the GeoParquet sidecar of a network GeoJSON.
+
+        :param filepath: Path to the network GeoJSON
+        :type filepath: str
+        :return: ``filepath`` with :attr:`SIDECAR_SUFFIX` appended
+        :rtype: str
+        """
+        return f"{filepath}{NetworkGeoJSONSchema.SIDECAR_SUFFIX}"
+
+    @staticmethod
+    def _source_stamp(filepath: str) -> dict[str, int]:
+        stat = os.stat(filepath)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    @staticmethod
+    def write_sidecar(layers: tuple[gpd.GeoDataFrame, ...], filepath: str) -> str | None:
+        """
+        Write the split layers of a network GeoJSON to its GeoParquet sidecar.
+
+        The sidecar stores the size and modification time of the GeoJSON it was written
+        from; :meth:`read_split_network` ignores it once the GeoJSON changes (e.g. after
+        editing in the map). Nested property values (dicts, lists) and mixed-type columns
+        are stored as JSON text and decoded on reading. A failed write is logged, not raised.
+
+        :param layers: (flow_lines, return_lines, building_connections, generator_connections)
+        :type layers: Tuple[gpd.GeoDataFrame, ...]
+        :param filepath: Path to the network GeoJSON the layers were read from or written to
+        :type filepath: str
+        :return: Path of the written sidecar, or None if writing failed
+        :rtype: str or None
+        """
+        path = NetworkGeoJSONSchema.sidecar_path(filepath)
+        crs = next((layer.crs for layer in layers if layer.crs is not None), None)
+        frames = [layer for layer in layers if len(layer)]
+        if frames:
+            gdf = gpd.GeoDataFrame(pd.concat(frames, ignore_index=True), geometry="geometry", crs=crs)
+        else:
+            gdf = gpd.GeoDataFrame({"feature_type": []}, geometry=[], crs=crs)
+        json_columns = []
+        for column in gdf.columns.drop("geometry"):
+            if gdf[column].dtype != object:
+                continue
+            values = gdf[column].dropna()
+            if not all(isinstance(value, str) for value in values):
+                gdf[column] = gdf[column].map(lambda value: None if _is_missing(value) else json.dumps(value))
+                json_columns.append(column)
+        layer_columns = {
+            feature_type: list(layer.columns)
+            for feature_type, layer in zip(NetworkGeoJSONSchema.SPLIT_FEATURE_TYPES, layers, strict=True)
+        }
+        try:
+            gdf.attrs = {
+                "source": NetworkGeoJSONSchema._source_stamp(filepath),
+                "json_columns": json_columns,
+                "layer_columns": layer_columns,
+            }
+            gdf.to_parquet(path, index=False)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Could not write the GeoParquet sidecar %s: %s", path, e)
+            return None
+        return path
+
+    @staticmethod
+    def _read_sidecar(filepath: str) -> tuple[gpd.GeoDataFrame, ...] | None:
+        """Read the split layers from the sidecar; None if it is missing, unreadable or stale."""
+        path = NetworkGeoJSONSchema.sidecar_path(filepath)
+        if not os.path.exists(path):
+            return None
+        try:
+            gdf = gpd.read_parquet(path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Ignoring unreadable GeoParquet sidecar %s: %s", path, e)
+            return None
+        if gdf.attrs.get("source") != NetworkGeoJSONSchema._source_stamp(filepath):
+            logger.info("GeoParquet sidecar %s is older than the GeoJSON; reading the GeoJSON", path)
+            return None
+        for column in gdf.attrs.get("json_columns", []):
+            gdf[column] = json.loads("[" + ",".join(gdf[column].fillna("null")) + "]")
+        layer_columns = gdf.attrs.get("layer_columns", {})
+        return tuple(
+            gdf.loc[gdf["feature_type"] == feature_type, layer_columns.get(feature_type, gdf.columns)].reset_index(
+                drop=True
+            )
+            for feature_type in NetworkGeoJSONSchema.SPLIT_FEATURE_TYPES
+        )
+
+    @staticmethod
+    def read_split_network(
+        filepath: str, crs: str = None, use_sidecar: bool = True
+    ) -> tuple[gpd.GeoDataFrame, gpd.GeoDataFrame, gpd.GeoDataFrame, gpd.GeoDataFrame]:
+        """
+        Read a unified network GeoJSON directly into the four layers of the split format.
+
+        Equivalent to :meth:`import_from_file` followed by :meth:`split_to_legacy_format`, but
+        the features are streamed (:meth:`iter_features`) and split by ``feature_type`` into
+        column arrays, so the parsed document is never held in memory and every layer is
+        built from arrays in one go. If an up-to-date GeoParquet sidecar exists (written by
+        :meth:`export_to_file`), it is read instead and the JSON is not parsed at all; a stale
+        sidecar is rewritten after the GeoJSON was read.
+
+        :param filepath: Path to the network GeoJSON
+        :type filepath: str
+        :param crs: Projected CRS override (EPSG code string). If ``None``, the CRS stored
+            in the file is used.
+        :type crs: str or None
+        :param use_sidecar: Read and refresh the GeoParquet sidecar
+        :type use_sidecar: bool
+        :return: (flow_lines, return_lines, building_connections, generator_connections)
+        :rtype: Tuple[gpd.GeoDataFrame, gpd.GeoDataFrame, gpd.GeoDataFrame, gpd.GeoDataFrame]
+        """
+        if use_sidecar:
+            layers = NetworkGeoJSONSchema._read_sidecar(filepath)
+            if layers is not None:
+                return layers if crs is None else tuple(layer.set_crs(crs, allow_override=True) for layer in layers)
+
+        # The header (crs, metadata) is complete only after the features were streamed
+        header: dict[str, Any] = {}
+        columns = NetworkGeoJSONSchema._split_features(NetworkGeoJSONSchema.iter_features(filepath, header))
+        NetworkGeoJSONSchema.validate_version(header, filepath=filepath)
+        crs = crs or NetworkGeoJSONSchema._embedded_crs(header)
+        layers = tuple(layer.to_gdf(crs) for layer in columns)
+        if use_sidecar and os.path.exists(NetworkGeoJSONSchema.sidecar_path(filepath)):
+            NetworkGeoJSONSchema.write_sidecar(layers, filepath)
+        return layers
+
     @staticmethod
     def update_calculated_data(
         geojson: dict[str, Any], flow_results: dict[str, dict], return_results: dict[str, dict]
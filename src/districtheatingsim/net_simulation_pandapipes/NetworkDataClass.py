@@ -17,11 +17,14 @@ It handles time series data, temperature control strategies, and comprehensive r
 with automatic calculation of key performance indicators.
 """
 
+import copy
 from dataclasses import asdict, dataclass, is_dataclass
 from typing import Any
 
 import numpy as np
 
+from districtheatingsim.net_generation.network_connectivity import DEFAULT_JUNCTION_TOLERANCE_M
+
 
 def json_default(obj):
     """``json.dump`` fallback that serialises numpy arrays losslessly as lists.
@@ -43,6 +46,60 @@ def json_default(obj):
     return str(obj)
 
 
+# Parameters of one producer in ``pump_results`` (the order of the parameter axis of ProducerResults)
+PRODUCER_PARAMETERS = ("qext_kW", "mass_flow", "deltap", "flow_temp", "return_temp", "flow_pressure", "return_pressure")
+
+# Time series plotted per producer: (parameter, plot key prefix, label, axis)
+_PRODUCER_PLOT_SERIES = (
+    ("qext_kW", "Wärmeerzeugung", "Wärmeerzeugung in kW", "left"),
+    ("mass_flow", "Massenstrom", "Massenstrom in kg/s", "right"),
+    ("deltap", "Delta p", "Druckdifferenz in bar", "right"),
+    ("flow_temp", "Vorlauftemperatur", "Temperatur in °C", "right"),
+    ("return_temp", "Rücklauftemperatur", "Temperatur in °C", "right"),
+    ("flow_pressure", "Vorlaufdruck", "Druck in bar", "right"),
+    ("return_pressure", "Rücklaufdruck", "Druck in bar", "right"),
+)
+
+
+@dataclass
+class ProducerResults:
+    """
+    Producer time series of ``pump_results`` as one producer × parameter × time array.
+
+    :ivar labels: (producer type, index) of each producer, in ``pump_results`` order
+    :vartype labels: List[Tuple[str, Any]]
+    :ivar values: Time series, axis 1 ordered as :data:`PRODUCER_PARAMETERS` (NaN where a producer lacks one)
+    :vartype values: np.ndarray
+    """
+
+    labels: list[tuple[str, Any]]
+    values: np.ndarray
+
+    @classmethod
+    def from_pump_results(cls, pump_results: dict[str, dict[Any, dict[str, np.ndarray]]]) -> "ProducerResults":
+        """
+        Stack the nested ``{producer_type: {index: {parameter: series}}}`` results.
+
+        :param pump_results: Producer results of ``calculate_results`` or ``load_results``
+        :type pump_results: Dict[str, Dict[Any, Dict[str, np.ndarray]]]
+        :return: Stacked results (an empty producer axis if there are no producers)
+        :rtype: ProducerResults
+        """
+        labels = [(pump_type, idx) for pump_type, pumps in pump_results.items() for idx in pumps]
+        series = [pump_results[pump_type][idx] for pump_type, idx in labels]
+        n_steps = max((len(values) for data in series for values in data.values()), default=0)
+        values = np.full((len(labels), len(PRODUCER_PARAMETERS), n_steps), np.nan)
+        for i, data in enumerate(series):
+            for j, parameter in enumerate(PRODUCER_PARAMETERS):
+                if parameter in data:
+                    values[i, j, : len(data[parameter])] = data[parameter]
+        return cls(labels, values)
+
+    def parameter(self, name: str) -> np.ndarray:
+        """Producer × time array of one parameter (a view)."""
+        return self.values[:, PRODUCER_PARAMETERS.index(name)]
+
+
 @dataclass
 class SecondaryProducer:
     """
@@ -104,16 +161,31 @@ class NetworkGenerationData:
     :vartype material_filter_pipe: str
     :ivar k_mm_pipe: Pipe roughness [mm]
     :vartype k_mm_pipe: float
+    :ivar junction_tolerance_m: Line vertices closer than this are merged into one junction [m]
+    :vartype junction_tolerance_m: float
     :ivar main_producer_location_index: Main heat producer index in GeoJSON
     :vartype main_producer_location_index: int
     :ivar secondary_producers: List of secondary producers
     :vartype secondary_producers: List[SecondaryProducer]
     :ivar net: Pandapipes network object
     :vartype net: Optional[Any]
+    :ivar input_signature: Digests of the inputs the net was built from, per category
+    :vartype input_signature: Optional[Dict[str, str]]
+    :ivar incremental_update: The last initialization patched the existing net instead of rebuilding it
+    :vartype incremental_update: bool
     :ivar pump_results: Structured pump simulation results
     :vartype pump_results: Optional[Dict[str, Any]]
     :ivar plot_data: Processed visualization data
     :vartype plot_data: Optional[Dict[str, Any]]
+    :ivar time_series_report: Report of a chunked (timing / boundary deviation), deduplicated
+        (hit rate) or surrogate (hold-out accuracy) time series run, or the pipe results of the
+        simplified run
+    :vartype time_series_report: Optional[Union[ChunkedRunReport, StateDedupReport, SurrogateReport,
+        FastNetworkResults]]
+    :ivar solver_report: Newton iterations, solves and fallbacks per time step of the adaptive pipeflow
+    :vartype solver_report: Optional[SolverReport]
+    :ivar telemetry: Wall time, solves, iterations and controller convergence per time step
+    :vartype telemetry: Optional[TimeSeriesTelemetry]
     :ivar kpi_results: Key performance indicators
     :vartype kpi_results: Optional[Dict[str, Union[int, float, None]]]
 
@@ -159,6 +231,9 @@ class NetworkGenerationData:
     COP_filename: str | None = None
     TRY_filename: str | None = None
 
+    # Junction merging of near-coincident line vertices during generation [m]
+    junction_tolerance_m: float = DEFAULT_JUNCTION_TOLERANCE_M
+
     # Building and temperature data (processed from JSON)
     supply_temperature_buildings: np.ndarray | None = None
     return_temperature_buildings: np.ndarray | None = None
@@ -186,6 +261,8 @@ class NetworkGenerationData:
 
     # Network object and simulation parameters
     net: Any | None = None
+    input_signature: dict[str, str] | None = None
+    incremental_update: bool = False
     start_time_step: int | None = None
     end_time_step: int | None = None
     results_csv_filename: str | None = None
@@ -195,10 +272,29 @@ class NetworkGenerationData:
     net_results: dict[str, Any] | None = None
     pump_results: dict[str, Any] | None = None
     plot_data: dict[str, Any] | None = None
+    time_series_report: Any | None = None
+    solver_report: Any | None = None
+    telemetry: Any | None = None
 
     # KPI results
     kpi_results: dict[str, int | float | None] | None = None
 
+    def reuse_network(self, previous: "NetworkGenerationData | None") -> None:
+        """
+        Take over the net of an earlier generation, so the initialization can patch it.
+
+        :param previous: Data of the earlier generation, None if there is none
+        :type previous: Optional[NetworkGenerationData]
+
+        .. note::
+           ``initialize_geojson`` only keeps the net if the geometry digest in
+           ``input_signature`` still matches; otherwise it builds a new one. The net is
+           copied, so a failed update leaves ``previous`` untouched.
+        """
+        if previous is not None and previous.net is not None:
+            self.net = copy.deepcopy(previous.net)
+            self.input_signature = previous.input_signature
+
     def calculate_results(self) -> dict[str, int | float | None]:
         """
         Calculate network KPIs including heat density, losses, and pump consumption.
@@ -261,12 +357,13 @@ class NetworkGenerationData:
         jahreswaermeerzeugung = 0
         pumpenstrom = 0
         if self.pump_results is not None:
-            for _pump_type, pumps in self.pump_results.items():
-                for _idx, pump_data in pumps.items():
-                    # Heat generation [MWh/a]
-                    jahreswaermeerzeugung += np.sum(pump_data["qext_kW"]) / 1000
-                    # Pump power: P = (ṁ * Δp) / ρ [MWh/a]
-                    pumpenstrom += np.sum((pump_data["mass_flow"] / 1000) * (pump_data["deltap"] * 100)) / 1000
+            producers = ProducerResults.from_pump_results(self.pump_results)
+            # Heat generation [MWh/a]
+            jahreswaermeerzeugung = np.sum(producers.parameter("qext_kW")) / 1000
+            # Pump power: P = (ṁ * Δp) / ρ [MWh/a]
+            pumpenstrom = (
+                np.sum((producers.parameter("mass_flow") / 1000) * (producers.parameter("deltap") * 100)) / 1000
+            )
 
         results["Jahreswärmeerzeugung [MWh]"] = jahreswaermeerzeugung if jahreswaermeerzeugung != 0 else None
         results["Pumpenstrom [MWh]"] = pumpenstrom if pumpenstrom != 0 else None
@@ -294,18 +391,13 @@ class NetworkGenerationData:
            Creates plot_data dict with entries: data (numpy array), label (string), axis
            (left/right), time (array). Includes heat demand, electrical data (cold networks),
            producer data (heat generation, mass flow, pressures, temperatures). Indexed by
-           variable name and producer number.
+           variable name and producer number. All entries share one time array; producer
+           series are views into one :class:`ProducerResults` array.
         """
-        # Determine time range for plots (use simulated range if available)
-        if hasattr(self, "start_time_step") and hasattr(self, "end_time_step"):
-            time_range = self.yearly_time_steps[self.start_time_step : self.end_time_step]
-            data_range_waerme = self.waerme_ges_kW[self.start_time_step : self.end_time_step]
-            data_range_strom = self.strombedarf_ges_kW[self.start_time_step : self.end_time_step]
-        else:
-            # Fallback: use full year
-            time_range = self.yearly_time_steps
-            data_range_waerme = self.waerme_ges_kW
-            data_range_strom = self.strombedarf_ges_kW
+        # Simulated range (the full year if start/end are unset); one time axis shared by all series
+        time_range = self.yearly_time_steps[self.start_time_step : self.end_time_step]
+        data_range_waerme = self.waerme_ges_kW[self.start_time_step : self.end_time_step]
+        data_range_strom = self.strombedarf_ges_kW[self.start_time_step : self.end_time_step]
 
         # Initialize plot data with base heat demand
         self.plot_data = {
@@ -332,64 +424,16 @@ class NetworkGenerationData:
                 "time": time_range,
             }
 
-        # Add detailed producer/pump data
+        # Add detailed producer/pump data: rows of the stacked producer array
         if self.pump_results is not None:
-            for pump_type, pumps in self.pump_results.items():
-                for idx, pump_data in pumps.items():
-                    # Time series data for simulation period
-                    time_series = self.yearly_time_steps[self.start_time_step : self.end_time_step]
-
-                    # Heat generation data
-                    self.plot_data[f"Wärmeerzeugung {pump_type} {idx + 1}"] = {
-                        "data": pump_data["qext_kW"],
-                        "label": "Wärmeerzeugung in kW",
-                        "axis": "left",
-                        "time": time_series,
-                    }
-
-                    # Hydraulic data
-                    self.plot_data[f"Massenstrom {pump_type} {idx + 1}"] = {
-                        "data": pump_data["mass_flow"],
-                        "label": "Massenstrom in kg/s",
-                        "axis": "right",
-                        "time": time_series,
-                    }
-
-                    self.plot_data[f"Delta p {pump_type} {idx + 1}"] = {
-                        "data": pump_data["deltap"],
-                        "label": "Druckdifferenz in bar",
-                        "axis": "right",
-                        "time": time_series,
-                    }
-
-                    # Temperature data
-                    self.plot_data[f"Vorlauftemperatur {pump_type} {idx + 1}"] = {
-                        "data": pump_data["flow_temp"],
-                        "label": "Temperatur in °C",
-                        "axis": "right",
-                        "time": time_series,
-                    }
-
-                    self.plot_data[f"Rücklauftemperatur {pump_type} {idx + 1}"] = {
-                        "data": pump_data["return_temp"],
-                        "label": "Temperatur in °C",
-                        "axis": "right",
-                        "time": time_series,
-                    }
-
-                    # Pressure data
-                    self.plot_data[f"Vorlaufdruck {pump_type} {idx + 1}"] = {
-                        "data": pump_data["flow_pressure"],
-                        "label": "Druck in bar",
-                        "axis": "right",
-                        "time": time_series,
-                    }
-
-                    self.plot_data[f"Rücklaufdruck {pump_type} {idx + 1}"] = {
-                        "data": pump_data["return_pressure"],
-                        "label": "Druck in bar",
-                        "axis": "right",
-                        "time": time_series,
+            producers = ProducerResults.from_pump_results(self.pump_results)
+            for (pump_type, idx), values in zip(producers.labels, producers.values, strict=True):
+                for parameter, key, label, axis in _PRODUCER_PLOT_SERIES:
+                    self.plot_data[f"{key} {pump_type} {idx + 1}"] = {
+                        "data": values[PRODUCER_PARAMETERS.index(parameter)],
+                        "label": label,
+                        "axis": axis,
+                        "time": time_range,
                     }
 
     def to_dict(self) -> dict[str, Any]:
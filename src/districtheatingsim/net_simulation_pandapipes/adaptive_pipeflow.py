@@ -0,0 +1,355 @@
+"""
+Adaptive, warm-started pipeflow.
+================================
+
+The time series and the pipe sizing solve every state with ``pp.pipeflow(net,
+mode="bidirectional", iter=100, alpha=0.5)``. Each call builds the internal tables from
+the element tables, so it starts from the nominal junction pressures and temperatures
+and 0.1 kg/s in every pipe, and the constant damping of 0.5 turns Newton's method into
+a linearly converging one: about 32 iterations per solve on the Görlitz network, no
+matter how little the state changed since the last hour.
+
+:class:`AdaptivePipeflow` is a drop-in ``run`` function
+(``run_timeseries(net, steps, ..., run=solver)``, :meth:`AdaptivePipeflow.run_control`):
+
+* **warm start** — free junction pressures and temperatures, slack mass flows and the
+  mass flows and outlet temperatures of the pipes start from the last converged solve.
+  Boundary values (pump pressure and supply temperature, consumer return temperatures,
+  controlled mass flows) are kept from the element tables.
+* **adaptive damping** — full Newton steps (``max_alpha``) while the solves converge;
+  after a failure the damping factor is halved (not below the caller's ``alpha``) and
+  doubled again after ``recovery_solves`` clean solves.
+* **adaptive iteration limit** — ``iter_margin`` × the largest iteration count of the
+  last ``history`` solves (at least ``min_iter``, at most the caller's ``iter``), so a
+  diverging attempt is stopped early.
+* **fallback** — a failed attempt is repeated cold with the caller's settings; only if
+  that fails too, ``PipeflowNotConverged`` reaches the caller.
+
+Every solve is recorded as a :class:`SolverCall`; :meth:`AdaptivePipeflow.report`
+sums them per time step (:class:`SolverReport`) to show which hours are expensive.
+The time step is known once the solver is attached to the network
+(:meth:`AdaptivePipeflow.attach`), which registers a controller that only passes the
+time step on.
+
+.. note::
+   Use one solver per network: the warm start is skipped when the internal tables
+   change shape (elements added or removed), but not when another network of the same
+   size is passed. Modes other than ``"bidirectional"`` are passed to ``pp.pipeflow``
+   unchanged. On the Görlitz network a week needs about 1400 instead of 6500 Newton
+   iterations (4× faster) with results equal to 1e-7, see
+   ``examples/benchmark_adaptive_pipeflow.py``.
+
+:author: Dipl.-Ing. (FH) Jonas Pfeiffer
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandapipes as pp
+from pandapipes.control.run_control import prepare_run_ctrl, run_control
+from pandapipes.idx_branch import MDOTINIT, TOUTINIT
+from pandapipes.idx_node import MDOTSLACKINIT, NODE_TYPE, NODE_TYPE_T, PINIT, TINIT, P, T
+from pandapipes.pf.pipeflow_setup import (
+    PipeflowNotConverged,
+    create_lookups,
+    get_lookup,
+    identify_active_nodes_branches,
+    init_all_result_tables,
+    init_options,
+    initialize_pit,
+)
+from pandapipes.pf.result_extraction import extract_all_results
+from pandapipes.pipeflow import bidirectional
+from pandapower.control.basic_controller import Controller
+
+# Node columns carried over from the last converged solve (boundary nodes excepted)
+_NODE_COLUMNS = [PINIT, TINIT, MDOTSLACKINIT]
+# Branch columns carried over for the pipes (other branches hold boundary values)
+_BRANCH_COLUMNS = [MDOTINIT, TOUTINIT]
+
+
+@dataclass
+class AdaptiveSolverSettings:
+    """
+    Damping and iteration control of :class:`AdaptivePipeflow`.
+
+    :ivar warm_start: Start every solve from the last converged state.
+    :ivar max_alpha: Damping factor while the solves converge (1 = full Newton step).
+    :ivar min_iter: Lower bound of the adaptive iteration limit.
+    :ivar iter_margin: Iteration limit as a multiple of the recent maximum.
+    :ivar history: Number of recent solves the iteration limit looks at.
+    :ivar recovery_solves: Clean solves after which a reduced damping factor is doubled again.
+    """
+
+    warm_start: bool = True
+    max_alpha: float = 1.0
+    min_iter: int = 10
+    iter_margin: float = 2.0
+    history: int = 24
+    recovery_solves: int = 10
+
+
+@dataclass
+class SolverCall:
+    """
+    One pipeflow solve.
+
+    :ivar time_step: Time step of the solve, -1 outside a time series.
+    :ivar iterations: Newton iterations, including a failed attempt before the fallback.
+    :ivar alpha: Damping factor of the converged solve.
+    :ivar warm_start: Started from the previous solve.
+    :ivar fallback: The adaptive attempt failed and the caller's settings were used.
+    :ivar seconds: Wall time [s].
+    """
+
+    time_step: int
+    iterations: int
+    alpha: float
+    warm_start: bool
+    fallback: bool
+    seconds: float
+
+
+@dataclass
+class SolverReport:
+    """
+    Solver effort per time step.
+
+    :ivar time_steps: Time steps in order of their first solve (-1 = solves outside a time series).
+    :ivar iterations: Newton iterations per time step (all solves of the controller loop).
+    :ivar solves: Pipeflow calls per time step.
+    :ivar fallbacks: Solves per time step that needed the caller's settings.
+    :ivar seconds: Solver wall time per time step [s].
+    """
+
+    time_steps: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=int))
+    iterations: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=int))
+    solves: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=int))
+    fallbacks: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=int))
+    seconds: np.ndarray = field(default_factory=lambda: np.zeros(0))
+
+    @property
+    def total_iterations(self) -> int:
+        """Newton iterations of the whole run."""
+        return int(self.iterations.sum())
+
+    def expensive_steps(self, n: int = 10) -> np.ndarray:
+        """
+        Time steps with the most Newton iterations.
+
+        :param n: Number of time steps
+        :type n: int
+        :return: Up to ``n`` time steps, most expensive first
+        :rtype: np.ndarray
+        """
+        order = np.argsort(-self.iterations, kind="stable")[:n]
+        return self.time_steps[order]
+
+
+class _TimeStepMarker(Controller):
+    """Passes the current time step of a time series to the solver; never acts on the network."""
+
+    def __init__(self, net, solver: "AdaptivePipeflow"):
+        super().__init__(net, order=-1, level=-1, initial_run=False)
+        self.solver = solver
+
+    def time_step(self, net, time_step: int) -> int:
+        self.solver.time_step = time_step
+        return time_step
+
+    def is_converged(self, net) -> bool:
+        return True
+
+
+class AdaptivePipeflow:
+    """
+    Warm-started pipeflow with adaptive damping and iteration limit.
+
+    :param settings: Damping and iteration control, defaults to :class:`AdaptiveSolverSettings`
+    :type settings: Optional[AdaptiveSolverSettings]
+
+    .. note::
+       Call it like ``pp.pipeflow``; the keyword arguments (``mode``, ``iter``, ``alpha``)
+       are the conservative settings of the fallback.
+    """
+
+    def __init__(self, settings: AdaptiveSolverSettings | None = None):
+        self.settings = settings or AdaptiveSolverSettings()
+        self.alpha = self.settings.max_alpha
+        self.time_step = -1
+        self.calls: list[SolverCall] = []
+        self._recent: deque[int] = deque(maxlen=self.settings.history)
+        self._clean_solves = 0
+        self._state: tuple[tuple[int, int, int, int], np.ndarray, np.ndarray] | None = None
+
+    def __call__(self, net, **kwargs) -> None:
+        """
+        Solve ``net`` like ``pp.pipeflow(net, **kwargs)``.
+
+        :param net: Pandapipes network
+        :type net: pandapipes.pandapipesNet
+        :param kwargs: Pipeflow options; ``iter`` and ``alpha`` are the fallback settings
+        :raises PipeflowNotConverged: If the fallback does not converge either
+        """
+        if kwargs.get("mode") != "bidirectional":
+            pp.pipeflow(net, **kwargs)
+            return
+
+        start = time.perf_counter()
+        max_iter = kwargs.get("iter", 100)
+        fallback_alpha = kwargs.get("alpha", 1.0)
+        alpha = max(self.alpha, fallback_alpha)
+        limit = max_iter
+        if self._recent:
+            limit = int(
+                np.clip(np.ceil(self.settings.iter_margin * max(self._recent)), self.settings.min_iter, max_iter)
+            )
+
+        iterations, warm, fallback = 0, False, False
+        try:
+            try:
+                warm = self._solve(net, dict(kwargs, iter=limit, alpha=alpha))
+                iterations = self._iterations(net)
+                self._clean_solves += 1
+                if self._clean_solves >= self.settings.recovery_solves:
+                    self.alpha = min(self.settings.max_alpha, 2.0 * self.alpha)
+                    self._clean_solves = 0
+            except PipeflowNotConverged:
+                iterations, warm, fallback = self._iterations(net), False, True
+                self.alpha = max(fallback_alpha, alpha / 2.0)
+                self._clean_solves = 0
+                alpha = fallback_alpha
+                pp.pipeflow(net, **kwargs)
+                iterations += self._iterations(net)
+            self._recent.append(self._iterations(net))
+            self._store_state(net)
+        finally:
+            self.calls.append(
+                SolverCall(self.time_step, iterations, alpha, warm, fallback, time.perf_counter() - start)
+            )
+
+    def _solve(self, net, options: dict) -> bool:
+        """``pp.pipeflow`` in bidirectional mode with the warm start between setup and solve."""
+        init_options(net, **options)
+        init_all_result_tables(net)
+        create_lookups(net)
+        initialize_pit(net)
+        net.converged = False
+        warm = self.settings.warm_start and self._apply_state(net)
+        identify_active_nodes_branches(net)
+        bidirectional(net)
+        extract_all_results(net, "bidirectional")
+        return warm
+
+    @staticmethod
+    def _iterations(net) -> int:
+        return int(net.get("_internal_results", {}).get("iterations_bidirectional", 0))
+
+    @staticmethod
+    def _layout(net) -> tuple[int, int, int, int]:
+        start, stop = get_lookup(net, "branch", "from_to").get("pipe", (0, 0))
+        return len(net["_pit"]["node"]), len(net["_pit"]["branch"]), start, stop
+
+    def _store_state(self, net) -> None:
+        layout = self._layout(net)
+        self._state = (
+            layout,
+            net["_pit"]["node"][:, _NODE_COLUMNS].copy(),
+            net["_pit"]["branch"][layout[2] : layout[3]][:, _BRANCH_COLUMNS].copy(),
+        )
+
+    def _apply_state(self, net) -> bool:
+        """Write the last converged state into the fresh internal tables; False if the layout changed."""
+        if self._state is None:
+            return False
+        layout, node_state, pipe_state = self._state
+        if layout != self._layout(net):
+            return False
+        node = net["_pit"]["node"]
+        free_pressure = node[:, NODE_TYPE] != P
+        free_temperature = node[:, NODE_TYPE_T] != T
+        node[free_pressure, PINIT] = node_state[free_pressure, 0]
+        node[free_temperature, TINIT] = node_state[free_temperature, 1]
+        node[:, MDOTSLACKINIT] = node_state[:, 2]
+        start, stop = layout[2], layout[3]
+        net["_pit"]["branch"][start:stop, MDOTINIT] = pipe_state[:, 0]
+        net["_pit"]["branch"][start:stop, TOUTINIT] = pipe_state[:, 1]
+        return True
+
+    def seed(self, net) -> bool:
+        """
+        Take the state of the last converged pipeflow of ``net`` (by any solver) as warm start.
+
+        :param net: Pandapipes network solved before
+        :type net: pandapipes.pandapipesNet
+        :return: False if ``net`` holds no converged internal tables
+        :rtype: bool
+        """
+        if "_pit" not in net or not net.get("converged", False):
+            return False
+        self._store_state(net)
+        return True
+
+    def run_control(self, net, **kwargs) -> None:
+        """
+        ``run_control`` of pandapipes with this solver as the pipeflow.
+
+        :param net: Pandapipes network with controllers
+        :type net: pandapipes.pandapipesNet
+        :param kwargs: Pipeflow options, see :meth:`__call__`
+        """
+        ctrl_variables = prepare_run_ctrl(net, None, **kwargs)
+        ctrl_variables["run"] = self
+        run_control(net, ctrl_variables=ctrl_variables, **kwargs)
+
+    def attach(self, net) -> None:
+        """Register a controller in ``net`` that tells the solver the current time step (replaces older ones)."""
+        self.detach(net, all_solvers=True)
+        _TimeStepMarker(net, self)
+
+    def detach(self, net, all_solvers: bool = False) -> None:
+        """
+        Remove the controller added by :meth:`attach`.
+
+        :param net: Pandapipes network
+        :type net: pandapipes.pandapipesNet
+        :param all_solvers: Also remove the controllers of other solvers (left over by an aborted run)
+        :type all_solvers: bool
+        """
+        markers = [
+            index
+            for index, ctrl in net.controller["object"].items()
+            if isinstance(ctrl, _TimeStepMarker) and (all_solvers or ctrl.solver is self)
+        ]
+        net.controller.drop(index=markers, inplace=True)
+        self.time_step = -1
+
+    def report(self) -> SolverReport:
+        """
+        Sum the recorded solves per time step.
+
+        :return: Iterations, solves, fallbacks and wall time per time step
+        :rtype: SolverReport
+        """
+        if not self.calls:
+            return SolverReport()
+        steps = np.array([call.time_step for call in self.calls])
+        time_steps, first, inverse = np.unique(steps, return_index=True, return_inverse=True)
+        order = np.argsort(first)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        group = rank[inverse]
+        n = len(time_steps)
+
+        def per_step(values, dtype=int) -> np.ndarray:
+            return np.bincount(group, weights=np.asarray(values, dtype=float), minlength=n).astype(dtype)
+
+        return SolverReport(
+            time_steps=time_steps[order],
+            iterations=per_step([call.iterations for call in self.calls]),
+            solves=per_step(np.ones(len(self.calls))),
+            fallbacks=per_step([call.fallback for call in self.calls]),
+            seconds=per_step([call.seconds for call in self.calls], dtype=float),
+        )
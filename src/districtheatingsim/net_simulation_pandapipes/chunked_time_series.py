@@ -0,0 +1,228 @@
+"""
+Chunked, process-parallel thermohydraulic time series.
+=====================================================
+
+``run_time_series.run_timeseries`` solves the whole start–end range in one process,
+one controlled bidirectional pipeflow after the other. :func:`run_time_series_chunked`
+splits the range into blocks and simulates them in worker processes, each on its own
+pickled copy of the network, then merges the ``OutputWriter`` arrays back into the
+``np_results`` layout that ``calculate_results`` and ``validate_simulation_results``
+expect (``"res_junction.t_k"`` → ``(time steps, elements)``).
+
+The controllers carry state from one step to the next (pump set points of the
+bad-point pressure controller, standard return temperatures of the minimum supply
+temperature controllers). A block therefore does not start cold: it first primes the
+controllers and solves the step *before* its first step (a quick pre-solve whose
+results are discarded), so it starts from a state close to the one the sequential run
+would hand over. The first block needs no pre-solve and is identical to the
+sequential run.
+
+Each block except the last also simulates the first step of the next block. The
+difference between both results at that step is reported as the chunk-boundary
+deviation — how far the warm-started block departs from the continued run, without a
+separate sequential reference run. :func:`chunk_boundary_deviation` compares against a
+sequential run when one is available.
+
+.. note::
+   Workers are started with the ``spawn`` method (safe from the GUI's worker thread);
+   each one imports pandapipes once, so chunking pays off for long ranges only. The
+   network passed in is not modified: its ``res_*`` tables keep the state before the run.
+
+:author: Dipl.-Ing. (FH) Jonas Pfeiffer
+"""
+
+import multiprocessing
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+from pandapipes.timeseries import run_time_series
+from pandapower.timeseries import OutputWriter
+
+
+@dataclass
+class ChunkTiming:
+    """
+    Wall-clock timing of one simulated block.
+
+    :ivar start: First time step of the block.
+    :ivar stop: Time step after the last merged step of the block.
+    :ivar presolve_seconds: Controller priming and warm-start pre-solve [s].
+    :ivar simulate_seconds: Time series run of the block (incl. overlap step) [s].
+    :ivar pid: Process id of the worker that ran the block.
+    """
+
+    start: int
+    stop: int
+    presolve_seconds: float
+    simulate_seconds: float
+    pid: int
+
+
+@dataclass
+class ChunkedRunReport:
+    """
+    Timing and accuracy summary of a chunked run.
+
+    :ivar chunks: Per-block timings in time order.
+    :ivar wall_seconds: Wall time of the whole run (incl. process start-up) [s].
+    :ivar max_workers: Number of worker processes (1 = run in-process).
+    :ivar boundary_deviation: ``{np_results key: max |Δ|}`` at the block boundaries,
+        between the warm-started block and the previous block's overlap step.
+    """
+
+    chunks: list[ChunkTiming] = field(default_factory=list)
+    wall_seconds: float = 0.0
+    max_workers: int = 1
+    boundary_deviation: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def max_boundary_deviation(self) -> float:
+        """Largest boundary deviation over all logged variables (0.0 for a single block)."""
+        return max(self.boundary_deviation.values(), default=0.0)
+
+
+def split_time_range(n_steps: int, chunk_size: int) -> list[tuple[int, int]]:
+    """
+    Split ``range(n_steps)`` into consecutive ``(start, stop)`` blocks.
+
+    :param n_steps: Number of simulated time steps
+    :type n_steps: int
+    :param chunk_size: Steps per block (the last block may be shorter)
+    :type chunk_size: int
+    :return: Blocks covering ``0 … n_steps`` without gaps or overlap
+    :rtype: List[Tuple[int, int]]
+    :raises ValueError: If ``chunk_size < 1``
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}.")
+    return [(start, min(start + chunk_size, n_steps)) for start in range(0, n_steps, chunk_size)]
+
+
+def _prime_controllers(net, time_step: int = 0) -> None:
+    """Run ``time_step`` of every active controller in execution order (sets first-step state)."""
+    active = net.controller[net.controller["in_service"].astype(bool)]
+    for ctrl in active.sort_values("order", kind="stable")["object"]:
+        ctrl.time_step(net, time_step)
+
+
+def _simulate_chunk(net, start: int, stop: int, overlap_stop: int, log_variables, warm_start: bool, run_kwargs):
+    """
+    Simulate one block on ``net`` (a private copy); top-level so worker processes can import it.
+
+    :return: ``(np_results, ChunkTiming)`` with results for ``start … overlap_stop - 1``
+    """
+    t0 = time.perf_counter()
+    if warm_start and start > 0:
+        # Controllers keep state from earlier steps. Step 0 first: the minimum supply temperature
+        # controllers record their standard return temperatures there, as in the sequential run.
+        # Then the step before the block, so the pre-solve starts from its inputs.
+        _prime_controllers(net, 0)
+        _prime_controllers(net, start - 1)
+        OutputWriter(net, [start - 1], output_path=None, log_variables=[])
+        run_time_series.run_timeseries(net, [start - 1], verbose=False, **run_kwargs)
+    t1 = time.perf_counter()
+
+    steps = range(start, overlap_stop)
+    ow = OutputWriter(net, steps, output_path=None, log_variables=list(log_variables))
+    run_time_series.run_timeseries(net, steps, verbose=False, **run_kwargs)
+    t2 = time.perf_counter()
+    return ow.np_results, ChunkTiming(start, stop, t1 - t0, t2 - t1, os.getpid())
+
+
+def run_time_series_chunked(
+    net,
+    time_steps: range,
+    log_variables: list[tuple[str, str]],
+    chunk_size: int,
+    max_workers: int | None = None,
+    warm_start: bool = True,
+    **run_kwargs,
+) -> tuple[dict[str, np.ndarray], ChunkedRunReport]:
+    """
+    Run a controlled time series in blocks, in parallel worker processes.
+
+    :param net: Pandapipes network with all time-series controllers installed
+    :type net: pandapipes.pandapipesNet
+    :param time_steps: Simulated time steps; must be ``range(n)`` (the controllers index their profiles from 0)
+    :type time_steps: range
+    :param log_variables: ``OutputWriter`` log variables (see ``create_log_variables``)
+    :type log_variables: List[Tuple[str, str]]
+    :param chunk_size: Time steps per block
+    :type chunk_size: int
+    :param max_workers: Worker processes; ``None`` = one per block up to ``os.cpu_count()``,
+        1 = simulate the blocks one after another in this process
+    :type max_workers: Optional[int]
+    :param warm_start: Prime controllers and pre-solve the step before each block
+    :type warm_start: bool
+    :param run_kwargs: Passed to ``run_timeseries`` (e.g. ``mode``, ``iter``, ``alpha``)
+    :return: ``(np_results, report)`` — merged ``OutputWriter.np_results`` and the run report
+    :rtype: Tuple[Dict[str, np.ndarray], ChunkedRunReport]
+    :raises ValueError: If ``time_steps`` does not start at 0 with step 1
+    """
+    if not isinstance(time_steps, range) or time_steps.start != 0 or time_steps.step != 1:
+        raise ValueError("Chunked time series needs time_steps = range(n_steps).")
+    n_steps = len(time_steps)
+    blocks = split_time_range(n_steps, chunk_size)
+    if max_workers is None:
+        max_workers = min(len(blocks), os.cpu_count() or 1)
+    max_workers = max(1, min(max_workers, len(blocks)))
+
+    # Each block but the last also runs the next block's first step (boundary check).
+    jobs = [(start, stop, min(stop + 1, n_steps), log_variables, warm_start, run_kwargs) for start, stop in blocks]
+
+    wall_start = time.perf_counter()
+    if max_workers == 1:
+        # Deep copy via pickle, exactly what a worker process would receive.
+        outputs = [_simulate_chunk(_copy_net(net), *job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = [pool.submit(_simulate_chunk, net, *job) for job in jobs]
+            outputs = [future.result() for future in futures]
+    report = ChunkedRunReport(
+        chunks=[timing for _, timing in outputs],
+        wall_seconds=time.perf_counter() - wall_start,
+        max_workers=max_workers,
+    )
+
+    np_results = {}
+    for key in outputs[0][0]:
+        parts = [results[key][: stop - start] for (results, _), (start, stop) in zip(outputs, blocks, strict=True)]
+        np_results[key] = np.concatenate(parts, axis=0)
+        deviations = [
+            np.max(np.abs(previous[key][-1] - following[key][0]), initial=0.0)
+            for (previous, _), (following, _) in zip(outputs[:-1], outputs[1:], strict=True)
+        ]
+        report.boundary_deviation[key] = float(max(deviations, default=0.0))
+    return np_results, report
+
+
+def chunk_boundary_deviation(
+    chunked_results: dict[str, np.ndarray], sequential_results: dict[str, np.ndarray], chunk_size: int
+) -> dict[str, float]:
+    """
+    Max absolute deviation of a chunked run from a sequential run at the block starts.
+
+    :param chunked_results: ``np_results`` of :func:`run_time_series_chunked`
+    :type chunked_results: Dict[str, np.ndarray]
+    :param sequential_results: ``np_results`` of the sequential run over the same range
+    :type sequential_results: Dict[str, np.ndarray]
+    :param chunk_size: Block size used for the chunked run
+    :type chunk_size: int
+    :return: ``{key: max |Δ|}`` over the first step of every block after the first
+    :rtype: Dict[str, float]
+    """
+    deviation = {}
+    for key, sequential in sequential_results.items():
+        starts = [start for start, _ in split_time_range(len(sequential), chunk_size)[1:]]
+        diff = np.abs(chunked_results[key][starts] - sequential[starts])
+        deviation[key] = float(np.max(diff, initial=0.0))
+    return deviation
+
+
+def _copy_net(net):
+    """Independent copy of ``net`` (same pickle round trip a worker process receives)."""
+    return pickle.loads(pickle.dumps(net, protocol=pickle.HIGHEST_PROTOCOL))
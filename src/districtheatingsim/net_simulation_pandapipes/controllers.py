@@ -89,28 +89,21 @@ class BadPointPressureLiftController(BasicCtrl):
         :rtype: Tuple[float, int]
 
         .. note::
-           Returns (0, -1) if no active consumers. Only considers consumers with qext_w != 0.
+           Returns (0, -1) if no active consumers or no results yet. Only considers consumers with
+           qext_w != 0; the search is one masked ``argmin`` over ``res_heat_consumer``.
         """
-        dp = []
-
-        # Calculate pressure differences for all active heat consumers
-        for idx, qext, p_from, p_to in zip(
-            net.heat_consumer.index,
-            net.heat_consumer["qext_w"],
-            net.res_heat_consumer["p_from_bar"],
-            net.res_heat_consumer["p_to_bar"],
-            strict=False,
-        ):
-            if qext != 0:  # Only consider active consumers
-                dp_diff = p_from - p_to
-                dp.append((dp_diff, idx))
-
-        if not dp:
+        if "res_heat_consumer" not in net:
+            return 0, -1  # Created before the first pipeflow
+        # Results and inputs are aligned by position; a stale or missing result table yields fewer rows
+        n = len(net.res_heat_consumer)
+        active = net.heat_consumer["qext_w"].to_numpy()[:n] != 0  # Only consider active consumers
+        if not active.any():
             return 0, -1  # No active consumers found
 
-        # Find minimum pressure difference
-        dp_min, idx_min = min(dp, key=lambda x: x[0])
-        return dp_min, idx_min
+        # Masked argmin over the pressure differences of all active consumers
+        dp = net.res_heat_consumer["p_from_bar"].to_numpy() - net.res_heat_consumer["p_to_bar"].to_numpy()
+        position = np.flatnonzero(active)[np.argmin(dp[active])]
+        return dp[position], net.heat_consumer.index[position]
 
     def time_step(self, net, time_step: int) -> int:
         """
@@ -143,8 +136,11 @@ class BadPointPressureLiftController(BasicCtrl):
            Converged if: all qext_w == 0 (standby) OR |current_dp - target_dp| < tolerance
         """
         # Standby mode - all consumers inactive
-        if all(net.heat_consumer["qext_w"] == 0):
+        if not net.heat_consumer["qext_w"].to_numpy().any():
             return True
+        if self.heat_consumer_idx < 0:
+            # Controller created before the first pipeflow: locate the worst point in the first results
+            self.dp_min, self.heat_consumer_idx = self.calculate_worst_point(net)
 
         # Calculate current pressure difference at worst point
         current_dp_bar = (
@@ -170,7 +166,7 @@ class BadPointPressureLiftController(BasicCtrl):
         self.iteration += 1
 
         # Handle standby mode - no heat demand
-        if all(net.heat_consumer["qext_w"] == 0):
+        if not net.heat_consumer["qext_w"].to_numpy().any():
             print("No heat flow detected. Switching to standby mode.")
             net.circ_pump_pressure.loc[:, "plift_bar"] = self.min_plift
             net.circ_pump_pressure.loc[:, "p_flow_bar"] = self.min_pflow
@@ -205,58 +201,86 @@ class MinimumSupplyTemperatureController(BasicCtrl):
 
     :param net: Pandapipes network object
     :type net: pandapipes.pandapipesNet
-    :param heat_consumer_idx: Index of heat consumer to control
-    :type heat_consumer_idx: int
-    :param min_supply_temperature: Minimum required supply temperature [°C], defaults to 65.0
-    :type min_supply_temperature: float
+    :param heat_consumer_idx: Index of the heat consumer to control, or an array of indices to control
+        several consumers with one controller
+    :type heat_consumer_idx: Union[int, np.ndarray]
+    :param min_supply_temperature: Minimum required supply temperature(s) [°C], scalar or one per consumer,
+        defaults to 65.0
+    :type min_supply_temperature: Union[float, np.ndarray]
     :param tolerance: Temperature tolerance for convergence [°C], defaults to 2.0
     :type tolerance: float
     :param max_iterations: Maximum iterations per time step, defaults to 100
     :type max_iterations: int
     :param temperature_adjustment_step: Temperature adjustment step [°C], defaults to 1.0
     :type temperature_adjustment_step: float
+    :param profile_name: Column(s) of ``data_source`` holding the setpoints, one per consumer,
+        defaults to "min_supply_temperature"
+    :type profile_name: Union[str, List[str]]
     :param debug: Enable debug output, defaults to False
     :type debug: bool
     :param \\**kwargs: Additional arguments for base controller
 
+    :ivar element_index: Controlled heat consumer indices
+    :vartype element_index: np.ndarray
     :ivar data_source: External time-varying temperature setpoints
     :vartype data_source: Optional[Any]
-    :ivar iteration: Current iteration counter
-    :vartype iteration: int
-    :ivar previous_temperatures: Temperature history for weighted averaging
-    :vartype previous_temperatures: List[float]
-    :ivar standard_return_temperature: Original return temperature setpoint
-    :vartype standard_return_temperature: float
+    :ivar iteration: Control steps per consumer in the current time step
+    :vartype iteration: np.ndarray
+    :ivar previous_temperatures: Supply temperature history (≤ 2 iterations × consumers) for weighted averaging
+    :vartype previous_temperatures: np.ndarray
+    :ivar converged: Per-consumer convergence mask of the last ``is_converged`` call
+    :vartype converged: np.ndarray
+    :ivar standard_return_temperature: Original return temperature setpoints [K]
+    :vartype standard_return_temperature: np.ndarray
 
     .. note::
        Critical for cold networks with heat pumps. Monitors supply temperature, adjusts return
        temperature setpoint to increase supply (higher return → higher mass flow → higher supply).
        Uses weighted averaging for stability. Supports time-varying requirements via data_source.
+       All consumers are checked and adjusted with array operations; each one converges on its
+       own mask exactly as a separate controller per consumer would.
     """
 
     def __init__(
         self,
         net,
-        heat_consumer_idx: int,
-        min_supply_temperature: float = 65.0,
+        heat_consumer_idx: int | np.ndarray,
+        min_supply_temperature: float | np.ndarray = 65.0,
         tolerance: float = 2.0,
         max_iterations: int = 100,
         temperature_adjustment_step: float = 1.0,
+        profile_name: str | list[str] = "min_supply_temperature",
         debug: bool = False,
         **kwargs,
     ):
         super().__init__(net, **kwargs)
         self.heat_consumer_idx = heat_consumer_idx
+        self.element_index = np.atleast_1d(heat_consumer_idx)
         self.min_supply_temperature = min_supply_temperature
         self.tolerance = tolerance
         self.max_iterations = max_iterations
         self.temperature_adjustment_step = temperature_adjustment_step
+        self.profile_name = profile_name
         self.debug = debug
 
         # Controller state variables
         self.data_source = None
-        self.iteration = 0
-        self.previous_temperatures: list[float] = []
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        """Clear iteration counters, temperature history and convergence mask."""
+        n = len(self.element_index)
+        self.iteration = np.zeros(n, dtype=int)
+        self.previous_temperatures = np.empty((0, n))
+        self.converged = np.zeros(n, dtype=bool)
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        # Nets pickled with the former one-consumer controller lack the array state
+        if "element_index" not in state:
+            self.element_index = np.atleast_1d(self.heat_consumer_idx)
+            self.profile_name = "min_supply_temperature"
+            self._reset_state()
 
     def time_step(self, net, time_step: int) -> int:
         """
@@ -270,31 +294,33 @@ class MinimumSupplyTemperatureController(BasicCtrl):
         :rtype: int
 
         .. note::
-           Resets iteration counter and temperature history. Stores/restores standard return
-           temperature. Updates min_supply_temperature from data_source if available.
+           Resets iteration counters and temperature history. Stores/restores standard return
+           temperatures. Updates min_supply_temperature from data_source if available.
         """
-        self.iteration = 0
-        self.previous_temperatures = []
+        self._reset_state()
 
         if time_step == 0:
-            # Store original return temperature for restoration
-            self.standard_return_temperature = net.heat_consumer["treturn_k"].at[self.heat_consumer_idx]
+            # Store original return temperatures for restoration
+            self.standard_return_temperature = net.heat_consumer.loc[self.element_index, "treturn_k"].to_numpy()
         else:
-            # Restore standard return temperature at start of each step
-            net.heat_consumer.at[self.heat_consumer_idx, "treturn_k"] = self.standard_return_temperature
+            # Restore standard return temperatures at start of each step
+            net.heat_consumer.loc[self.element_index, "treturn_k"] = self.standard_return_temperature
 
-        # Update minimum temperature from external data source
+        # Update minimum temperatures from external data source
         if self.data_source is not None:
-            self.min_supply_temperature = self.data_source.df.at[time_step, "min_supply_temperature"]
+            if isinstance(self.profile_name, str):
+                self.min_supply_temperature = self.data_source.df.at[time_step, self.profile_name]
+            else:
+                self.min_supply_temperature = self.data_source.df.loc[time_step, self.profile_name].to_numpy(float)
 
         return time_step
 
-    def get_weighted_average_temperature(self) -> float | None:
+    def get_weighted_average_temperature(self) -> np.ndarray | None:
         """
         Calculate weighted average of recent supply temperatures for stability.
 
-        :return: Weighted average temperature [°C], or None if no history
-        :rtype: Optional[float]
+        :return: Weighted average temperature per consumer [°C], or None if no history
+        :rtype: Optional[np.ndarray]
 
         .. note::
            Linear weighting: recent values weighted more heavily. Prevents oscillations.
@@ -303,106 +329,186 @@ class MinimumSupplyTemperatureController(BasicCtrl):
             return None
 
         weights = np.arange(1, len(self.previous_temperatures) + 1)
-        weighted_avg = np.dot(self.previous_temperatures, weights) / weights.sum()
-        return weighted_avg
+        return weights @ self.previous_temperatures / weights.sum()
 
     def control_step(self, net) -> None:
         """
-        Adjust return temperature to ensure minimum supply temperature.
+        Adjust return temperatures to ensure minimum supply temperatures.
 
         :param net: Pandapipes network to control
         :type net: pandapipes.pandapipesNet
 
         .. note::
-           Standby mode if all qext_w == 0. Uses weighted averaging for stability.
-           Increases return temp if supply < minimum (higher return → higher mass flow → higher supply).
+           Standby mode if all qext_w == 0. Uses weighted averaging for stability. Only consumers
+           not converged in the last ``is_converged`` call are adjusted: their return temperature is
+           raised if the supply is below the minimum (higher return → higher mass flow → higher supply).
         """
-        self.iteration += 1
+        active = ~self.converged
+        self.iteration[active] += 1
 
         # Handle standby mode - no heat demand
-        if all(net.heat_consumer["qext_w"] == 0):
+        if not net.heat_consumer["qext_w"].to_numpy().any():
             if self.debug:
                 print("No heat flow detected. Switching to standby mode.")
             return super().control_step(net)
 
-        # Get current inlet temperature
-        current_T_in = net.res_heat_consumer["t_from_k"].at[self.heat_consumer_idx] - KELVIN_OFFSET
+        # Apply weighted averaging for stability, current inlet temperatures without history
+        current_T_in = self.get_weighted_average_temperature()
+        if current_T_in is None:
+            current_T_in = net.res_heat_consumer.loc[self.element_index, "t_from_k"].to_numpy() - KELVIN_OFFSET
 
-        # Apply weighted averaging for stability
-        weighted_avg_T_in = self.get_weighted_average_temperature()
-        if weighted_avg_T_in is not None:
-            current_T_in = weighted_avg_T_in
-
-        # Adjust return temperature if supply temperature too low
-        if current_T_in < self.min_supply_temperature:
-            new_T_out = net.heat_consumer.at[self.heat_consumer_idx, "treturn_k"] + self.temperature_adjustment_step
-            net.heat_consumer.at[self.heat_consumer_idx, "treturn_k"] = new_T_out
+        # Adjust return temperatures where the supply temperature is too low
+        adjust = active & (current_T_in < self.min_supply_temperature)
+        if adjust.any():
+            adjusted = self.element_index[adjust]
+            net.heat_consumer.loc[adjusted, "treturn_k"] += self.temperature_adjustment_step
 
             if self.debug:
-                print(
-                    f"Minimum supply temperature not met. Adjusted target output temperature to {new_T_out - KELVIN_OFFSET:.1f}°C."
-                )
+                for idx, new_T_out in net.heat_consumer.loc[adjusted, "treturn_k"].items():
+                    print(
+                        f"Minimum supply temperature not met for heat_consumer_idx: {idx}. "
+                        f"Adjusted target output temperature to {new_T_out - KELVIN_OFFSET:.1f}°C."
+                    )
 
         return super().control_step(net)
 
     def is_converged(self, net) -> bool:
         """
-        Check convergence: standby, temperature met and stable, or max iterations.
+        Check convergence: standby, or every consumer's temperature met and stable (or out of iterations).
 
         :param net: Pandapipes network with current simulation results
         :type net: pandapipes.pandapipesNet
-        :return: True if converged, False otherwise
+        :return: True if all consumers converged, False otherwise
         :rtype: bool
 
         .. note::
-           Converged if: all qext_w == 0 (standby) OR (supply >= minimum AND change < tolerance)
-           OR max iterations reached. Maintains temperature history for weighted averaging.
+           A consumer converged if: supply >= minimum AND (change < tolerance OR max iterations reached).
+           All qext_w == 0 (standby) converges immediately. Updates the per-consumer mask
+           ``converged`` and the temperature history for weighted averaging.
         """
         # Standby mode - all consumers inactive
-        if all(net.heat_consumer["qext_w"] == 0):
+        if not net.heat_consumer["qext_w"].to_numpy().any():
             return True
 
-        # Get current temperatures and system state
-        current_T_out = net.res_heat_consumer["t_to_k"].at[self.heat_consumer_idx] - KELVIN_OFFSET
-        current_T_in = net.res_heat_consumer["t_from_k"].at[self.heat_consumer_idx] - KELVIN_OFFSET
-        previous_T_in = self.previous_temperatures[-1] if self.previous_temperatures else None
-        current_mass_flow = net.res_heat_consumer["mdot_from_kg_per_s"].at[self.heat_consumer_idx]
+        # Get current inlet temperatures
+        current_T_in = net.res_heat_consumer.loc[self.element_index, "t_from_k"].to_numpy() - KELVIN_OFFSET
 
         # Check temperature stability
-        temperature_change = abs(current_T_in - previous_T_in) if previous_T_in is not None else float("inf")
-        converged_T_in = temperature_change < self.tolerance
+        if len(self.previous_temperatures):
+            converged_T_in = np.abs(current_T_in - self.previous_temperatures[-1]) < self.tolerance
+        else:
+            converged_T_in = np.zeros(len(self.element_index), dtype=bool)
 
         # Update temperature history (keep last 2 values)
-        self.previous_temperatures.append(current_T_in)
-        if len(self.previous_temperatures) > 2:
-            self.previous_temperatures.pop(0)
-
-        # Check minimum temperature requirement
-        if current_T_in < self.min_supply_temperature:
-            if self.debug:
+        self.previous_temperatures = np.vstack([self.previous_temperatures[-1:], current_T_in])
+
+        # Minimum temperature requirement, then stability or forced convergence after maximum iterations
+        below_minimum = current_T_in < self.min_supply_temperature
+        out_of_iterations = self.iteration >= self.max_iterations
+        self.converged = ~below_minimum & (converged_T_in | out_of_iterations)
+
+        if self.debug:
+            result = net.res_heat_consumer.loc[self.element_index]
+            for position in range(len(self.element_index)):
+                if below_minimum[position]:
+                    state = "Supply temperature not met for"
+                elif converged_T_in[position]:
+                    state = "Controller converged:"
+                elif out_of_iterations[position]:
+                    state = "Max iterations reached for"
+                else:
+                    continue
                 print(
-                    f"Supply temperature not met for heat_consumer_idx: {self.heat_consumer_idx}. "
-                    f"current_temperature_in: {current_T_in:.1f}°C, "
-                    f"current_temperature_out: {current_T_out:.1f}°C, "
-                    f"current_mass_flow: {current_mass_flow:.3f} kg/s"
+                    f"{state} heat_consumer_idx: {self.element_index[position]}, "
+                    f"current_temperature_in: {current_T_in[position]:.1f}°C, "
+                    f"current_temperature_out: {result['t_to_k'].iat[position] - KELVIN_OFFSET:.1f}°C, "
+                    f"current_mass_flow: {result['mdot_from_kg_per_s'].iat[position]:.3f} kg/s"
                 )
-            return False
 
-        # Check temperature stability convergence
-        if converged_T_in:
-            if self.debug:
-                print(
-                    f"Controller converged: heat_consumer_idx: {self.heat_consumer_idx}, "
-                    f"current_temperature_in: {current_T_in:.1f}°C, "
-                    f"current_temperature_out: {current_T_out:.1f}°C, "
-                    f"current_mass_flow: {current_mass_flow:.3f} kg/s"
+        return bool(self.converged.all())
+
+
+class HeatConsumerProfileController(BasicCtrl):
+    """
+    Batch profile controller writing the set points of all heat consumers at once.
+
+    :param net: Pandapipes network object
+    :type net: pandapipes.pandapipesNet
+    :param qext_w: Heat demand matrix (time × consumers) [W]
+    :type qext_w: np.ndarray
+    :param treturn_k: Return temperature matrix (time × consumers) [K], None leaves treturn_k untouched
+    :type treturn_k: Optional[np.ndarray]
+    :param min_supply_temperature: Minimum supply temperature matrix (time × consumers) [°C], None to skip
+    :type min_supply_temperature: Optional[np.ndarray]
+    :param min_supply_targets: ``(controller_index, columns)`` pairs of the
+        :class:`MinimumSupplyTemperatureController` instances fed from ``min_supply_temperature``;
+        ``columns`` is one column for a single-consumer controller or an array of columns
+    :type min_supply_targets: Optional[List[Tuple[int, Union[int, np.ndarray]]]]
+    :param element_index: Heat consumer indices of the matrix columns, defaults to ``net.heat_consumer.index``
+    :type element_index: Optional[np.ndarray]
+    :param \\**kwargs: Additional arguments for base controller
+
+    .. note::
+       Replaces one ``ConstControl`` + ``DFData`` per consumer and variable. Each time step
+       writes a whole matrix row with one ``.loc`` assignment per variable; row ``t`` is used
+       for time step ``t``, so the simulated time steps must run from 0. Register it with a
+       lower order than the MinimumSupplyTemperatureControllers so their standard return
+       temperature is taken after the profile has been written (as with the ConstControls).
+    """
+
+    def __init__(
+        self,
+        net,
+        qext_w: np.ndarray,
+        treturn_k: np.ndarray | None = None,
+        min_supply_temperature: np.ndarray | None = None,
+        min_supply_targets: list[tuple[int, int | np.ndarray]] | None = None,
+        element_index: np.ndarray | None = None,
+        **kwargs,
+    ):
+        super().__init__(net, **kwargs)
+        self.element_index = np.asarray(net.heat_consumer.index) if element_index is None else np.asarray(element_index)
+        for name, matrix in (
+            ("qext_w", qext_w),
+            ("treturn_k", treturn_k),
+            ("min_supply_temperature", min_supply_temperature),
+        ):
+            if matrix is not None and (matrix.ndim != 2 or matrix.shape[1] != len(self.element_index)):
+                raise ValueError(
+                    f"{name} must have shape (time steps, {len(self.element_index)} consumers), got {matrix.shape}"
                 )
-            return True
+        self.qext_w = qext_w
+        self.treturn_k = treturn_k
+        self.min_supply_temperature = min_supply_temperature
+        self.min_supply_targets = list(min_supply_targets or [])
+        self.applied = False
 
-        # Forced convergence after maximum iterations
-        if self.iteration >= self.max_iterations:
-            if self.debug:
-                print(f"Max iterations reached for heat_consumer_idx: {self.heat_consumer_idx}")
-            return True
+    def time_step(self, net, time_step: int) -> int:
+        """
+        Write row ``time_step`` of every profile matrix into the network.
 
-        return False
+        :param net: Pandapipes network object
+        :type net: pandapipes.pandapipesNet
+        :param time_step: Current simulation time step index
+        :type time_step: int
+        :return: Current time step (pass-through)
+        :rtype: int
+        """
+        self.applied = False
+        net.heat_consumer.loc[self.element_index, "qext_w"] = self.qext_w[time_step]
+        if self.treturn_k is not None:
+            net.heat_consumer.loc[self.element_index, "treturn_k"] = self.treturn_k[time_step]
+        if self.min_supply_temperature is not None:
+            row = self.min_supply_temperature[time_step]
+            controllers = net.controller["object"]
+            for controller_index, columns in self.min_supply_targets:
+                controllers.at[controller_index].min_supply_temperature = row[columns]
+        return time_step
+
+    def is_converged(self, net) -> bool:
+        """Converged once the written set points have been part of a pipeflow (like ``ConstControl``)."""
+        return self.applied
+
+    def control_step(self, net) -> None:
+        """Mark the set points as applied."""
+        self.applied = True
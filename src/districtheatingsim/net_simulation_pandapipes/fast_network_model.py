@@ -0,0 +1,707 @@
+"""
+Quasi-static network model for the simplified time series.
+==========================================================
+
+``simplified_time_series_net`` used to scale the design state with the demand: constant
+pump pressures and return temperature, design losses split by producer share. That
+overestimates the pump head at part load and misses how the relative losses grow in
+summer. :class:`FastNetworkModel` replaces the scaling with a steady-state model of
+the radial network, built once from the initialized ``net`` and evaluated for all
+hours as array operations — no pipeflow calls:
+
+* **Mass flows** — each consumer draws ``qext / (cp · (T_supply,in − T_return))``; the
+  flow of every pipe is the sum of the consumers (minus secondary producer feed-in)
+  behind it, summed leaves-first over the supply and return trees.
+* **Heat losses** — per pipe from its U-value, outer diameter, length and soil
+  temperature with the sectioned steady-state balance pandapipes uses, propagated
+  from the producer along the supply tree and mixed at the junctions of the return
+  tree. The supply temperature at the consumers feeds back into their mass flow
+  (Newton-weighted fixed-point passes until it changes by less than 0.01 K).
+* **Pressures** — the friction loss of every pipe scales with ``mdot²`` (friction
+  factor and loss coefficient of the design state). The pump lift follows the
+  bad-point rule of :class:`BadPointPressureLiftController`: the consumer with the
+  largest path loss gets exactly ``target_dp_min_bar``. Static offsets (elevation,
+  model error) are calibrated on the design state, so the model reproduces it.
+
+:class:`FastNetworkResults` holds the producer results in the layout of
+``calculate_results`` plus per-pipe flows and losses. See
+``examples/benchmark_fast_network_model.py`` for timing and a comparison with the
+controlled pipeflow.
+
+.. note::
+   Supply and return side must each be a tree rooted at the main producer
+   (``circ_pump_pressure``); a meshed network raises ``ValueError`` and the caller falls
+   back to the design scaling. Secondary producers feed in at their connection point;
+   flow directions are taken from the tree, so a secondary producer that reverses a
+   pipe is treated with the magnitude of that flow. Minimum supply temperature
+   controllers of the consumers are not modelled.
+
+:author: Dipl.-Ing. (FH) Jonas Pfeiffer
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from districtheatingsim.constants import CP_WATER_KJ_KGK, KELVIN_OFFSET
+from districtheatingsim.net_simulation_pandapipes.controllers import BadPointPressureLiftController
+
+# Branch elements without friction and heat loss that still connect the tree (producer connections)
+_CONNECTOR_TABLES = ("flow_control", "valve")
+# Coupling between supply temperature at the consumers and their mass flow: convergence limit [K] and max. passes
+_TEMPERATURE_TOLERANCE_K = 0.01
+_MAX_TEMPERATURE_PASSES = 20
+# Time steps evaluated together; bounds the working arrays to a few MB for a thousand pipes
+_BLOCK_STEPS = 256
+# Smallest temperature spread of a consumer [K], keeps the mass flow finite when the supply cools down
+_MIN_CONSUMER_SPREAD_K = 1.0
+_CP_J_KGK = CP_WATER_KJ_KGK * 1000.0
+# pandapipes default of the ambient_temperature option [K]
+_DEFAULT_AMBIENT_K = 293.15
+
+
+@dataclass
+class FastNetworkResults:
+    """
+    Outcome of :meth:`FastNetworkModel.simulate` (time along the first axis).
+
+    :ivar pump_results: Producer results in the layout of ``calculate_results``.
+    :ivar pipe_mass_flow_kg_s: Pipe mass flows, positive from ``from_junction`` to ``to_junction`` [kg/s].
+    :ivar pipe_heat_loss_w: Heat loss of every pipe [W].
+    :ivar consumer_mass_flow_kg_s: Heat consumer mass flows [kg/s].
+    :ivar consumer_supply_temperature: Supply temperature at the heat consumers [°C].
+    :ivar consumer_dp_bar: Differential pressure across the heat consumers [bar].
+    :ivar seconds: Wall-clock time of the evaluation [s].
+    """
+
+    pump_results: dict[str, dict[int, dict[str, np.ndarray]]]
+    pipe_mass_flow_kg_s: np.ndarray
+    pipe_heat_loss_w: np.ndarray
+    consumer_mass_flow_kg_s: np.ndarray
+    consumer_supply_temperature: np.ndarray
+    consumer_dp_bar: np.ndarray
+    seconds: float = 0.0
+
+    @property
+    def heat_loss_kW(self) -> np.ndarray:
+        """Total pipe heat loss per time step [kW]."""
+        return self.pipe_heat_loss_w.sum(axis=1) / 1000.0
+
+
+def _spanning_tree(root: int, adjacency: dict[int, list[tuple[int, int]]]) -> tuple[list[int], dict[int, int]]:
+    """
+    Breadth-first tree of the junctions reachable from ``root``.
+
+    :param root: Start junction
+    :type root: int
+    :param adjacency: ``junction -> [(branch position, neighbour junction), ...]``
+    :type adjacency: Dict[int, List[Tuple[int, int]]]
+    :return: ``(order, parent_branch)`` — junctions in BFS order and the branch leading to each
+        junction from its parent (-1 for the root)
+    :rtype: Tuple[List[int], Dict[int, int]]
+    :raises ValueError: If the reachable part contains a loop
+    """
+    order, parent_branch = [root], {root: -1}
+    queue = deque([root])
+    while queue:
+        node = queue.popleft()
+        for branch, neighbour in adjacency.get(node, ()):
+            if branch == parent_branch[node]:
+                continue
+            if neighbour in parent_branch:
+                raise ValueError(f"Network is meshed (loop closed at junction {neighbour}); needs a radial network.")
+            parent_branch[neighbour] = branch
+            order.append(neighbour)
+            queue.append(neighbour)
+    return order, parent_branch
+
+
+@dataclass
+class _TreeIndex:
+    """
+    Array form of a tree for sums over all time steps at once.
+
+    Positions are the junctions in breadth-first order (root = 0), so every depth level is a
+    contiguous run of positions. Sums along the tree are sparse products: ``behind`` adds the
+    taps downstream of every position (the flows), its transpose ``path`` adds the positions on
+    the way from the root to every tap (the pressure drops). Per level, ``children`` adds the
+    junctions to their parents on the level above, for the mixing of the return flows.
+
+    :ivar branches: Branch above every position (-1 for the root).
+    :ivar parents: Parent position of every position (-1 for the root).
+    :ivar levels: Per depth level below the root: ``(positions, positions of the level above, children)``.
+    :ivar taps: Position of every tap junction.
+    :ivar tap_matrix: Sparse ``positions × taps`` incidence of the taps.
+    :ivar behind: Sparse ``positions × taps``, 1 where the tap lies downstream of the branch above the position.
+    :ivar path: Sparse ``taps × positions``, transpose of ``behind``.
+    """
+
+    branches: np.ndarray
+    parents: np.ndarray
+    levels: list[tuple[slice, slice, csr_matrix]]
+    taps: np.ndarray
+    tap_matrix: csr_matrix
+    behind: csr_matrix
+    path: csr_matrix
+
+    @classmethod
+    def from_tree(cls, root: int, tree: list[tuple[int, int, int]], tap_nodes: np.ndarray) -> "_TreeIndex":
+        position = {root: 0}
+        for node, _, _ in tree:
+            position[node] = len(position)
+        n_positions = len(position)
+        branches = np.array([-1] + [branch for _, branch, _ in tree], dtype=int)
+        parents = np.array([-1] + [position[parent] for _, _, parent in tree], dtype=int)
+        depth = np.zeros(n_positions, dtype=int)
+        for pos in range(1, n_positions):
+            depth[pos] = depth[parents[pos]] + 1
+        bounds = [0, *(np.flatnonzero(np.diff(depth)) + 1).tolist(), n_positions]
+        levels = []
+        for above, start, stop in zip(bounds[:-2], bounds[1:-1], bounds[2:], strict=True):
+            children = csr_matrix(
+                (np.ones(stop - start), (parents[start:stop] - above, np.arange(stop - start))),
+                shape=(start - above, stop - start),
+            )
+            levels.append((slice(start, stop), slice(above, start), children))
+        taps = np.array([position[int(node)] for node in tap_nodes], dtype=int)
+        shape = (n_positions, len(taps))
+        tap_matrix = csr_matrix((np.ones(len(taps)), (taps, np.arange(len(taps)))), shape=shape)
+        # Walk all taps up to the root at once, one level per step
+        rows, columns = [], []
+        current, tap_ids = taps, np.arange(len(taps))
+        while len(current):
+            below_root = current > 0
+            current, tap_ids = current[below_root], tap_ids[below_root]
+            rows.append(current)
+            columns.append(tap_ids)
+            current = parents[current]
+        rows, columns = np.concatenate(rows), np.concatenate(columns)
+        behind = csr_matrix((np.ones(len(rows)), (rows, columns)), shape=shape)
+        return cls(branches, parents, levels, taps, tap_matrix, behind, behind.T.tocsr())
+
+    def gather_taps(self, tap_values: np.ndarray) -> np.ndarray:
+        """Sum of the values of the taps at every position (zero without a tap)."""
+        return np.asarray(self.tap_matrix @ tap_values)
+
+    def subtree_sum(self, tap_values: np.ndarray) -> np.ndarray:
+        """Sum of the values of the taps downstream of every position (zero at the root)."""
+        return np.asarray(self.behind @ tap_values)
+
+    def path_sum(self, branch_values: np.ndarray) -> np.ndarray:
+        """Sum of ``branch_values`` along the path from the root to every tap."""
+        return np.asarray(self.path @ branch_values[self.branches])
+
+
+def _integer_power(values: np.ndarray, exponent: int) -> np.ndarray:
+    """``values ** exponent`` for a positive integer exponent by repeated squaring (faster than ``np.power``)."""
+    result = None
+    square = values
+    while True:
+        if exponent & 1:
+            result = square.copy() if result is None else np.multiply(result, square, out=result)
+        exponent >>= 1
+        if not exponent:
+            return result
+        square = square * square
+
+
+class FastNetworkModel:
+    """
+    Vectorized steady-state model of a radial district heating network.
+
+    :param net: Initialized pandapipes network with design results (``res_*`` of the
+        initialization pipeflow)
+    :type net: pandapipes.pandapipesNet
+
+    :ivar n_pipes: Number of pipes (rows of ``net.pipe``)
+    :vartype n_pipes: int
+    :ivar n_consumers: Number of heat consumers (rows of ``net.heat_consumer``)
+    :vartype n_consumers: int
+
+    .. note::
+       Out-of-service pipes and consumers carry no flow. Taps are the heat consumers
+       followed by the secondary producers (``circ_pump_mass``); both connect a supply
+       junction with a return junction.
+    """
+
+    def __init__(self, net):
+        self.net = net
+        pumps = net.circ_pump_pressure[net.circ_pump_pressure.in_service]
+        if len(pumps) != 1:
+            raise ValueError(f"Fast network model needs exactly one main producer, found {len(pumps)}.")
+        self.pump_index = pumps.index[0]
+        supply_root = self._supply_root = int(pumps.flow_junction.iloc[0])
+        return_root = self._return_root = int(pumps.return_junction.iloc[0])
+
+        # Branches: all pipes (by position in net.pipe) followed by in-service connectors
+        pipes = net.pipe
+        self.n_pipes = len(pipes)
+        from_junction = list(pipes.from_junction.astype(int))
+        to_junction = list(pipes.to_junction.astype(int))
+        active = list(pipes.in_service.astype(bool))
+        for table in _CONNECTOR_TABLES:
+            if table in net and len(net[table]):
+                from_junction += list(net[table].from_junction.astype(int))
+                to_junction += list(net[table].to_junction.astype(int))
+                in_service = net[table].in_service.astype(bool)
+                if "opened" in net[table]:
+                    in_service &= net[table].opened.astype(bool)
+                active += list(in_service)
+        n_branches = len(from_junction)
+
+        adjacency: dict[int, list[tuple[int, int]]] = {}
+        for branch, (a, b, in_service) in enumerate(zip(from_junction, to_junction, active, strict=True)):
+            if in_service:
+                adjacency.setdefault(a, []).append((branch, b))
+                adjacency.setdefault(b, []).append((branch, a))
+        supply_order, self._supply_parent = _spanning_tree(supply_root, adjacency)
+        return_order, self._return_parent = _spanning_tree(return_root, adjacency)
+        if return_root in self._supply_parent:
+            raise ValueError("Supply and return side are connected by branches; needs separate trees.")
+
+        # Taps: heat consumers, then secondary producers
+        consumers = net.heat_consumer
+        self.n_consumers = len(consumers)
+        self._consumer_active = consumers.in_service.to_numpy(dtype=bool)
+        producers = net.circ_pump_mass if "circ_pump_mass" in net else None
+        self.producer_indices = [] if producers is None else list(producers.index)
+        supply_nodes = list(consumers.from_junction.astype(int))
+        return_nodes = list(consumers.to_junction.astype(int))
+        if producers is not None:
+            supply_nodes += list(producers.flow_junction.astype(int))
+            return_nodes += list(producers.return_junction.astype(int))
+        self._tap_supply = np.array(supply_nodes, dtype=int)
+        self._tap_return = np.array(return_nodes, dtype=int)
+
+        for tap, (s, r) in enumerate(zip(supply_nodes, return_nodes, strict=True)):
+            for node, tree in ((s, self._supply_parent), (r, self._return_parent)):
+                if node not in tree:
+                    raise ValueError(f"Tap {tap} (junction {node}) is not connected to the main producer.")
+
+        # Tree branches in BFS order as (junction, branch above it, parent junction); the direction of the
+        # tree flow relative to from -> to (supply: away from the producer, return: towards it)
+        self._direction = np.zeros(n_branches)
+        self._supply_tree, self._return_tree = [], []
+        for order, tree, outwards, branches in (
+            (supply_order, self._supply_parent, True, self._supply_tree),
+            (return_order, self._return_parent, False, self._return_tree),
+        ):
+            for node in order[1:]:
+                branch = tree[node]
+                downstream_is_to = to_junction[branch] == node
+                parent = from_junction[branch] if downstream_is_to else to_junction[branch]
+                branches.append((node, branch, parent))
+                self._direction[branch] = 1.0 if downstream_is_to == outwards else -1.0
+
+        self._supply_index = _TreeIndex.from_tree(supply_root, self._supply_tree, self._tap_supply)
+        self._return_index = _TreeIndex.from_tree(return_root, self._return_tree, self._tap_return)
+        # Return water enters at the consumers only
+        self._return_inflow = self._return_index.tap_matrix[:, : self.n_consumers]
+
+        self._setup_pipe_parameters()
+        # Soil temperature above every supply junction (root: 0 °C) and its step from the parent
+        supply_index = self._supply_index
+        self._supply_soil = np.append(0.0, self._soil_temperature[supply_index.branches[1:]])
+        self._supply_soil_shift = np.append(0.0, self._supply_soil[supply_index.parents[1:]] - self._supply_soil[1:])
+        self._calibrate_design_state(supply_root, return_root)
+
+    @property
+    def trees(self) -> dict[str, list[tuple[int, int, int]]]:
+        """
+        Supply and return tree as ``(junction, branch, parent junction)`` in breadth-first order.
+
+        Branches are the pipe positions followed by the connectors (``flow_control``, ``valve``).
+        """
+        return {"supply": self._supply_tree, "return": self._return_tree}
+
+    def _setup_pipe_parameters(self) -> None:
+        """Friction coefficient, heat transfer and soil temperature of every branch (connectors: none)."""
+        pipes = self.net.pipe
+        n_branches = len(self._direction)
+        inner = pipes.inner_diameter_mm.to_numpy(dtype=float) / 1000.0
+        outer = inner.copy()
+        if "outer_diameter_mm" in pipes:
+            values = pipes.outer_diameter_mm.to_numpy(dtype=float) / 1000.0
+            outer = np.where(np.isnan(values), inner, values)
+        length = pipes.length_km.to_numpy(dtype=float) * 1000.0
+
+        res = self.net.res_pipe
+        friction = res["lambda"].to_numpy(dtype=float)
+        # Pipes without design flow: fully rough limit of Colebrook
+        rough = 0.25 / np.log10(pipes.k_mm.to_numpy(dtype=float) / 1000.0 / (3.7 * inner)) ** 2
+        friction = np.where(np.isfinite(friction) & (friction > 0), friction, rough)
+        mean_temperature = (res.t_from_k.to_numpy(dtype=float) + res.t_to_k.to_numpy(dtype=float)) / 2
+        mean_temperature = np.where(np.isfinite(mean_temperature), mean_temperature, 333.15)
+        density = np.asarray(self.net.fluid.get_density(mean_temperature), dtype=float)
+        area = np.pi * inner**2 / 4
+        zeta = friction * length / inner + pipes.loss_coefficient.to_numpy(dtype=float)
+
+        # dp [bar] = resistance · mdot · |mdot|
+        self._resistance = np.zeros(n_branches)
+        self._resistance[: self.n_pipes] = zeta / (2 * density * area**2) / 1e5
+        # W/K of the whole pipe, split into its sections as in pandapipes
+        self._conductance = np.zeros(n_branches)
+        self._conductance[: self.n_pipes] = pipes.u_w_per_m2k.to_numpy(dtype=float) * np.pi * outer * length
+        self._sections = np.ones(n_branches)
+        self._sections[: self.n_pipes] = pipes.sections.to_numpy(dtype=float)
+        self._soil_temperature = np.zeros(n_branches)
+        # Missing soil temperature: pandapipes uses the ambient temperature of the last pipeflow
+        ambient = getattr(self.net, "_options", {}).get("ambient_temperature", _DEFAULT_AMBIENT_K)
+        soil = pipes.text_k.to_numpy(dtype=float)
+        self._soil_temperature[: self.n_pipes] = np.where(np.isnan(soil), ambient, soil) - KELVIN_OFFSET
+        inactive = ~pipes.in_service.to_numpy(dtype=bool)
+        self._resistance[: self.n_pipes][inactive] = 0.0
+        self._conductance[: self.n_pipes][inactive] = 0.0
+        # Heat capacity flow per section [kg/s] at which the excess temperature halves per section
+        self._capacity = self._conductance / (self._sections * _CP_J_KGK)
+
+    def _calibrate_design_state(self, supply_root: int, return_root: int) -> None:
+        """Static pressure offsets per tap and pump settings from the design results."""
+        pressure = self.net.res_junction.p_bar
+        design_flow = np.zeros(len(self._direction))
+        design_flow[: self.n_pipes] = np.nan_to_num(self.net.res_pipe.mdot_from_kg_per_s.to_numpy(dtype=float))
+        # Pressure drops in tree direction, so signs follow the design flow direction
+        design_dp = self._resistance * design_flow * np.abs(design_flow) * self._direction
+        supply_loss = self._supply_index.path_sum(design_dp)
+        return_loss = self._return_index.path_sum(design_dp)
+
+        self.design_flow_pressure = float(pressure.at[supply_root])
+        self.design_return_pressure = float(pressure.at[return_root])
+        self._supply_offset = pressure.loc[self._tap_supply].to_numpy() - (self.design_flow_pressure - supply_loss)
+        self._return_offset = pressure.loc[self._tap_return].to_numpy() - (self.design_return_pressure + return_loss)
+
+        self.bad_point_controller = None
+        for ctrl, in_service in zip(self.net.controller.object, self.net.controller.in_service, strict=True):
+            if (
+                in_service
+                and isinstance(ctrl, BadPointPressureLiftController)
+                and ctrl.circ_pump_pressure_idx == self.pump_index
+            ):
+                self.bad_point_controller = ctrl
+
+    @staticmethod
+    def _subtree_sum(index: _TreeIndex, tap_flow: np.ndarray, out: np.ndarray) -> None:
+        """Sum the tap flows behind every tree branch into ``out`` (leaves first)."""
+        out[index.branches[1:]] = index.subtree_sum(tap_flow)[1:]
+
+    def _decay(self, branches: np.ndarray, mass_flow: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Ratio of outlet to inlet excess temperature over soil per branch (sectioned balance, 0 without flow).
+
+        :param branches: Branch positions (rows of ``mass_flow``)
+        :param mass_flow: Mass flow magnitude (branches × time steps) [kg/s]
+        :param out: Array of the same shape for the result, None allocates one
+        :return: ``out`` or a new array
+        """
+        capacity = self._capacity[branches]
+        ratio = np.add(mass_flow, capacity[:, None], out=out)
+        # Lossless branches (connectors) pass the temperature on, with or without flow
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.divide(mass_flow, ratio, out=ratio)
+        ratio[capacity == 0.0] = 1.0
+        sections = self._sections[branches].astype(int)
+        for count in np.unique(sections[sections > 1]):
+            rows = sections == count
+            ratio[rows] = _integer_power(ratio[rows], int(count))
+        return ratio
+
+    def _supply_side(self, flow: np.ndarray, supply: np.ndarray) -> np.ndarray:
+        """
+        Propagate the supply temperature from the producer along the supply tree.
+
+        :param flow: Mass flow into every supply tree position (positions × time steps) [kg/s]
+        :param supply: Supply temperature of the producer per time step [°C]
+        :return: Temperature at every supply tree position (positions × time steps) [°C]
+        """
+        index = self._supply_index
+        magnitude = np.abs(flow) if self.producer_indices else flow
+        # Excess over the soil of the branch above every junction: the decay times the excess at the parent
+        excess = np.empty_like(flow)
+        excess[0] = supply
+        self._decay(index.branches[1:], magnitude[1:], out=excess[1:])
+        for level, _, _ in index.levels:
+            inlet = np.take(excess, index.parents[level], axis=0)
+            shift = self._supply_soil_shift[level]
+            if shift.any():
+                inlet += shift[:, None]
+            excess[level] *= inlet
+        excess += self._supply_soil[:, None]
+        return excess
+
+    def _return_side(
+        self, branch_flow: np.ndarray, consumer_flow: np.ndarray, consumer_return: np.ndarray, loss: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Mix the consumer return flows towards the producer; fills ``loss`` of the return branches.
+
+        :param branch_flow: Branch mass flows in tree direction (branches × time steps) [kg/s]
+        :param consumer_flow: Consumer mass flows (consumers × time steps) [kg/s]
+        :param consumer_return: Consumer return temperatures (consumers × time steps) [°C]
+        :param loss: Heat loss of every branch (branches × time steps) [W]
+        :return: Return temperature at the main producer and at the secondary producers [°C], NaN without inflow
+        """
+        index = self._return_index
+        branches = index.branches
+        # Only the consumers feed return water in; secondary producers draw it off
+        mass = np.asarray(self._return_inflow @ consumer_flow)
+        enthalpy = np.asarray(self._return_inflow @ (consumer_flow * consumer_return))
+        flow = np.abs(branch_flow[branches])
+        flow[0] = 0.0
+        decay = self._decay(branches, flow)
+        soil = self._soil_temperature[branches][:, None]
+
+        # Leaves first: every junction has received all inflows when its level is reached
+        for level, above, children in reversed(index.levels):
+            excess = np.empty_like(enthalpy[level])
+            excess[:] = soil[level]
+            np.divide(enthalpy[level], mass[level], out=excess, where=mass[level] > 1e-9)
+            excess -= soil[level]
+            loss[branches[level]] = _CP_J_KGK * flow[level] * excess * (1.0 - decay[level])
+            excess *= decay[level]
+            excess += soil[level]
+            excess *= flow[level]
+            enthalpy[above] += children @ excess
+            mass[above] += children @ flow[level]
+        producers = np.append(0, index.taps[self.n_consumers :])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mixed = np.where(mass[producers] > 1e-9, enthalpy[producers] / mass[producers], np.nan)
+        return mixed[0], mixed[1:]
+
+    def _solve_block(
+        self,
+        qext: np.ndarray,
+        supply: np.ndarray,
+        treturn: np.ndarray,
+        producer_flow: np.ndarray,
+        demand: np.ndarray,
+        branch_flow: np.ndarray,
+        loss: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Consumer flows and supply temperatures of a block of time steps (fixed point per time step).
+
+        Fills ``branch_flow`` of both trees and ``loss`` of the supply branches (branches × time steps).
+
+        :return: Consumer mass flows [kg/s] and supply temperatures at the consumers [°C] (consumers × time steps)
+        """
+        index = self._supply_index
+        consumer_taps = index.taps[: self.n_consumers]
+        # Idle consumers sit at soil temperature; only the active ones set the flows
+        idle = None if demand.all() else ~demand
+        heat_capacity_flow = qext / _CP_J_KGK
+        consumer_supply = np.array(np.broadcast_to(supply, qext.shape))
+        consumer_flow = np.empty_like(qext)
+        tap_flow = consumer_flow
+        if len(producer_flow):
+            tap_flow = np.vstack([consumer_flow, -producer_flow])
+            consumer_flow = tap_flow[: self.n_consumers]
+        # Every time step is its own fixed point: converged ones keep their flows, so their step stays zero
+        pending = True
+        for _ in range(_MAX_TEMPERATURE_PASSES):
+            spread = np.subtract(consumer_supply, treturn)
+            np.maximum(spread, _MIN_CONSUMER_SPREAD_K, out=spread)
+            np.divide(heat_capacity_flow, spread, out=consumer_flow, where=pending)
+            # Supply tree per position: mass flow from the parent and temperature
+            flow = index.subtree_sum(tap_flow)
+            temperature = self._supply_side(flow, supply)
+            reached = temperature[consumer_taps]
+            step = reached - consumer_supply
+            if idle is not None:
+                step[idle] = 0.0
+            converged = np.abs(step).max(axis=0, initial=0.0) < _TEMPERATURE_TOLERANCE_K
+            # More flow cools less: the drop scales with the spread, so d(reached)/d(supply) = -drop/spread.
+            # Newton weight spread / (spread + drop) against the oscillation, at most a full step
+            weight = np.subtract(supply, reached, out=reached)
+            np.maximum(weight, 0.0, out=weight)
+            weight += spread
+            np.divide(spread, weight, out=weight)
+            weight[:, converged] = 1.0
+            step *= weight
+            consumer_supply += step
+            if converged.all():
+                break
+            pending = ~converged
+
+        branches = index.branches[1:]
+        branch_flow[branches] = flow[1:]
+        temperature[1:] -= np.take(temperature, index.parents[1:], axis=0)
+        loss[branches] = -_CP_J_KGK * np.abs(flow[1:]) * temperature[1:]
+        self._subtree_sum(self._return_index, tap_flow, branch_flow)
+        return consumer_flow, consumer_supply
+
+    def _pressures(self, branch_flow: np.ndarray, demand: np.ndarray) -> tuple[np.ndarray, ...]:
+        """
+        Pump lift and tap pressures of a block of time steps; friction scales with ``mdot²``.
+
+        :param branch_flow: Branch mass flows in tree direction (branches × time steps) [kg/s]
+        :param demand: Consumers with heat demand (consumers × time steps)
+        :return: Pump lift and return pressure of the main producer, supply and return pressure at the taps [bar]
+        """
+        branch_dp = np.abs(branch_flow)
+        branch_dp *= branch_flow
+        branch_dp *= self._resistance[:, None]
+        supply_drop = self._supply_index.path_sum(branch_dp)
+        supply_drop -= self._supply_offset[:, None]
+        return_rise = self._return_index.path_sum(branch_dp)
+        return_rise += self._return_offset[:, None]
+        n_steps = branch_flow.shape[1]
+        plift = np.full(n_steps, self.design_flow_pressure - self.design_return_pressure)
+        return_pressure = np.full(n_steps, self.design_return_pressure)
+        controller = self.bad_point_controller
+        if controller is not None:
+            # Bad point: the consumer with the largest path loss gets exactly the target differential pressure
+            path_loss = supply_drop[: self.n_consumers] + return_rise[: self.n_consumers]
+            worst = np.max(np.where(demand, path_loss, -np.inf), axis=0)
+            standby = ~demand.any(axis=0)
+            plift = np.where(standby, controller.min_plift, controller.target_dp_min_bar + worst)
+            return_pressure = np.where(standby, controller.min_pflow - controller.min_plift, return_pressure)
+        np.subtract(return_pressure + plift, supply_drop, out=supply_drop)
+        return_rise += return_pressure
+        return plift, return_pressure, supply_drop, return_rise
+
+    def pipe_mass_flows(
+        self, consumer_mass_flow: np.ndarray, producer_mass_flow: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Pipe mass flows of one state, summed leaves-first over the supply and return trees.
+
+        :param consumer_mass_flow: Mass flow of every heat consumer [kg/s]
+        :type consumer_mass_flow: np.ndarray
+        :param producer_mass_flow: Secondary producer mass flows (``circ_pump_mass`` rows) [kg/s], None uses
+            ``mdot_flow_kg_per_s`` of the table
+        :type producer_mass_flow: Optional[np.ndarray]
+        :return: Mass flow of every pipe, positive from ``from_junction`` to ``to_junction`` [kg/s]
+        :rtype: np.ndarray
+        """
+        consumer_flow = np.where(self._consumer_active, np.asarray(consumer_mass_flow, dtype=float), 0.0)
+        if producer_mass_flow is None:
+            producer_mass_flow = (
+                self.net.circ_pump_mass.mdot_flow_kg_per_s.to_numpy(dtype=float) if self.producer_indices else []
+            )
+        tap_flow = np.concatenate([consumer_flow, -np.asarray(producer_mass_flow, dtype=float)])
+        branch_flow = np.zeros(len(self._direction))
+        # The trees share no branch, so both sums fill the same array
+        self._subtree_sum(self._supply_index, tap_flow, branch_flow)
+        self._subtree_sum(self._return_index, tap_flow, branch_flow)
+        return (branch_flow * self._direction)[: self.n_pipes]
+
+    def simulate(
+        self,
+        qext_w: np.ndarray,
+        supply_temperature: np.ndarray | float,
+        return_temperature: np.ndarray | None = None,
+        producer_mass_flow: np.ndarray | None = None,
+    ) -> FastNetworkResults:
+        """
+        Evaluate all time steps.
+
+        :param qext_w: Heat demand (time × consumers) [W]
+        :type qext_w: np.ndarray
+        :param supply_temperature: Supply temperature of the producers per time step or constant [°C]
+        :type supply_temperature: Union[np.ndarray, float]
+        :param return_temperature: Consumer return temperatures (time × consumers) [°C], None uses
+            ``net.heat_consumer.treturn_k``
+        :type return_temperature: Optional[np.ndarray]
+        :param producer_mass_flow: Secondary producer mass flows (time × ``circ_pump_mass`` rows) [kg/s],
+            None uses ``mdot_flow_kg_per_s`` of the table
+        :type producer_mass_flow: Optional[np.ndarray]
+        :return: Producer, pipe and consumer results
+        :rtype: FastNetworkResults
+        """
+        start = time.perf_counter()
+        qext = np.asarray(qext_w, dtype=float)
+        if qext.ndim != 2 or qext.shape[1] != self.n_consumers:
+            raise ValueError(f"qext_w must have shape (time steps, {self.n_consumers}), got {qext.shape}.")
+        # Consumers × time, contiguous along time for the per-branch array operations
+        qext = np.ascontiguousarray(np.where(self._consumer_active, qext, 0.0).T)
+        n_steps = qext.shape[1]
+        supply = np.broadcast_to(np.asarray(supply_temperature, dtype=float), (n_steps,))
+        if return_temperature is None:
+            treturn = (self.net.heat_consumer.treturn_k.to_numpy(dtype=float) - KELVIN_OFFSET)[:, None]
+        else:
+            treturn = np.ascontiguousarray(np.asarray(return_temperature, dtype=float).T)
+        treturn = np.broadcast_to(treturn, qext.shape)
+        n_producers = len(self.producer_indices)
+        if producer_mass_flow is None:
+            producer_flow = (
+                self.net.circ_pump_mass.mdot_flow_kg_per_s.to_numpy(dtype=float)[:, None] if n_producers else 0
+            )
+        else:
+            producer_flow = np.ascontiguousarray(np.asarray(producer_mass_flow, dtype=float).T)
+        producer_flow = np.broadcast_to(producer_flow, (n_producers, n_steps))
+
+        demand = qext > 0
+        consumer_flow, consumer_supply, consumer_dp = np.empty_like(qext), np.empty_like(qext), np.empty_like(qext)
+        branch_flow = np.zeros((len(self._direction), n_steps))
+        loss = np.zeros_like(branch_flow)
+        main_return, plift, return_pressure = np.empty(n_steps), np.empty(n_steps), np.empty(n_steps)
+        producer_return, producer_supply_pressure, producer_return_pressure = (
+            np.empty((n_producers, n_steps)) for _ in range(3)
+        )
+        producer_taps = slice(self.n_consumers, None)
+        # Blocks of time steps keep the working arrays in the cache
+        for first in range(0, n_steps, _BLOCK_STEPS):
+            block = slice(first, first + _BLOCK_STEPS)
+            flows, losses = branch_flow[:, block], loss[:, block]
+            consumer_flow[:, block], consumer_supply[:, block] = self._solve_block(
+                qext[:, block],
+                supply[block],
+                treturn[:, block],
+                producer_flow[:, block],
+                demand[:, block],
+                flows,
+                losses,
+            )
+            main_return[block], producer_return[:, block] = self._return_side(
+                flows, consumer_flow[:, block], treturn[:, block], losses
+            )
+            plift[block], return_pressure[block], tap_supply_pressure, tap_return_pressure = self._pressures(
+                flows, demand[:, block]
+            )
+            consumer_dp[:, block] = tap_supply_pressure[: self.n_consumers] - tap_return_pressure[: self.n_consumers]
+            producer_supply_pressure[:, block] = tap_supply_pressure[producer_taps]
+            producer_return_pressure[:, block] = tap_return_pressure[producer_taps]
+            flows *= self._direction[:, None]
+        flow_pressure = return_pressure + plift
+
+        main_flow = consumer_flow.sum(axis=0) - producer_flow.sum(axis=0)
+        main_return = np.where(np.isnan(main_return), supply, main_return)
+        pump_results = {
+            "Heizentrale Haupteinspeisung": {
+                self.pump_index: {
+                    "mass_flow": main_flow,
+                    "flow_pressure": flow_pressure,
+                    "return_pressure": return_pressure,
+                    "deltap": plift,
+                    "return_temp": main_return,
+                    "flow_temp": supply.copy(),
+                    "qext_kW": main_flow * CP_WATER_KJ_KGK * (supply - main_return),
+                }
+            },
+            "weitere Einspeisung": {},
+        }
+        producer_return = np.where(np.isnan(producer_return), supply, producer_return)
+        for position, index in enumerate(self.producer_indices):
+            pump_results["weitere Einspeisung"][index] = {
+                "mass_flow": producer_flow[position].copy(),
+                "flow_pressure": producer_supply_pressure[position],
+                "return_pressure": producer_return_pressure[position],
+                "deltap": producer_supply_pressure[position] - producer_return_pressure[position],
+                "return_temp": producer_return[position],
+                "flow_temp": supply.copy(),
+                "qext_kW": producer_flow[position] * CP_WATER_KJ_KGK * (supply - producer_return[position]),
+            }
+
+        pipes = slice(0, self.n_pipes)
+        return FastNetworkResults(
+            pump_results=pump_results,
+            pipe_mass_flow_kg_s=branch_flow[pipes].T,
+            pipe_heat_loss_w=loss[pipes].T,
+            consumer_mass_flow_kg_s=consumer_flow.T,
+            consumer_supply_temperature=consumer_supply.T,
+            consumer_dp_bar=consumer_dp.T,
+            seconds=time.perf_counter() - start,
+        )
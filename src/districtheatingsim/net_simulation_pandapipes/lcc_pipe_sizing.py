@@ -0,0 +1,448 @@
+"""
+Life-cycle-cost-optimal pipe sizing for radial networks.
+=========================================================
+
+Velocity-limit sizing (``init_diameter_types``, ``optimize_diameter_types``) picks the
+smallest bore that keeps ``v_max`` and ignores what a bore costs over its life: a larger
+pipe costs more to build and loses more heat through its larger surface, a smaller one
+needs more pumping energy. :func:`optimize_lcc_diameter_types` chooses the std-type of
+every pipe by the annuity of all three, evaluated over the load duration curve of the
+year:
+
+* **Load classes** — the hours are sorted by total heat demand and grouped into
+  ``n_load_classes`` classes (the peak hour is a class of its own). The quasi-static
+  :class:`~districtheatingsim.net_simulation_pandapipes.fast_network_model.FastNetworkModel`
+  evaluates the class means in one vectorized call: pipe mass flows and heat losses.
+* **Cost per pipe and type** — investment ``(base + slope · d_inner) · length`` as
+  capital annuity (VDI 2067, :func:`~districtheatingsim.utilities.annuity.annuity`);
+  heat loss scaled from the modelled loss with ``u · π · d_outer`` of the type; pumping
+  energy ``Σ R · |ṁ|³ / ρ / η`` with the Swamee-Jain friction factor of the type. Both
+  energies are priced with the demand-bound annuity factor.
+* **Selection** — dynamic programming along the supply and return tree, leaves first:
+  for every pipe and every remaining pressure budget the cheapest type of the subtree.
+  Constraints are ``v_max`` at the peak flow of every pipe and the peak pressure loss on
+  every path from the producer, ``max_path_loss_bar`` split evenly between the supply and
+  the return side.
+
+The std-types stay within the insulation grade of each pipe, as in the velocity sizing.
+
+.. note::
+   The flows come from the consumer loads and do not depend on the bores in a tree; the
+   heat loss is linearized at the temperatures of the current network. The pumping energy
+   of a class uses the class mean flows, corrected with the cubic mean of the total demand
+   within the class. The constraints hold at the peak hour of the given profile, which is
+   below the sum of the design loads if not all consumers peak at once. Meshed networks
+   raise ``ValueError`` (see ``FastNetworkModel``).
+
+:author: Dipl.-Ing. (FH) Jonas Pfeiffer
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from districtheatingsim.constants import KELVIN_OFFSET
+from districtheatingsim.net_simulation_pandapipes.adaptive_pipeflow import AdaptivePipeflow
+from districtheatingsim.net_simulation_pandapipes.fast_network_model import FastNetworkModel
+from districtheatingsim.net_simulation_pandapipes.resource_registry import pipe_catalog
+from districtheatingsim.net_simulation_pandapipes.utilities import _insulation_grade, _set_pipe_std_type
+from districtheatingsim.utilities.annuity import annuity
+
+# Laminar below this Reynolds number (friction factor 64 / Re)
+_LAMINAR_REYNOLDS = 2300.0
+
+
+@dataclass
+class LccParameters:
+    """
+    Cost and constraint parameters of the life-cycle-cost sizing.
+
+    :ivar base_cost_eur_per_m: Investment per pipe metre independent of the bore [€/m].
+    :ivar cost_eur_per_m_mm: Investment per pipe metre and mm inner diameter [€/(m·mm)].
+    :ivar lifetime_years: Technical lifetime of the pipes [years].
+    :ivar interest_rate_factor: Interest rate factor (1 + rate).
+    :ivar inflation_rate_factor: Inflation rate factor (1 + rate).
+    :ivar time_period_years: Economic analysis period [years].
+    :ivar heat_price_eur_per_mwh: Price of the lost heat [€/MWh].
+    :ivar electricity_price_eur_per_mwh: Price of the pump electricity [€/MWh].
+    :ivar pump_efficiency: Overall pump efficiency.
+    :ivar v_max: Maximum velocity at the peak flow [m/s].
+    :ivar max_path_loss_bar: Maximum pressure loss from the producer to a consumer and back at the peak [bar].
+    :ivar n_load_classes: Classes of the load duration curve.
+    :ivar pressure_steps: Resolution of the pressure budget per network side.
+    """
+
+    base_cost_eur_per_m: float = 200.0
+    cost_eur_per_m_mm: float = 3.0
+    lifetime_years: int = 40
+    interest_rate_factor: float = 1.05
+    inflation_rate_factor: float = 1.03
+    time_period_years: int = 20
+    heat_price_eur_per_mwh: float = 60.0
+    electricity_price_eur_per_mwh: float = 150.0
+    pump_efficiency: float = 0.6
+    v_max: float = 2.0
+    max_path_loss_bar: float = 2.0
+    n_load_classes: int = 50
+    pressure_steps: int = 200
+
+    @classmethod
+    def from_economic_parameters(cls, economic_parameters: dict, **kwargs) -> "LccParameters":
+        """
+        Parameters with interest, inflation, period and prices from a GUI ``economic_parameters`` mapping.
+
+        :param economic_parameters: Mapping with ``capital_interest_rate``, ``inflation_rate`` (VDI 2067
+            factors), ``time_period``, ``electricity_price`` and optionally ``gas_price`` (price of the lost heat)
+        :type economic_parameters: dict
+        :param kwargs: Further fields of :class:`LccParameters`
+        :return: Parameters
+        :rtype: LccParameters
+        """
+        values = {
+            "interest_rate_factor": economic_parameters["capital_interest_rate"],
+            "inflation_rate_factor": economic_parameters["inflation_rate"],
+            "time_period_years": economic_parameters["time_period"],
+            "electricity_price_eur_per_mwh": economic_parameters["electricity_price"],
+        }
+        if "gas_price" in economic_parameters:
+            values["heat_price_eur_per_mwh"] = economic_parameters["gas_price"]
+        values.update(kwargs)
+        return cls(**values)
+
+    def capital_factor(self) -> float:
+        """Capital-bound annuity per € of investment [1/a]."""
+        return annuity(
+            1.0,
+            self.lifetime_years,
+            0,
+            0,
+            interest_rate_factor=self.interest_rate_factor,
+            inflation_rate_factor=self.inflation_rate_factor,
+            consideration_time_period_years=self.time_period_years,
+        )
+
+    def energy_factor(self) -> float:
+        """Demand-bound annuity per € of first-year energy cost."""
+        return annuity(
+            0.0,
+            self.lifetime_years,
+            0,
+            0,
+            interest_rate_factor=self.interest_rate_factor,
+            inflation_rate_factor=self.inflation_rate_factor,
+            consideration_time_period_years=self.time_period_years,
+            annual_energy_demand=1.0,
+            energy_cost_per_unit=1.0,
+        )
+
+
+@dataclass
+class LccSizingResult:
+    """
+    Outcome of :func:`optimize_lcc_diameter_types`.
+
+    :ivar pipes: Breakdown per pipe (index of ``net.pipe``): chosen ``std_type``, ``inner_diameter_mm``,
+        ``peak_velocity_m_per_s``, ``peak_dp_bar``, ``investment_eur``, ``capital_eur_per_a``,
+        ``heat_loss_mwh_per_a``, ``heat_loss_eur_per_a``, ``pump_energy_mwh_per_a``, ``pump_eur_per_a``
+        and ``total_eur_per_a``.
+    :ivar seconds: Wall-clock time of the sizing without the verification pipeflow [s].
+    """
+
+    pipes: pd.DataFrame
+    seconds: float = 0.0
+
+    @property
+    def total_eur_per_a(self) -> float:
+        """Annuity of the whole network [€/a]."""
+        return float(self.pipes["total_eur_per_a"].sum())
+
+    def summary(self) -> dict[str, float]:
+        """Totals of the breakdown with German labels, as shown in the info panel."""
+        pipes = self.pipes
+        return {
+            "Investition Rohrleitungen [€]": float(pipes["investment_eur"].sum()),
+            "Kapitalkosten [€/a]": float(pipes["capital_eur_per_a"].sum()),
+            "Wärmeverluste [MWh/a]": float(pipes["heat_loss_mwh_per_a"].sum()),
+            "Kosten Wärmeverluste [€/a]": float(pipes["heat_loss_eur_per_a"].sum()),
+            "Pumpenstrom [MWh/a]": float(pipes["pump_energy_mwh_per_a"].sum()),
+            "Kosten Pumpenstrom [€/a]": float(pipes["pump_eur_per_a"].sum()),
+            "Jahreskosten Rohrleitungen [€/a]": self.total_eur_per_a,
+        }
+
+
+def load_classes(
+    qext_w: np.ndarray,
+    supply_temperature: np.ndarray,
+    return_temperature: np.ndarray | None,
+    n_classes: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray | None, np.ndarray, np.ndarray]:
+    """
+    Group the hours of the load duration curve into classes of similar total demand.
+
+    :param qext_w: Heat demand (time × consumers) [W]
+    :type qext_w: np.ndarray
+    :param supply_temperature: Supply temperature per time step [°C]
+    :type supply_temperature: np.ndarray
+    :param return_temperature: Consumer return temperatures (time × consumers) [°C] or None
+    :type return_temperature: Optional[np.ndarray]
+    :param n_classes: Number of classes; the peak hour is the first one
+    :type n_classes: int
+    :return: ``(qext_w, supply, return, hours, cubic_factor)`` per class — class means, number of
+        hours and ``mean(Q³) / mean(Q)³`` of the total demand within the class
+    :rtype: Tuple[np.ndarray, np.ndarray, Optional[np.ndarray], np.ndarray, np.ndarray]
+    """
+    qext = np.asarray(qext_w, dtype=float)
+    supply = np.broadcast_to(np.asarray(supply_temperature, dtype=float), (len(qext),))
+    total = qext.sum(axis=1)
+    order = np.argsort(-total, kind="stable")
+    groups = [order[:1]] + [group for group in np.array_split(order[1:], max(n_classes - 1, 1)) if len(group)]
+
+    class_qext = np.array([qext[group].mean(axis=0) for group in groups])
+    class_supply = np.array([supply[group].mean() for group in groups])
+    class_return = None
+    if return_temperature is not None:
+        treturn = np.broadcast_to(np.asarray(return_temperature, dtype=float), qext.shape)
+        class_return = np.array([treturn[group].mean(axis=0) for group in groups])
+    hours = np.array([len(group) for group in groups], dtype=float)
+    cubic_factor = np.ones(len(groups))
+    for position, group in enumerate(groups):
+        mean = total[group].mean()
+        if mean > 0:
+            cubic_factor[position] = np.mean(total[group] ** 3) / mean**3
+    return class_qext, class_supply, class_return, hours, cubic_factor
+
+
+def _friction_factor(reynolds: np.ndarray, roughness_m: np.ndarray, diameter_m: np.ndarray) -> np.ndarray:
+    """Darcy friction factor: Swamee-Jain, laminar 64 / Re below Re = 2300."""
+    reynolds = np.maximum(reynolds, 1.0)
+    turbulent = 0.25 / np.log10(roughness_m / (3.7 * diameter_m) + 5.74 / reynolds**0.9) ** 2
+    return np.where(reynolds < _LAMINAR_REYNOLDS, 64.0 / reynolds, turbulent)
+
+
+def tree_dynamic_program(
+    tree: list[tuple[int, int, int]], cost: np.ndarray, steps: np.ndarray, budget_steps: int
+) -> dict[int, int]:
+    """
+    Cheapest option per tree branch with a budget on every path from the root.
+
+    :param tree: ``(node, branch, parent node)`` in breadth-first order from the root
+    :type tree: List[Tuple[int, int, int]]
+    :param cost: Cost of every option (branches × options); ``inf`` marks an infeasible option
+    :type cost: np.ndarray
+    :param steps: Budget the option uses, in integer budget steps (branches × options)
+    :type steps: np.ndarray
+    :param budget_steps: Budget of every root-to-leaf path
+    :type budget_steps: int
+    :return: Chosen option per branch of the tree
+    :rtype: Dict[int, int]
+    :raises ValueError: If no choice keeps every path within the budget
+
+    .. note::
+       Leaves first, every node gets the minimum cost of its subtree as a function of the budget
+       left when it is reached (``budget_steps + 1`` values); the choices are then read off from
+       the root. Effort: branches × options × budget steps.
+    """
+    if not tree:
+        return {}
+    budget = np.arange(budget_steps + 1)
+    subtree: dict[int, np.ndarray] = {}
+    choice: dict[int, np.ndarray] = {}
+    for node, branch, parent in reversed(tree):
+        below = subtree.pop(node, np.zeros(budget_steps + 1))
+        remaining = budget[None, :] - steps[branch][:, None]
+        candidates = cost[branch][:, None] + np.where(remaining >= 0, below[np.maximum(remaining, 0)], np.inf)
+        best = candidates.argmin(axis=0)
+        choice[branch] = best
+        subtree[parent] = subtree.get(parent, 0.0) + candidates[best, budget]
+
+    root = tree[0][2]
+    if not np.isfinite(subtree[root][budget_steps]):
+        raise ValueError("No pipe selection keeps the pressure loss of every path within the budget.")
+    left = {root: budget_steps}
+    chosen = {}
+    for node, branch, parent in tree:
+        option = int(choice[branch][left[parent]])
+        chosen[branch] = option
+        left[node] = left[parent] - int(steps[branch][option])
+    return chosen
+
+
+def optimize_lcc_diameter_types(
+    net,
+    qext_w: np.ndarray,
+    supply_temperature: np.ndarray | float,
+    return_temperature: np.ndarray | None = None,
+    parameters: LccParameters | None = None,
+    material_filter: str = "P235GH/PUR/PEHD",
+    k: float = 0.1,
+    verify: bool = True,
+) -> LccSizingResult:
+    """
+    Choose the std-type of every pipe of a radial network by its life-cycle cost.
+
+    :param net: Initialized pandapipes network with design results (see ``FastNetworkModel``)
+    :type net: pandapipes.pandapipesNet
+    :param qext_w: Heat demand of the year (time × consumers) [W]
+    :type qext_w: np.ndarray
+    :param supply_temperature: Supply temperature per time step or constant [°C]
+    :type supply_temperature: Union[np.ndarray, float]
+    :param return_temperature: Consumer return temperatures (time × consumers) [°C], None uses
+        ``net.heat_consumer.treturn_k``
+    :type return_temperature: Optional[np.ndarray]
+    :param parameters: Cost and constraint parameters, None uses the defaults
+    :type parameters: Optional[LccParameters]
+    :param material_filter: Pipe material filter for standard types
+    :type material_filter: str
+    :param k: Pipe roughness [mm]
+    :type k: float
+    :param verify: Solve the network with the chosen types (pipeflow + control)
+    :type verify: bool
+    :return: Per-pipe cost breakdown; the chosen types are set in ``net``
+    :rtype: LccSizingResult
+    :raises ValueError: If the network is meshed or the constraints cannot be met
+    """
+    parameters = parameters or LccParameters()
+    start = time.perf_counter()
+    catalog = pipe_catalog(net, material_filter)
+    model = FastNetworkModel(net)
+    n_pipes = model.n_pipes
+
+    qext = np.asarray(qext_w, dtype=float)
+    supply = np.broadcast_to(np.asarray(supply_temperature, dtype=float), (len(qext),))
+    class_qext, class_supply, class_return, hours, cubic_factor = load_classes(
+        qext, supply, return_temperature, parameters.n_load_classes
+    )
+    if class_return is None:
+        class_return = (net.heat_consumer.treturn_k.to_numpy(dtype=float) - KELVIN_OFFSET)[None, :]
+    results = model.simulate(class_qext, class_supply, class_return)
+    mass_flow = np.abs(results.pipe_mass_flow_kg_s)
+    peak_flow = mass_flow.max(axis=0)
+    # Σ hours · |ṁ|³ [kg³/s³ · h] and the flow with the same cubic mean
+    cubed_flow_hours = (hours * cubic_factor) @ mass_flow**3
+    energy_flow = np.cbrt(cubed_flow_hours / hours.sum())
+    loss_wh = hours @ results.pipe_heat_loss_w
+
+    pipes = net.pipe
+    length_m = pipes.length_km.to_numpy(dtype=float) * 1000.0
+    res = net.res_pipe
+    mean_temperature = (res.t_from_k.to_numpy(dtype=float) + res.t_to_k.to_numpy(dtype=float)) / 2
+    mean_temperature = np.where(np.isfinite(mean_temperature), mean_temperature, 333.15)
+    density = np.asarray(net.fluid.get_density(mean_temperature), dtype=float)
+    viscosity = np.asarray(net.fluid.get_viscosity(mean_temperature), dtype=float)
+    # Kelvin-hours of excess temperature over the soil, from the loss of the current pipe
+    inner_m = pipes.inner_diameter_mm.to_numpy(dtype=float) / 1000.0
+    outer_m = inner_m.copy()
+    if "outer_diameter_mm" in pipes:
+        values = pipes.outer_diameter_mm.to_numpy(dtype=float) / 1000.0
+        outer_m = np.where(np.isnan(values), inner_m, values)
+    conductance = pipes.u_w_per_m2k.to_numpy(dtype=float) * np.pi * outer_m * length_m
+    excess_kelvin_hours = np.divide(loss_wh, conductance, out=np.zeros(n_pipes), where=conductance > 0)
+
+    # Options per pipe: the bores of its insulation grade, padded with infeasible entries
+    ladders = [catalog.ladders.get(_insulation_grade(str(std_type))) for std_type in pipes.std_type]
+    all_types = list(catalog.table.sort_values("inner_diameter_mm").index)
+    ladders = [ladder or all_types for ladder in ladders]
+    n_options = max(len(ladder) for ladder in ladders)
+    option_names = np.full((n_pipes, n_options), "", dtype=object)
+    inner_mm = np.full((n_pipes, n_options), np.nan)
+    u_per_mk = np.zeros((n_pipes, n_options))
+    for position, ladder in enumerate(ladders):
+        option_names[position, : len(ladder)] = ladder
+        for option, name in enumerate(ladder):
+            try:
+                inner, u_w_per_m2k = catalog.properties(name)
+            except ValueError:
+                continue  # no heat-loss data: not an option
+            inner_mm[position, option] = inner
+            u_per_mk[position, option] = u_w_per_m2k * np.pi * catalog.table.at[name, "outer_diameter_mm"] / 1000.0
+
+    diameter = inner_mm / 1000.0
+    area = np.pi * diameter**2 / 4
+    rho, mu, length = density[:, None], viscosity[:, None], length_m[:, None]
+    zeta_local = pipes.loss_coefficient.to_numpy(dtype=float)[:, None]
+    roughness = k / 1000.0
+
+    def resistance(flow: np.ndarray) -> np.ndarray:
+        """dp [Pa] = resistance · ṁ² per option."""
+        reynolds = 4.0 * flow[:, None] / (np.pi * diameter * mu)
+        friction = _friction_factor(reynolds, roughness, diameter)
+        return (friction * length / diameter + zeta_local) / (2.0 * rho * area**2)
+
+    with np.errstate(invalid="ignore"):
+        peak_velocity = peak_flow[:, None] / (rho * area)
+        peak_dp_bar = resistance(peak_flow) * peak_flow[:, None] ** 2 / 1e5
+        pump_mwh = resistance(energy_flow) * cubed_flow_hours[:, None] / rho / parameters.pump_efficiency / 1e6
+    heat_loss_mwh = u_per_mk * length * excess_kelvin_hours[:, None] / 1e6
+    investment = (parameters.base_cost_eur_per_m + parameters.cost_eur_per_m_mm * inner_mm) * length
+    capital = parameters.capital_factor() * investment
+    energy_factor = parameters.energy_factor()
+    heat_cost = energy_factor * parameters.heat_price_eur_per_mwh * heat_loss_mwh
+    pump_cost = energy_factor * parameters.electricity_price_eur_per_mwh * pump_mwh
+    total = capital + heat_cost + pump_cost
+    feasible = np.isfinite(total) & (peak_velocity <= parameters.v_max)
+    if not feasible.any(axis=1).all():
+        too_fast = np.flatnonzero(~feasible.any(axis=1))
+        raise ValueError(f"No std-type keeps v_max = {parameters.v_max} m/s in pipes {too_fast.tolist()}.")
+
+    # Branches of the trees: pipes, then the connectors without cost or pressure loss
+    trees = model.trees
+    n_branches = max([n_pipes] + [branch + 1 for tree in trees.values() for _, branch, _ in tree])
+    branch_cost = np.full((n_branches, n_options), np.inf)
+    branch_cost[:n_pipes] = np.where(feasible, total, np.inf)
+    branch_cost[n_pipes:, 0] = 0.0
+    side_budget_bar = parameters.max_path_loss_bar / 2.0
+    step_bar = side_budget_bar / parameters.pressure_steps
+    branch_steps = np.zeros((n_branches, n_options), dtype=int)
+    with np.errstate(invalid="ignore"):
+        branch_steps[:n_pipes] = np.where(
+            feasible, np.ceil(peak_dp_bar / step_bar - 1e-9), parameters.pressure_steps + 1
+        ).astype(int)
+
+    # Pipes outside the trees (out of service, not connected) carry no flow: cheapest type
+    chosen = feasible.argmax(axis=1)
+    chosen = np.where(np.isfinite(branch_cost[:n_pipes]).any(axis=1), branch_cost[:n_pipes].argmin(axis=1), chosen)
+    for side, tree in trees.items():
+        try:
+            selection = tree_dynamic_program(tree, branch_cost, branch_steps, parameters.pressure_steps)
+        except ValueError as e:
+            raise ValueError(
+                f"{e} ({side} side, {side_budget_bar:.2f} bar of max_path_loss_bar = "
+                f"{parameters.max_path_loss_bar} bar)"
+            ) from e
+        for branch, option in selection.items():
+            if branch < n_pipes:
+                chosen[branch] = option
+
+    rows = np.arange(n_pipes)
+    for position, option in enumerate(chosen):
+        _set_pipe_std_type(net, pipes.index[position], option_names[position, option], catalog, k)
+    breakdown = pd.DataFrame(
+        {
+            "std_type": option_names[rows, chosen],
+            "inner_diameter_mm": inner_mm[rows, chosen],
+            "peak_velocity_m_per_s": peak_velocity[rows, chosen],
+            "peak_dp_bar": peak_dp_bar[rows, chosen],
+            "investment_eur": investment[rows, chosen],
+            "capital_eur_per_a": capital[rows, chosen],
+            "heat_loss_mwh_per_a": heat_loss_mwh[rows, chosen],
+            "heat_loss_eur_per_a": heat_cost[rows, chosen],
+            "pump_energy_mwh_per_a": pump_mwh[rows, chosen],
+            "pump_eur_per_a": pump_cost[rows, chosen],
+            "total_eur_per_a": total[rows, chosen],
+        },
+        index=pipes.index,
+    )
+    result = LccSizingResult(pipes=breakdown, seconds=time.perf_counter() - start)
+    logging.info(
+        f"LCC sizing of {n_pipes} pipes over {len(hours)} load classes in {result.seconds:.2f} s: "
+        f"{result.total_eur_per_a:,.0f} €/a"
+    )
+
+    if verify:
+        solver = AdaptivePipeflow()
+        solver(net, mode="bidirectional", iter=100)
+        solver.run_control(net, mode="bidirectional", iter=100)
+    return result
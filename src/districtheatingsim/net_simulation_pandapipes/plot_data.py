@@ -7,6 +7,10 @@ Python structures, so the rendering layer (``interactive_network_plot``) no long
 mixes pandapipes queries with Plotly trace building (BACKLOG B1/B3). Being Plotly- and
 GUI-free, this layer is unit-testable through the network test seam.
 
+Coordinates, colour values and hover texts are taken column-wise from the element and
+result tables (junction lookups by ``Index.get_indexer``, one formatted string list per
+hover field), so preparing a net with thousands of pipes takes milliseconds.
+
 :author: Dipl.-Ing. (FH) Jonas Pfeiffer
 """
 
@@ -14,7 +18,6 @@ from dataclasses import dataclass
 
 import geopandas as gpd
 import numpy as np
-from shapely.geometry import Point
 
 from districtheatingsim.constants import KELVIN_OFFSET
 
@@ -32,14 +35,32 @@ class JunctionPlotData:
 
 def junction_geodata_wgs84(net, crs) -> gpd.GeoDataFrame:
     """Junction coordinates as a WGS84 GeoDataFrame (for Plotly mapbox)."""
-    gdf = gpd.GeoDataFrame(
-        net.junction_geodata,
-        geometry=[Point(xy) for xy in zip(net.junction_geodata["x"], net.junction_geodata["y"], strict=False)],
-        crs=crs,
-    )
+    geodata = net.junction_geodata
+    gdf = gpd.GeoDataFrame(geodata, geometry=gpd.points_from_xy(geodata["x"], geodata["y"]), crs=crs)
     return gdf.to_crs("EPSG:4326")
 
 
+def _format(template: str, *columns) -> list[str]:
+    """``template`` formatted row by row with the values of ``columns``."""
+    return list(map(template.format, *(np.asarray(column).tolist() for column in columns)))
+
+
+def _join(fields: list[list[str]], present=None) -> list[str]:
+    """Concatenate the hover fields per row; rows where ``present`` is False get an empty text."""
+    texts = ["".join(parts) for parts in zip(*fields, strict=True)]
+    if present is not None:
+        texts = [text if ok else "" for text, ok in zip(texts, present, strict=True)]
+    return texts
+
+
+def _parameter_field(parameter: str | None, values: np.ndarray | None) -> list[list[str]]:
+    """Hover line of the colour-coded parameter (no field when not colour-coded)."""
+    if values is None or not parameter:
+        return []
+    label = parameter_label(parameter)
+    return [[f"{label}: {value:.2f}<br>" for value in values.tolist()]]
+
+
 def junction_plot_data(net, crs, parameter: str | None = None) -> JunctionPlotData:
     """
     Extract junction marker data (coords, hover text, colour values) from the net.
@@ -52,15 +73,12 @@ def junction_plot_data(net, crs, parameter: str | None = None) -> JunctionPlotDa
     """
     gdf = junction_geodata_wgs84(net, crs)
 
-    hover_texts = []
-    for idx in gdf.index:
-        junction = net.junction.loc[idx]
-        text = f"<b>{junction['name']}</b><br>"
-        if hasattr(net, "res_junction"):
-            res = net.res_junction.loc[idx]
-            text += f"Druck: {res['p_bar']:.2f} bar<br>"
-            text += f"Temperatur: {res['t_k'] - KELVIN_OFFSET:.1f} °C<br>"
-        hover_texts.append(text)
+    fields = [_format("<b>{}</b><br>", net.junction.loc[gdf.index, "name"])]
+    if hasattr(net, "res_junction"):
+        res = net.res_junction.loc[gdf.index]
+        fields.append(_format("Druck: {:.2f} bar<br>", res["p_bar"]))
+        fields.append(_format("Temperatur: {:.1f} °C<br>", res["t_k"] - KELVIN_OFFSET))
+    hover_texts = _join(fields)
 
     values = None
     if parameter and hasattr(net, "res_junction"):
@@ -97,14 +115,27 @@ def parameter_value(res_df, idx, parameter):
     Value of ``parameter`` for component ``idx``, computing the derived ``dt_k`` /
     ``dp_bar`` from the from/to columns. Returns ``None`` if unavailable.
     """
+    values = parameter_values(res_df, [idx], parameter)
+    return None if values is None else values[0]
+
+
+def parameter_values(res_df, index, parameter) -> np.ndarray | None:
+    """
+    Values of ``parameter`` for the components ``index`` (see :func:`parameter_value`).
+
+    :return: One value per entry of ``index``, or ``None`` if unavailable.
+    :rtype: np.ndarray | None
+    """
     if parameter == "dt_k":
         if "t_from_k" in res_df.columns and "t_to_k" in res_df.columns:
-            return res_df.loc[idx, "t_from_k"] - res_df.loc[idx, "t_to_k"]
+            rows = res_df.loc[index]
+            return (rows["t_from_k"] - rows["t_to_k"]).to_numpy()
     elif parameter == "dp_bar":
         if "p_from_bar" in res_df.columns and "p_to_bar" in res_df.columns:
-            return res_df.loc[idx, "p_from_bar"] - res_df.loc[idx, "p_to_bar"]
+            rows = res_df.loc[index]
+            return (rows["p_from_bar"] - rows["p_to_bar"]).to_numpy()
     elif parameter in res_df.columns:
-        return res_df.loc[idx, parameter]
+        return res_df.loc[index, parameter].to_numpy()
     return None
 
 
@@ -133,23 +164,81 @@ class PipePlotData:
     center_lon: float
 
 
-def _pipe_hover_text(net, idx, pipe, parameter, value, has_res) -> str:
-    text = f"<b>{pipe['name']}</b><br>"
-    text += f"Typ: {pipe['std_type']}<br>"
-    text += f"Länge: {pipe['length_km']:.3f} km<br>"
-    if has_res:
-        res = net.res_pipe.loc[idx]
-        if "mdot_from_kg_per_s" in res.index:
-            text += f"Massenstrom: {res['mdot_from_kg_per_s']:.2f} kg/s<br>"
-        if "v_mean_m_per_s" in res.index:
-            text += f"Geschwindigkeit: {res['v_mean_m_per_s']:.2f} m/s<br>"
-        if "t_from_k" in res.index and "t_to_k" in res.index:
-            text += f"ΔT: {res['t_from_k'] - res['t_to_k']:.1f} K<br>"
-        if "p_from_bar" in res.index and "p_to_bar" in res.index:
-            text += f"Δp: {res['p_from_bar'] - res['p_to_bar']:.2f} bar<br>"
-        if value is not None and parameter:
-            text += f"{parameter_label(parameter)}: {value:.2f}<br>"
-    return text
+def _connected_rows(table, from_column: str, to_column: str, junctions_wgs84):
+    """
+    Rows of ``table`` whose two junctions have coordinates, with their WGS84 coordinates.
+
+    :return: (rows, from_lat, from_lon, to_lat, to_lon) — the coordinates as arrays over ``rows``
+    """
+    junction_index = junctions_wgs84.index
+    i_from = junction_index.get_indexer(table[from_column])
+    i_to = junction_index.get_indexer(table[to_column])
+    keep = (i_from >= 0) & (i_to >= 0)
+    lats = junctions_wgs84.geometry.y.to_numpy()
+    lons = junctions_wgs84.geometry.x.to_numpy()
+    i_from, i_to = i_from[keep], i_to[keep]
+    return table[keep], lats[i_from], lons[i_from], lats[i_to], lons[i_to]
+
+
+def _segments(rows, coords, hover_texts, values, default_name: str) -> list[PipeSegment]:
+    """One :class:`PipeSegment` per row, from the column arrays of the line element."""
+    from_lat, from_lon, to_lat, to_lon = (c.tolist() for c in coords)
+    mid_lat = ((coords[0] + coords[2]) / 2).tolist()
+    mid_lon = ((coords[1] + coords[3]) / 2).tolist()
+    indices = rows.index.tolist()
+    if "name" in rows.columns:
+        names = rows["name"].tolist()
+    else:
+        names = [f"{default_name} {idx}" for idx in indices]
+    row_values = values.tolist() if values is not None else [None] * len(indices)
+    return [
+        PipeSegment(*fields)
+        for fields in zip(
+            from_lat,
+            from_lon,
+            mid_lat,
+            mid_lon,
+            to_lat,
+            to_lon,
+            hover_texts,
+            row_values,
+            indices,
+            names,
+            strict=True,
+        )
+    ]
+
+
+def _plot_data(segments: list[PipeSegment], values: list[np.ndarray], junctions_wgs84) -> PipePlotData:
+    """Wrap the segments with the colour range of ``values`` and the network centre."""
+    vmin = vmax = None
+    values = np.concatenate(values) if values else np.empty(0)
+    if len(values):
+        vmin, vmax = float(values.min()), float(values.max())
+        if vmax - vmin < 1e-10:
+            vmax = vmin + 1  # avoid divide-by-zero in colour normalisation
+    center_lat = float(junctions_wgs84.geometry.y.mean())
+    center_lon = float(junctions_wgs84.geometry.x.mean())
+    return PipePlotData(segments, vmin, vmax, center_lat, center_lon)
+
+
+def _pipe_hover_texts(rows, res, parameter, values) -> list[str]:
+    fields = [
+        _format("<b>{}</b><br>", rows["name"]),
+        _format("Typ: {}<br>", rows["std_type"]),
+        _format("Länge: {:.3f} km<br>", rows["length_km"]),
+    ]
+    if res is not None:
+        if "mdot_from_kg_per_s" in res.columns:
+            fields.append(_format("Massenstrom: {:.2f} kg/s<br>", res["mdot_from_kg_per_s"]))
+        if "v_mean_m_per_s" in res.columns:
+            fields.append(_format("Geschwindigkeit: {:.2f} m/s<br>", res["v_mean_m_per_s"]))
+        if "t_from_k" in res.columns and "t_to_k" in res.columns:
+            fields.append(_format("ΔT: {:.1f} K<br>", res["t_from_k"] - res["t_to_k"]))
+        if "p_from_bar" in res.columns and "p_to_bar" in res.columns:
+            fields.append(_format("Δp: {:.2f} bar<br>", res["p_from_bar"] - res["p_to_bar"]))
+        fields += _parameter_field(parameter, values)
+    return _join(fields)
 
 
 def pipe_plot_data(net, junctions_wgs84, parameter: str | None = None) -> PipePlotData:
@@ -165,70 +254,38 @@ def pipe_plot_data(net, junctions_wgs84, parameter: str | None = None) -> PipePl
         return PipePlotData([], None, None, 0.0, 0.0)
 
     has_res = hasattr(net, "res_pipe")
-    center_lat = float(junctions_wgs84.geometry.y.mean())
-    center_lon = float(junctions_wgs84.geometry.x.mean())
-
-    segments: list[PipeSegment] = []
-    values: list[float] = []
-    for idx in net.pipe.index:
-        pipe = net.pipe.loc[idx]
-        try:
-            fc = junctions_wgs84.loc[pipe["from_junction"]].geometry
-            tc = junctions_wgs84.loc[pipe["to_junction"]].geometry
-        except KeyError:
-            continue
-        value = parameter_value(net.res_pipe, idx, parameter) if (parameter and has_res) else None
-        if value is not None:
-            values.append(value)
-        segments.append(
-            PipeSegment(
-                from_lat=fc.y,
-                from_lon=fc.x,
-                mid_lat=(fc.y + tc.y) / 2,
-                mid_lon=(fc.x + tc.x) / 2,
-                to_lat=tc.y,
-                to_lon=tc.x,
-                hover_text=_pipe_hover_text(net, idx, pipe, parameter, value, has_res),
-                value=value,
-                idx=idx,
-                name=pipe.get("name", f"Pipe {idx}"),
-            )
-        )
-
-    vmin = vmax = None
-    if values:
-        vmin, vmax = min(values), max(values)
-        if vmax - vmin < 1e-10:
-            vmax = vmin + 1  # avoid divide-by-zero in colour normalisation
-    return PipePlotData(segments, vmin, vmax, center_lat, center_lon)
-
-
-def _heat_consumer_hover_text(net, idx, hc, parameter, value, has_res) -> str:
-    text = f"<b>{hc['name']}</b><br>"
-    text += f"Wärmebedarf: {hc['qext_w'] / 1000:.1f} kW<br>"
-    if has_res:
-        res = net.res_heat_consumer.loc[idx]
-        if "mdot_from_kg_per_s" in res.index:
-            text += f"Massenstrom: {res['mdot_from_kg_per_s']:.2f} kg/s<br>"
-        if "t_from_k" in res.index:
-            text += f"Vorlauftemp.: {res['t_from_k'] - KELVIN_OFFSET:.1f} °C<br>"
-        if "t_to_k" in res.index:
-            text += f"Rücklauftemp.: {res['t_to_k'] - KELVIN_OFFSET:.1f} °C<br>"
-        if "dt_k" in res.index:
-            text += f"ΔT: {res['dt_k']:.1f} K<br>"
-        elif "t_from_k" in res.index and "t_to_k" in res.index:
-            text += f"ΔT: {res['t_from_k'] - res['t_to_k']:.1f} K<br>"
-        if "p_from_bar" in res.index:
-            text += f"Vorlaufdruck: {res['p_from_bar']:.2f} bar<br>"
-        if "p_to_bar" in res.index:
-            text += f"Rücklaufdruck: {res['p_to_bar']:.2f} bar<br>"
-        if "deltap_bar" in res.index:
-            text += f"Δp: {res['deltap_bar']:.2f} bar<br>"
-        elif "p_from_bar" in res.index and "p_to_bar" in res.index:
-            text += f"Δp: {res['p_from_bar'] - res['p_to_bar']:.2f} bar<br>"
-        if value is not None and parameter:
-            text += f"{parameter_label(parameter)}: {value:.2f}<br>"
-    return text
+    rows, *coords = _connected_rows(net.pipe, "from_junction", "to_junction", junctions_wgs84)
+    res = net.res_pipe.loc[rows.index] if has_res else None
+    values = parameter_values(net.res_pipe, rows.index, parameter) if (parameter and has_res) else None
+    hover_texts = _pipe_hover_texts(rows, res, parameter, values)
+    segments = _segments(rows, coords, hover_texts, values, "Pipe")
+    return _plot_data(segments, [values] if values is not None else [], junctions_wgs84)
+
+
+def _heat_consumer_hover_texts(rows, res, parameter, values) -> list[str]:
+    fields = [_format("<b>{}</b><br>", rows["name"]), _format("Wärmebedarf: {:.1f} kW<br>", rows["qext_w"] / 1000)]
+    if res is not None:
+        columns = res.columns
+        if "mdot_from_kg_per_s" in columns:
+            fields.append(_format("Massenstrom: {:.2f} kg/s<br>", res["mdot_from_kg_per_s"]))
+        if "t_from_k" in columns:
+            fields.append(_format("Vorlauftemp.: {:.1f} °C<br>", res["t_from_k"] - KELVIN_OFFSET))
+        if "t_to_k" in columns:
+            fields.append(_format("Rücklauftemp.: {:.1f} °C<br>", res["t_to_k"] - KELVIN_OFFSET))
+        if "dt_k" in columns:
+            fields.append(_format("ΔT: {:.1f} K<br>", res["dt_k"]))
+        elif "t_from_k" in columns and "t_to_k" in columns:
+            fields.append(_format("ΔT: {:.1f} K<br>", res["t_from_k"] - res["t_to_k"]))
+        if "p_from_bar" in columns:
+            fields.append(_format("Vorlaufdruck: {:.2f} bar<br>", res["p_from_bar"]))
+        if "p_to_bar" in columns:
+            fields.append(_format("Rücklaufdruck: {:.2f} bar<br>", res["p_to_bar"]))
+        if "deltap_bar" in columns:
+            fields.append(_format("Δp: {:.2f} bar<br>", res["deltap_bar"]))
+        elif "p_from_bar" in columns and "p_to_bar" in columns:
+            fields.append(_format("Δp: {:.2f} bar<br>", res["p_from_bar"] - res["p_to_bar"]))
+        fields += _parameter_field(parameter, values)
+    return _join(fields)
 
 
 def heat_consumer_plot_data(net, junctions_wgs84, parameter: str | None = None) -> PipePlotData:
@@ -242,42 +299,12 @@ def heat_consumer_plot_data(net, junctions_wgs84, parameter: str | None = None)
         return PipePlotData([], None, None, 0.0, 0.0)
 
     has_res = hasattr(net, "res_heat_consumer")
-    center_lat = float(junctions_wgs84.geometry.y.mean())
-    center_lon = float(junctions_wgs84.geometry.x.mean())
-
-    segments: list[PipeSegment] = []
-    values: list[float] = []
-    for idx in net.heat_consumer.index:
-        hc = net.heat_consumer.loc[idx]
-        try:
-            fc = junctions_wgs84.loc[hc["from_junction"]].geometry
-            tc = junctions_wgs84.loc[hc["to_junction"]].geometry
-        except KeyError:
-            continue
-        value = parameter_value(net.res_heat_consumer, idx, parameter) if (parameter and has_res) else None
-        if value is not None:
-            values.append(value)
-        segments.append(
-            PipeSegment(
-                from_lat=fc.y,
-                from_lon=fc.x,
-                mid_lat=(fc.y + tc.y) / 2,
-                mid_lon=(fc.x + tc.x) / 2,
-                to_lat=tc.y,
-                to_lon=tc.x,
-                hover_text=_heat_consumer_hover_text(net, idx, hc, parameter, value, has_res),
-                value=value,
-                idx=idx,
-                name=hc.get("name", f"Heat Consumer {idx}"),
-            )
-        )
-
-    vmin = vmax = None
-    if values:
-        vmin, vmax = min(values), max(values)
-        if vmax - vmin < 1e-10:
-            vmax = vmin + 1
-    return PipePlotData(segments, vmin, vmax, center_lat, center_lon)
+    rows, *coords = _connected_rows(net.heat_consumer, "from_junction", "to_junction", junctions_wgs84)
+    res = net.res_heat_consumer.loc[rows.index] if has_res else None
+    values = parameter_values(net.res_heat_consumer, rows.index, parameter) if (parameter and has_res) else None
+    hover_texts = _heat_consumer_hover_texts(rows, res, parameter, values)
+    segments = _segments(rows, coords, hover_texts, values, "Heat Consumer")
+    return _plot_data(segments, [values] if values is not None else [], junctions_wgs84)
 
 
 _PUMP_TYPES = [
@@ -286,54 +313,53 @@ _PUMP_TYPES = [
 ]
 
 
-def _pump_coords(junctions_wgs84, pump):
-    """From/to junction geometry for a pump row, handling both column conventions.
+def _pump_junction_columns(pump_df) -> tuple[str, str] | None:
+    """From/to junction columns of a pump table, handling both column conventions.
 
     Returns ``None`` when neither ``from/to_junction`` nor ``flow/return_junction``
-    is present. May raise ``KeyError``/``IndexError`` if a referenced junction is
-    missing (the caller treats that as "skip this pump").
+    is present (the caller skips the table).
     """
-    if "from_junction" in pump.index and "to_junction" in pump.index:
-        return (junctions_wgs84.loc[pump["from_junction"]].geometry, junctions_wgs84.loc[pump["to_junction"]].geometry)
-    if "flow_junction" in pump.index and "return_junction" in pump.index:
-        return (
-            junctions_wgs84.loc[pump["flow_junction"]].geometry,
-            junctions_wgs84.loc[pump["return_junction"]].geometry,
-        )
+    if "from_junction" in pump_df.columns and "to_junction" in pump_df.columns:
+        return "from_junction", "to_junction"
+    if "flow_junction" in pump_df.columns and "return_junction" in pump_df.columns:
+        return "flow_junction", "return_junction"
     return None
 
 
-def _pump_hover_text(net, res_table, idx, pump, parameter, value) -> str:
+def _pump_hover_texts(net, res_table, rows, parameter, values) -> list[str]:
     # Pumps run return -> supply, so from=return / to=supply: the supply ("Vorlauf")
     # fields read the *to* columns and the return ("Rücklauf") fields the *from*
     # columns. This swap is intentional and preserved verbatim from the renderer.
-    text = f"<b>{pump['name']}</b><br>"
+    fields = [_format("<b>{}</b><br>", rows["name"])]
     if hasattr(net, res_table):
-        try:
-            res = getattr(net, res_table).loc[idx]
-            if "mdot_from_kg_per_s" in res.index:
-                text += f"Massenstrom: {res['mdot_from_kg_per_s']:.2f} kg/s<br>"
-            if "t_from_k" in res.index:
-                text += f"Vorlauftemp.: {res['t_to_k'] - KELVIN_OFFSET:.1f} °C<br>"
-            if "t_to_k" in res.index:
-                text += f"Rücklauftemp.: {res['t_from_k'] - KELVIN_OFFSET:.1f} °C<br>"
-            if "dt_k" in res.index:
-                text += f"ΔT: {res['dt_k']:.1f} K<br>"
-            elif "t_from_k" in res.index and "t_to_k" in res.index:
-                text += f"ΔT: {res['t_to_k'] - res['t_from_k']:.1f} K<br>"
-            if "p_from_bar" in res.index:
-                text += f"Vorlaufdruck: {res['p_to_bar']:.2f} bar<br>"
-            if "p_to_bar" in res.index:
-                text += f"Rücklaufdruck: {res['p_from_bar']:.2f} bar<br>"
-            if "deltap_bar" in res.index:
-                text += f"Druckanhebung: {res['deltap_bar']:.2f} bar<br>"
-            elif "p_from_bar" in res.index and "p_to_bar" in res.index:
-                text += f"Druckanhebung: {res['p_to_bar'] - res['p_from_bar']:.2f} bar<br>"
-        except (KeyError, IndexError):
-            pass
-    if value is not None and parameter:
-        text += f"{parameter_label(parameter)}: {value:.2f}<br>"
-    return text
+        res_df = getattr(net, res_table)
+        # Pumps without a result row keep only their name
+        present = rows.index.isin(res_df.index)
+        res = res_df.reindex(rows.index)
+        columns = res.columns
+        res_fields = []
+        if "mdot_from_kg_per_s" in columns:
+            res_fields.append(_format("Massenstrom: {:.2f} kg/s<br>", res["mdot_from_kg_per_s"]))
+        if "t_to_k" in columns:
+            res_fields.append(_format("Vorlauftemp.: {:.1f} °C<br>", res["t_to_k"] - KELVIN_OFFSET))
+        if "t_from_k" in columns:
+            res_fields.append(_format("Rücklauftemp.: {:.1f} °C<br>", res["t_from_k"] - KELVIN_OFFSET))
+        if "dt_k" in columns:
+            res_fields.append(_format("ΔT: {:.1f} K<br>", res["dt_k"]))
+        elif "t_from_k" in columns and "t_to_k" in columns:
+            res_fields.append(_format("ΔT: {:.1f} K<br>", res["t_to_k"] - res["t_from_k"]))
+        if "p_to_bar" in columns:
+            res_fields.append(_format("Vorlaufdruck: {:.2f} bar<br>", res["p_to_bar"]))
+        if "p_from_bar" in columns:
+            res_fields.append(_format("Rücklaufdruck: {:.2f} bar<br>", res["p_from_bar"]))
+        if "deltap_bar" in columns:
+            res_fields.append(_format("Druckanhebung: {:.2f} bar<br>", res["deltap_bar"]))
+        elif "p_from_bar" in columns and "p_to_bar" in columns:
+            res_fields.append(_format("Druckanhebung: {:.2f} bar<br>", res["p_to_bar"] - res["p_from_bar"]))
+        if res_fields:
+            fields.append(_join(res_fields, present))
+    fields += _parameter_field(parameter, values)
+    return _join(fields)
 
 
 def pump_plot_data(net, junctions_wgs84, parameter: str | None = None) -> PipePlotData:
@@ -347,69 +373,45 @@ def pump_plot_data(net, junctions_wgs84, parameter: str | None = None) -> PipePl
     if not pump_types:
         return PipePlotData([], None, None, 0.0, 0.0)
 
-    center_lat = float(junctions_wgs84.geometry.y.mean())
-    center_lon = float(junctions_wgs84.geometry.x.mean())
-
     segments: list[PipeSegment] = []
-    values: list[float] = []
+    values: list[np.ndarray] = []
     for pump_table, res_table in pump_types:
         pump_df = getattr(net, pump_table)
+        junction_columns = _pump_junction_columns(pump_df)
+        if junction_columns is None:
+            continue
         has_res = hasattr(net, res_table)
-        for idx in pump_df.index:
-            pump = pump_df.loc[idx]
-            try:
-                coords = _pump_coords(junctions_wgs84, pump)
-            except (KeyError, IndexError):
-                continue
-            if coords is None:
-                continue
-            fc, tc = coords
-            value = parameter_value(getattr(net, res_table), idx, parameter) if (parameter and has_res) else None
-            if value is not None:
-                values.append(value)
-            segments.append(
-                PipeSegment(
-                    from_lat=fc.y,
-                    from_lon=fc.x,
-                    mid_lat=(fc.y + tc.y) / 2,
-                    mid_lon=(fc.x + tc.x) / 2,
-                    to_lat=tc.y,
-                    to_lon=tc.x,
-                    hover_text=_pump_hover_text(net, res_table, idx, pump, parameter, value),
-                    value=value,
-                    idx=idx,
-                    name=pump.get("name", f"Pump {idx}"),
-                )
-            )
-
-    vmin = vmax = None
-    if values:
-        vmin, vmax = min(values), max(values)
-        if vmax - vmin < 1e-10:
-            vmax = vmin + 1
-    return PipePlotData(segments, vmin, vmax, center_lat, center_lon)
+        rows, *coords = _connected_rows(pump_df, *junction_columns, junctions_wgs84)
+        table_values = (
+            parameter_values(getattr(net, res_table), rows.index, parameter) if (parameter and has_res) else None
+        )
+        if table_values is not None:
+            values.append(table_values)
+        hover_texts = _pump_hover_texts(net, res_table, rows, parameter, table_values)
+        segments += _segments(rows, coords, hover_texts, table_values, "Pump")
+    return _plot_data(segments, values, junctions_wgs84)
 
 
-def _flow_control_hover_text(net, idx, fc, parameter, value) -> str:
-    text = f"<b>{fc['name']}</b><br>"
-    if "controlled_mdot_kg_per_s" in fc.index:
-        text += f"Soll-Massenstrom: {fc['controlled_mdot_kg_per_s']:.2f} kg/s<br>"
+def _flow_control_hover_texts(net, rows, parameter, values) -> list[str]:
+    fields = [_format("<b>{}</b><br>", rows["name"])]
+    if "controlled_mdot_kg_per_s" in rows.columns:
+        fields.append(_format("Soll-Massenstrom: {:.2f} kg/s<br>", rows["controlled_mdot_kg_per_s"]))
     if hasattr(net, "res_flow_control"):
-        try:
-            res = net.res_flow_control.loc[idx]
-            if "mdot_from_kg_per_s" in res.index:
-                text += f"Massenstrom: {res['mdot_from_kg_per_s']:.2f} kg/s<br>"
-            if "p_from_bar" in res.index:
-                text += f"Vorlaufdruck: {res['p_from_bar']:.2f} bar<br>"
-            if "p_to_bar" in res.index:
-                text += f"Rücklaufdruck: {res['p_to_bar']:.2f} bar<br>"
-            if "deltap_bar" in res.index:
-                text += f"Druckdifferenz: {res['deltap_bar']:.2f} bar<br>"
-        except (KeyError, IndexError):
-            pass
-    if value is not None and parameter:
-        text += f"{parameter_label(parameter)}: {value:.2f}<br>"
-    return text
+        present = rows.index.isin(net.res_flow_control.index)
+        res = net.res_flow_control.reindex(rows.index)
+        res_fields = []
+        if "mdot_from_kg_per_s" in res.columns:
+            res_fields.append(_format("Massenstrom: {:.2f} kg/s<br>", res["mdot_from_kg_per_s"]))
+        if "p_from_bar" in res.columns:
+            res_fields.append(_format("Vorlaufdruck: {:.2f} bar<br>", res["p_from_bar"]))
+        if "p_to_bar" in res.columns:
+            res_fields.append(_format("Rücklaufdruck: {:.2f} bar<br>", res["p_to_bar"]))
+        if "deltap_bar" in res.columns:
+            res_fields.append(_format("Druckdifferenz: {:.2f} bar<br>", res["deltap_bar"]))
+        if res_fields:
+            fields.append(_join(res_fields, present))
+    fields += _parameter_field(parameter, values)
+    return _join(fields)
 
 
 def flow_control_plot_data(net, junctions_wgs84, parameter: str | None = None) -> PipePlotData:
@@ -423,42 +425,11 @@ def flow_control_plot_data(net, junctions_wgs84, parameter: str | None = None) -
         return PipePlotData([], None, None, 0.0, 0.0)
 
     has_res = hasattr(net, "res_flow_control")
-    center_lat = float(junctions_wgs84.geometry.y.mean())
-    center_lon = float(junctions_wgs84.geometry.x.mean())
-
-    segments: list[PipeSegment] = []
-    values: list[float] = []
-    for idx in net.flow_control.index:
-        fc = net.flow_control.loc[idx]
-        try:
-            c_from = junctions_wgs84.loc[fc["from_junction"]].geometry
-            c_to = junctions_wgs84.loc[fc["to_junction"]].geometry
-        except KeyError:
-            continue
-        value = parameter_value(net.res_flow_control, idx, parameter) if (parameter and has_res) else None
-        if value is not None:
-            values.append(value)
-        segments.append(
-            PipeSegment(
-                from_lat=c_from.y,
-                from_lon=c_from.x,
-                mid_lat=(c_from.y + c_to.y) / 2,
-                mid_lon=(c_from.x + c_to.x) / 2,
-                to_lat=c_to.y,
-                to_lon=c_to.x,
-                hover_text=_flow_control_hover_text(net, idx, fc, parameter, value),
-                value=value,
-                idx=idx,
-                name=fc.get("name", f"Flow Control {idx}"),
-            )
-        )
-
-    vmin = vmax = None
-    if values:
-        vmin, vmax = min(values), max(values)
-        if vmax - vmin < 1e-10:
-            vmax = vmin + 1
-    return PipePlotData(segments, vmin, vmax, center_lat, center_lon)
+    rows, *coords = _connected_rows(net.flow_control, "from_junction", "to_junction", junctions_wgs84)
+    values = parameter_values(net.res_flow_control, rows.index, parameter) if (parameter and has_res) else None
+    hover_texts = _flow_control_hover_texts(net, rows, parameter, values)
+    segments = _segments(rows, coords, hover_texts, values, "Flow Control")
+    return _plot_data(segments, [values] if values is not None else [], junctions_wgs84)
 
 
 def available_plot_parameters(net) -> dict[str, list[str]]:
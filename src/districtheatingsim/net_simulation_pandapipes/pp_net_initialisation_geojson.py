@@ -17,21 +17,29 @@ It automatically processes building heat demands, calculates temperature require
 creates appropriate network topologies with proper controller configurations.
 """
 
+import hashlib
 import json
 import logging
-import warnings
 from typing import Any
 
 import geopandas as gpd
 import numpy as np
 import pandapipes as pp
 import pandas as pd
-from pandapipes.control.run_control import run_control
+import shapely
 
 from districtheatingsim.constants import CP_WATER_KJ_KGK, KELVIN_OFFSET
-from districtheatingsim.net_generation.network_connectivity import check_geojson_connectivity
+from districtheatingsim.net_generation.network_connectivity import (
+    DEFAULT_JUNCTION_TOLERANCE_M,
+    NearMissCluster,
+    check_network_connectivity,
+    merge_near_points,
+)
 from districtheatingsim.net_generation.network_geojson_schema import NetworkGeoJSONSchema
+from districtheatingsim.net_simulation_pandapipes.adaptive_pipeflow import AdaptivePipeflow
+from districtheatingsim.net_simulation_pandapipes.NetworkDataClass import json_default
 from districtheatingsim.net_simulation_pandapipes.pipe_std_types import resolve_pipe_u_w_per_m2k
+from districtheatingsim.net_simulation_pandapipes.resource_registry import load_cop_table
 from districtheatingsim.net_simulation_pandapipes.result_validation import (
     validate_net_results,
     validate_pressure_plausibility,
@@ -41,6 +49,9 @@ from districtheatingsim.net_simulation_pandapipes.utilities import (
     correct_flow_directions,
     create_controllers,
     init_diameter_types,
+    orient_pipes_from_producer,
+    update_controllers,
+    upsize_overloaded_pipes,
 )
 
 
@@ -59,43 +70,10 @@ def initialize_geojson(NetworkGenerationData) -> Any:
     .. note::
        Loads unified GeoJSON (Wärmenetz.geojson), processes heat demands, validates temperatures.
        Handles cold networks (COP calculation), applies 2% min load. Calculates mass flows
-       (main: total demand/ΔT, secondary: percentage-based). Creates complete pandapipes network.
+       (main: total demand/ΔT, secondary: percentage-based). Creates complete pandapipes network,
+       or patches the existing one (:func:`update_network`) if the geometry is unchanged
+       (:func:`network_input_signature`); ``incremental_update`` records which path ran.
     """
-    # Load unified network GeoJSON data
-
-    # Connectivity gate (C31): pandapipes merges line endpoints into junctions by EXACT
-    # coordinate match, so a vertex the Leaflet editor nudged off its neighbour silently
-    # splits the network and the solver later fails with an opaque connectivity error far
-    # from the cause. Catch it here with a clear, actionable message instead.
-    with open(NetworkGenerationData.network_geojson_path, encoding="utf-8") as _conn_f:
-        _conn_geojson = NetworkGeoJSONSchema.ensure_feature_types(json.load(_conn_f))  # C32: repair old saves
-    _conn_report = check_geojson_connectivity(_conn_geojson)
-    if not _conn_report.ok:
-        raise ValueError(
-            "Das Wärmenetz ist nicht vollständig verbunden und kann nicht berechnet werden:\n- "
-            + "\n- ".join(_conn_report.messages)
-            + "\n\nBitte im Tab 'Kartenansicht Netzgenerierung' die Konnektivität prüfen "
-            "und korrigieren (ggf. Auto-Snap)."
-        )
-
-    # Read unified GeoJSON file (read_network_gdf repairs a missing feature_type column from
-    # layer_name for older map exports — C32).
-    network_gdf = NetworkGeoJSONSchema.read_network_gdf(NetworkGenerationData.network_geojson_path, driver="GeoJSON")
-
-    # Separate features by type
-    gdf_dict = {
-        "flow_line": network_gdf[network_gdf["feature_type"] == NetworkGeoJSONSchema.FEATURE_TYPE_FLOW].copy(),
-        "return_line": network_gdf[network_gdf["feature_type"] == NetworkGeoJSONSchema.FEATURE_TYPE_RETURN].copy(),
-        "heat_consumer": network_gdf[network_gdf["feature_type"] == NetworkGeoJSONSchema.FEATURE_TYPE_BUILDING].copy(),
-        "heat_producer": network_gdf[network_gdf["feature_type"] == NetworkGeoJSONSchema.FEATURE_TYPE_GENERATOR].copy(),
-    }
-
-    print(f"Loaded unified network GeoJSON with {len(network_gdf)} features")
-    print(f"  Flow lines: {len(gdf_dict['flow_line'])}")
-    print(f"  Return lines: {len(gdf_dict['return_line'])}")
-    print(f"  Heat consumers: {len(gdf_dict['heat_consumer'])}")
-    print(f"  Heat producers: {len(gdf_dict['heat_producer'])}")
-
     print(f"Max supply temperature heat generator: {NetworkGenerationData.max_supply_temperature_heat_generator} °C")
 
     # Load and process heat demand data
@@ -165,7 +143,7 @@ def initialize_geojson(NetworkGenerationData) -> Any:
     # Process heat demands based on network configuration
     if NetworkGenerationData.netconfiguration == "kaltes Netz":
         # Cold network: Calculate heat pump performance
-        COP_file_values = np.genfromtxt(NetworkGenerationData.COP_filename, delimiter=";")
+        COP_file_values = load_cop_table(NetworkGenerationData.COP_filename)
         COP, _ = COP_WP(supply_temperature_buildings, return_temperature_heat_consumer, COP_file_values)
         print(f"COP dezentrale Wärmepumpen Gebäude: {COP}")
 
@@ -242,8 +220,24 @@ def initialize_geojson(NetworkGenerationData) -> Any:
         "secondary_producers": NetworkGenerationData.secondary_producers,
     }
 
-    # Create the pandapipes network
-    net = create_network(gdf_dict, consumer_dict, pipe_dict, producer_dict)
+    # Patch the existing net if only loads, temperatures or pump settings changed, otherwise build it
+    signature = network_input_signature(NetworkGenerationData, consumer_dict, pipe_dict, producer_dict)
+    changed = changed_network_inputs(NetworkGenerationData.input_signature, signature)
+    previous_net = NetworkGenerationData.net
+    NetworkGenerationData.incremental_update = (
+        previous_net is not None
+        and "geometry" not in changed
+        and len(previous_net.heat_consumer) == len(max_waerme_hast_ges_W)
+    )
+    if NetworkGenerationData.incremental_update:
+        logging.info(f"Updating the existing network in place, changed inputs: {sorted(changed) or 'none'}")
+        net = update_network(previous_net, consumer_dict, pipe_dict, producer_dict, changed)
+    else:
+        gdf_dict = read_network_features(NetworkGenerationData)
+        net = create_network(
+            gdf_dict, consumer_dict, pipe_dict, producer_dict, NetworkGenerationData.junction_tolerance_m
+        )
+    NetworkGenerationData.input_signature = signature
 
     # Store processed data in NetworkGenerationData object
     NetworkGenerationData.supply_temperature_buildings = supply_temperature_buildings
@@ -293,6 +287,195 @@ def initialize_geojson(NetworkGenerationData) -> Any:
     return NetworkGenerationData
 
 
+def read_network_features(NetworkGenerationData) -> dict[str, gpd.GeoDataFrame]:
+    """
+    Read the unified network GeoJSON split by feature type and pass it through the connectivity gate.
+
+    :param NetworkGenerationData: Configuration with network_geojson_path and junction_tolerance_m
+    :type NetworkGenerationData: object
+    :return: GeoDataFrames of flow_line, return_line, heat_consumer and heat_producer features
+    :rtype: dict[str, gpd.GeoDataFrame]
+    :raises ValueError: If the network is not fully connected
+    """
+    # Read unified GeoJSON file: streamed and split by feature type in one pass, or from the
+    # GeoParquet sidecar written on export (a missing feature_type is repaired from
+    # layer_name for older map exports — C32).
+    layers = NetworkGeoJSONSchema.read_split_network(NetworkGenerationData.network_geojson_path)
+
+    # Connectivity gate (C31): generation merges line endpoints into junctions only within
+    # the small junction tolerance (floating-point noise), so a vertex the Leaflet editor
+    # nudged off its neighbour silently splits the network and the solver later fails with
+    # an opaque connectivity error far from the cause. Catch it here with a clear, actionable
+    # message instead — evaluated with the same merge as create_network.
+    feature_groups = [[line for line in _line_coords(gdf) if len(line) >= 2] for gdf in layers]
+    report = check_network_connectivity(*feature_groups, merge_tolerance=NetworkGenerationData.junction_tolerance_m)
+    if not report.ok:
+        raise ValueError(
+            "Das Wärmenetz ist nicht vollständig verbunden und kann nicht berechnet werden:\n- "
+            + "\n- ".join(report.messages)
+            + "\n\nBitte im Tab 'Kartenansicht Netzgenerierung' die Konnektivität prüfen "
+            "und korrigieren (ggf. Auto-Snap)."
+        )
+
+    gdf_dict = dict(zip(("flow_line", "return_line", "heat_consumer", "heat_producer"), layers, strict=True))
+
+    print(f"Loaded unified network GeoJSON with {sum(len(gdf) for gdf in layers)} features")
+    print(f"  Flow lines: {len(gdf_dict['flow_line'])}")
+    print(f"  Return lines: {len(gdf_dict['return_line'])}")
+    print(f"  Heat consumers: {len(gdf_dict['heat_consumer'])}")
+    print(f"  Heat producers: {len(gdf_dict['heat_producer'])}")
+
+    return gdf_dict
+
+
+def _digest(*parts) -> str:
+    """SHA-256 of the JSON form of ``parts`` (arrays as lists)."""
+    return hashlib.sha256(json.dumps(parts, default=json_default, sort_keys=True).encode()).hexdigest()
+
+
+def network_input_signature(
+    NetworkGenerationData, consumer_dict: dict, pipe_dict: dict, producer_dict: dict
+) -> dict[str, str]:
+    """
+    Digest of the network inputs per category, to tell which of them changed since the last build.
+
+    :param NetworkGenerationData: Configuration with network_geojson_path, junction_tolerance_m and
+        diameter_optimization_pipe_checked
+    :type NetworkGenerationData: object
+    :param consumer_dict: Heat consumer config as passed to :func:`create_network`
+    :type consumer_dict: dict
+    :param pipe_dict: Pipe config as passed to :func:`create_network`
+    :type pipe_dict: dict
+    :param producer_dict: Producer config as passed to :func:`create_network`
+    :type producer_dict: dict
+    :return: Hex digests of ``geometry``, ``loads``, ``temperatures`` and ``producers``
+    :rtype: dict[str, str]
+
+    .. note::
+       ``geometry`` covers everything that shapes the net: the GeoJSON file, the junction
+       tolerance, the pipe specification, whether the diameters are optimized (a patched net
+       keeps its pipes, so switching the optimization on needs a rebuild) and the producer
+       locations. ``producers`` are the pump pressures and the load shares of the secondary
+       producers.
+    """
+    with open(NetworkGenerationData.network_geojson_path, "rb") as f:
+        geojson_digest = hashlib.sha256(f.read()).hexdigest()
+    secondary_producers = producer_dict["secondary_producers"] or []
+    return {
+        "geometry": _digest(
+            geojson_digest,
+            NetworkGenerationData.junction_tolerance_m,
+            pipe_dict,
+            bool(NetworkGenerationData.diameter_optimization_pipe_checked),
+            producer_dict["main_producer_location_index"],
+            [producer.index for producer in secondary_producers],
+        ),
+        "loads": _digest(consumer_dict["qext_w"]),
+        "temperatures": _digest(
+            producer_dict["supply_temperature"],
+            consumer_dict["min_supply_temperature_heat_consumer"],
+            consumer_dict["return_temperature_heat_consumer"],
+        ),
+        "producers": _digest(
+            producer_dict["flow_pressure_pump"],
+            producer_dict["lift_pressure_pump"],
+            [producer.load_percentage for producer in secondary_producers],
+        ),
+    }
+
+
+def changed_network_inputs(previous: dict[str, str] | None, current: dict[str, str]) -> set[str]:
+    """
+    Categories of :func:`network_input_signature` that differ between two builds.
+
+    :param previous: Signature of the last build, None if there is none
+    :type previous: dict[str, str] | None
+    :param current: Signature of the current inputs
+    :type current: dict[str, str]
+    :return: Changed categories; all of them without a previous signature
+    :rtype: set[str]
+    """
+    if not previous:
+        return set(current)
+    return {category for category, digest in current.items() if previous.get(category) != digest}
+
+
+def update_network(
+    net, consumer_dict: dict, pipe_dict: dict, producer_dict: dict, changed: set[str] | None = None
+) -> pp.pandapipesNet:
+    """
+    Apply new loads, temperatures and pump settings to a network built by :func:`create_network`.
+
+    :param net: Network of an earlier build with the same geometry
+    :type net: pandapipes.pandapipesNet
+    :param consumer_dict: Heat consumer config (qext_w, min_supply_temperature_heat_consumer, return_temperature_heat_consumer)
+    :type consumer_dict: dict
+    :param pipe_dict: Pipe config (v_max_pipe, material_filter, k_mm)
+    :type pipe_dict: dict
+    :param producer_dict: Producer config (supply_temperature, pressures, secondary_producers)
+    :type producer_dict: dict
+    :param changed: Changed input categories (:func:`changed_network_inputs`), None for all
+    :type changed: set[str] | None
+    :return: The patched and solved network
+    :rtype: pp.pandapipesNet
+
+    .. note::
+       Patches the boundary values of the heat consumers and producers and the setpoints of the
+       controllers (:func:`update_controllers`) and solves once with controls, warm-started from the
+       last converged state; the pump pressures of the pressure controller are kept unless the
+       ``producers`` inputs changed. The sized pipes
+       are kept; only pipes above ``v_max_pipe`` are enlarged (:func:`upsize_overloaded_pipes`),
+       followed by one more solve.
+    """
+    qext_w = np.asarray(consumer_dict["qext_w"], dtype=float)
+    min_supply_temperature_heat_consumer = consumer_dict["min_supply_temperature_heat_consumer"]
+    return_temperature_heat_consumer = np.asarray(consumer_dict["return_temperature_heat_consumer"], dtype=float)
+    supply_temperature = producer_dict["supply_temperature"]
+    secondary_producers = producer_dict["secondary_producers"]
+
+    # Boundary values, as create_network sets them
+    supply_temperature_k = supply_temperature + KELVIN_OFFSET
+    net.heat_consumer["qext_w"] = qext_w
+    net.heat_consumer["treturn_k"] = return_temperature_heat_consumer + KELVIN_OFFSET
+    net.circ_pump_pressure["t_flow_k"] = supply_temperature_k
+    if changed is None or "producers" in changed:
+        net.circ_pump_pressure["p_flow_bar"] = producer_dict["flow_pressure_pump"]
+        net.circ_pump_pressure["plift_bar"] = producer_dict["lift_pressure_pump"]
+    if secondary_producers:
+        mass_flows = [producer.mass_flow for producer in secondary_producers]
+        net.circ_pump_mass["mdot_flow_kg_per_s"] = mass_flows
+        net.circ_pump_mass["t_flow_k"] = supply_temperature_k
+        net.flow_control["controlled_mdot_kg_per_s"] = mass_flows
+
+    net = update_controllers(
+        net,
+        qext_w,
+        supply_temperature,
+        min_supply_temperature_heat_consumer,
+        return_temperature_heat_consumer,
+        secondary_producers,
+    )
+
+    # As in init_diameter_types: solve, then let the controllers adjust (run_control itself
+    # only re-solves after a control step)
+    solver = AdaptivePipeflow()
+    solver.seed(net)
+    solver(net, mode="bidirectional", iter=100)
+    solver.run_control(net, mode="bidirectional", iter=100)
+    enlarged = upsize_overloaded_pipes(
+        net, v_max_pipe=pipe_dict["v_max_pipe"], material_filter=pipe_dict["material_filter"], k=pipe_dict["k_mm"]
+    )
+    if enlarged:
+        logging.info(f"Enlarged {enlarged} pipes above {pipe_dict['v_max_pipe']} m/s")
+        solver(net, mode="bidirectional", iter=100)
+        solver.run_control(net, mode="bidirectional", iter=100)
+    net = correct_flow_directions(net)
+
+    validate_net_results(net, context="network update")
+    validate_pressure_plausibility(net, context="network update")
+    return net
+
+
 def get_line_coords_and_lengths(gdf: gpd.GeoDataFrame) -> tuple[list[list[tuple]], list[float]]:
     """
     Extract 2-D coordinates and lengths from LineString geometries.
@@ -309,24 +492,27 @@ def get_line_coords_and_lengths(gdf: gpd.GeoDataFrame) -> tuple[list[list[tuple]
 
     .. note::
        Only processes LineString geometries, skips others with warning. Uses
-       GeoPandas length property for geodetic calculation.
+       GeoPandas length property for geodetic calculation. The vertices of all
+       lines are read in one ``shapely.get_coordinates`` call.
     """
-    all_line_coords, all_line_lengths = [], []
     gdf["length"] = gdf.geometry.length
+    geom_types = gdf.geometry.geom_type.to_numpy()
+    is_line = geom_types == "LineString"
+    for geom_type in geom_types[~is_line]:
+        print(f"Geometrie ist kein LineString: {geom_type}")
 
-    for _index, row in gdf.iterrows():
-        line = row["geometry"]
+    all_line_coords = _line_coords(gdf)
+    all_line_lengths = gdf["length"].to_numpy()[is_line].tolist()
+    return all_line_coords, all_line_lengths
 
-        if line.geom_type == "LineString":
-            # Strip Z — keep only (x, y) for junction dict keys
-            coords = [(c[0], c[1]) for c in line.coords]
-            length = row["length"]
-            all_line_coords.append(coords)
-            all_line_lengths.append(length)
-        else:
-            print(f"Geometrie ist kein LineString: {line.geom_type}")
 
-    return all_line_coords, all_line_lengths
+def _line_coords(gdf: gpd.GeoDataFrame) -> list[list[tuple]]:
+    """2-D vertex tuples of the LineString geometries of ``gdf``, read in one ``shapely.get_coordinates`` call."""
+    lines = gdf.geometry.to_numpy()[gdf.geometry.geom_type.to_numpy() == "LineString"]
+    # Strip Z — keep only (x, y) for junction dict keys
+    coords, line_index = shapely.get_coordinates(lines, return_index=True)
+    bounds = np.cumsum(np.bincount(line_index, minlength=len(lines)))[:-1]
+    return [list(map(tuple, part.tolist())) for part in np.split(coords, bounds)] if len(lines) else []
 
 
 def build_elevation_lookup_from_gdf(gdf: gpd.GeoDataFrame) -> dict[tuple, float]:
@@ -365,19 +551,49 @@ def get_all_point_coords_from_line_cords(all_line_coords: list[list[tuple]]) ->
     :rtype: List[Tuple]
 
     .. note::
-       Removes duplicates using set operations. Order not guaranteed.
-       Essential for proper network topology without duplicate junctions.
+       Removes duplicates using set operations. The order follows set iteration,
+       which is the same for the same coordinates in the same order (float hashes
+       are not randomized), so the junction numbering of existing projects stays
+       stable. Essential for proper network topology without duplicate junctions.
     """
     point_coords = [koordinate for paar in all_line_coords for koordinate in paar]
     unique_point_coords = list(set(point_coords))
     return unique_point_coords
 
 
+def merge_junction_coords(
+    line_groups: list[list[list[tuple]]], tolerance: float = DEFAULT_JUNCTION_TOLERANCE_M
+) -> tuple[list[list[list[tuple]]], list[NearMissCluster]]:
+    """
+    Snap line vertices that lie within *tolerance* of each other onto one shared coordinate.
+
+    :param line_groups: Groups of 2-D coordinate sequences (flow lines, return lines, connections)
+    :type line_groups: List[List[List[Tuple]]]
+    :param tolerance: Merge distance [m]; 0 merges exact duplicates only
+    :type tolerance: float
+    :return: (snapped line_groups, merged clusters)
+    :rtype: Tuple[List[List[List[Tuple]]], List[NearMissCluster]]
+
+    .. note::
+       Uses :func:`~districtheatingsim.net_generation.network_connectivity.merge_near_points`
+       (KD-tree, O(n log n)) on the vertices of all groups, the clustering of the connectivity
+       check and Auto-Snap. The representative of a cluster is one of its input coordinates, so
+       exact lookups (elevation, junctions) keep working.
+    """
+    points = [coords for group in line_groups for line in group for coords in line]
+    mapping, clusters = merge_near_points(points, tolerance)
+    if not clusters:
+        return line_groups, clusters
+    snapped = [[[mapping[coords] for coords in line] for line in group] for group in line_groups]
+    return snapped, clusters
+
+
 def create_network(
     gdf_dict: dict[str, gpd.GeoDataFrame],
     consumer_dict: dict[str, Any],
     pipe_dict: dict[str, Any],
     producer_dict: dict[str, Any],
+    junction_tolerance_m: float = DEFAULT_JUNCTION_TOLERANCE_M,
 ) -> pp.pandapipesNet:
     """
     Create complete pandapipes network with junctions, pipes, consumers, and producers.
@@ -390,6 +606,8 @@ def create_network(
     :type pipe_dict: Dict[str, Any]
     :param producer_dict: Producer config (supply_temperature, pressures, main_producer_location_index, secondary_producers)
     :type producer_dict: Dict[str, Any]
+    :param junction_tolerance_m: Line vertices closer than this are merged into one junction [m]
+    :type junction_tolerance_m: float
     :return: Complete pandapipes network with optimized diameters and controllers
     :rtype: pp.pandapipesNet
 
@@ -397,6 +615,10 @@ def create_network(
        Steps: 1) junctions from coords, 2) pipes (supply/return), 3) heat consumers,
        4) producers (main=circ_pump_pressure, secondary=circ_pump_mass), 5) pipeflow,
        6) controllers, diameter optimization. Corrects flow directions automatically.
+       Junctions, pipes and heat consumers are created with the bulk creators of
+       pandapipes (one table append per element type). Vertices within
+       ``junction_tolerance_m`` (floating-point noise) become one junction; merged
+       clusters are logged.
     """
     # Extract data from dictionaries
     gdf_flow_line, gdf_return_line, gdf_heat_exchanger, gdf_heat_producer = (
@@ -461,14 +683,18 @@ def create_network(
         Dict[Tuple, int]
             Dictionary mapping coordinates to junction IDs.
         """
-        junction_dict = {}
-        for i, coords in enumerate(all_coords, start=0):
-            height = elevation_lookup.get(coords, 0.0)
-            junction_id = pp.create_junction(
-                net_i, pn_bar=1.05, tfluid_k=supply_temperature_k, height_m=height, name=f"Junction {i}", geodata=coords
-            )
-            junction_dict[coords] = junction_id
-        return junction_dict
+        if not all_coords:
+            return {}
+        junction_ids = pp.create_junctions(
+            net_i,
+            len(all_coords),
+            pn_bar=1.05,
+            tfluid_k=supply_temperature_k,
+            height_m=[elevation_lookup.get(coords, 0.0) for coords in all_coords],
+            name=[f"Junction {i}" for i in range(len(all_coords))],
+            geodata=all_coords,
+        )
+        return dict(zip(all_coords, junction_ids.tolist(), strict=True))
 
     def create_pipes(
         net_i: pp.pandapipesNet,
@@ -499,50 +725,47 @@ def create_network(
         line_type : str
             Description of line type for naming.
         """
-        for coords, length_m, i in zip(all_line_coords, all_line_lengths, range(len(all_line_coords)), strict=False):
-            if pipe_mode == "diameter":
-                diameter_mm = pipe_type_or_diameter
-                pp.create_pipe_from_parameters(
-                    net_i,
-                    from_junction=junction_dict[coords[0]],
-                    to_junction=junction_dict[coords[1]],
-                    length_km=length_m / 1000,
-                    diameter_m=diameter_mm / 1000,
-                    k_mm=k_mm,
-                    u_w_per_m2k=u_w_per_m2k_pipe,
-                    name=f"{line_type} {i}",
-                    geodata=coords,
-                    sections=5,
-                    text_k=283,
-                )
-            elif pipe_mode == "type":
-                pp.create_pipe(
-                    net_i,
-                    from_junction=junction_dict[coords[0]],
-                    to_junction=junction_dict[coords[1]],
-                    std_type=pipe_type_or_diameter,
-                    length_km=length_m / 1000,
-                    k_mm=k_mm,
-                    name=f"{line_type} {i}",
-                    geodata=coords,
-                    sections=5,
-                    text_k=283,
-                )
+        n_lines = min(len(all_line_coords), len(all_line_lengths))
+        if n_lines == 0:
+            return
+        all_line_coords = all_line_coords[:n_lines]
+        common = {
+            "from_junctions": [junction_dict[coords[0]] for coords in all_line_coords],
+            "to_junctions": [junction_dict[coords[1]] for coords in all_line_coords],
+            "length_km": np.asarray(all_line_lengths[:n_lines], dtype=float) / 1000,
+            "k_mm": k_mm,
+            "name": [f"{line_type} {i}" for i in range(n_lines)],
+            "geodata": all_line_coords,
+            "sections": 5,
+            "text_k": 283,
+        }
+        if pipe_mode == "diameter":
+            diameter_mm = pipe_type_or_diameter
+            pipe_ids = pp.create_pipes_from_parameters(
+                net_i, diameter_m=diameter_mm / 1000, u_w_per_m2k=u_w_per_m2k_pipe, **common
+            )
+            # The bulk creator fills std_type with "" / NaN; keep None as create_pipe_from_parameters does
+            net_i.pipe.loc[pipe_ids, "std_type"] = None
+        elif pipe_mode == "type":
+            pp.create_pipes(net_i, std_type=pipe_type_or_diameter, **common)
 
     def create_heat_consumers(
         net_i: pp.pandapipesNet, all_coords: list[list[tuple]], junction_dict: dict[tuple, int], name_prefix: str
     ) -> None:
         """Create heat consumers in the network."""
-        for i, (coords, q, t) in enumerate(zip(all_coords, qext_w, return_temperature_heat_consumer_k, strict=False)):
-            pp.create_heat_consumer(
-                net_i,
-                from_junction=junction_dict[coords[0]],
-                to_junction=junction_dict[coords[1]],
-                loss_coefficient=0,
-                qext_w=q,
-                treturn_k=t,
-                name=f"{name_prefix} {i}",
-            )
+        n_consumers = min(len(all_coords), len(qext_w), len(return_temperature_heat_consumer_k))
+        if n_consumers == 0:
+            return
+        all_coords = all_coords[:n_consumers]
+        pp.create_heat_consumers(
+            net_i,
+            from_junctions=[junction_dict[coords[0]] for coords in all_coords],
+            to_junctions=[junction_dict[coords[1]] for coords in all_coords],
+            loss_coefficient=0.0,
+            qext_w=np.asarray(qext_w[:n_consumers], dtype=float),
+            treturn_k=np.asarray(return_temperature_heat_consumer_k[:n_consumers], dtype=float),
+            name=[f"{name_prefix} {i}" for i in range(n_consumers)],
+        )
 
     def _resolve_pump_junctions(coords, jd_vl, jd_rl):
         """Return (return_junction_idx, flow_junction_idx) for a generator connection line.
@@ -660,8 +883,24 @@ def create_network(
         logging.info("No elevation data in GeoJSON — all junctions set to height_m=0.")
 
     # Create network topology
-    flow_line_2d_coords = get_line_coords_and_lengths(gdf_flow_line)[0]
-    return_line_2d_coords = get_line_coords_and_lengths(gdf_return_line)[0]
+    flow_line_2d_coords, flow_line_lengths = get_line_coords_and_lengths(gdf_flow_line)
+    return_line_2d_coords, return_line_lengths = get_line_coords_and_lengths(gdf_return_line)
+    heat_consumer_coords = get_line_coords_and_lengths(gdf_heat_exchanger)[0]
+    all_heat_producer_coords = get_line_coords_and_lengths(gdf_heat_producer)[0]
+    (flow_line_2d_coords, return_line_2d_coords, heat_consumer_coords, all_heat_producer_coords), merged = (
+        merge_junction_coords(
+            [flow_line_2d_coords, return_line_2d_coords, heat_consumer_coords, all_heat_producer_coords],
+            junction_tolerance_m,
+        )
+    )
+    if merged:
+        logging.warning(
+            "%d junction cluster(s) within %g m merged (%d coordinates), e.g. %s",
+            len(merged),
+            junction_tolerance_m,
+            sum(len(cluster.members) for cluster in merged),
+            "; ".join(str(cluster.members) for cluster in merged[:3]),
+        )
 
     junction_dict_vl = create_junctions_from_coords(
         net, get_all_point_coords_from_line_cords(flow_line_2d_coords), elevation_lookup
@@ -673,7 +912,8 @@ def create_network(
     # Create pipes
     create_pipes(
         net,
-        *get_line_coords_and_lengths(gdf_flow_line),
+        flow_line_2d_coords,
+        flow_line_lengths,
         junction_dict_vl,
         pipe_creation_mode,
         diameter_mm if pipe_creation_mode == "diameter" else pipetype,
@@ -681,7 +921,8 @@ def create_network(
     )
     create_pipes(
         net,
-        *get_line_coords_and_lengths(gdf_return_line),
+        return_line_2d_coords,
+        return_line_lengths,
         junction_dict_rl,
         pipe_creation_mode,
         diameter_mm if pipe_creation_mode == "diameter" else pipetype,
@@ -691,13 +932,12 @@ def create_network(
     # Create heat consumers
     create_heat_consumers(
         net,
-        get_line_coords_and_lengths(gdf_heat_exchanger)[0],
+        heat_consumer_coords,
         {**junction_dict_vl, **junction_dict_rl},
         "heat consumer",
     )
 
     # Create heat producers
-    all_heat_producer_coords, all_heat_producer_lengths = get_line_coords_and_lengths(gdf_heat_producer)
     if all_heat_producer_coords:
         # Main producer (pressure controlled)
         create_circulation_pump_pressure(
@@ -724,14 +964,10 @@ def create_network(
 
     print(f"secondary_producers: {secondary_producers}")
 
-    # Initial flow simulation – catch the pump-direction UserWarning so that
-    # correct_flow_directions() below can fix the topology.
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore", UserWarning)
-        try:
-            pp.pipeflow(net, mode="bidirectional", iter=100)
-        except UserWarning as e:
-            logging.warning(f"Initial pipeflow UserWarning (will be corrected): {e}")
+    # Orient the pipes along the flow before the first solve; init_diameter_types runs the
+    # design pipeflow and control loop, correct_flow_directions only re-solves if pipes of a
+    # meshed or multi-producer net still carry reverse flow.
+    orient_pipes_from_producer(net)
 
     # Network optimization
     net = create_controllers(
@@ -742,14 +978,8 @@ def create_network(
         return_temperature_heat_consumer,
         secondary_producers,
     )
-
-    try:
-        run_control(net, mode="bidirectional", iter=100)
-    except UserWarning as e:
-        logging.warning(f"run_control UserWarning (will be corrected by correct_flow_directions): {e}")
-
-    net = correct_flow_directions(net)
     net = init_diameter_types(net, v_max_pipe=v_max_pipe, material_filter=material_filter, k=k_mm)
+    net = correct_flow_directions(net)
 
     # Fail loudly at build time if the design state did not converge, instead of
     # letting NaN propagate into the time series (BACKLOG C2).
@@ -14,12 +14,33 @@ from pandapower.control.controller.const_control import ConstControl
 from pandapower.timeseries import DFData, OutputWriter
 
 from districtheatingsim.constants import CP_WATER_KJ_KGK, KELVIN_OFFSET
-from districtheatingsim.net_simulation_pandapipes.controllers import MinimumSupplyTemperatureController
+from districtheatingsim.net_simulation_pandapipes.adaptive_pipeflow import AdaptivePipeflow, SolverReport
+from districtheatingsim.net_simulation_pandapipes.chunked_time_series import run_time_series_chunked
+from districtheatingsim.net_simulation_pandapipes.controllers import (
+    HeatConsumerProfileController,
+    MinimumSupplyTemperatureController,
+)
+from districtheatingsim.net_simulation_pandapipes.fast_network_model import FastNetworkModel, FastNetworkResults
+from districtheatingsim.net_simulation_pandapipes.resource_registry import load_cop_table
+from districtheatingsim.net_simulation_pandapipes.result_cache import CachedRunReport, ResultCache
 from districtheatingsim.net_simulation_pandapipes.result_validation import (
     validate_design_state,
     validate_simulation_results,
 )
-from districtheatingsim.net_simulation_pandapipes.utilities import COP_WP
+from districtheatingsim.net_simulation_pandapipes.state_dedup import StateDedupSettings, run_time_series_deduplicated
+from districtheatingsim.net_simulation_pandapipes.surrogate_time_series import (
+    PIPE_LOG_VARIABLES,
+    SurrogateSettings,
+    run_time_series_surrogate,
+)
+from districtheatingsim.net_simulation_pandapipes.time_series_checkpoint import (
+    DEFAULT_CHECKPOINT_STEPS,
+    checkpoint_key,
+    run_time_series_checkpointed,
+)
+from districtheatingsim.net_simulation_pandapipes.time_series_telemetry import TelemetryRecorder, TimeSeriesTelemetry
+from districtheatingsim.net_simulation_pandapipes.utilities import COP_WP, register_controller
+from districtheatingsim.utilities.table_export import DEFAULT_CHUNK_ROWS, open_csv, write_columns
 from districtheatingsim.utilities.test_reference_year import import_TRY
 
 
@@ -39,13 +60,20 @@ def update_heat_consumer_qext_controller(
     :type start: int
     :param end: End index for slicing profiles
     :type end: int
+
+    .. note::
+       Puts the ConstControls back in service if :func:`install_heat_consumer_profile_controller`
+       had replaced them, and removes its batch controller.
     """
+    updated = []
     for i, qext_w_profile in enumerate(qext_w_profiles):
         df = pd.DataFrame(index=time_steps, data={f"qext_w_{i}": qext_w_profile[start:end]})
         data_source = DFData(df)
-        for ctrl in net.controller.object.values:
+        for controller_index, ctrl in net.controller["object"].items():
             if isinstance(ctrl, ConstControl) and ctrl.element_index == i and ctrl.variable == "qext_w":
                 ctrl.data_source = data_source
+                updated.append(controller_index)
+    _reactivate_const_controls(net, updated)
 
 
 def update_heat_consumer_temperature_controller(
@@ -68,23 +96,14 @@ def update_heat_consumer_temperature_controller(
     .. note::
        Handles both scalar (static) and array (dynamic) temperature requirements.
     """
-    controller_count = 0
+    min_supply = _profile_matrix(min_supply_temperature_heat_consumer, len(time_steps), start, end)
     for ctrl in net.controller.object.values:
         if isinstance(ctrl, MinimumSupplyTemperatureController):
-            profile = min_supply_temperature_heat_consumer[controller_count]
-            # Check if static or time-dependent
-            if np.isscalar(profile) or (isinstance(profile, np.ndarray) and profile.ndim == 0):
-                # Single value: repeat for all time steps
-                values = np.full(len(time_steps), profile)
-            elif isinstance(profile, np.ndarray) and profile.ndim == 1 and len(profile) == 1:
-                values = np.full(len(time_steps), profile[0])
-            else:
-                # Time series: take correct slice
-                values = profile[start:end]
-            df_return_temp = pd.DataFrame(index=time_steps, data={"min_supply_temperature": values})
-            data_source_return_temp = DFData(df_return_temp)
-            ctrl.data_source = data_source_return_temp
-            controller_count += 1
+            # One profile per consumer, in net.heat_consumer order; a controller reads its consumers' columns
+            columns = net.heat_consumer.index.get_indexer(ctrl.element_index)
+            profile_names = np.atleast_1d(ctrl.profile_name)
+            df_min_supply = pd.DataFrame(min_supply[:, columns], index=time_steps, columns=profile_names)
+            ctrl.data_source = DFData(df_min_supply)
 
 
 def update_heat_consumer_return_temperature_controller(
@@ -105,8 +124,10 @@ def update_heat_consumer_return_temperature_controller(
     :type end: int
 
     .. note::
-       Automatically converts temperatures from °C to K (adds KELVIN_OFFSET).
+       Automatically converts temperatures from °C to K (adds KELVIN_OFFSET). Puts the ConstControls
+       back in service if :func:`install_heat_consumer_profile_controller` had replaced them.
     """
+    updated = []
     for i, return_temp_profile in enumerate(return_temperature_heat_consumer):
         # Check if static or time-dependent
         if np.isscalar(return_temp_profile) or (
@@ -128,7 +149,7 @@ def update_heat_consumer_return_temperature_controller(
         df_return_temp = pd.DataFrame(index=time_steps, data={f"treturn_k_{i}": values})
         data_source_return_temp = DFData(df_return_temp)
 
-        for ctrl in net.controller.object.values:
+        for controller_index, ctrl in net.controller["object"].items():
             if (
                 isinstance(ctrl, ConstControl)
                 and ctrl.element == "heat_consumer"
@@ -137,6 +158,137 @@ def update_heat_consumer_return_temperature_controller(
             ):
                 # Update the data source of the existing ConstControl
                 ctrl.data_source = data_source_return_temp
+                updated.append(controller_index)
+    _reactivate_const_controls(net, updated)
+
+
+def _reactivate_const_controls(net, controller_indices: list) -> None:
+    """
+    Put per-consumer ConstControls back in service after a batch profile controller had replaced them.
+
+    The :class:`HeatConsumerProfileController` of an earlier time series is removed: its profiles
+    cover other time steps and it would overwrite the updated variables.
+    """
+    batch = [
+        index for index, ctrl in net.controller["object"].items() if isinstance(ctrl, HeatConsumerProfileController)
+    ]
+    net.controller.drop(index=batch, inplace=True)
+    net.controller.loc[controller_indices, "in_service"] = True
+
+
+def _profile_matrix(profiles, n_steps: int, start: int, end: int, offset: float = 0.0) -> np.ndarray:
+    """
+    Stack per-consumer profiles into a (time × consumers) matrix.
+
+    :param profiles: One entry per consumer: a time series (sliced to ``start:end``) or a
+        scalar / one-element array (held constant)
+    :type profiles: Union[np.ndarray, List]
+    :param n_steps: Number of simulated time steps
+    :type n_steps: int
+    :param start: Start index for slicing profiles
+    :type start: int
+    :param end: End index for slicing profiles
+    :type end: int
+    :param offset: Added to every value (e.g. KELVIN_OFFSET)
+    :type offset: float
+    :return: Float matrix of shape (n_steps, consumers); may be a read-only view of ``profiles``
+    :rtype: np.ndarray
+    """
+    if isinstance(profiles, np.ndarray) and profiles.dtype != object:
+        # Regular array: sliced/broadcast views instead of a loop over consumers (no year-long copies)
+        values = profiles.astype(float, copy=False)
+        if values.ndim == 1 or (values.ndim == 2 and values.shape[1] == 1):
+            matrix = np.broadcast_to(values.reshape(len(values)) + offset, (n_steps, len(values)))
+        else:
+            matrix = values[:, start:end].T
+            if offset:
+                matrix = matrix + offset
+    else:
+        columns = []
+        for profile in profiles:
+            profile = np.asarray(profile, dtype=float)
+            if profile.ndim == 0 or profile.size == 1:
+                columns.append(np.full(n_steps, profile.reshape(-1)[0]))
+            else:
+                columns.append(profile[start:end])
+        matrix = (np.column_stack(columns) if columns else np.empty((n_steps, 0))) + offset
+    if matrix.shape[0] != n_steps:
+        raise ValueError(f"Profiles cover {matrix.shape[0]} time steps, expected {n_steps} (slice {start}:{end}).")
+    return matrix
+
+
+def install_heat_consumer_profile_controller(
+    net,
+    qext_w_profiles: np.ndarray | list,
+    time_steps: range,
+    start: int,
+    end: int,
+    return_temperature_heat_consumer: np.ndarray | list | None = None,
+    min_supply_temperature_heat_consumer: np.ndarray | list | None = None,
+) -> HeatConsumerProfileController:
+    """
+    Drive all heat consumer profiles from one vectorized batch controller.
+
+    :param net: Pandapipes network with controllers from create_controllers
+    :type net: pandapipes.pandapipesNet
+    :param qext_w_profiles: Heat demand profiles, one per consumer [W]
+    :type qext_w_profiles: Union[np.ndarray, List]
+    :param time_steps: Time steps for simulation period
+    :type time_steps: range
+    :param start: Start index for slicing profiles
+    :type start: int
+    :param end: End index for slicing profiles
+    :type end: int
+    :param return_temperature_heat_consumer: Return temperature profiles [°C], None keeps the existing controllers
+    :type return_temperature_heat_consumer: Optional[Union[np.ndarray, List]]
+    :param min_supply_temperature_heat_consumer: Minimum supply temperature profiles [°C], None keeps the
+        existing setpoints
+    :type min_supply_temperature_heat_consumer: Optional[Union[np.ndarray, List]]
+    :return: The registered batch controller
+    :rtype: HeatConsumerProfileController
+
+    .. note::
+       Replaces update_heat_consumer_qext_controller, update_heat_consumer_return_temperature_controller
+       and update_heat_consumer_temperature_controller with a single pass over ``net.controller``: the
+       per-consumer qext_w / treturn_k ConstControls are set out of service (so a saved net keeps them;
+       the per-consumer update functions put them back) and a previously installed batch controller is
+       replaced. Profile columns map to
+       ``net.heat_consumer.index`` in order, as the ConstControls' ``element_index`` did.
+    """
+    n_steps = len(time_steps)
+    qext_w = _profile_matrix(qext_w_profiles, n_steps, start, end)
+    treturn_k = (
+        None
+        if return_temperature_heat_consumer is None
+        else _profile_matrix(return_temperature_heat_consumer, n_steps, start, end, offset=KELVIN_OFFSET)
+    )
+    min_supply = (
+        None
+        if min_supply_temperature_heat_consumer is None
+        else _profile_matrix(min_supply_temperature_heat_consumer, n_steps, start, end)
+    )
+
+    replaced_variables = {"qext_w"} if treturn_k is None else {"qext_w", "treturn_k"}
+    deactivate, drop, min_supply_targets = [], [], []
+    for controller_index, ctrl in net.controller["object"].items():
+        if isinstance(ctrl, HeatConsumerProfileController):
+            drop.append(controller_index)
+        elif isinstance(ctrl, ConstControl) and ctrl.element == "heat_consumer" and ctrl.variable in replaced_variables:
+            deactivate.append(controller_index)
+        elif min_supply is not None and isinstance(ctrl, MinimumSupplyTemperatureController):
+            # The setpoint now comes from the batch controller instead of a per-consumer DFData
+            ctrl.data_source = None
+            columns = net.heat_consumer.index.get_indexer(ctrl.element_index)
+            min_supply_targets.append((controller_index, columns if np.ndim(ctrl.heat_consumer_idx) else columns[0]))
+    net.controller.drop(index=drop, inplace=True)
+    net.controller.loc[deactivate, "in_service"] = False
+
+    controller = HeatConsumerProfileController(
+        net, qext_w, treturn_k=treturn_k, min_supply_temperature=min_supply, min_supply_targets=min_supply_targets
+    )
+    # Order -2 runs it before the other controllers (all order -1), as the ConstControls it replaces were created first
+    register_controller(net, controller, order=-2)
+    return controller
 
 
 def update_secondary_producer_controller(
@@ -302,7 +454,7 @@ def time_series_preprocessing(NetworkGenerationData) -> Any:
     if NetworkGenerationData.netconfiguration == "kaltes Netz":
         if not NetworkGenerationData.COP_filename:
             raise ValueError("Für ein kaltes Netz wird eine COP-Kennfeld-Datei benötigt, es ist aber keine gesetzt.")
-        COP_file_values = np.genfromtxt(NetworkGenerationData.COP_filename, delimiter=";")
+        COP_file_values = load_cop_table(NetworkGenerationData.COP_filename)
 
     # Supply temperature control strategy implementation
     if NetworkGenerationData.supply_temperature_control == "Statisch":
@@ -430,21 +582,17 @@ def time_series_preprocessing(NetworkGenerationData) -> Any:
     return NetworkGenerationData
 
 
-def thermohydraulic_time_series_net(NetworkGenerationData) -> Any:
+def _install_time_series_controllers(NetworkGenerationData) -> tuple[range, HeatConsumerProfileController]:
     """
-    Run thermohydraulic time series simulation with controller updates.
+    Install the profile controllers of the selected time range (shared by all pipeflow-based modes).
 
     :param NetworkGenerationData: Network data with preprocessed model and parameters
     :type NetworkGenerationData: object
-    :return: Updated NetworkGenerationData with simulation results and pump operations
-    :rtype: Any
-
-    .. note::
-       Runs bidirectional simulation with iter=100, alpha=0.5. Updates all controllers
-       (heat demand, temperatures, secondary producers). Logs junction, heat consumer,
-       and pump data.
+    :return: ``(time_steps, profile_controller)`` — ``range(n)`` of the selected range and the heat
+        consumer batch controller (its matrices are the simulated inputs)
+    :rtype: Tuple[range, HeatConsumerProfileController]
     """
-    # Update the ConstControl
+    # Simulated time steps of the selected range
     time_steps = range(
         0,
         len(
@@ -454,14 +602,6 @@ def thermohydraulic_time_series_net(NetworkGenerationData) -> Any:
         ),
     )
 
-    update_heat_consumer_qext_controller(
-        NetworkGenerationData.net,
-        NetworkGenerationData.waerme_hast_ges_W,
-        time_steps,
-        NetworkGenerationData.start_time_step,
-        NetworkGenerationData.end_time_step,
-    )
-
     # Update secondary producer controls
     if NetworkGenerationData.secondary_producers:
         update_secondary_producer_controller(
@@ -472,32 +612,30 @@ def thermohydraulic_time_series_net(NetworkGenerationData) -> Any:
             NetworkGenerationData.end_time_step,
         )
 
-    # Update temperature controllers if applicable
+    # Heat demand, return and minimum supply temperatures of all consumers in one batch controller
+    min_supply_temperature = None
     if (
         NetworkGenerationData.min_supply_temperature_heat_consumer is not None
         and np.any(np.array(NetworkGenerationData.min_supply_temperature_heat_consumer) != 0)
         and isinstance(NetworkGenerationData.min_supply_temperature_heat_consumer, np.ndarray)
     ):
-        print("Update TemperatureController")
-        update_heat_consumer_temperature_controller(
-            NetworkGenerationData.net,
-            NetworkGenerationData.min_supply_temperature_heat_consumer,
-            time_steps,
-            NetworkGenerationData.start_time_step,
-            NetworkGenerationData.end_time_step,
-        )
+        min_supply_temperature = NetworkGenerationData.min_supply_temperature_heat_consumer
 
+    return_temperature = None
     if NetworkGenerationData.return_temperature_heat_consumer is not None and isinstance(
         NetworkGenerationData.return_temperature_heat_consumer, np.ndarray
     ):
-        print("Update Return Temperature Const Control")
-        update_heat_consumer_return_temperature_controller(
-            NetworkGenerationData.net,
-            NetworkGenerationData.return_temperature_heat_consumer,
-            time_steps,
-            NetworkGenerationData.start_time_step,
-            NetworkGenerationData.end_time_step,
-        )
+        return_temperature = NetworkGenerationData.return_temperature_heat_consumer
+
+    profile_controller = install_heat_consumer_profile_controller(
+        NetworkGenerationData.net,
+        NetworkGenerationData.waerme_hast_ges_W,
+        time_steps,
+        NetworkGenerationData.start_time_step,
+        NetworkGenerationData.end_time_step,
+        return_temperature_heat_consumer=return_temperature,
+        min_supply_temperature_heat_consumer=min_supply_temperature,
+    )
 
     # Always update supply temperature controller so its DFData covers all time_steps.
     # update_heat_generator_supply_temperature_controller handles both scalars and arrays.
@@ -510,40 +648,422 @@ def thermohydraulic_time_series_net(NetworkGenerationData) -> Any:
             NetworkGenerationData.end_time_step,
         )
 
+    return time_steps, profile_controller
+
+
+def _supply_temperature_series(NetworkGenerationData, n_steps: int) -> np.ndarray:
+    """Supply temperature of the heat generator per simulated time step [°C] (static value broadcast)."""
+    supply_temperature = NetworkGenerationData.supply_temperature_heat_generator
+    if isinstance(supply_temperature, np.ndarray):
+        return supply_temperature[NetworkGenerationData.start_time_step : NetworkGenerationData.end_time_step]
+    return np.full(n_steps, float(supply_temperature))
+
+
+def _producer_mass_flow_series(NetworkGenerationData, n_steps: int) -> np.ndarray | None:
+    """Mass flow [kg/s] of the secondary producers per simulated step, ``(n_steps, producers)``; None without."""
+    if not NetworkGenerationData.secondary_producers:
+        return None
+    return np.column_stack(
+        [
+            np.broadcast_to(np.asarray(mass_flow, dtype=float), (n_steps,))
+            if np.ndim(mass_flow) == 0
+            else mass_flow[NetworkGenerationData.start_time_step : NetworkGenerationData.end_time_step]
+            for mass_flow in (
+                getattr(producer, "mass_flow", 0.0) for producer in NetworkGenerationData.secondary_producers
+            )
+        ]
+    )
+
+
+def _print_solver_report(report: SolverReport) -> None:
+    """Print the solver effort of an adaptive run and its most expensive time steps."""
+    if not len(report.time_steps):
+        return
+    order = np.argsort(-report.iterations, kind="stable")[:3]
+    expensive = ", ".join(f"{report.time_steps[i]} ({report.iterations[i]})" for i in order)
+    print(
+        f"Adaptive pipeflow: {report.total_iterations} iterations in {int(report.solves.sum())} solves, "
+        f"{int(report.fallbacks.sum())} fallbacks, most expensive steps: {expensive}"
+    )
+
+
+def _print_telemetry(telemetry: TimeSeriesTelemetry) -> None:
+    """Print wall time, non-converged and slowest time steps of a recorded run."""
+    if not len(telemetry.time_steps):
+        return
+    failed = telemetry.time_steps[~telemetry.converged]
+    slowest = ", ".join(
+        f"{step} ({telemetry.seconds[telemetry.time_steps == step][0]:.2f} s)" for step in telemetry.slowest_steps(3)
+    )
+    print(
+        f"Time series telemetry: {len(telemetry.time_steps)} steps in {telemetry.total_seconds:.1f} s, "
+        f"{len(failed)} not converged{' (' + ', '.join(map(str, failed[:5])) + ')' if len(failed) else ''}, "
+        f"slowest steps: {slowest}"
+    )
+
+
+def _solver_settings(run_kwargs: dict, solver: AdaptivePipeflow | None) -> str:
+    """Pipeflow settings of a run for error messages: the last solve of the adaptive solver and its fallback."""
+    settings = ", ".join(f"{name}={value}" for name, value in run_kwargs.items() if name != "run")
+    if solver is None or not solver.calls:
+        return settings
+    call = solver.calls[-1]
+    last = "fallback" if call.fallback else f"alpha={call.alpha:g}{', warm start' if call.warm_start else ''}"
+    return f"adaptive pipeflow, last solve at time step {call.time_step}: {last}; fallback {settings}"
+
+
+def _finish_telemetry(NetworkGenerationData, recorder: TelemetryRecorder | None) -> None:
+    """Detach the recorder and store its telemetry, also after a failed run (shows where it failed)."""
+    if recorder is None:
+        return
+    recorder.detach(NetworkGenerationData.net)
+    NetworkGenerationData.telemetry = recorder.report()
+    _print_telemetry(NetworkGenerationData.telemetry)
+
+
+def thermohydraulic_time_series_net(
+    NetworkGenerationData,
+    chunk_size: int | None = None,
+    max_workers: int | None = None,
+    state_dedup: StateDedupSettings | None = None,
+    adaptive_solver: bool = False,
+    telemetry: bool = True,
+    checkpoint_dir: str | None = None,
+    checkpoint_every: int = DEFAULT_CHECKPOINT_STEPS,
+    resume: bool = True,
+    cache: ResultCache | None = None,
+    force_recompute: bool = False,
+) -> Any:
+    """
+    Run thermohydraulic time series simulation with controller updates.
+
+    :param NetworkGenerationData: Network data with preprocessed model and parameters
+    :type NetworkGenerationData: object
+    :param chunk_size: Simulate blocks of this many time steps in parallel worker processes
+        (see :func:`~districtheatingsim.net_simulation_pandapipes.chunked_time_series.run_time_series_chunked`);
+        None runs the whole range sequentially
+    :type chunk_size: Optional[int]
+    :param max_workers: Worker processes for the chunked run, None = one per block up to the CPU count
+    :type max_workers: Optional[int]
+    :param state_dedup: Solve only distinct (quantized) load states and reuse their results
+        (see :func:`~districtheatingsim.net_simulation_pandapipes.state_dedup.run_time_series_deduplicated`);
+        None solves every time step
+    :type state_dedup: Optional[StateDedupSettings]
+    :param adaptive_solver: Solve with the warm-started, adaptively damped pipeflow
+        (see :mod:`~districtheatingsim.net_simulation_pandapipes.adaptive_pipeflow`), which falls back
+        to the fixed settings on failure; False uses ``pp.pipeflow`` with the fixed settings
+    :type adaptive_solver: bool
+    :param telemetry: Record wall time, solves, iterations, residuals and controller convergence per
+        time step (see :mod:`~districtheatingsim.net_simulation_pandapipes.time_series_telemetry`);
+        False installs nothing
+    :type telemetry: bool
+    :param checkpoint_dir: Checkpoint the sequential run to this directory every ``checkpoint_every`` steps
+        (see :mod:`~districtheatingsim.net_simulation_pandapipes.time_series_checkpoint`); None does not checkpoint
+    :type checkpoint_dir: Optional[str]
+    :param checkpoint_every: Time steps between checkpoints
+    :type checkpoint_every: int
+    :param resume: Continue from a checkpoint of the same inputs in ``checkpoint_dir``; False starts over
+    :type resume: bool
+    :param cache: Serve a run with unchanged inputs from this result cache and store new runs in it
+        (see :mod:`~districtheatingsim.net_simulation_pandapipes.result_cache`); None always simulates
+    :type cache: Optional[ResultCache]
+    :param force_recompute: Simulate even if ``cache`` holds the results (and replace them)
+    :type force_recompute: bool
+    :return: Updated NetworkGenerationData with simulation results and pump operations
+    :rtype: Any
+    :raises ValueError: If ``chunk_size``, ``state_dedup`` and ``checkpoint_dir`` are combined
+
+    .. note::
+       Runs bidirectional simulation with iter=100, alpha=0.5 (the fallback settings of the
+       adaptive solver). Updates all controllers (heat demand, temperatures, secondary
+       producers). Logs junction, heat consumer, and pump data. A chunked run stores its
+       timing / boundary-deviation report in ``time_series_report`` and leaves ``net``'s
+       result tables at the pre-run state; a deduplicated run stores its hit-rate report
+       there. The iterations per time step of the adaptive solver are stored in
+       ``solver_report`` (not for chunked runs, whose solves happen in the workers), the
+       per-step telemetry in ``telemetry`` (not for chunked runs either). Both are kept on failure,
+       and the solver is detached from ``net`` in any case.
+       A checkpointed run keeps its checkpoint on failure and removes it when it completes.
+       A run served from ``cache`` stores a ``CachedRunReport`` in ``time_series_report`` and
+       has no ``solver_report`` or ``telemetry``.
+    """
+    if chunk_size is not None and state_dedup is not None:
+        raise ValueError("chunk_size and state_dedup cannot be combined.")
+    if checkpoint_dir is not None and (chunk_size is not None or state_dedup is not None):
+        raise ValueError("checkpoint_dir cannot be combined with chunk_size or state_dedup.")
+
+    time_steps, profile_controller = _install_time_series_controllers(NetworkGenerationData)
+
     # Configure logging and run simulation
     log_variables = create_log_variables(NetworkGenerationData.net)
-    ow = OutputWriter(NetworkGenerationData.net, time_steps, output_path=None, log_variables=log_variables)
+    run_kwargs = {"mode": "bidirectional", "iter": 100, "alpha": 0.5}
+    solver = None
+    if adaptive_solver:
+        solver = AdaptivePipeflow()
+        run_kwargs["run"] = solver
+    chunked = state_dedup is None and chunk_size is not None and len(time_steps) > chunk_size
+
+    producer_mass_flow = _producer_mass_flow_series(NetworkGenerationData, len(time_steps))
+    # Inputs of the run besides the element tables and controllers, for the cache and checkpoint keys
+    key_settings = {
+        "time_range": (NetworkGenerationData.start_time_step, NetworkGenerationData.end_time_step),
+        "return_temperature": NetworkGenerationData.return_temperature_heat_consumer,
+        "min_supply_temperature": NetworkGenerationData.min_supply_temperature_heat_consumer,
+        "producer_mass_flow": producer_mass_flow,
+        "log_variables": log_variables,
+        "pipeflow": {name: value for name, value in run_kwargs.items() if name != "run"},
+        "adaptive_solver": adaptive_solver,
+    }
 
-    try:
-        run_time_series.run_timeseries(NetworkGenerationData.net, time_steps, mode="bidirectional", iter=100, alpha=0.5)
-    except Exception as e:
-        raise RuntimeError(f"Thermohydraulic time-series simulation failed (bidirectional, iter=100): {e}") from e
+    # A report of an earlier run in another mode must not describe these results
+    NetworkGenerationData.time_series_report = None
+    cache_key = None
+    if cache is not None:
+        # Before the solver and the telemetry probe are attached (they only observe the run)
+        cache_key = cache.key(
+            NetworkGenerationData.net,
+            **key_settings,
+            chunk_size=chunk_size if chunked else None,
+            state_dedup=state_dedup,
+        )
+        cached_results = None if force_recompute else cache.load(cache_key, NetworkGenerationData.net)
+        if cached_results is not None:
+            print(f"Time series results taken from the cache ({cache_key[:12]}, {cache.directory})")
+            NetworkGenerationData.net_results = cached_results
+            NetworkGenerationData.time_series_report = CachedRunReport(cache_key, cache.directory)
+            NetworkGenerationData.solver_report = None
+            NetworkGenerationData.telemetry = None
+            validate_simulation_results(NetworkGenerationData.net_results, context="cached thermohydraulic time series")
+            NetworkGenerationData.pump_results = calculate_results(
+                NetworkGenerationData.net, NetworkGenerationData.net_results
+            )
+            return NetworkGenerationData
 
-    NetworkGenerationData.net_results = ow.np_results
+    checkpoint_run_key = None
+    if checkpoint_dir is not None:
+        checkpoint_run_key = checkpoint_key(NetworkGenerationData.net, **key_settings)
+
+    if solver is not None and not chunked:
+        solver.attach(NetworkGenerationData.net)
+
+    recorder = None
+    NetworkGenerationData.solver_report = None
+    NetworkGenerationData.telemetry = None
+    if telemetry and not chunked:
+        recorder = TelemetryRecorder()
+        recorder.attach(NetworkGenerationData.net)
+        run_kwargs["run"] = recorder.wrap(run_kwargs.get("run"))
+
+    try:
+        if state_dedup is not None:
+            try:
+                NetworkGenerationData.net_results, report = run_time_series_deduplicated(
+                    NetworkGenerationData.net,
+                    time_steps,
+                    log_variables,
+                    profile_controller.qext_w,
+                    _supply_temperature_series(NetworkGenerationData, len(time_steps)),
+                    return_temperature=profile_controller.treturn_k,
+                    min_supply_temperature=profile_controller.min_supply_temperature,
+                    producer_mass_flow=producer_mass_flow,
+                    settings=state_dedup,
+                    **run_kwargs,
+                )
+            except Exception as e:
+                settings = _solver_settings(run_kwargs, solver)
+                raise RuntimeError(
+                    f"Deduplicated thermohydraulic time-series simulation failed ({settings}): {e}"
+                ) from e
+            NetworkGenerationData.time_series_report = report
+            print(
+                f"Deduplicated time series: {report.n_solved} of {report.n_steps} steps solved "
+                f"(hit rate {report.hit_rate:.1%}) in {report.solve_seconds:.1f} s"
+            )
+        elif chunked:
+            try:
+                NetworkGenerationData.net_results, report = run_time_series_chunked(
+                    NetworkGenerationData.net,
+                    time_steps,
+                    log_variables,
+                    chunk_size,
+                    max_workers=max_workers,
+                    **run_kwargs,
+                )
+            except Exception as e:
+                settings = _solver_settings(run_kwargs, solver)
+                raise RuntimeError(f"Chunked thermohydraulic time-series simulation failed ({settings}): {e}") from e
+            NetworkGenerationData.time_series_report = report
+            print(
+                f"Chunked time series: {len(report.chunks)} blocks on {report.max_workers} workers in "
+                f"{report.wall_seconds:.1f} s, max. boundary deviation {report.max_boundary_deviation:.3g}"
+            )
+        elif checkpoint_dir is not None:
+            try:
+                NetworkGenerationData.net_results, NetworkGenerationData.net, solver, report = (
+                    run_time_series_checkpointed(
+                        NetworkGenerationData.net,
+                        time_steps,
+                        log_variables,
+                        checkpoint_dir,
+                        every=checkpoint_every,
+                        key=checkpoint_run_key,
+                        resume=resume,
+                        solver=solver,
+                        recorder=recorder,
+                        **{name: value for name, value in run_kwargs.items() if name != "run"},
+                    )
+                )
+            except Exception as e:
+                settings = _solver_settings(run_kwargs, solver)
+                raise RuntimeError(
+                    f"Thermohydraulic time-series simulation failed ({settings}): {e}\n"
+                    f"Completed time steps are kept in {checkpoint_dir} for a resume."
+                ) from e
+            NetworkGenerationData.time_series_report = report
+        else:
+            ow = OutputWriter(NetworkGenerationData.net, time_steps, output_path=None, log_variables=log_variables)
+
+            try:
+                run_time_series.run_timeseries(NetworkGenerationData.net, time_steps, **run_kwargs)
+            except Exception as e:
+                settings = _solver_settings(run_kwargs, solver)
+                raise RuntimeError(f"Thermohydraulic time-series simulation failed ({settings}): {e}") from e
+
+            NetworkGenerationData.net_results = ow.np_results
+    finally:
+        # Also after a failure: no solver controller may stay in the net for the next run
+        if solver is not None and not chunked:
+            solver.detach(NetworkGenerationData.net)
+            NetworkGenerationData.solver_report = solver.report()
+            _print_solver_report(NetworkGenerationData.solver_report)
+        _finish_telemetry(NetworkGenerationData, recorder)
     # Fail loudly on a non-converged / infeasible run instead of letting NaN/inf
     # propagate into the heat and temperature post-processing (BACKLOG C2).
     validate_simulation_results(NetworkGenerationData.net_results, context="thermohydraulic time series")
+    if cache is not None:
+        cache.store(cache_key, NetworkGenerationData.net_results, NetworkGenerationData.net)
     NetworkGenerationData.pump_results = calculate_results(NetworkGenerationData.net, NetworkGenerationData.net_results)
 
     return NetworkGenerationData
 
 
-def simplified_time_series_net(NetworkGenerationData) -> Any:
+def surrogate_time_series_net(NetworkGenerationData, settings: SurrogateSettings | None = None) -> Any:
     """
-    Run simplified time series by scaling design state with building heat demand.
+    Run the time series on representative hours and reconstruct the rest with fitted surfaces.
+
+    :param NetworkGenerationData: Network data with preprocessed model and parameters
+    :type NetworkGenerationData: object
+    :param settings: Number of representative / hold-out hours, defaults to :class:`SurrogateSettings`
+    :type settings: Optional[SurrogateSettings]
+    :return: Updated NetworkGenerationData with reconstructed results and pump operations
+    :rtype: Any
+
+    .. note::
+       Between simplified_time_series_net and thermohydraulic_time_series_net in cost and accuracy:
+       full bidirectional pipeflows (iter=100, alpha=0.5) for the representative hours only, see
+       :mod:`~districtheatingsim.net_simulation_pandapipes.surrogate_time_series`, solved with the
+       adaptive pipeflow. Pipe results are logged in addition. The hold-out accuracy is stored in
+       ``time_series_report`` (saved next to the results CSV, see
+       :func:`~districtheatingsim.net_simulation_pandapipes.surrogate_time_series.surrogate_report_path`),
+       the solver effort per hour in ``solver_report``.
+    """
+    time_steps, profile_controller = _install_time_series_controllers(NetworkGenerationData)
+    log_variables = create_log_variables(NetworkGenerationData.net) + PIPE_LOG_VARIABLES
+    solver = AdaptivePipeflow()
+    solver.attach(NetworkGenerationData.net)
+
+    run_kwargs = {"mode": "bidirectional", "iter": 100, "alpha": 0.5}
+    try:
+        NetworkGenerationData.net_results, report = run_time_series_surrogate(
+            NetworkGenerationData.net,
+            time_steps,
+            log_variables,
+            profile_controller.qext_w,
+            _supply_temperature_series(NetworkGenerationData, len(time_steps)),
+            settings=settings,
+            run=solver,
+            **run_kwargs,
+        )
+    except Exception as e:
+        raise RuntimeError(
+            f"Surrogate thermohydraulic time-series simulation failed ({_solver_settings(run_kwargs, solver)}): {e}"
+        ) from e
+    finally:
+        solver.detach(NetworkGenerationData.net)
+        NetworkGenerationData.solver_report = solver.report()
+
+    NetworkGenerationData.time_series_report = report
+    worst = max(report.validation_error.items(), key=lambda item: item[1], default=("-", 0.0))
+    print(
+        f"Surrogate time series: {len(report.representative_steps)} representative + "
+        f"{len(report.validation_steps)} hold-out of {report.n_steps} steps solved in {report.solve_seconds:.1f} s, "
+        f"max. hold-out error {worst[1]:.3g} ({worst[0]})"
+    )
+    validate_simulation_results(NetworkGenerationData.net_results, context="surrogate time series")
+    NetworkGenerationData.pump_results = calculate_results(NetworkGenerationData.net, NetworkGenerationData.net_results)
+
+    return NetworkGenerationData
+
+
+def _simulate_fast_network_model(NetworkGenerationData, model: FastNetworkModel, n_steps: int) -> FastNetworkResults:
+    """
+    Evaluate the fast network model with the profiles of the selected time range.
+
+    :param NetworkGenerationData: Network data with preprocessed profiles
+    :type NetworkGenerationData: object
+    :param model: Model built from the initialized network
+    :type model: FastNetworkModel
+    :param n_steps: Number of simulated time steps
+    :type n_steps: int
+    :return: Results of all time steps
+    :rtype: FastNetworkResults
+
+    .. note::
+       Secondary producers map to the ``circ_pump_mass`` rows in list order, as in
+       create_network; without a schedule per row the table values are held constant.
+    """
+    start, end = NetworkGenerationData.start_time_step, NetworkGenerationData.end_time_step
+    qext_w = _profile_matrix(NetworkGenerationData.waerme_hast_ges_W, n_steps, start, end)
+    return_temperature = None
+    if isinstance(NetworkGenerationData.return_temperature_heat_consumer, np.ndarray):
+        return_temperature = _profile_matrix(
+            NetworkGenerationData.return_temperature_heat_consumer, n_steps, start, end
+        )
+
+    producer_mass_flow = None
+    producers = NetworkGenerationData.secondary_producers or []
+    if producers and len(producers) == len(model.producer_indices):
+        producer_mass_flow = _profile_matrix([producer.mass_flow for producer in producers], n_steps, start, end)
+    return model.simulate(
+        qext_w,
+        _supply_temperature_series(NetworkGenerationData, n_steps),
+        return_temperature=return_temperature,
+        producer_mass_flow=producer_mass_flow,
+    )
+
+
+def simplified_time_series_net(NetworkGenerationData, fast_network_model: bool = True) -> Any:
+    """
+    Run simplified time series without pipeflow, based on the design state.
 
     :param NetworkGenerationData: Network data with design state from initialization
     :type NetworkGenerationData: object
-    :return: Updated NetworkGenerationData with scaled load profiles
+    :param fast_network_model: Evaluate losses, return temperature and pump pressures with the
+        quasi-static :class:`FastNetworkModel`; False scales the design state with the demand
+    :type fast_network_model: bool
+    :return: Updated NetworkGenerationData with pump_results (and the FastNetworkResults as
+        time_series_report)
     :rtype: Any
 
     .. note::
-       No pipeflow calculation. Uses design state from net.res_*, scales with demand.
-       Constant temperatures/pressures from design. Losses scaled proportionally.
-       Much faster than thermohydraulic_time_series_net.
+       No pipeflow calculation. The fast network model computes pipe heat losses from
+       U-value, length and soil temperature and pressure drops scaling with mdot² for all
+       hours at once. Meshed networks fall back to the design scaling: constant
+       temperatures/pressures from design, design losses split by producer share.
     """
 
     print("Starte vereinfachte Zeitreihenberechnung (basierend auf Auslegung)...")
+    NetworkGenerationData.time_series_report = None
 
     # Get time steps for selected simulation range
     time_steps = range(
@@ -619,6 +1139,22 @@ def simplified_time_series_net(NetworkGenerationData) -> Any:
 
     print(f"Auslegungsverluste: {design_losses_kW:.1f} kW ({design_loss_factor * 100:.2f}%)")
 
+    if fast_network_model:
+        try:
+            model = FastNetworkModel(NetworkGenerationData.net)
+        except ValueError as e:
+            print(f"Netzmodell nicht anwendbar ({e}), skaliere Auslegungszustand.")
+        else:
+            results = _simulate_fast_network_model(NetworkGenerationData, model, n_steps)
+            NetworkGenerationData.pump_results = results.pump_results
+            NetworkGenerationData.time_series_report = results
+            print(
+                f"Netzverluste: {results.heat_loss_kW.sum():.0f} kWh ({results.heat_loss_kW.mean():.1f} kW im Mittel), "
+                f"Rechenzeit {results.seconds * 1000:.0f} ms"
+            )
+            print(f"Vereinfachte Berechnung erfolgreich abgeschlossen ({n_steps} Zeitschritte).")
+            return NetworkGenerationData
+
     # Create time series by scaling with building demand
     NetworkGenerationData.pump_results = {"Heizentrale Haupteinspeisung": {}, "weitere Einspeisung": {}}
 
@@ -745,7 +1281,14 @@ def calculate_results(
 
 
 def save_results_csv(
-    time_steps: np.ndarray, total_heat_KW: np.ndarray, strom_wp_kW: np.ndarray, pump_results: dict, filename: str
+    time_steps: np.ndarray,
+    total_heat_KW: np.ndarray,
+    strom_wp_kW: np.ndarray,
+    pump_results: dict,
+    filename: str,
+    *,
+    compression: str | None = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
 ) -> None:
     """
     Export simulation results to CSV file with German column headers.
@@ -758,44 +1301,46 @@ def save_results_csv(
     :type strom_wp_kW: np.ndarray
     :param pump_results: Structured pump results from calculate_results
     :type pump_results: Dict
-    :param filename: Output CSV file path
+    :param filename: Output file path (``.csv``; ``.csv.gz``/``.csv.zst`` compress, ``.parquet`` writes Parquet)
     :type filename: str
+    :param compression: Explicit CSV compression (``"gzip"``/``"zstd"``); inferred from ``filename`` if ``None``
+    :type compression: Optional[str]
+    :param chunk_rows: Rows written per chunk
+    :type chunk_rows: int
 
     .. note::
        Semicolon-separated CSV with German column names. Includes Zeit,
        Gesamtwärmebedarf_Gebäude_kW, pump data (Wärmeerzeugung, Massenstrom,
-       Delta p, temperatures, pressures). UTF-8-sig encoding.
-    """
-    # Convert arrays to pandas DataFrame
-    df = pd.DataFrame(
-        {
-            "Zeit": time_steps,
-            "Gesamtwärmebedarf_Gebäude_kW": total_heat_KW,
-            "Gesamtheizlast_Gebäude_kW": total_heat_KW + strom_wp_kW,
-            "Gesamtstrombedarf_Wärmepumpen_Gebäude_kW": strom_wp_kW,
-        }
-    )
+       Delta p, temperatures, pressures). UTF-8-sig encoding. Written in chunks
+       straight from the arrays (see :func:`~districtheatingsim.utilities.table_export.write_columns`).
+    """
+    columns = {
+        "Zeit": time_steps,
+        "Gesamtwärmebedarf_Gebäude_kW": total_heat_KW,
+        "Gesamtheizlast_Gebäude_kW": np.asarray(total_heat_KW) + np.asarray(strom_wp_kW),
+        "Gesamtstrombedarf_Wärmepumpen_Gebäude_kW": strom_wp_kW,
+    }
 
     # Add pump data columns
     for pump_type, pumps in pump_results.items():
         for idx, pump_data in pumps.items():
-            df[f"Wärmeerzeugung_{pump_type}_{idx + 1}_kW"] = pump_data["qext_kW"]
-            df[f"Massenstrom_{pump_type}_{idx + 1}_kg/s"] = pump_data["mass_flow"]
-            df[f"Delta p_{pump_type}_{idx + 1}_bar"] = pump_data["deltap"]
-            df[f"Vorlauftemperatur_{pump_type}_{idx + 1}_°C"] = pump_data["flow_temp"]
-            df[f"Rücklauftemperatur_{pump_type}_{idx + 1}_°C"] = pump_data["return_temp"]
-            df[f"Vorlaufdruck_{pump_type}_{idx + 1}_bar"] = pump_data["flow_pressure"]
-            df[f"Rücklaufdruck_{pump_type}_{idx + 1}_bar"] = pump_data["return_pressure"]
+            columns[f"Wärmeerzeugung_{pump_type}_{idx + 1}_kW"] = pump_data["qext_kW"]
+            columns[f"Massenstrom_{pump_type}_{idx + 1}_kg/s"] = pump_data["mass_flow"]
+            columns[f"Delta p_{pump_type}_{idx + 1}_bar"] = pump_data["deltap"]
+            columns[f"Vorlauftemperatur_{pump_type}_{idx + 1}_°C"] = pump_data["flow_temp"]
+            columns[f"Rücklauftemperatur_{pump_type}_{idx + 1}_°C"] = pump_data["return_temp"]
+            columns[f"Vorlaufdruck_{pump_type}_{idx + 1}_bar"] = pump_data["flow_pressure"]
+            columns[f"Rücklaufdruck_{pump_type}_{idx + 1}_bar"] = pump_data["return_pressure"]
 
-    # Save DataFrame as CSV with German formatting
-    df.to_csv(filename, sep=";", date_format="%Y-%m-%d %H:%M:%S", index=False, encoding="utf-8-sig")
+    # Stream to disk with German formatting
+    write_columns(columns, filename, compression=compression, chunk_rows=chunk_rows, date_format="%Y-%m-%d %H:%M:%S")
 
 
 def import_results_csv(filename: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, dict]:
     """
     Import simulation results from CSV file created by save_results_csv.
 
-    :param filename: Input CSV file path
+    :param filename: Input CSV file path (``.csv.gz``/``.csv.zst`` are decompressed)
     :type filename: str
     :return: (time_steps, total_heat_KW, strom_wp_kW, pump_results)
     :rtype: Tuple[np.ndarray, np.ndarray, np.ndarray, Dict]
@@ -808,8 +1353,9 @@ def import_results_csv(filename: str) -> tuple[np.ndarray, np.ndarray, np.ndarra
        structure. Converts dtypes to datetime64/float64. Returns time_steps as
        datetime, heat/power as kW arrays, pump_results matching calculate_results.
     """
-    # Load data from CSV file
-    data = pd.read_csv(filename, sep=";", parse_dates=["Zeit"])
+    # Load data from CSV file (plain or .gz/.zst compressed)
+    with open_csv(filename) as f:
+        data = pd.read_csv(f, sep=";", parse_dates=["Zeit"])
 
     # Extract general time series and heat data
     time_steps = data["Zeit"].values.astype("datetime64")
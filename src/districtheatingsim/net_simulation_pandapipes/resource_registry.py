@@ -0,0 +1,233 @@
+"""
+Process-wide registry of static simulation resources (COP field, pipe catalog).
+==============================================================================
+
+Two static data sets were re-read on every use:
+
+* the heat-pump characteristic ``Kennlinien WP.csv`` — ``np.genfromtxt`` in
+  ``COP_WP``, the time-series preprocessing, the network initialisation and the
+  energy-system tab;
+* the pandapipes pipe std-type catalog — rebuilt as a DataFrame, filtered by
+  material and re-grouped into diameter ladders by ``init_diameter_types`` /
+  ``optimize_diameter_types``, with a per-pipe catalog scan in
+  ``select_std_type_within_grade``.
+
+:func:`load_cop_table` and :func:`pipe_catalog` load each data set once per
+process and hand out the cached (read-only) result; :class:`PipeCatalog` holds the
+derived structures (ladders, per-type positions and properties) so that neighbour
+and property lookups are O(1) dict hits and within-grade selection is a binary
+search. :func:`registry_stats` exposes load/hit counters and the time spent
+loading, so repeated sizing and heat-pump runs can be checked for parsing costs.
+
+:author: Dipl.-Ing. (FH) Jonas Pfeiffer
+"""
+
+import os
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandapipes as pp
+import pandas as pd
+
+from districtheatingsim.net_simulation_pandapipes.pipe_std_types import resolve_pipe_u_w_per_m2k
+from districtheatingsim.utilities.utilities import DEFAULT_COP_RESOURCE, get_resource_path
+
+
+@dataclass
+class ResourceStats:
+    """
+    Load/hit counters of one registry resource.
+
+    :ivar loads: Number of times the resource was (re)built from its source.
+    :ivar hits: Number of lookups served from the cache.
+    :ivar load_seconds: Total wall time spent building the resource [s].
+    """
+
+    loads: int = 0
+    hits: int = 0
+    load_seconds: float = 0.0
+
+
+@dataclass
+class PipeCatalog:
+    """
+    Pipe std-types of one material with the lookup structures the sizing code needs.
+
+    :ivar material: Material filter the catalog was built for (``None`` = all types).
+    :ivar table: Catalog rows (DataFrame indexed by std-type name).
+    :ivar ladders: ``{grade: [type_name, …]}`` ordered small→large bore, as
+        returned by :func:`~districtheatingsim.net_simulation_pandapipes.utilities.build_diameter_ladders`.
+    """
+
+    material: str | None
+    table: pd.DataFrame
+    ladders: dict[str, list[str]]
+    _positions: dict[str, tuple[str, int]] = field(default_factory=dict, repr=False)
+    _grade_diameters: dict[str | None, tuple[np.ndarray, list[str]]] = field(default_factory=dict, repr=False)
+    _properties: dict[str, tuple[float, float | None]] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_table(cls, table: pd.DataFrame, material: str | None) -> "PipeCatalog":
+        """Build the catalog and its lookup structures from a std-type table."""
+        # Imported here: utilities imports this module for its sizing functions.
+        from districtheatingsim.net_simulation_pandapipes.utilities import build_diameter_ladders
+
+        ladders = build_diameter_ladders(table)
+        catalog = cls(material=material, table=table, ladders=ladders)
+        diameters = table["inner_diameter_mm"].to_dict()
+        for grade, names in ladders.items():
+            for pos, name in enumerate(names):
+                catalog._positions[name] = (grade, pos)
+            catalog._grade_diameters[grade] = (np.array([diameters[n] for n in names], dtype=float), names)
+        all_names = sorted(table.index, key=lambda n: (diameters[n], n))
+        catalog._grade_diameters[None] = (np.array([diameters[n] for n in all_names], dtype=float), all_names)
+        for name, row in table.iterrows():
+            try:
+                u_w_per_m2k = resolve_pipe_u_w_per_m2k(row)
+            except ValueError:
+                u_w_per_m2k = None  # no heat-loss data (e.g. gas/water pipes); raised on use
+            catalog._properties[name] = (float(row["inner_diameter_mm"]), u_w_per_m2k)
+        return catalog
+
+    def properties(self, std_type: str) -> tuple[float, float]:
+        """
+        ``(inner_diameter_mm, u_w_per_m2k)`` of a std-type (O(1)).
+
+        :raises KeyError: If ``std_type`` is not in the catalog.
+        :raises ValueError: If the type has no heat-transfer coefficient
+            (see :func:`resolve_pipe_u_w_per_m2k`).
+        """
+        inner_diameter_mm, u_w_per_m2k = self._properties[std_type]
+        if u_w_per_m2k is None:
+            resolve_pipe_u_w_per_m2k(self.table.loc[std_type])  # raises the descriptive ValueError
+        return inner_diameter_mm, u_w_per_m2k
+
+    def neighbor(self, std_type: str, *, larger: bool) -> str | None:
+        """
+        Next-larger or next-smaller bore of the *same insulation grade* (O(1)).
+
+        Same result as ``neighbor_std_type(std_type, catalog.ladders, larger=...)``.
+        """
+        position = self._positions.get(std_type)
+        if position is None:
+            return None
+        grade, pos = position
+        ladder = self.ladders[grade]
+        new_pos = pos + (1 if larger else -1)
+        return ladder[new_pos] if 0 <= new_pos < len(ladder) else None
+
+    def select_within_grade(self, grade: str, required_diameter_mm: float) -> str:
+        """
+        Smallest type of ``grade`` with an inner diameter ≥ ``required_diameter_mm``.
+
+        Same rule as ``select_std_type_within_grade``: falls back to the largest type
+        of the grade if none is big enough, and to the whole catalog for an unknown
+        grade. Binary search over the pre-sorted ladder.
+        """
+        diameters, names = self._grade_diameters.get(grade, self._grade_diameters[None])
+        pos = int(np.searchsorted(diameters, required_diameter_mm, side="left"))
+        return names[pos] if pos < len(names) else names[-1]
+
+
+_stats: dict[str, ResourceStats] = {"cop_table": ResourceStats(), "pipe_catalog": ResourceStats()}
+_cop_tables: dict[tuple[str, int, int], np.ndarray] = {}
+_pipe_catalogs: dict[tuple, PipeCatalog] = {}
+
+
+def load_cop_table(filename: str | None = None) -> np.ndarray:
+    """
+    Heat-pump COP characteristic (``Kennlinien WP.csv`` layout), loaded once per file.
+
+    :param filename: COP CSV path; ``None`` uses the bundled default field.
+    :type filename: str | None
+    :return: The parsed table (row 0 = supply temperatures, column 0 = source
+        temperatures). Shared and **read-only**.
+    :rtype: np.ndarray
+    :raises FileNotFoundError: If the file does not exist.
+
+    .. note::
+       Cached per ``(path, mtime, size)``, so an edited file is re-read.
+    """
+    path = os.path.abspath(filename if filename else get_resource_path(DEFAULT_COP_RESOURCE))
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    stats = _stats["cop_table"]
+    table = _cop_tables.get(key)
+    if table is not None:
+        stats.hits += 1
+        return table
+
+    start = time.perf_counter()
+    table = np.genfromtxt(path, delimiter=";")
+    table.flags.writeable = False
+    _cop_tables[key] = table
+    stats.loads += 1
+    stats.load_seconds += time.perf_counter() - start
+    return table
+
+
+def _std_type_fingerprint(net) -> tuple:
+    """Identity of the pipe std-types available in ``net`` (name + sizing-relevant values)."""
+    # Values are stringified: NaN never compares equal to itself, which would make
+    # every lookup a miss.
+    fields = ("material", "inner_diameter_mm", "u_w_per_mk", "u_w_per_m2k")
+    return tuple(
+        sorted((str(name), *(str(props.get(f)) for f in fields)) for name, props in net.std_types["pipe"].items())
+    )
+
+
+def pipe_catalog(net=None, material: str | None = None) -> PipeCatalog:
+    """
+    Cached pipe std-type catalog, optionally filtered to one material.
+
+    :param net: Network whose std-types to use (custom types included); ``None``
+        uses the pandapipes library defaults.
+    :param material: Material filter (e.g. ``ISOPLUS_MATERIAL``); ``None`` keeps all types.
+    :type material: str | None
+    :return: The shared :class:`PipeCatalog` (treat its ``table`` as read-only).
+    :rtype: PipeCatalog
+    :raises ValueError: If no std-type matches ``material``.
+
+    .. note::
+       Keyed by the material and a fingerprint of the net's pipe std-types, so a net
+       with added or changed types gets its own catalog.
+    """
+    if net is None:
+        net = pp.create_empty_network(fluid="water")
+    key = (material, _std_type_fingerprint(net))
+    stats = _stats["pipe_catalog"]
+    catalog = _pipe_catalogs.get(key)
+    if catalog is not None:
+        stats.hits += 1
+        return catalog
+
+    start = time.perf_counter()
+    table = pp.std_types.available_std_types(net, "pipe")
+    if material is not None:
+        table = table[table["material"] == material]
+        if table.empty:
+            raise ValueError(f"No standard pipe types found for material filter: {material}")
+    catalog = PipeCatalog.from_table(table, material)
+    _pipe_catalogs[key] = catalog
+    stats.loads += 1
+    stats.load_seconds += time.perf_counter() - start
+    return catalog
+
+
+def registry_stats() -> dict[str, ResourceStats]:
+    """
+    Snapshot of the load/hit counters per resource (``"cop_table"``, ``"pipe_catalog"``).
+
+    :return: ``{resource: ResourceStats}`` (copies; mutating them has no effect).
+    :rtype: dict[str, ResourceStats]
+    """
+    return {name: ResourceStats(s.loads, s.hits, s.load_seconds) for name, s in _stats.items()}
+
+
+def clear_registry() -> None:
+    """Drop all cached resources and reset the counters."""
+    _cop_tables.clear()
+    _pipe_catalogs.clear()
+    for name in _stats:
+        _stats[name] = ResourceStats()
@@ -0,0 +1,367 @@
+"""
+Content-addressed cache of network time series results.
+=======================================================
+
+Re-running "Zeitreihenberechnung" with unchanged inputs, or simulating a second variant
+with the same network, repeated the whole time series. :class:`ResultCache` stores the
+results of a run under a key of everything that determines them (:meth:`ResultCache.key`):
+
+* the element tables (junctions, pipes, heat consumers, pumps, flow controls, …),
+  normalized — sorted rows and columns, numbers as float, without names, the initial
+  guesses of the junctions and the columns the time-series controllers overwrite
+  (heat demand, return temperatures, pump set points: their values before the run are
+  leftovers of the previous run, the profiles that set them are part of the key),
+* the pipe standard types in use,
+* the configuration of the controllers, including the profiles over the simulated range,
+* the run settings (mode, solver, deduplication, …).
+
+Compute the key before a solver or telemetry recorder is attached: their controllers
+only observe the run and would make the key unique.
+
+An entry is ``<key>.npz`` (the ``OutputWriter`` arrays, ``net_results``) plus
+``<key>.pkl`` (the result tables and controlled columns of the network after the run).
+A hit restores both into the network, so the caller continues exactly as after a
+simulation. The least recently used entries are removed once the cache exceeds
+``max_bytes``. Reading or writing the cache never fails a simulation: broken entries are
+treated as misses and write errors are logged.
+
+Usage::
+
+    cache = ResultCache(os.path.join(project_folder, RESULT_CACHE_DIRNAME))
+    key = cache.key(net, mode="bidirectional", iter=100)
+    hit = cache.load(key, net)          # np_results or None
+    ...
+    cache.store(key, np_results, net)
+
+:author: Dipl.-Ing. (FH) Jonas Pfeiffer
+"""
+
+import glob
+import hashlib
+import logging
+import os
+import pickle
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from pandapower.control.controller.const_control import ConstControl
+from pandapower.timeseries import DFData
+
+from districtheatingsim.net_simulation_pandapipes.controllers import (
+    BadPointPressureLiftController,
+    HeatConsumerProfileController,
+    MinimumSupplyTemperatureController,
+)
+
+#: Folder (in the project folder) holding the cached results of all variants.
+RESULT_CACHE_DIRNAME = ".net_results_cache"
+
+#: Bump when the key or the entry layout changes (part of the key).
+RESULT_CACHE_VERSION = 1
+
+#: Default size limit of the cache folder.
+DEFAULT_MAX_CACHE_BYTES = 2 * 1024**3
+
+#: Element tables that take part in the key (if present in the network).
+_ELEMENT_TABLES = (
+    "junction",
+    "pipe",
+    "valve",
+    "heat_consumer",
+    "heat_exchanger",
+    "circ_pump_pressure",
+    "circ_pump_mass",
+    "pump",
+    "flow_control",
+    "ext_grid",
+    "sink",
+    "source",
+)
+
+#: Columns that never change the results: names and the start values of the Newton solver.
+_IGNORED_COLUMNS = {"name"}
+_INITIAL_GUESS_COLUMNS = {("junction", "pn_bar"), ("junction", "tfluid_k")}
+
+
+@dataclass
+class CachedRunReport:
+    """
+    Report of a time series served from the cache.
+
+    :ivar key: Cache key of the run.
+    :ivar directory: Cache folder.
+    """
+
+    key: str
+    directory: str
+
+
+def _controlled_columns(net) -> set[tuple[str, str]]:
+    """``(table, column)`` pairs that the controllers of ``net`` write during a time series."""
+    columns = set(_INITIAL_GUESS_COLUMNS)
+    for ctrl in net.controller["object"]:
+        if isinstance(ctrl, ConstControl):
+            columns.add((ctrl.element, ctrl.variable))
+        elif isinstance(ctrl, BadPointPressureLiftController):
+            columns.update({("circ_pump_pressure", "plift_bar"), ("circ_pump_pressure", "p_flow_bar")})
+        elif isinstance(ctrl, HeatConsumerProfileController):
+            columns.add(("heat_consumer", "qext_w"))
+            if ctrl.treturn_k is not None:
+                columns.add(("heat_consumer", "treturn_k"))
+        elif isinstance(ctrl, MinimumSupplyTemperatureController):
+            columns.add(("heat_consumer", "treturn_k"))
+    return columns
+
+
+def _update(digest, value) -> None:
+    """Feed ``value`` (scalars, strings, arrays, tables, nested lists/dicts) into ``digest``."""
+    if isinstance(value, DFData):
+        value = value.df
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        digest.update(repr(list(value.columns) if isinstance(value, pd.DataFrame) else value.name).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        array = np.ascontiguousarray(value, dtype=float if value.dtype.kind in "biuf" else None)
+        digest.update(repr((array.shape, array.dtype.str)).encode())
+        digest.update(array.tobytes() if array.dtype != object else repr(array.tolist()).encode())
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"[{len(value)}".encode())
+        for item in value:
+            _update(digest, item)
+    elif isinstance(value, dict):
+        for item_key in sorted(value, key=repr):
+            digest.update(repr(item_key).encode())
+            _update(digest, value[item_key])
+    elif isinstance(value, (bool, np.bool_, int, np.integer, float, np.floating)):
+        digest.update(repr(float(value)).encode())
+    else:
+        digest.update(repr(value).encode())
+
+
+def _controller_config(ctrl, index: int, profile_targets: set[int]) -> list:
+    """Settings of a controller that affect the results (no state carried over from earlier runs)."""
+    if isinstance(ctrl, ConstControl):
+        return [ctrl.element, ctrl.variable, ctrl.element_index, ctrl.profile_name, ctrl.scale_factor, ctrl.data_source]
+    if isinstance(ctrl, BadPointPressureLiftController):
+        return [
+            ctrl.circ_pump_pressure_idx,
+            ctrl.target_dp_min_bar,
+            ctrl.tolerance,
+            ctrl.proportional_gain,
+            ctrl.min_plift,
+            ctrl.min_pflow,
+        ]
+    if isinstance(ctrl, MinimumSupplyTemperatureController):
+        config = [
+            ctrl.element_index,
+            ctrl.tolerance,
+            ctrl.max_iterations,
+            ctrl.temperature_adjustment_step,
+            ctrl.profile_name,
+            ctrl.data_source,
+        ]
+        # Set every step by the data source or the profile controller otherwise
+        if ctrl.data_source is None and index not in profile_targets:
+            config.append(np.asarray(ctrl.min_supply_temperature, dtype=float))
+        return config
+    if isinstance(ctrl, HeatConsumerProfileController):
+        return [ctrl.element_index, ctrl.qext_w, ctrl.treturn_k, ctrl.min_supply_temperature, ctrl.min_supply_targets]
+    # Unknown controller: its public attributes (objects without a stable repr make the key unique)
+    return [{name: value for name, value in vars(ctrl).items() if not name.startswith("_") and name != "net"}]
+
+
+def time_series_key(net, **settings) -> str:
+    """
+    Key of a time series on ``net`` with its controllers installed, before the run.
+
+    Shared by :class:`ResultCache` and the checkpoints of
+    :mod:`~districtheatingsim.net_simulation_pandapipes.time_series_checkpoint`.
+
+    :param net: Pandapipes network with all time-series controllers installed
+    :type net: pandapipes.pandapipesNet
+    :param settings: Run settings that change the results (mode, iterations, solver, range, …)
+    :return: Hex digest
+    :rtype: str
+    """
+    digest = hashlib.sha256(f"districtheatingsim-results-{RESULT_CACHE_VERSION}".encode())
+    controlled = _controlled_columns(net)
+    for table in _ELEMENT_TABLES:
+        if table not in net or not len(net[table]):
+            continue
+        frame = net[table]
+        columns = sorted(
+            column for column in frame.columns if column not in _IGNORED_COLUMNS and (table, column) not in controlled
+        )
+        frame = frame[columns].sort_index()
+        numeric = frame.select_dtypes(include=["number", "bool"]).columns
+        frame = frame.astype({column: float for column in numeric})
+        digest.update(table.encode())
+        _update(digest, frame)
+
+    if "pipe" in net and len(net.pipe) and "std_type" in net.pipe:
+        pipe_types = net.std_types.get("pipe", {})
+        used = sorted(str(name) for name in net.pipe["std_type"].dropna().unique())
+        _update(digest, {name: pipe_types.get(name) for name in used})
+
+    active = net.controller[net.controller["in_service"].astype(bool)].sort_index()
+    profile_targets = {
+        index
+        for ctrl in active["object"]
+        if isinstance(ctrl, HeatConsumerProfileController)
+        for index, _ in ctrl.min_supply_targets
+    }
+    for index, row in active.iterrows():
+        ctrl = row["object"]
+        digest.update(f"{type(ctrl).__module__}.{type(ctrl).__qualname__}".encode())
+        _update(digest, [row["level"], row["order"], _controller_config(ctrl, index, profile_targets)])
+
+    _update(digest, settings)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Folder of time series results addressed by a key of their inputs.
+
+    :param directory: Cache folder (created on the first store)
+    :type directory: str
+    :param max_bytes: Size limit; the least recently used entries are removed beyond it
+    :type max_bytes: int
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_CACHE_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, net, **settings) -> str:
+        """
+        Key of a time series on ``net`` with its controllers installed, before the run.
+
+        :param net: Pandapipes network with all time-series controllers installed
+        :type net: pandapipes.pandapipesNet
+        :param settings: Run settings that change the results (mode, iterations, solver, range, …)
+        :return: Hex digest, see :func:`time_series_key`
+        :rtype: str
+        """
+        return time_series_key(net, **settings)
+
+    def _paths(self, key: str) -> tuple[str, str]:
+        base = os.path.join(self.directory, key)
+        return base + ".npz", base + ".pkl"
+
+    def load(self, key: str, net) -> dict[str, np.ndarray] | None:
+        """
+        Results of ``key``; on a hit the result tables and controlled columns are written into ``net``.
+
+        :param key: Cache key, see :meth:`key`
+        :type key: str
+        :param net: Network of the run
+        :type net: pandapipes.pandapipesNet
+        :return: ``np_results`` of the cached run, None on a miss
+        :rtype: Optional[Dict[str, np.ndarray]]
+        """
+        results_path, state_path = self._paths(key)
+        if not (os.path.exists(results_path) and os.path.exists(state_path)):
+            return None
+        try:
+            with np.load(results_path, allow_pickle=False) as data:
+                np_results = {name: data[name] for name in data.files}
+            with open(state_path, "rb") as f:
+                state = pickle.load(f)
+        except Exception as e:
+            logging.warning(f"Ergebnis-Cache-Eintrag {key} ist nicht lesbar und wird verworfen: {e}")
+            self.remove(key)
+            return None
+
+        for table, frame in state["results"].items():
+            net[table] = frame
+        for (table, column), values in state["columns"].items():
+            net[table][column] = values
+        for path in (results_path, state_path):
+            os.utime(path)  # least recently used eviction
+        return np_results
+
+    def store(self, key: str, np_results: dict[str, np.ndarray], net) -> None:
+        """
+        Store the results of a completed run and evict old entries beyond ``max_bytes``.
+
+        :param key: Cache key computed before the run, see :meth:`key`
+        :type key: str
+        :param np_results: ``OutputWriter.np_results`` of the run
+        :type np_results: Dict[str, np.ndarray]
+        :param net: Network after the run
+        :type net: pandapipes.pandapipesNet
+        """
+        results_path, state_path = self._paths(key)
+        state = {
+            "results": {table: net[table].copy() for table in net.keys() if table.startswith("res_")},
+            "columns": {
+                (table, column): net[table][column].copy()
+                for table, column in _controlled_columns(net)
+                if table in net and column in net[table]
+            },
+        }
+        suffix = f".{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(results_path + suffix, "wb") as f:
+                np.savez(f, **np_results)
+            with open(state_path + suffix, "wb") as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(results_path + suffix, results_path)
+            os.replace(state_path + suffix, state_path)
+        except Exception as e:
+            logging.warning(f"Ergebnis-Cache konnte nicht geschrieben werden ({self.directory}): {e}")
+            for path in (results_path + suffix, state_path + suffix):
+                if os.path.exists(path):
+                    os.remove(path)
+            return
+        self.evict(keep=key)
+
+    def entries(self) -> list[tuple[str, int, float]]:
+        """
+        Cached runs, least recently used first.
+
+        :return: ``(key, size in bytes, last use as timestamp)`` per entry
+        :rtype: List[Tuple[str, int, float]]
+        """
+        entries = []
+        for results_path in glob.glob(os.path.join(glob.escape(self.directory), "*.npz")):
+            key = os.path.basename(results_path)[: -len(".npz")]
+            paths = [path for path in self._paths(key) if os.path.exists(path)]
+            entries.append(
+                (key, sum(os.path.getsize(path) for path in paths), max(os.path.getmtime(path) for path in paths))
+            )
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def size_bytes(self) -> int:
+        """Total size of the cached entries [bytes]."""
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, keep: str | None = None) -> None:
+        """
+        Remove the least recently used entries until the cache fits into ``max_bytes``.
+
+        :param keep: Entry that is never removed (the one just stored)
+        :type keep: Optional[str]
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for key, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if key != keep:
+                self.remove(key)
+                total -= size
+
+    def remove(self, key: str) -> None:
+        """Delete the entry of ``key``."""
+        for path in self._paths(key):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        for key, _, _ in self.entries():
+            self.remove(key)
@@ -0,0 +1,252 @@
+"""
+Columnar (Parquet) store for network time-series results.
+=========================================================
+
+The German semicolon CSV written by ``save_results_csv`` is the exchange format
+for the energy-system tab, but it is a poor storage format: loading one
+producer's flow temperature means parsing the whole year of every column, and the
+nested ``pump_results`` dict is rebuilt by splitting column names. The raw
+per-junction / per-consumer arrays (``net_results``) are not persisted at all.
+
+This module writes the same data (plus ``net_results``) to a single compressed
+Parquet file with one column per series:
+
+* ``time``, ``total_heat_kW``, ``heat_pump_power_kW``
+* ``pump/<pump_type>/<idx>/<param>`` — one column per ``pump_results`` entry
+  (``idx`` zero-based, exactly as in ``pump_results``)
+* ``net/<table>.<variable>/<element>`` — one column per element of each
+  ``OutputWriter`` result array (e.g. ``net/res_junction.t_k/12``)
+
+The layout (schema version, producer indices, result-array widths) is stored as
+JSON in the Parquet key-value metadata, so :func:`read_results_layout` answers
+"what is in this file" from the footer alone, and :func:`read_pump_series` /
+:func:`read_net_result` read just the requested columns.
+
+:author: Dipl.-Ing. (FH) Jonas Pfeiffer
+"""
+
+import json
+import os
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+#: Bump when the column naming or metadata layout changes. Files written with a
+#: newer version are rejected; older versions are read (or migrated) here.
+RESULTS_STORE_SCHEMA_VERSION = 1
+
+#: Key of the layout JSON in the Parquet key-value metadata.
+_METADATA_KEY = b"districtheatingsim.results"
+
+#: Rows per row group (~ one month of hourly steps) so time-range reads can skip groups.
+ROW_GROUP_SIZE = 744
+
+_PUMP_PREFIX = "pump"
+_NET_PREFIX = "net"
+
+
+def results_parquet_path(csv_filename: str) -> str:
+    """
+    Path of the Parquet results store that accompanies a results CSV.
+
+    :param csv_filename: Results CSV path (e.g. ``Lastgang/Lastgang.csv``).
+    :return: Same path with a ``.parquet`` extension.
+    :rtype: str
+    """
+    return os.path.splitext(csv_filename)[0] + ".parquet"
+
+
+def pump_column(pump_type: str, idx: int, param: str) -> str:
+    """Column name of one ``pump_results[pump_type][idx][param]`` series."""
+    return f"{_PUMP_PREFIX}/{pump_type}/{int(idx)}/{param}"
+
+
+def net_column(key: str, element: int) -> str:
+    """Column name of element ``element`` of the ``net_results[key]`` array."""
+    return f"{_NET_PREFIX}/{key}/{int(element)}"
+
+
+def save_results_parquet(
+    filename: str,
+    time_steps: np.ndarray,
+    total_heat_KW: np.ndarray,
+    strom_wp_kW: np.ndarray,
+    pump_results: dict,
+    net_results: dict | None = None,
+    compression: str = "zstd",
+) -> None:
+    """
+    Write network time-series results to a columnar Parquet store.
+
+    :param filename: Output ``.parquet`` path.
+    :type filename: str
+    :param time_steps: Time axis (``datetime64`` or numeric), length ``T``.
+    :type time_steps: np.ndarray
+    :param total_heat_KW: Building heat demand [kW], length ``T``.
+    :type total_heat_KW: np.ndarray
+    :param strom_wp_kW: Building heat pump electricity demand [kW], length ``T``.
+    :type strom_wp_kW: np.ndarray
+    :param pump_results: Nested producer results from ``calculate_results``.
+    :type pump_results: dict
+    :param net_results: Optional raw ``OutputWriter.np_results`` (``{key: (T, n) array}``).
+        Omitted for the simplified time series, which has no per-element results.
+    :type net_results: dict | None
+    :param compression: Parquet codec (``"zstd"``, ``"snappy"``, ``"gzip"``, ``"none"``).
+    :type compression: str
+    :raises ValueError: If a series length does not match ``time_steps``.
+    """
+    n_steps = len(time_steps)
+    time_values = np.asarray(time_steps)
+    if np.issubdtype(time_values.dtype, np.datetime64):
+        # Arrow has no hour/minute datetime units (profiles are often datetime64[h]).
+        time_values = time_values.astype("datetime64[s]")
+    columns = {
+        "time": pa.array(time_values),
+        "total_heat_kW": pa.array(np.asarray(total_heat_KW, dtype="float64")),
+        "heat_pump_power_kW": pa.array(np.asarray(strom_wp_kW, dtype="float64")),
+    }
+    layout: dict = {"schema_version": RESULTS_STORE_SCHEMA_VERSION, "pumps": {}, "net_results": {}}
+
+    for pump_type, pumps in pump_results.items():
+        layout["pumps"][pump_type] = {}
+        for idx, pump_data in pumps.items():
+            layout["pumps"][pump_type][str(int(idx))] = sorted(pump_data)
+            for param, values in pump_data.items():
+                columns[pump_column(pump_type, idx, param)] = pa.array(np.asarray(values, dtype="float64"))
+
+    for key, values in (net_results or {}).items():
+        arr = np.asarray(values)
+        if arr.size == 0 or not np.issubdtype(arr.dtype, np.number):
+            continue
+        arr = arr.reshape(len(arr), -1).astype("float64", copy=False)
+        layout["net_results"][key] = arr.shape[1]
+        for element in range(arr.shape[1]):
+            columns[net_column(key, element)] = pa.array(arr[:, element])
+
+    for name, column in columns.items():
+        if len(column) != n_steps:
+            raise ValueError(f"results column '{name}' has {len(column)} rows, expected {n_steps} (time steps).")
+
+    table = pa.table(columns)
+    table = table.replace_schema_metadata({_METADATA_KEY: json.dumps(layout).encode("utf-8")})
+    pq.write_table(table, filename, compression=compression, row_group_size=ROW_GROUP_SIZE)
+
+
+def read_results_layout(filename: str) -> dict:
+    """
+    Read the store layout from the Parquet footer (no column data is read).
+
+    :param filename: Parquet results store.
+    :return: ``{"schema_version", "pumps": {type: {idx: [params]}}, "net_results": {key: n}}``.
+    :rtype: dict
+    :raises ValueError: If the file is not a results store or was written by a newer version.
+    """
+    metadata = pq.read_schema(filename).metadata or {}
+    if _METADATA_KEY not in metadata:
+        raise ValueError(f"'{filename}' is not a DistrictHeatingSim results store (layout metadata missing).")
+    layout = json.loads(metadata[_METADATA_KEY].decode("utf-8"))
+    version = int(layout.get("schema_version", 0))
+    if version > RESULTS_STORE_SCHEMA_VERSION:
+        raise ValueError(
+            f"results store '{filename}' has schema version {version}; this version of "
+            f"DistrictHeatingSim reads up to {RESULTS_STORE_SCHEMA_VERSION}."
+        )
+    return layout
+
+
+def load_results_parquet(filename: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, dict]:
+    """
+    Load the CSV-equivalent results from a Parquet store.
+
+    Drop-in replacement for ``import_results_csv``: the per-element
+    ``net_results`` columns are **not** read.
+
+    :param filename: Parquet results store.
+    :return: ``(time_steps, total_heat_KW, strom_wp_kW, pump_results)``.
+    :rtype: tuple[np.ndarray, np.ndarray, np.ndarray, dict]
+    """
+    layout = read_results_layout(filename)
+    pump_columns = [
+        pump_column(pump_type, int(idx), param)
+        for pump_type, pumps in layout["pumps"].items()
+        for idx, params in pumps.items()
+        for param in params
+    ]
+    table = pq.read_table(filename, columns=["time", "total_heat_kW", "heat_pump_power_kW", *pump_columns])
+
+    pump_results: dict = {}
+    for pump_type, pumps in layout["pumps"].items():
+        pump_results[pump_type] = {}
+        for idx, params in pumps.items():
+            pump_results[pump_type][int(idx)] = {
+                param: table.column(pump_column(pump_type, int(idx), param)).to_numpy() for param in params
+            }
+
+    return (
+        table.column("time").to_numpy(),
+        table.column("total_heat_kW").to_numpy(),
+        table.column("heat_pump_power_kW").to_numpy(),
+        pump_results,
+    )
+
+
+def read_pump_series(filename: str, pump_type: str, idx: int, param: str) -> np.ndarray:
+    """
+    Read a single producer series (one column) from the store.
+
+    :param filename: Parquet results store.
+    :param pump_type: Producer group, e.g. ``"Heizentrale Haupteinspeisung"``.
+    :param idx: Zero-based producer index within the group.
+    :param param: Result key, e.g. ``"flow_temp"`` or ``"qext_kW"``.
+    :return: The series, length ``T``.
+    :rtype: np.ndarray
+    :raises KeyError: If the store has no such series.
+    """
+    column = pump_column(pump_type, idx, param)
+    if column not in pq.read_schema(filename).names:
+        raise KeyError(f"results store has no series '{column}'.")
+    return pq.read_table(filename, columns=[column]).column(0).to_numpy()
+
+
+def read_net_result(filename: str, key: str, elements: list[int] | None = None) -> np.ndarray:
+    """
+    Read one raw ``net_results`` array (or a subset of its elements).
+
+    :param filename: Parquet results store.
+    :param key: ``OutputWriter`` key, e.g. ``"res_junction.t_k"``.
+    :param elements: Element (column) indices to read; ``None`` reads all.
+    :return: ``(T, len(elements))`` array.
+    :rtype: np.ndarray
+    :raises KeyError: If the store has no such result array.
+    """
+    layout = read_results_layout(filename)
+    if key not in layout["net_results"]:
+        raise KeyError(f"results store has no net result '{key}'.")
+    if elements is None:
+        elements = range(layout["net_results"][key])
+    columns = [net_column(key, element) for element in elements]
+    table = pq.read_table(filename, columns=columns)
+    return np.column_stack([table.column(name).to_numpy() for name in columns])
+
+
+def load_results(csv_filename: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, dict]:
+    """
+    Load results for a results CSV path, preferring its Parquet store.
+
+    The Parquet store is used when it exists and is not older than the CSV (a CSV
+    edited or replaced by hand after the run wins); otherwise the CSV is parsed.
+
+    :param csv_filename: Results CSV path.
+    :return: ``(time_steps, total_heat_KW, strom_wp_kW, pump_results)``.
+    :rtype: tuple[np.ndarray, np.ndarray, np.ndarray, dict]
+    """
+    # Local import: the CSV reader lives in the (pandapipes-heavy) time-series module.
+    from districtheatingsim.net_simulation_pandapipes.pp_net_time_series_simulation import import_results_csv
+
+    parquet_path = results_parquet_path(csv_filename)
+    if os.path.exists(parquet_path) and (
+        not os.path.exists(csv_filename) or os.path.getmtime(parquet_path) >= os.path.getmtime(csv_filename)
+    ):
+        return load_results_parquet(parquet_path)
+    return import_results_csv(csv_filename)
@@ -0,0 +1,188 @@
+"""
+Load-state deduplication for the thermohydraulic time series.
+============================================================
+
+Many hours of a year drive the network with practically the same inputs — summer
+nights with domestic hot water only, hours clipped to the 2 % minimum load — yet the
+time series solves a full controlled pipeflow for every one of them.
+:func:`run_time_series_deduplicated` quantizes the inputs of each time step (heat
+demand vector, supply temperature, return and minimum supply temperatures of the
+consumers, secondary producer mass flows) into a state signature,
+solves only the first step of every distinct signature (in time order, so the
+controllers still see a chronological sequence) and copies the converged results to
+all later steps with the same signature.
+
+The quantization steps set the trade-off: a step of 0 only merges exactly equal
+states, coarser steps reuse more results at the price of a larger deviation.
+:class:`StateDedupReport` gives the hit rate (share of steps served from a previous
+solve); :func:`max_result_deviation` compares the reconstructed results with a full
+run. See ``examples/benchmark_state_dedup.py`` for numbers on the Görlitz project.
+
+.. note::
+   The bad-point pressure controller carries its pump set point from one step to the
+   next, so in a full run the same load state can settle at a slightly different pump
+   pressure depending on the preceding hour; pressures therefore deviate even with
+   exact signatures, temperatures and flows do not.
+   Reused steps carry the results of their representative step, including the logged
+   ``heat_consumer.qext_w``; the demand totals of the KPIs come from the profiles and
+   are not affected.
+
+:author: Dipl.-Ing. (FH) Jonas Pfeiffer
+"""
+
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+from pandapipes.timeseries import run_time_series
+from pandapower.timeseries import OutputWriter
+
+
+@dataclass
+class StateDedupSettings:
+    """
+    Quantization steps of the state signature (0 = only identical values match).
+
+    :ivar qext_step_w: Heat demand step per consumer [W].
+    :ivar temperature_step_k: Supply/return temperature step [K].
+    :ivar mass_flow_step_kg_s: Secondary producer mass flow step [kg/s].
+    """
+
+    qext_step_w: float = 1000.0
+    temperature_step_k: float = 0.5
+    mass_flow_step_kg_s: float = 0.01
+
+
+@dataclass
+class StateDedupReport:
+    """
+    Outcome of a deduplicated run.
+
+    :ivar n_steps: Simulated time steps.
+    :ivar n_solved: Steps actually solved (distinct signatures).
+    :ivar settings: Quantization used.
+    :ivar solve_seconds: Wall time of the reduced time series [s].
+    :ivar max_deviation: ``{np_results key: max |Δ|}`` against a full run, if compared
+        (see :func:`max_result_deviation`).
+    """
+
+    n_steps: int
+    n_solved: int
+    settings: StateDedupSettings
+    solve_seconds: float = 0.0
+    max_deviation: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of time steps served from an earlier solve (0 … 1)."""
+        return 1.0 - self.n_solved / self.n_steps if self.n_steps else 0.0
+
+
+def state_signatures(state: list[tuple[np.ndarray, float]]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Group time steps by their quantized input state.
+
+    :param state: ``(values, step)`` pairs; ``values`` has one row per time step (1-D
+        arrays are one column), ``step`` is its quantization step (0 = exact)
+    :type state: List[Tuple[np.ndarray, float]]
+    :return: ``(representatives, group)`` — the first time step of every distinct
+        signature in ascending order, and for each time step the position of its
+        representative in that array
+    :rtype: Tuple[np.ndarray, np.ndarray]
+    """
+    columns = []
+    for values, step in state:
+        values = np.asarray(values, dtype=float)
+        values = values.reshape(len(values), -1)
+        columns.append(np.round(values / step) if step > 0 else values)
+    signature = np.hstack(columns)
+    # np.unique sorts the signatures; re-sort the groups by first occurrence (time order).
+    _, first, inverse = np.unique(signature, axis=0, return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return first[order], rank[inverse.reshape(-1)]
+
+
+def run_time_series_deduplicated(
+    net,
+    time_steps: range,
+    log_variables: list[tuple[str, str]],
+    qext_w: np.ndarray,
+    supply_temperature: float | np.ndarray,
+    return_temperature: np.ndarray | None = None,
+    min_supply_temperature: np.ndarray | None = None,
+    producer_mass_flow: np.ndarray | None = None,
+    settings: StateDedupSettings | None = None,
+    **run_kwargs,
+) -> tuple[dict[str, np.ndarray], StateDedupReport]:
+    """
+    Run the time series on the distinct input states only and expand the results.
+
+    :param net: Pandapipes network with all time-series controllers installed
+    :type net: pandapipes.pandapipesNet
+    :param time_steps: Simulated time steps, ``range(n)``
+    :type time_steps: range
+    :param log_variables: ``OutputWriter`` log variables (see ``create_log_variables``)
+    :type log_variables: List[Tuple[str, str]]
+    :param qext_w: Heat demand matrix (time × consumers) [W], as driven by the controllers
+    :type qext_w: np.ndarray
+    :param supply_temperature: Supply temperature per time step (or constant) [°C or K]
+    :type supply_temperature: Union[float, np.ndarray]
+    :param return_temperature: Return temperature matrix (time × consumers) [°C or K], None if constant
+    :type return_temperature: Optional[np.ndarray]
+    :param min_supply_temperature: Minimum supply temperature matrix (time × consumers) [°C], None if unused
+    :type min_supply_temperature: Optional[np.ndarray]
+    :param producer_mass_flow: Secondary producer mass flows (time × producers) [kg/s], None without producers
+    :type producer_mass_flow: Optional[np.ndarray]
+    :param settings: Quantization steps, defaults to :class:`StateDedupSettings`
+    :type settings: Optional[StateDedupSettings]
+    :param run_kwargs: Passed to ``run_timeseries`` (e.g. ``mode``, ``iter``, ``alpha``)
+    :return: ``(np_results, report)`` — results for every time step and the dedup report
+    :rtype: Tuple[Dict[str, np.ndarray], StateDedupReport]
+    :raises ValueError: If ``time_steps`` is not ``range(n)`` or an input covers another number of steps
+    """
+    if not isinstance(time_steps, range) or time_steps.start != 0 or time_steps.step != 1:
+        raise ValueError("Deduplicated time series needs time_steps = range(n_steps).")
+    settings = settings or StateDedupSettings()
+    n_steps = len(time_steps)
+    state = [
+        (qext_w, settings.qext_step_w),
+        (np.broadcast_to(np.asarray(supply_temperature, dtype=float), (n_steps,)), settings.temperature_step_k),
+    ]
+    for values, step in (
+        (return_temperature, settings.temperature_step_k),
+        (min_supply_temperature, settings.temperature_step_k),
+        (producer_mass_flow, settings.mass_flow_step_kg_s),
+    ):
+        if values is not None:
+            state.append((values, step))
+    for values, _ in state:
+        if len(values) != n_steps:
+            raise ValueError(f"State input covers {len(values)} time steps, expected {n_steps}.")
+
+    representatives, group = state_signatures(state)
+    start = time.perf_counter()
+    ow = OutputWriter(net, representatives.tolist(), output_path=None, log_variables=log_variables)
+    run_time_series.run_timeseries(net, representatives.tolist(), **run_kwargs)
+    report = StateDedupReport(
+        n_steps=n_steps,
+        n_solved=len(representatives),
+        settings=settings,
+        solve_seconds=time.perf_counter() - start,
+    )
+    return {key: values[group] for key, values in ow.np_results.items()}, report
+
+
+def max_result_deviation(results: dict[str, np.ndarray], reference: dict[str, np.ndarray]) -> dict[str, float]:
+    """
+    Max absolute deviation per result key against a reference (full) run.
+
+    :param results: ``np_results`` to check
+    :type results: Dict[str, np.ndarray]
+    :param reference: ``np_results`` of the full run over the same time steps
+    :type reference: Dict[str, np.ndarray]
+    :return: ``{key: max |Δ|}``
+    :rtype: Dict[str, float]
+    """
+    return {key: float(np.max(np.abs(results[key] - expected), initial=0.0)) for key, expected in reference.items()}
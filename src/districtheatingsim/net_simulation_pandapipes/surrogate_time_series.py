@@ -0,0 +1,342 @@
+"""
+Representative-hour surrogate of the thermohydraulic time series.
+=================================================================
+
+A third calculation mode between ``simplified_time_series_net`` (quasi-static network
+model without pipeflow) and ``thermohydraulic_time_series_net``
+(one controlled pipeflow per hour):
+
+1. :func:`select_representative_steps` clusters the hourly input states (heat demand
+   per consumer, total demand, supply temperature) into ``k`` groups with k-means and
+   picks the real hour closest to each centroid. The peak- and minimum-load hours are
+   always included so the fit does not extrapolate at the ends.
+2. Those hours — plus a few random hold-out hours for validation — are simulated with
+   the full controlled pipeflow, in time order.
+3. Every logged result column (producer mass flows, pressures and temperatures, pipe
+   mass flows / pressures / temperatures, junction states) is fitted with a quadratic
+   surface (a plane for small ``k``) in total heat demand and supply temperature; heat consumer results are
+   fitted against the consumer's own demand. The surfaces reconstruct all time steps
+   in the usual ``np_results`` layout, so ``calculate_results`` works unchanged;
+   solved hours keep their exact results.
+4. The hold-out hours give the accuracy of the reconstruction
+   (:class:`SurrogateReport`, saved as JSON next to the results, see
+   :func:`surrogate_report_path`); :func:`max_result_deviation` compares against a full run.
+
+.. note::
+   The surfaces only see demand and supply temperature. Effects of other time-varying
+   inputs (building return temperature curves, minimum supply temperatures, secondary
+   producer schedules) show up as fit error in the validation report, and so do hours
+   near zero load, where long pipes cool the return strongly. The pump pressure of the
+   bad-point controller depends on the previous hour and scatters around the surface.
+
+:author: Dipl.-Ing. (FH) Jonas Pfeiffer
+"""
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+
+import numpy as np
+from pandapipes.timeseries import run_time_series
+from pandapower.timeseries import OutputWriter
+from scipy.cluster.vq import kmeans2
+
+from districtheatingsim.net_simulation_pandapipes.state_dedup import max_result_deviation
+
+#: Pipe results logged in addition to ``create_log_variables`` (mass flow, Δp, heat loss per pipe).
+PIPE_LOG_VARIABLES = [
+    ("res_pipe", "mdot_from_kg_per_s"),
+    ("res_pipe", "p_from_bar"),
+    ("res_pipe", "p_to_bar"),
+    ("res_pipe", "t_from_k"),
+    ("res_pipe", "t_to_k"),
+]
+
+_CONSUMER_PREFIX = "res_heat_consumer."
+_QEXT_KEY = "heat_consumer.qext_w"
+
+
+@dataclass
+class SurrogateSettings:
+    """
+    Size of the surrogate model.
+
+    :ivar n_states: Representative hours (k-means clusters) simulated for the fit.
+    :ivar n_validation: Additional random hours simulated to measure the reconstruction error.
+    :ivar seed: Seed of the clustering and the hold-out draw.
+    """
+
+    n_states: int = 48
+    n_validation: int = 24
+    seed: int = 0
+
+
+@dataclass
+class SurrogateReport:
+    """
+    Outcome of a surrogate run.
+
+    :ivar n_steps: Reconstructed time steps.
+    :ivar representative_steps: Time steps the surfaces were fitted on.
+    :ivar validation_steps: Hold-out time steps (simulated, not used for the fit).
+    :ivar solve_seconds: Wall time of the pipeflow runs [s].
+    :ivar fit_seconds: Wall time of fitting and reconstruction [s].
+    :ivar validation_error: ``{np_results key: max |Δ|}`` of the surfaces on the hold-out hours.
+    :ivar validation_rmse: ``{np_results key: RMSE}`` of the surfaces on the hold-out hours.
+    :ivar max_deviation: ``{np_results key: max |Δ|}`` against a full run, if compared.
+    """
+
+    n_steps: int
+    representative_steps: np.ndarray
+    validation_steps: np.ndarray
+    solve_seconds: float = 0.0
+    fit_seconds: float = 0.0
+    validation_error: dict[str, float] = field(default_factory=dict)
+    validation_rmse: dict[str, float] = field(default_factory=dict)
+    max_deviation: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def n_solved(self) -> int:
+        """Time steps solved with the full pipeflow (representatives + hold-out)."""
+        return len(self.representative_steps) + len(self.validation_steps)
+
+    def save(self, file_path: str) -> None:
+        """
+        Write the report as JSON (time steps as lists, errors per result column).
+
+        :param file_path: Output path, see :func:`surrogate_report_path`
+        :type file_path: str
+        """
+        data = asdict(self)
+        data["representative_steps"] = np.asarray(self.representative_steps).tolist()
+        data["validation_steps"] = np.asarray(self.validation_steps).tolist()
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    @classmethod
+    def load(cls, file_path: str) -> "SurrogateReport":
+        """
+        Read a report written by :meth:`save`.
+
+        :param file_path: JSON path
+        :type file_path: str
+        :return: The report
+        :rtype: SurrogateReport
+        """
+        with open(file_path, encoding="utf-8") as f:
+            data = json.load(f)
+        data["representative_steps"] = np.asarray(data["representative_steps"], dtype=int)
+        data["validation_steps"] = np.asarray(data["validation_steps"], dtype=int)
+        return cls(**data)
+
+
+def surrogate_report_path(results_csv_filename: str) -> str:
+    """
+    Path of the accuracy report that accompanies the results CSV of a surrogate run.
+
+    :param results_csv_filename: Results CSV path (e.g. ``Lastgang/Lastgang.csv``).
+    :return: ``<name>_surrogate.json`` next to it.
+    :rtype: str
+    """
+    return os.path.splitext(results_csv_filename)[0] + "_surrogate.json"
+
+
+def select_representative_steps(
+    qext_w: np.ndarray, supply_temperature: np.ndarray, n_states: int, seed: int = 0
+) -> np.ndarray:
+    """
+    Representative time steps of the hourly load / temperature states (k-means medoids).
+
+    :param qext_w: Heat demand matrix (time × consumers) [W]
+    :type qext_w: np.ndarray
+    :param supply_temperature: Supply temperature per time step [°C]
+    :type supply_temperature: np.ndarray
+    :param n_states: Number of clusters
+    :type n_states: int
+    :param seed: Seed of the k-means initialisation
+    :type seed: int
+    :return: Sorted time steps: one real hour per non-empty cluster plus the peak- and
+        minimum-load hours (all steps if ``n_states`` covers the range)
+    :rtype: np.ndarray
+    """
+    n_steps, n_consumers = qext_w.shape
+    if n_states >= n_steps:
+        return np.arange(n_steps)
+
+    total = qext_w.sum(axis=1)
+    features = [qext_w / np.where(qext_w.max(axis=0) > 0, qext_w.max(axis=0), 1.0)]
+    # Total demand and supply temperature drive the surfaces; weight them like all consumer columns together.
+    weight = np.sqrt(max(n_consumers, 1))
+    for series in (total, supply_temperature):
+        span = np.ptp(series)
+        features.append((weight * (series - series.min()) / span if span > 0 else np.zeros(n_steps))[:, None])
+    features = np.hstack(features)
+
+    centroids, labels = kmeans2(features, n_states, minit="++", seed=np.random.default_rng(seed))
+    steps = {int(np.argmax(total)), int(np.argmin(total))}
+    for cluster in np.unique(labels):
+        members = np.flatnonzero(labels == cluster)
+        distance = np.linalg.norm(features[members] - centroids[cluster], axis=1)
+        steps.add(int(members[np.argmin(distance)]))
+    return np.array(sorted(steps))
+
+
+#: Training steps per coefficient required for the quadratic surface; fewer fall back to a plane.
+_STEPS_PER_COEFFICIENT = 2
+
+
+def _design_matrix(
+    load: np.ndarray, supply_temperature: np.ndarray, scale: tuple[float, float, float], quadratic: bool
+) -> np.ndarray:
+    """Surface terms ``[1, x, y(, x², xy, y²)]`` of scaled load x and supply temperature y."""
+    load_scale, temperature_mid, temperature_scale = scale
+    x = load / load_scale
+    y = (supply_temperature - temperature_mid) / temperature_scale
+    terms = [np.ones_like(x), x, y]
+    if quadratic:
+        terms += [x * x, x * y, y * y]
+    return np.column_stack(terms)
+
+
+def _scale(load: np.ndarray, supply_temperature: np.ndarray) -> tuple[float, float, float]:
+    """Scaling of the regressors to about 0 … 1 (keeps the least-squares problem well conditioned)."""
+    load_scale = float(np.max(np.abs(load))) or 1.0
+    temperature_mid = float(np.mean(supply_temperature))
+    temperature_scale = float(np.ptp(supply_temperature)) or 1.0
+    return load_scale, temperature_mid, temperature_scale
+
+
+def fit_surfaces(
+    train_steps: np.ndarray,
+    train_results: dict[str, np.ndarray],
+    qext_w: np.ndarray,
+    supply_temperature: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """
+    Fit the result surfaces on the solved steps and evaluate them for every time step.
+
+    :param train_steps: Time steps the results belong to
+    :type train_steps: np.ndarray
+    :param train_results: ``np_results`` rows of ``train_steps`` (``{key: (len(train_steps), n)}``)
+    :type train_results: Dict[str, np.ndarray]
+    :param qext_w: Heat demand matrix of all time steps (time × consumers) [W]
+    :type qext_w: np.ndarray
+    :param supply_temperature: Supply temperature of all time steps [°C]
+    :type supply_temperature: np.ndarray
+    :return: Reconstructed ``np_results`` for all time steps; ``heat_consumer.qext_w`` is the input itself
+    :rtype: Dict[str, np.ndarray]
+    """
+    total = qext_w.sum(axis=1)
+    # Demand and supply temperature are strongly correlated over a year; with few training steps the
+    # quadratic terms would overshoot between them.
+    quadratic = len(train_steps) >= 6 * _STEPS_PER_COEFFICIENT
+    design = _design_matrix(total, supply_temperature, _scale(total, supply_temperature), quadratic)
+
+    results = {}
+    network_keys = [key for key in train_results if not key.startswith(_CONSUMER_PREFIX) and key != _QEXT_KEY]
+    if network_keys:
+        # One least-squares solve for all network-level columns (shared regressors).
+        targets = np.hstack([train_results[key] for key in network_keys])
+        coefficients = np.linalg.lstsq(design[train_steps], targets, rcond=None)[0]
+        predicted = design @ coefficients
+        offsets = np.cumsum([0] + [train_results[key].shape[1] for key in network_keys])
+        for key, begin, end in zip(network_keys, offsets[:-1], offsets[1:], strict=True):
+            results[key] = predicted[:, begin:end]
+
+    consumer_keys = [key for key in train_results if key.startswith(_CONSUMER_PREFIX)]
+    for key in consumer_keys:
+        results[key] = np.empty((len(total), train_results[key].shape[1]))
+    for consumer in range(qext_w.shape[1] if consumer_keys else 0):
+        load = qext_w[:, consumer]
+        design = _design_matrix(load, supply_temperature, _scale(load, supply_temperature), quadratic)
+        targets = np.column_stack([train_results[key][:, consumer] for key in consumer_keys])
+        coefficients = np.linalg.lstsq(design[train_steps], targets, rcond=None)[0]
+        predicted = design @ coefficients
+        for column, key in enumerate(consumer_keys):
+            results[key][:, consumer] = predicted[:, column]
+
+    if _QEXT_KEY in train_results:
+        results[_QEXT_KEY] = np.array(qext_w, dtype=float)
+    return results
+
+
+def run_time_series_surrogate(
+    net,
+    time_steps: range,
+    log_variables: list[tuple[str, str]],
+    qext_w: np.ndarray,
+    supply_temperature: float | np.ndarray,
+    settings: SurrogateSettings | None = None,
+    **run_kwargs,
+) -> tuple[dict[str, np.ndarray], SurrogateReport]:
+    """
+    Simulate the representative and hold-out hours and reconstruct all time steps.
+
+    :param net: Pandapipes network with all time-series controllers installed
+    :type net: pandapipes.pandapipesNet
+    :param time_steps: Simulated time steps, ``range(n)``
+    :type time_steps: range
+    :param log_variables: ``OutputWriter`` log variables, e.g. ``create_log_variables(net) + PIPE_LOG_VARIABLES``
+    :type log_variables: List[Tuple[str, str]]
+    :param qext_w: Heat demand matrix (time × consumers) [W], as driven by the controllers
+    :type qext_w: np.ndarray
+    :param supply_temperature: Supply temperature per time step (or constant) [°C]
+    :type supply_temperature: Union[float, np.ndarray]
+    :param settings: Model size, defaults to :class:`SurrogateSettings`
+    :type settings: Optional[SurrogateSettings]
+    :param run_kwargs: Passed to ``run_timeseries`` (e.g. ``mode``, ``iter``, ``alpha``)
+    :return: ``(np_results, report)`` — reconstructed results for every time step and the surrogate report
+    :rtype: Tuple[Dict[str, np.ndarray], SurrogateReport]
+    :raises ValueError: If ``time_steps`` is not ``range(n)``, the inputs cover another
+        number of steps or ``n_states < 1``
+    """
+    if not isinstance(time_steps, range) or time_steps.start != 0 or time_steps.step != 1:
+        raise ValueError("Surrogate time series needs time_steps = range(n_steps).")
+    settings = settings or SurrogateSettings()
+    if settings.n_states < 1:
+        raise ValueError(f"n_states must be >= 1, got {settings.n_states}.")
+    n_steps = len(time_steps)
+    qext_w = np.asarray(qext_w, dtype=float)
+    supply_temperature = np.broadcast_to(np.asarray(supply_temperature, dtype=float), (n_steps,))
+    if len(qext_w) != n_steps:
+        raise ValueError(f"Heat demand covers {len(qext_w)} time steps, expected {n_steps}.")
+
+    representatives = select_representative_steps(qext_w, supply_temperature, settings.n_states, settings.seed)
+    remaining = np.setdiff1d(np.arange(n_steps), representatives)
+    rng = np.random.default_rng(settings.seed)
+    validation = np.sort(rng.choice(remaining, size=min(settings.n_validation, len(remaining)), replace=False))
+    solved = np.union1d(representatives, validation)
+
+    start = time.perf_counter()
+    ow = OutputWriter(net, solved.tolist(), output_path=None, log_variables=log_variables)
+    run_time_series.run_timeseries(net, solved.tolist(), **run_kwargs)
+    solve_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    is_representative = np.isin(solved, representatives)
+    results = fit_surfaces(
+        representatives,
+        {key: values[is_representative] for key, values in ow.np_results.items()},
+        qext_w,
+        supply_temperature,
+    )
+    report = SurrogateReport(
+        n_steps=n_steps,
+        representative_steps=representatives,
+        validation_steps=validation,
+        solve_seconds=solve_seconds,
+    )
+    if len(validation):
+        actual = {key: values[~is_representative] for key, values in ow.np_results.items()}
+        predicted = {key: values[validation] for key, values in results.items()}
+        report.validation_error = max_result_deviation(predicted, actual)
+        report.validation_rmse = {
+            key: float(np.sqrt(np.mean((predicted[key] - expected) ** 2))) if expected.size else 0.0
+            for key, expected in actual.items()
+        }
+    # Solved hours keep their exact results.
+    for key, values in ow.np_results.items():
+        results[key][solved] = values
+    report.fit_seconds = time.perf_counter() - start
+    return results, report
@@ -0,0 +1,283 @@
+"""
+Checkpoint and resume of network time series runs.
+===================================================
+
+A full year of ``thermohydraulic_time_series_net`` that fails at hour 7000 (pipeflow not
+converged, application closed, crashed process) used to lose every simulated hour.
+:func:`run_time_series_checkpointed` runs the range in segments of ``every`` time steps
+and, after each segment, writes to a checkpoint directory:
+
+* ``segment_<start>_<stop>.npz`` — the ``OutputWriter`` arrays of the segment
+  (``"res_junction.t_k"`` → ``(steps, elements)``), written once and never rewritten,
+* ``state_<done>.pkl`` — the network (element tables, result tables, controller states
+  such as the pump set point of the bad-point controller) and the adaptive solver
+  (warm-start state, damping), pickled together,
+* ``checkpoint.json`` — the manifest (run key, completed steps, segment files), replaced
+  atomically last, so an interrupted write leaves the previous checkpoint valid.
+
+A resumed run continues from the pickled state with the controllers and the solver
+exactly where the interrupted run left them, so its results equal those of an
+uninterrupted run. The manifest stores a key of the run inputs (:func:`checkpoint_key`);
+a checkpoint of other inputs is discarded instead of resumed.
+
+.. note::
+   Telemetry (:mod:`~districtheatingsim.net_simulation_pandapipes.time_series_telemetry`)
+   covers the steps simulated after the resume only. The checkpoint directory is removed
+   after a completed run unless ``keep=True``.
+
+:author: Dipl.-Ing. (FH) Jonas Pfeiffer
+"""
+
+import glob
+import json
+import os
+import pickle
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+import pandapipes as pp
+from pandapipes.timeseries import run_time_series
+from pandapower.timeseries import OutputWriter
+
+from districtheatingsim.net_simulation_pandapipes.result_cache import time_series_key
+
+#: Bump when the file layout changes; checkpoints of another version are not resumed.
+CHECKPOINT_VERSION = 1
+
+#: Default segment length: one week of hourly steps.
+DEFAULT_CHECKPOINT_STEPS = 168
+
+_MANIFEST = "checkpoint.json"
+
+
+@dataclass
+class CheckpointReport:
+    """
+    Summary of a checkpointed run.
+
+    :ivar directory: Checkpoint directory.
+    :ivar resumed_from: Position in ``time_steps`` the run resumed at, None if it started from the beginning.
+    :ivar checkpoints: Checkpoints written by this run.
+    :ivar save_seconds: Wall time spent writing checkpoints [s].
+    """
+
+    directory: str
+    resumed_from: int | None = None
+    checkpoints: int = 0
+    save_seconds: float = 0.0
+
+
+def checkpoint_path(results_csv_filename: str) -> str:
+    """
+    Checkpoint directory that accompanies a results CSV.
+
+    :param results_csv_filename: Results CSV path (e.g. ``Lastgang/Lastgang.csv``).
+    :return: ``<name>_checkpoint`` next to it.
+    :rtype: str
+    """
+    return os.path.splitext(results_csv_filename)[0] + "_checkpoint"
+
+
+def checkpoint_key(net, **settings) -> str:
+    """
+    Key of the run inputs, the same digest as the result cache.
+
+    Covers the normalized element tables, the pipe standard types in use, the controller
+    configurations with their profiles and the run settings, see
+    :func:`~districtheatingsim.net_simulation_pandapipes.result_cache.time_series_key`.
+    Compute it before the solver and the telemetry recorder are attached.
+
+    :param net: Pandapipes network with all time-series controllers installed, before the run
+    :type net: pandapipes.pandapipesNet
+    :param settings: Run settings that change the results (range, profiles, mode, iterations, solver, …)
+    :return: Hex digest
+    :rtype: str
+    """
+    return time_series_key(net, checkpoint_version=CHECKPOINT_VERSION, **settings)
+
+
+def read_checkpoint(directory: str) -> dict | None:
+    """
+    Manifest of the checkpoint in ``directory``.
+
+    :param directory: Checkpoint directory
+    :type directory: str
+    :return: ``{"version", "key", "n_steps", "done", "segments", "state", "saved_at"}``,
+        None if there is no readable checkpoint of this version
+    :rtype: Optional[dict]
+    """
+    try:
+        with open(os.path.join(directory, _MANIFEST), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != CHECKPOINT_VERSION:
+        return None
+    return manifest
+
+
+def remove_checkpoint(directory: str) -> None:
+    """
+    Delete the checkpoint files in ``directory`` and the directory itself if it is empty then.
+
+    :param directory: Checkpoint directory
+    :type directory: str
+    """
+    patterns = (_MANIFEST, _MANIFEST + ".tmp", "segment_*.npz", "state_*.pkl", "state_*.pkl.tmp")
+    for pattern in patterns:
+        for path in glob.glob(os.path.join(glob.escape(directory), pattern)):
+            os.remove(path)
+    if os.path.isdir(directory) and not os.listdir(directory):
+        os.rmdir(directory)
+
+
+def _write_atomic(path: str, write) -> None:
+    """Write via ``write(file)`` to ``path + ".tmp"`` and move it into place."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def _dump_state(f, net, solver) -> None:
+    """
+    Pickle ``net`` and ``solver`` together (the solver is also referenced by its controller).
+
+    The output writer (its arrays are saved per segment) and the ``run`` function that
+    ``run_timeseries`` leaves in ``net._options`` are left out; both are set again by the next segment.
+    """
+    output_writer = net.pop("output_writer", None)
+    options = net.get("_options", {})
+    run = options.pop("run", None)
+    try:
+        pickle.dump({"net": net, "solver": solver}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    finally:
+        if output_writer is not None:
+            net["output_writer"] = output_writer
+        if run is not None:
+            options["run"] = run
+
+
+def _save_checkpoint(directory: str, manifest: dict, segment: tuple[int, int], results: dict, net, solver) -> None:
+    start, stop = segment
+    segment_file = f"segment_{start:06d}_{stop:06d}.npz"
+    _write_atomic(os.path.join(directory, segment_file), lambda f: np.savez(f, **results))
+    state_file = f"state_{stop:06d}.pkl"
+    _write_atomic(os.path.join(directory, state_file), lambda f: _dump_state(f, net, solver))
+    previous_state = manifest.get("state")
+
+    manifest["segments"].append([start, stop, segment_file])
+    manifest["done"] = stop
+    manifest["state"] = state_file
+    manifest["saved_at"] = datetime.now().isoformat(timespec="seconds")
+    _write_atomic(os.path.join(directory, _MANIFEST), lambda f: f.write(json.dumps(manifest, indent=1).encode()))
+    if previous_state and previous_state != state_file:
+        os.remove(os.path.join(directory, previous_state))
+
+
+def _load_checkpoint(directory: str, manifest: dict) -> tuple[list[dict], object, object]:
+    segments = []
+    for _, _, segment_file in manifest["segments"]:
+        with np.load(os.path.join(directory, segment_file)) as data:
+            segments.append({key: data[key] for key in data.files})
+    with open(os.path.join(directory, manifest["state"]), "rb") as f:
+        state = pickle.load(f)
+    net, solver = state["net"], state["solver"]
+    if solver is not None:
+        # Controllers pickle a copy of their attributes: link the restored solver to the net again
+        solver.attach(net)
+    return segments, net, solver
+
+
+def run_time_series_checkpointed(
+    net,
+    time_steps: range,
+    log_variables: list[tuple[str, str]],
+    directory: str,
+    every: int = DEFAULT_CHECKPOINT_STEPS,
+    key: str = "",
+    resume: bool = True,
+    keep: bool = False,
+    solver=None,
+    recorder=None,
+    **run_kwargs,
+) -> tuple[dict[str, np.ndarray], object, object, CheckpointReport]:
+    """
+    Run a controlled time series in segments and checkpoint after each one.
+
+    :param net: Pandapipes network with all time-series controllers installed (and ``solver`` attached)
+    :type net: pandapipes.pandapipesNet
+    :param time_steps: Simulated time steps
+    :type time_steps: range
+    :param log_variables: ``OutputWriter`` log variables (see ``create_log_variables``)
+    :type log_variables: List[Tuple[str, str]]
+    :param directory: Checkpoint directory (created if missing)
+    :type directory: str
+    :param every: Time steps per segment
+    :type every: int
+    :param key: Key of the run inputs (see :func:`checkpoint_key`); a checkpoint with another key is discarded
+    :type key: str
+    :param resume: Continue from a matching checkpoint; False discards it
+    :type resume: bool
+    :param keep: Keep the checkpoint after the completed run
+    :type keep: bool
+    :param solver: ``AdaptivePipeflow`` attached to ``net``, checkpointed with it; None solves with ``pp.pipeflow``
+    :type solver: Optional[AdaptivePipeflow]
+    :param recorder: ``TelemetryRecorder`` attached to ``net``; detached while a checkpoint is written
+    :type recorder: Optional[TelemetryRecorder]
+    :param run_kwargs: Passed to ``run_timeseries`` (e.g. ``mode``, ``iter``, ``alpha``), without ``run``
+    :return: ``(np_results, net, solver, report)`` — merged ``OutputWriter.np_results``, the network and
+        solver in their final state (the restored objects after a resume) and the run report
+    :rtype: Tuple[Dict[str, np.ndarray], pandapipes.pandapipesNet, Optional[AdaptivePipeflow], CheckpointReport]
+    :raises ValueError: If ``every < 1``
+    """
+    if every < 1:
+        raise ValueError(f"every must be >= 1, got {every}.")
+    n_steps = len(time_steps)
+    report = CheckpointReport(directory)
+
+    manifest = read_checkpoint(directory) if resume else None
+    if manifest is not None and (manifest["key"] != key or manifest["n_steps"] != n_steps):
+        print(f"Checkpoint in {directory} belongs to other inputs, starting from the beginning.")
+        manifest = None
+    if manifest is None:
+        remove_checkpoint(directory)
+        os.makedirs(directory, exist_ok=True)
+        manifest = {"version": CHECKPOINT_VERSION, "key": key, "n_steps": n_steps, "done": 0, "segments": []}
+        segments = []
+    else:
+        segments, restored_net, solver = _load_checkpoint(directory, manifest)
+        if recorder is not None:
+            recorder.detach(net)
+            recorder.attach(restored_net)
+        net = restored_net
+        report.resumed_from = manifest["done"]
+        print(f"Resuming time series at step {manifest['done']} of {n_steps} from {directory}.")
+
+    run = pp.pipeflow if solver is None else solver
+    if recorder is not None:
+        run = recorder.wrap(run)
+    for start in range(manifest["done"], n_steps, every):
+        stop = min(start + every, n_steps)
+        steps = time_steps[start:stop]
+        ow = OutputWriter(net, steps, output_path=None, log_variables=list(log_variables))
+        run_time_series.run_timeseries(net, steps, run=run, **run_kwargs)
+        segments.append(ow.np_results)
+
+        t0 = time.perf_counter()
+        # The recorder's wrapped controller methods cannot be pickled
+        if recorder is not None:
+            recorder.detach(net)
+        _save_checkpoint(directory, manifest, (start, stop), ow.np_results, net, solver)
+        if recorder is not None:
+            recorder.attach(net)
+        report.checkpoints += 1
+        report.save_seconds += time.perf_counter() - t0
+
+    names = segments[0] if segments else {}
+    np_results = {name: np.concatenate([segment[name] for segment in segments], axis=0) for name in names}
+    if not keep:
+        remove_checkpoint(directory)
+    return np_results, net, solver, report
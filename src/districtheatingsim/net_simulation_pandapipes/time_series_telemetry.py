@@ -0,0 +1,331 @@
+"""
+Convergence and timing telemetry of network time series runs.
+=============================================================
+
+A slow or failing year of ``thermohydraulic_time_series_net`` used to leave nothing but
+console output ("Max iterations reached"). :class:`TelemetryRecorder` records, for every
+time step of a ``run_timeseries`` call:
+
+* wall time of the step (controllers, pipeflows and output writer),
+* pipeflow calls, Newton iterations and the residual norm of the last solve,
+* controller loop rounds and which controllers adjusted the network (``control_step``
+  calls), and which were still adjusting when the step ended without convergence.
+
+Usage::
+
+    recorder = TelemetryRecorder()
+    recorder.attach(net)
+    run_timeseries(net, steps, ..., run=recorder.wrap(run))
+    recorder.detach(net)
+    telemetry = recorder.report()   # TimeSeriesTelemetry
+    telemetry.save("telemetry.csv") # or .parquet
+
+:meth:`TelemetryRecorder.attach` registers a probe controller (first in the controller
+order, it never acts on the network) and wraps ``control_step`` of the registered
+controllers; :meth:`TelemetryRecorder.detach` restores them. Without a recorder nothing is
+installed, so switching telemetry off costs nothing; with it a step costs a few
+microseconds. A step that raised (pipeflow not converged) is reported as the last step.
+
+.. note::
+   Controller loop rounds are counted on the level of the probe, the lowest controller
+   level of the network (all controllers of this package use level -1). The recorder
+   wraps the controllers present at :meth:`~TelemetryRecorder.attach`; detach it before
+   the network is pickled (e.g. for chunked runs, which are not recorded).
+
+:author: Dipl.-Ing. (FH) Jonas Pfeiffer
+"""
+
+import os
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandapipes as pp
+import pandas as pd
+from pandapower.control.basic_controller import Controller
+
+from districtheatingsim.utilities.table_export import write_columns
+
+
+def telemetry_path(results_csv_filename: str) -> str:
+    """
+    Path of the telemetry table that accompanies a results CSV.
+
+    :param results_csv_filename: Results CSV path (e.g. ``Lastgang/Lastgang.csv``).
+    :return: ``<name>_telemetry.csv`` next to it.
+    :rtype: str
+    """
+    return os.path.splitext(results_csv_filename)[0] + "_telemetry.csv"
+
+
+@dataclass
+class TimeSeriesTelemetry:
+    """
+    Convergence and timing per time step of a time series run.
+
+    :ivar time_steps: Simulated time steps in run order.
+    :ivar seconds: Wall time per time step [s].
+    :ivar solves: Pipeflow calls per time step.
+    :ivar iterations: Newton iterations per time step (converged attempts of all solves).
+    :ivar control_rounds: Controller loop rounds per time step.
+    :ivar residuals: Residual norm of the last solve of the time step.
+    :ivar converged: Controller loop and pipeflow converged.
+    :ivar adjusting: Controllers with ``control_step`` calls, ``"name ×calls; …"`` per time step.
+    :ivar unconverged: Controllers still adjusting when a non-converged time step ended.
+    """
+
+    time_steps: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=int))
+    seconds: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    solves: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=int))
+    iterations: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=int))
+    control_rounds: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=int))
+    residuals: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    converged: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))
+    adjusting: list[str] = field(default_factory=list)
+    unconverged: list[str] = field(default_factory=list)
+
+    @property
+    def total_seconds(self) -> float:
+        """Wall time of all recorded time steps [s]."""
+        return float(self.seconds.sum())
+
+    def slowest_steps(self, n: int = 10) -> np.ndarray:
+        """
+        Time steps with the longest wall time.
+
+        :param n: Number of time steps
+        :type n: int
+        :return: Up to ``n`` time steps, slowest first
+        :rtype: np.ndarray
+        """
+        return self.time_steps[np.argsort(-self.seconds, kind="stable")[:n]]
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """
+        Table columns in export order.
+
+        :return: ``{column: 1-D array}``, one row per time step
+        :rtype: Dict[str, np.ndarray]
+        """
+        return {
+            "time_step": self.time_steps,
+            "seconds": self.seconds,
+            "solves": self.solves,
+            "iterations": self.iterations,
+            "control_rounds": self.control_rounds,
+            "residual": self.residuals,
+            "converged": self.converged,
+            "adjusting": np.array(self.adjusting, dtype=object),
+            "unconverged": np.array(self.unconverged, dtype=object),
+        }
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per time step, see :meth:`columns`."""
+        return pd.DataFrame(self.columns())
+
+    def save(self, file_path: str, fmt: str | None = None) -> None:
+        """
+        Export the table as semicolon-separated CSV or Parquet.
+
+        :param file_path: Output path; ``.parquet`` writes Parquet, ``.csv.gz``/``.csv.zst`` compress
+        :type file_path: str
+        :param fmt: ``"csv"`` or ``"parquet"``, None infers it from ``file_path``
+        :type fmt: Optional[str]
+        """
+        write_columns(self.columns(), file_path, fmt=fmt)
+
+    def summary(self, offset: int = 0) -> dict[str, int | float | str]:
+        """
+        Key figures for the network info panel.
+
+        :param offset: Added to the time steps shown (start of the simulated range)
+        :type offset: int
+        :return: German labels → values
+        :rtype: Dict[str, Union[int, float, str]]
+        """
+        if not len(self.time_steps):
+            return {}
+        failed = self.time_steps[~self.converged]
+        slowest = int(np.argmax(self.seconds))
+        summary: dict[str, int | float | str] = {
+            "Rechenzeit Zeitreihe [s]": self.total_seconds,
+            "Pipeflow-Aufrufe": int(self.solves.sum()),
+            "Newton-Iterationen": int(self.iterations.sum()),
+            "max. Reglerschleifen je Zeitschritt": int(self.control_rounds.max()),
+            "Nicht konvergierte Zeitschritte": len(failed),
+            "Langsamster Zeitschritt": f"{offset + self.time_steps[slowest]} ({self.seconds[slowest]:.2f} s)",
+        }
+        if len(failed):
+            summary["Erste nicht konvergierte Zeitschritte"] = ", ".join(str(offset + step) for step in failed[:5])
+        return summary
+
+
+class _TelemetryProbe(Controller):
+    """Marks the start and end of every time step and every controller loop round; never acts."""
+
+    def __init__(self, net, recorder: "TelemetryRecorder", order: float, level: int):
+        super().__init__(net, order=order, level=level, initial_run=False)
+        self.recorder = recorder
+
+    def time_step(self, net, time_step: int) -> int:
+        self.recorder._start_step(time_step)
+        return time_step
+
+    def is_converged(self, net) -> bool:
+        self.recorder._start_round()
+        return True
+
+    def finalize_step(self, net, time_step: int) -> None:
+        self.recorder._end_step()
+
+
+class TelemetryRecorder:
+    """
+    Records :class:`TimeSeriesTelemetry` of ``run_timeseries`` calls on one network.
+
+    .. note::
+       Steps recorded by several ``run_timeseries`` calls (e.g. the representative hours
+       of a deduplicated run) are appended in run order.
+    """
+
+    def __init__(self):
+        self._rows: list[tuple] = []
+        self._step: dict | None = None
+        self._wrapped: list = []
+
+    def attach(self, net) -> None:
+        """
+        Register the probe controller and wrap ``control_step`` of the registered controllers.
+
+        :param net: Pandapipes network with controllers
+        :type net: pandapipes.pandapipesNet
+        """
+        self.detach(net)
+        controllers = net.controller[net.controller["in_service"]] if len(net.controller) else net.controller
+        order = min(-1.0, float(controllers["order"].min()) if len(controllers) else -1.0) - 1.0
+        level = int(controllers["level"].min()) if len(controllers) else -1
+        for index, ctrl in net.controller["object"].items():
+            self._wrap_controller(ctrl, f"{ctrl} #{index}")
+        _TelemetryProbe(net, self, order=order, level=level)
+
+    def detach(self, net) -> None:
+        """
+        Remove the probe controllers and restore the wrapped ``control_step`` methods.
+
+        :param net: Pandapipes network
+        :type net: pandapipes.pandapipesNet
+        """
+        for ctrl in self._wrapped:
+            ctrl.__dict__.pop("control_step", None)
+        self._wrapped = []
+        probes = [index for index, ctrl in net.controller["object"].items() if isinstance(ctrl, _TelemetryProbe)]
+        net.controller.drop(index=probes, inplace=True)
+
+    def wrap(self, run: Callable | None = None) -> Callable:
+        """
+        Pipeflow function that records solves, iterations and residuals.
+
+        :param run: Function called like ``pp.pipeflow(net, **kwargs)``, defaults to ``pp.pipeflow``
+        :type run: Optional[Callable]
+        :return: Recording wrapper, pass it as ``run=`` to ``run_timeseries``
+        :rtype: Callable
+        """
+        run = pp.pipeflow if run is None else run
+
+        def recorded_run(net, **kwargs) -> None:
+            step = self._step
+            if step is None:
+                run(net, **kwargs)
+                return
+            step["solves"] += 1
+            step["failed"] = True
+            run(net, **kwargs)
+            step["failed"] = False
+            internal = net.get("_internal_results", {})
+            for key, value in internal.items():
+                if key.startswith("iterations"):
+                    step["iterations"] += int(value)
+                elif key.startswith("residual_norm"):
+                    step["residual"] = float(value)
+
+        return recorded_run
+
+    def _wrap_controller(self, ctrl, label: str) -> None:
+        control_step = ctrl.control_step
+
+        def recorded_control_step(net, *args, **kwargs):
+            if self._step is not None:
+                self._step["adjusting"][label] += 1
+                self._step["round"].add(label)
+            return control_step(net, *args, **kwargs)
+
+        ctrl.control_step = recorded_control_step
+        self._wrapped.append(ctrl)
+
+    def _start_step(self, time_step: int) -> None:
+        if self._step is not None:
+            self._end_step()
+        self._step = {
+            "time_step": time_step,
+            "start": time.perf_counter(),
+            "solves": 0,
+            "iterations": 0,
+            "rounds": 0,
+            "residual": np.nan,
+            "failed": False,
+            "adjusting": Counter(),
+            "round": set(),
+        }
+
+    def _start_round(self) -> None:
+        if self._step is not None:
+            self._step["rounds"] += 1
+            self._step["round"] = set()
+
+    def _end_step(self) -> None:
+        step, self._step = self._step, None
+        if step is None:
+            return
+        # Controllers that adjusted in the last round: the loop stopped at its iteration limit
+        unconverged = sorted(step["round"])
+        converged = not step["failed"] and not unconverged
+        self._rows.append(
+            (
+                step["time_step"],
+                time.perf_counter() - step["start"],
+                step["solves"],
+                step["iterations"],
+                step["rounds"],
+                step["residual"],
+                converged,
+                "; ".join(f"{label} ×{calls}" for label, calls in step["adjusting"].items()),
+                "; ".join(unconverged),
+            )
+        )
+
+    def report(self) -> TimeSeriesTelemetry:
+        """
+        Telemetry of the recorded time steps, including a step that raised.
+
+        :return: One entry per time step in run order
+        :rtype: TimeSeriesTelemetry
+        """
+        self._end_step()
+        if not self._rows:
+            return TimeSeriesTelemetry()
+        time_steps, seconds, solves, iterations, rounds, residuals, converged, adjusting, unconverged = zip(
+            *self._rows, strict=True
+        )
+        return TimeSeriesTelemetry(
+            time_steps=np.array(time_steps, dtype=int),
+            seconds=np.array(seconds, dtype=float),
+            solves=np.array(solves, dtype=int),
+            iterations=np.array(iterations, dtype=int),
+            control_rounds=np.array(rounds, dtype=int),
+            residuals=np.array(residuals, dtype=float),
+            converged=np.array(converged, dtype=bool),
+            adjusting=list(adjusting),
+            unconverged=list(unconverged),
+        )
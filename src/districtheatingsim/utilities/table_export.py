@@ -0,0 +1,143 @@
+"""
+Streaming, chunked export of result time series (CSV / compressed CSV / Parquet).
+================================================================================
+
+``EnergySystem.save_to_csv`` and ``save_results_csv`` used to assemble one wide
+DataFrame column by column and then write it in one go, holding a second full
+copy of every series in memory. :func:`write_columns` instead takes the columns
+as they already exist (``{header: array}``) and writes ``chunk_rows`` rows at a
+time, so peak memory is one chunk regardless of run length (multi-year or
+15-minute profiles).
+
+The default output is unchanged — German semicolon CSV, ``utf-8-sig`` (Excel
+recognises the umlauts) — and byte-identical to the former single-shot
+``DataFrame.to_csv``. Optional targets:
+
+* ``.csv.gz`` / ``.csv.zst`` (or ``compression="gzip"/"zstd"``) — compressed CSV
+  via pyarrow's stream codecs, no extra dependency;
+* ``.parquet`` (or ``fmt="parquet"``) — one row group per chunk.
+
+:func:`open_csv` is the read-side counterpart: pandas needs the optional
+``zstandard`` package for ``.zst``, so compressed CSVs are decoded through the
+same pyarrow codecs.
+
+:author: Dipl.-Ing. (FH) Jonas Pfeiffer
+"""
+
+import io
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+#: Rows per written chunk (one year of hourly values).
+DEFAULT_CHUNK_ROWS = 8760
+
+_COMPRESSION_BY_SUFFIX = {".gz": "gzip", ".zst": "zstd"}
+
+
+def infer_export_format(
+    file_path: str, fmt: str | None = None, compression: str | None = None
+) -> tuple[str, str | None]:
+    """
+    Resolve the output format and CSV compression for ``file_path``.
+
+    :param file_path: Target path; ``.parquet``, ``.gz`` and ``.zst`` suffixes are recognised.
+    :param fmt: ``"csv"`` or ``"parquet"``; ``None`` infers it from the suffix.
+    :param compression: ``"gzip"``, ``"zstd"`` or ``None`` (CSV only); ``None`` infers it from the suffix.
+    :return: ``(fmt, compression)``.
+    :rtype: tuple[str, str | None]
+    :raises ValueError: For an unknown format or compression.
+    """
+    _, suffix = os.path.splitext(file_path.lower())
+    if fmt is None:
+        fmt = "parquet" if suffix == ".parquet" else "csv"
+    if fmt not in ("csv", "parquet"):
+        raise ValueError(f"Unknown export format '{fmt}' (expected 'csv' or 'parquet').")
+    if fmt == "csv" and compression is None:
+        compression = _COMPRESSION_BY_SUFFIX.get(suffix)
+    if compression is not None and compression not in ("gzip", "zstd"):
+        raise ValueError(f"Unknown CSV compression '{compression}' (expected 'gzip' or 'zstd').")
+    return fmt, compression
+
+
+def write_columns(
+    columns: dict[str, np.ndarray],
+    file_path: str,
+    *,
+    fmt: str | None = None,
+    compression: str | None = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    sep: str = ";",
+    encoding: str = "utf-8-sig",
+    date_format: str | None = None,
+) -> None:
+    """
+    Write equal-length columns to CSV or Parquet, ``chunk_rows`` rows at a time.
+
+    :param columns: ``{header: 1-D array}`` in output column order. Arrays are
+        sliced per chunk, never concatenated.
+    :type columns: dict[str, np.ndarray]
+    :param file_path: Output path (see :func:`infer_export_format`).
+    :type file_path: str
+    :param fmt: ``"csv"`` (default) or ``"parquet"``; inferred from the suffix if ``None``.
+    :param compression: ``"gzip"`` / ``"zstd"`` for CSV; inferred from the suffix if ``None``.
+    :param chunk_rows: Rows per chunk (CSV write / Parquet row group).
+    :type chunk_rows: int
+    :param sep: CSV field separator (German default ``;``).
+    :param encoding: CSV text encoding (``utf-8-sig`` for Excel).
+    :param date_format: ``strftime`` format for datetime columns (CSV only).
+    :raises ValueError: If the columns differ in length or ``chunk_rows < 1``.
+    """
+    fmt, compression = infer_export_format(file_path, fmt, compression)
+    if chunk_rows < 1:
+        raise ValueError(f"chunk_rows must be >= 1, got {chunk_rows}.")
+    arrays = {name: np.asarray(values) for name, values in columns.items()}
+    lengths = {len(values) for values in arrays.values()}
+    if len(lengths) > 1:
+        detail = ", ".join(f"{name}={len(values)}" for name, values in arrays.items())
+        raise ValueError(f"Export columns differ in length: {detail}")
+    n_rows = lengths.pop() if lengths else 0
+
+    def chunks():
+        # Yield at least one (possibly empty) chunk so the header is always written.
+        for start in range(0, max(n_rows, 1), chunk_rows):
+            yield pd.DataFrame({name: values[start : start + chunk_rows] for name, values in arrays.items()})
+
+    if fmt == "parquet":
+        writer = None
+        try:
+            for chunk in chunks():
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(file_path, table.schema, compression=compression or "zstd")
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        return
+
+    raw = pa.output_stream(file_path, compression=compression) if compression else open(file_path, "wb")
+    # os.linesep like DataFrame.to_csv(path), so uncompressed output stays byte-identical.
+    with io.TextIOWrapper(raw, encoding=encoding, newline="") as handle:
+        for i, chunk in enumerate(chunks()):
+            chunk.to_csv(
+                handle, sep=sep, index=False, header=(i == 0), date_format=date_format, lineterminator=os.linesep
+            )
+
+
+def open_csv(file_path: str, encoding: str = "utf-8-sig") -> io.TextIOWrapper:
+    """
+    Open a CSV written by :func:`write_columns` as text, decompressing ``.gz`` / ``.zst``.
+
+    :param file_path: CSV path; the compression is inferred from the suffix.
+    :type file_path: str
+    :param encoding: Text encoding (``utf-8-sig`` also reads files without BOM).
+    :return: Text handle for ``pd.read_csv`` (close it, or use it as a context manager).
+    :rtype: io.TextIOWrapper
+    """
+    _, compression = infer_export_format(file_path, "csv")
+    raw = pa.input_stream(file_path, compression=compression) if compression else open(file_path, "rb")
+    return io.TextIOWrapper(raw, encoding=encoding, newline="")
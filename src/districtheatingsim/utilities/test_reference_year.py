@@ -4,32 +4,46 @@ Test Reference Year (TRY) import module for German weather data.
 This module provides functionality to import and parse standardized meteorological
 data files used for building energy simulations and district heating calculations.
 
+Parsing the fixed-width DWD file with ``pd.read_fwf`` takes far longer than any of
+its consumers need, and the same file is imported by the energy system, the PV
+calculation, the network time series and the GUI. :func:`import_TRY` therefore
+caches the parsed arrays at two levels, keyed by a hash of the file *content*:
+
+* **process-wide** — repeated imports return the same read-only arrays;
+* **on disk** — a ``.npy`` next to the TRY file (``.try_cache/<hash>.npy``, i.e. in
+  the project's ``Klimadaten`` folder) that later processes load instead of
+  re-parsing. If the folder is not writable the disk level is silently skipped.
+
+Editing or replacing the TRY file changes its hash, so stale entries are never
+served. See ``examples/benchmark_try_cache.py`` for cold/warm timings.
+
 :author: Dipl.-Ing. (FH) Jonas Pfeiffer
 """
 
+import hashlib
+import logging
+import os
+
+import numpy as np
 import pandas as pd
 
+#: Folder (next to the TRY file) holding the parsed ``.npy`` caches.
+TRY_CACHE_DIRNAME = ".try_cache"
 
-def import_TRY(filename):
-    """
-    Read and parse TRY (Test Reference Year) weather data file.
+#: Bump when the parser or the cached record layout changes (part of the cache key).
+_TRY_CACHE_VERSION = 1
 
-    :param filename: Path to TRY file in fixed-width format
-    :type filename: str
-    :return: Tuple of (temperature, windspeed, direct_radiation, global_radiation, cloud_cover)
-    :rtype: tuple of numpy.ndarray
-    :raises FileNotFoundError: If TRY file cannot be found
-    :raises ValueError: If file format is invalid
+# Record fields, in the order import_TRY returns them.
+_TRY_FIELDS = ("temperature", "windspeed", "direct_radiation", "global_radiation", "cloud_cover")
 
-    .. note::
-        - File contains 8760 hourly values for a complete year
-        - Temperature in °C (at 2m height)
-        - Wind speed in m/s (at 10m height)
-        - Radiation values in W/m² (horizontal surface)
-        - Cloud cover in eighths (0-8, where 9=not observable)
-        - Global radiation is calculated as sum of direct and diffuse radiation
-    """
+# Process-wide caches: content hash -> parsed arrays, and the cheap
+# (path, mtime_ns, size) -> content hash lookup that avoids re-hashing unchanged files.
+_parsed_cache: dict[str, tuple[np.ndarray, ...]] = {}
+_digest_cache: dict[tuple[str, int, int], str] = {}
 
+
+def _parse_TRY(filename):
+    """Parse a TRY file with ``pd.read_fwf`` (the uncached path of :func:`import_TRY`)."""
     # Define column widths for fixed-width format
     col_widths = [8, 8, 3, 3, 3, 6, 5, 4, 5, 2, 5, 4, 5, 5, 4, 5, 3]
 
@@ -48,3 +62,90 @@ def import_TRY(filename):
     cloud_cover = data["N"].values  # Cloud coverage [eighths]
 
     return temperature, windspeed, direct_radiation, global_radiation, cloud_cover
+
+
+def _content_digest(filename) -> str:
+    """Hash of the TRY file content (memoized per path/mtime/size)."""
+    path = os.path.abspath(filename)
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    digest = _digest_cache.get(key)
+    if digest is None:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"v{_TRY_CACHE_VERSION}".encode())
+        with open(path, "rb") as f:
+            h.update(f.read())
+        digest = h.hexdigest()
+        _digest_cache[key] = digest
+    return digest
+
+
+def _to_record(arrays) -> np.ndarray:
+    """Pack the five parsed arrays into one structured array (keeps each dtype)."""
+    record = np.empty(len(arrays[0]), dtype=[(name, arr.dtype) for name, arr in zip(_TRY_FIELDS, arrays, strict=True)])
+    for name, arr in zip(_TRY_FIELDS, arrays, strict=True):
+        record[name] = arr
+    return record
+
+
+def _load_arrays(filename) -> tuple[np.ndarray, ...]:
+    """Parsed TRY arrays from the process cache, the disk cache, or the parser."""
+    digest = _content_digest(filename)
+    arrays = _parsed_cache.get(digest)
+    if arrays is not None:
+        return arrays
+
+    cache_path = os.path.join(os.path.dirname(os.path.abspath(filename)), TRY_CACHE_DIRNAME, f"{digest}.npy")
+    try:
+        record = np.load(cache_path, allow_pickle=False)
+    except (OSError, ValueError):
+        record = _to_record(_parse_TRY(filename))
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # Write-then-rename so a concurrent reader never sees a half-written file.
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, record, allow_pickle=False)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logging.debug(f"TRY-Cache konnte nicht geschrieben werden ({cache_path}): {e}")
+
+    arrays = tuple(np.ascontiguousarray(record[name]) for name in _TRY_FIELDS)
+    for arr in arrays:
+        arr.flags.writeable = False
+    _parsed_cache[digest] = arrays
+    return arrays
+
+
+def clear_TRY_cache() -> None:
+    """Drop the process-wide TRY cache (the on-disk ``.npy`` files are kept)."""
+    _parsed_cache.clear()
+    _digest_cache.clear()
+
+
+def import_TRY(filename, use_cache=True):
+    """
+    Read and parse TRY (Test Reference Year) weather data file.
+
+    :param filename: Path to TRY file in fixed-width format
+    :type filename: str
+    :param use_cache: Serve the parsed arrays from the content-hash cache (default).
+        ``False`` always re-parses the file and returns writable copies.
+    :type use_cache: bool
+    :return: Tuple of (temperature, windspeed, direct_radiation, global_radiation, cloud_cover)
+    :rtype: tuple of numpy.ndarray
+    :raises FileNotFoundError: If TRY file cannot be found
+    :raises ValueError: If file format is invalid
+
+    .. note::
+        - File contains 8760 hourly values for a complete year
+        - Temperature in °C (at 2m height)
+        - Wind speed in m/s (at 10m height)
+        - Radiation values in W/m² (horizontal surface)
+        - Cloud cover in eighths (0-8, where 9=not observable)
+        - Global radiation is calculated as sum of direct and diffuse radiation
+        - Cached arrays are shared and **read-only**; copy them before modifying.
+    """
+    if not use_cache or not isinstance(filename, str | os.PathLike):
+        return _parse_TRY(filename)
+    return _load_arrays(filename)
@@ -94,3 +94,32 @@ def load_profile():
     the examples use) precisely so the golden-master metrics below are stable.
     """
     return np.linspace(50.0, 400.0, 8760)
+
+
+def _solved_two_consumer_net(min_supply_temperature=None):
+    """Small ring net (one pump, two heat consumers) with create_controllers, solved once."""
+    import pandapipes as pp
+    from pandapipes.control.run_control import run_control
+
+    from districtheatingsim.constants import KELVIN_OFFSET
+    from districtheatingsim.net_simulation_pandapipes.utilities import create_controllers
+
+    net = pp.create_empty_network(fluid="water")
+    st = 85 + KELVIN_OFFSET
+    coords = [(0, 10), (0, 0), (10, 0), (60, 0), (85, 0), (85, 10), (60, 10), (10, 10)]
+    j = [pp.create_junction(net, pn_bar=1.05, tfluid_k=st, geodata=c) for c in coords]
+    pp.create_circ_pump_const_pressure(net, j[0], j[1], p_flow_bar=4, plift_bar=1.5, t_flow_k=st, type="auto")
+    for a, b, length in [(1, 2, 0.01), (2, 3, 0.05), (3, 4, 0.025), (5, 6, 0.25), (6, 7, 0.05), (7, 0, 0.01)]:
+        pp.create_pipe(net, j[a], j[b], std_type="ISOPLUS_DRE100_2x", length_km=length, k_mm=0.1)
+    pp.create_heat_consumer(net, j[4], j[5], qext_w=500000, treturn_k=55 + KELVIN_OFFSET)
+    pp.create_heat_consumer(net, j[3], j[6], qext_w=200000, treturn_k=60 + KELVIN_OFFSET)
+    pp.pipeflow(net, mode="bidirectional", iter=100)
+    net = create_controllers(net, np.array([500000, 200000]), 85, min_supply_temperature, np.array([55, 60]), None)
+    run_control(net, mode="bidirectional", iter=100)
+    return net
+
+
+@pytest.fixture(scope="session")
+def solved_two_consumer_net():
+    """Factory for a freshly built and solved two-consumer ring net (time-series controller tests)."""
+    return _solved_two_consumer_net
@@ -0,0 +1,137 @@
+"""
+Unit tests for the warm-started, adaptively damped pipeflow (``adaptive_pipeflow.py``).
+"""
+
+import numpy as np
+import pytest
+
+from districtheatingsim.net_simulation_pandapipes.adaptive_pipeflow import (
+    AdaptivePipeflow,
+    AdaptiveSolverSettings,
+    SolverCall,
+)
+
+
+class TestSolverReport:
+    def test_sums_per_time_step_in_solve_order(self):
+        solver = AdaptivePipeflow()
+        solver.calls = [
+            SolverCall(5, 10, 1.0, False, False, 0.1),
+            SolverCall(5, 4, 1.0, True, False, 0.05),
+            SolverCall(2, 30, 0.5, False, True, 0.3),
+            SolverCall(7, 3, 1.0, True, False, 0.02),
+        ]
+        report = solver.report()
+        np.testing.assert_array_equal(report.time_steps, [5, 2, 7])
+        np.testing.assert_array_equal(report.iterations, [14, 30, 3])
+        np.testing.assert_array_equal(report.solves, [2, 1, 1])
+        np.testing.assert_array_equal(report.fallbacks, [0, 1, 0])
+        np.testing.assert_allclose(report.seconds, [0.15, 0.3, 0.02])
+        assert report.total_iterations == 47
+        np.testing.assert_array_equal(report.expensive_steps(2), [2, 5])
+
+    def test_empty(self):
+        report = AdaptivePipeflow().report()
+        assert report.total_iterations == 0
+        assert len(report.expensive_steps()) == 0
+
+
+@pytest.mark.slow
+class TestAdaptivePipeflow:
+    N_STEPS = 8
+
+    @classmethod
+    def _time_series(cls, net, run=None):
+        from pandapipes.timeseries import run_time_series
+        from pandapower.timeseries import OutputWriter
+
+        from districtheatingsim.net_simulation_pandapipes import pp_net_time_series_simulation as ts
+
+        steps = range(cls.N_STEPS)
+        qext = np.column_stack([np.linspace(500e3, 50e3, cls.N_STEPS), np.linspace(200e3, 20e3, cls.N_STEPS)])
+        ts.install_heat_consumer_profile_controller(net, qext.T, steps, 0, cls.N_STEPS, np.array([55.0, 60.0]))
+        ts.update_heat_generator_supply_temperature_controller(
+            net, np.linspace(85.0, 70.0, cls.N_STEPS), steps, 0, cls.N_STEPS
+        )
+        ow = OutputWriter(net, steps, output_path=None, log_variables=ts.create_log_variables(net))
+        kwargs = {} if run is None else {"run": run}
+        run_time_series.run_timeseries(net, steps, mode="bidirectional", iter=100, alpha=0.5, **kwargs)
+        return ow.np_results
+
+    def test_time_series_matches_fixed_settings(self, solved_two_consumer_net):
+        reference = self._time_series(solved_two_consumer_net())
+
+        net = solved_two_consumer_net()
+        solver = AdaptivePipeflow()
+        solver.attach(net)
+        results = self._time_series(net, run=solver)
+        solver.detach(net)
+
+        for key in reference:
+            np.testing.assert_allclose(results[key], reference[key], rtol=1e-6, atol=1e-6, err_msg=key)
+        report = solver.report()
+        np.testing.assert_array_equal(report.time_steps, np.arange(self.N_STEPS))
+        assert np.all(report.solves >= 1) and np.all(report.iterations > 0)
+        assert report.fallbacks.sum() == 0
+        assert all(call.warm_start for call in solver.calls[1:])
+        assert not any(getattr(ctrl, "solver", None) is solver for ctrl in net.controller["object"])
+
+    def test_fallback_after_failed_attempt(self, solved_two_consumer_net):
+        net = solved_two_consumer_net()
+        solver = AdaptivePipeflow(AdaptiveSolverSettings(min_iter=1, iter_margin=0.01))
+        solver(net, mode="bidirectional", iter=100, alpha=0.5)
+        reference = net.res_junction.p_bar.copy()
+        # One iteration is not enough after a change of the demand
+        net.heat_consumer.qext_w *= 0.5
+        solver(net, mode="bidirectional", iter=100, alpha=0.5)
+        assert solver.calls[-1].fallback and not solver.calls[-1].warm_start
+        assert solver.alpha == 0.5
+        assert net.converged
+        net.heat_consumer.qext_w *= 2.0
+        solver(net, mode="bidirectional", iter=100, alpha=0.5)
+        np.testing.assert_allclose(net.res_junction.p_bar, reference, atol=1e-5)
+
+    def test_no_warm_start_after_layout_change(self, solved_two_consumer_net):
+        import pandapipes as pp
+
+        net = solved_two_consumer_net()
+        solver = AdaptivePipeflow()
+        solver(net, mode="bidirectional", iter=100)
+        solver(net, mode="bidirectional", iter=100)
+        assert solver.calls[-1].warm_start
+        pp.create_junction(net, pn_bar=1.0, tfluid_k=350.0)
+        solver(net, mode="bidirectional", iter=100)
+        assert not solver.calls[-1].warm_start
+
+    def test_failed_time_series_detaches_the_solver(self, solved_two_consumer_net, monkeypatch):
+        import dataclasses
+
+        from pandapipes.pipeflow import PipeflowNotConverged
+
+        from districtheatingsim.net_simulation_pandapipes import pp_net_time_series_simulation as ts
+        from districtheatingsim.net_simulation_pandapipes.NetworkDataClass import NetworkGenerationData
+
+        required = {
+            field.name: None
+            for field in dataclasses.fields(NetworkGenerationData)
+            if field.default is dataclasses.MISSING and field.default_factory is dataclasses.MISSING
+        }
+        data = NetworkGenerationData(**required)
+        data.net = solved_two_consumer_net()
+        data.waerme_hast_ges_W = np.full((2, self.N_STEPS), 100e3)
+        data.start_time_step, data.end_time_step = 0, self.N_STEPS
+        data.secondary_producers = []
+        data.supply_temperature_heat_generator = 85.0
+        data.return_temperature_heat_consumer = np.array([55.0, 60.0])
+
+        def fail_after_one_solve(net, time_steps, run=None, **kwargs):
+            run(net, **kwargs)
+            raise PipeflowNotConverged("diverged")
+
+        monkeypatch.setattr(ts.run_time_series, "run_timeseries", fail_after_one_solve)
+        with pytest.raises(RuntimeError, match=r"last solve at time step -1: alpha=1; fallback mode=bidirectional"):
+            ts.thermohydraulic_time_series_net(data, adaptive_solver=True)
+
+        assert not any(hasattr(ctrl, "solver") for ctrl in data.net.controller["object"])
+        assert data.solver_report.solves.sum() == 1
+        assert data.telemetry is not None
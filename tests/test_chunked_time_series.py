@@ -0,0 +1,123 @@
+"""
+Unit tests for the chunked, process-parallel time series (``chunked_time_series.py``).
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from districtheatingsim.net_simulation_pandapipes import chunked_time_series
+from districtheatingsim.net_simulation_pandapipes.chunked_time_series import (
+    ChunkedRunReport,
+    chunk_boundary_deviation,
+    run_time_series_chunked,
+    split_time_range,
+)
+
+
+class TestSplitTimeRange:
+    def test_blocks_cover_range(self):
+        assert split_time_range(10, 4) == [(0, 4), (4, 8), (8, 10)]
+        assert split_time_range(8, 4) == [(0, 4), (4, 8)]
+        assert split_time_range(3, 10) == [(0, 3)]
+        assert split_time_range(0, 4) == []
+
+    def test_invalid_chunk_size_raises(self):
+        with pytest.raises(ValueError, match="chunk_size"):
+            split_time_range(10, 0)
+
+
+class TestBoundaryDeviation:
+    def test_only_block_starts_compared(self):
+        sequential = {"res_junction.t_k": np.zeros((10, 2))}
+        chunked = {"res_junction.t_k": np.zeros((10, 2))}
+        chunked["res_junction.t_k"][3] = 5.0  # inside the first block: ignored
+        chunked["res_junction.t_k"][4, 1] = -0.5  # start of the second block
+        assert chunk_boundary_deviation(chunked, sequential, 4) == {"res_junction.t_k": 0.5}
+
+    def test_report_maximum(self):
+        assert ChunkedRunReport().max_boundary_deviation == 0.0
+        report = ChunkedRunReport(boundary_deviation={"a": 0.1, "b": 0.3})
+        assert report.max_boundary_deviation == 0.3
+
+    def test_time_steps_must_start_at_zero(self):
+        with pytest.raises(ValueError, match="range"):
+            run_time_series_chunked(None, range(2, 10), [], 4)
+
+
+class TestWarmStart:
+    def test_controllers_primed_with_step_zero_and_the_step_before_the_block(self, monkeypatch):
+        class Recorder:
+            def __init__(self):
+                self.steps = []
+
+            def time_step(self, net, time):
+                self.steps.append(time)
+
+        recorder = Recorder()
+        net = type("Net", (), {})()
+        net.controller = pd.DataFrame({"object": [recorder], "in_service": [True], "order": [-1]})
+        monkeypatch.setattr(chunked_time_series, "OutputWriter", lambda *args, **kwargs: SimpleNamespace(np_results={}))
+        monkeypatch.setattr(chunked_time_series.run_time_series, "run_timeseries", lambda *args, **kwargs: None)
+
+        chunked_time_series._simulate_chunk(net, 8, 12, 13, [], True, {})
+        assert recorder.steps == [0, 7]
+
+
+@pytest.mark.slow
+class TestChunkedRun:
+    N_STEPS = 12
+
+    @classmethod
+    def _prepared_net(cls, solved_two_consumer_net):
+        from districtheatingsim.net_simulation_pandapipes import pp_net_time_series_simulation as ts
+
+        rng = np.random.default_rng(1)
+        qext = np.vstack([rng.uniform(2e5, 5e5, cls.N_STEPS), rng.uniform(1e5, 2e5, cls.N_STEPS)])
+        treturn = np.vstack([np.linspace(50, 58, cls.N_STEPS), np.linspace(55, 60, cls.N_STEPS)])
+        min_supply = np.array([75.0, 80.0])
+        steps = range(cls.N_STEPS)
+
+        net = solved_two_consumer_net(min_supply)
+        ts.install_heat_consumer_profile_controller(net, qext, steps, 0, cls.N_STEPS, treturn, min_supply)
+        ts.update_heat_generator_supply_temperature_controller(net, np.full(cls.N_STEPS, 85.0), steps, 0, cls.N_STEPS)
+        return net, ts.create_log_variables(net)
+
+    @pytest.fixture(scope="class")
+    def sequential(self, solved_two_consumer_net):
+        from pandapipes.timeseries import run_time_series
+        from pandapower.timeseries import OutputWriter
+
+        net, log_variables = self._prepared_net(solved_two_consumer_net)
+        ow = OutputWriter(net, range(self.N_STEPS), output_path=None, log_variables=log_variables)
+        run_time_series.run_timeseries(net, range(self.N_STEPS), mode="bidirectional", iter=100, alpha=0.5)
+        return ow.np_results
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_matches_sequential_run(self, solved_two_consumer_net, sequential, max_workers):
+        net, log_variables = self._prepared_net(solved_two_consumer_net)
+        results, report = run_time_series_chunked(
+            net,
+            range(self.N_STEPS),
+            log_variables,
+            4,
+            max_workers=max_workers,
+            mode="bidirectional",
+            iter=100,
+            alpha=0.5,
+        )
+
+        assert results.keys() == sequential.keys()
+        for key, expected in sequential.items():
+            assert results[key].shape == expected.shape
+            np.testing.assert_array_equal(results[key][:4], expected[:4])  # first block is the sequential run
+            np.testing.assert_allclose(results[key], expected, rtol=0, atol=0.05, err_msg=key)
+
+        assert [(c.start, c.stop) for c in report.chunks] == [(0, 4), (4, 8), (8, 12)]
+        assert report.chunks[0].presolve_seconds < report.chunks[1].presolve_seconds
+        assert report.max_workers == max_workers
+        deviation = chunk_boundary_deviation(results, sequential, 4)
+        assert max(deviation.values()) < 0.05
+        assert report.boundary_deviation.keys() == sequential.keys()
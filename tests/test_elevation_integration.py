@@ -118,6 +118,29 @@ class TestGetLineCoordsAndLengths:
         assert coords_list[0][0] == (1.0, 2.0)
         assert coords_list[0][1] == (4.0, 6.0)
 
+    def test_several_lines_and_other_geometries(self):
+        from districtheatingsim.net_simulation_pandapipes.pp_net_initialisation_geojson import (
+            get_line_coords_and_lengths,
+        )
+
+        lines = [LineString([(0, 0), (3, 4), (3, 8)]), Point(1, 1), LineString([(5, 5, 1), (5, 6, 2)])]
+        coords_list, lengths = get_line_coords_and_lengths(_make_gdf_from_lines(lines))
+        assert coords_list == [[(0.0, 0.0), (3.0, 4.0), (3.0, 8.0)], [(5.0, 5.0), (5.0, 6.0)]]
+        assert lengths == pytest.approx([9.0, 1.0])
+
+
+class TestUniqueJunctionCoords:
+    def test_shared_points_once_in_set_order(self):
+        from districtheatingsim.net_simulation_pandapipes.pp_net_initialisation_geojson import (
+            get_all_point_coords_from_line_cords,
+        )
+
+        coords_list = [[(10.0, 0.0), (0.0, 0.0)], [(10.0, 0.0), (10.0, -5.0)], [(0.0, 0.0), (10.0, 0.0)]]
+        unique = get_all_point_coords_from_line_cords(coords_list)
+        assert sorted(unique) == [(0.0, 0.0), (10.0, -5.0), (10.0, 0.0)]
+        # Same numbering as the set-based deduplication existing projects were built with
+        assert unique == list({(10.0, 0.0), (0.0, 0.0), (10.0, -5.0)})
+
 
 class TestCollectUniquePoints:
     """Tests for elevation_utils.collect_unique_points_from_gdfs."""
@@ -261,6 +284,189 @@ class TestFlatNetworkRegressionHeightM:
         assert (net.junction["height_m"] == 0.0).all()
 
 
+@pytest.mark.slow
+class TestCreateNetworkElements:
+    """Junctions, pipes and heat consumers of ``create_network`` on a small 3-D network."""
+
+    @staticmethod
+    def _inputs(pipe_creation_mode):
+        import numpy as np
+
+        # Supply main with one branch; return lines offset by (1, 1); consumers at the three ends
+        nodes = {0: (0.0, 0.0, 100.0), 1: (50.0, 0.0, 102.0), 2: (100.0, 0.0, 104.0), 3: (50.0, 40.0, 101.0)}
+        edges = [(0, 1), (1, 2), (1, 3)]
+
+        def shifted(node):
+            x, y, z = nodes[node]
+            return (x + 1.0, y + 1.0, z)
+
+        gdf_dict = {
+            "flow_line": _make_gdf_from_lines([LineString([nodes[a], nodes[b]]) for a, b in edges]),
+            "return_line": _make_gdf_from_lines([LineString([shifted(b), shifted(a)]) for a, b in edges]),
+            "heat_consumer": _make_gdf_from_lines([LineString([nodes[n], shifted(n)]) for n in (2, 3)]),
+            "heat_producer": _make_gdf_from_lines([LineString([shifted(0), nodes[0]])]),
+        }
+        consumer_dict = {
+            "qext_w": np.array([50e3, 30e3]),
+            "min_supply_temperature_heat_consumer": np.array([60.0, 60.0]),
+            "return_temperature_heat_consumer": np.array([55.0, 50.0]),
+        }
+        pipe_dict = {
+            "pipetype": "ISOPLUS_DRE100_2x",
+            "v_max_pipe": 1.5,
+            "material_filter": "P235GH/PUR/PEHD",
+            "pipe_creation_mode": pipe_creation_mode,
+            "k_mm": 0.1,
+        }
+        producer_dict = {
+            "supply_temperature": 85.0,
+            "flow_pressure_pump": 4.0,
+            "lift_pressure_pump": 1.5,
+            "main_producer_location_index": 0,
+            "secondary_producers": [],
+        }
+        return gdf_dict, consumer_dict, pipe_dict, producer_dict
+
+    @pytest.mark.parametrize("pipe_creation_mode", ["type", "diameter"])
+    def test_elements_follow_the_geometry(self, pipe_creation_mode):
+        from districtheatingsim.net_simulation_pandapipes.pp_net_initialisation_geojson import create_network
+
+        gdf_dict, *rest = self._inputs(pipe_creation_mode)
+        net = create_network(gdf_dict, *rest)
+
+        geodata = net.junction_geodata
+        position = {(x, y): j for j, x, y in zip(geodata.index, geodata["x"], geodata["y"], strict=True)}
+        assert len(net.junction) == len(position) == 8
+        assert net.junction["name"].tolist() == [f"Junction {i}" for i in range(4)] * 2
+        assert sorted(net.junction["height_m"]) == [100.0, 100.0, 101.0, 101.0, 102.0, 102.0, 104.0, 104.0]
+
+        lines = list(gdf_dict["flow_line"].geometry) + list(gdf_dict["return_line"].geometry)
+        assert len(net.pipe) == len(lines)
+        for pipe, line in zip(net.pipe.index, lines, strict=True):
+            start, end = (c[:2] for c in line.coords)
+            assert net.pipe.at[pipe, "from_junction"] == position[start]
+            assert net.pipe.at[pipe, "to_junction"] == position[end]
+            assert net.pipe.at[pipe, "length_km"] == pytest.approx(line.length / 1000)
+            assert net.pipe_geodata.at[pipe, "coords"] == [start, end]
+        assert net.pipe["name"].tolist()[:3] == ["flow line 0", "flow line 1", "flow line 2"]
+
+        assert net.heat_consumer["name"].tolist() == ["heat consumer 0", "heat consumer 1"]
+        assert net.heat_consumer["from_junction"].tolist() == [position[(100.0, 0.0)], position[(50.0, 40.0)]]
+        assert net.heat_consumer["treturn_k"].tolist() == pytest.approx([328.15, 323.15])
+
+    @staticmethod
+    def _loop_build(gdf_dict, consumer_dict, pipe_dict, producer_dict):
+        """Junctions, pipes and heat consumers built one element at a time, as before the bulk creators."""
+        from districtheatingsim.net_simulation_pandapipes.pipe_std_types import resolve_pipe_u_w_per_m2k
+        from districtheatingsim.net_simulation_pandapipes.pp_net_initialisation_geojson import (
+            build_elevation_lookup_from_gdf,
+        )
+
+        net = pp.create_empty_network(fluid="water")
+        properties = pp.std_types.available_std_types(net, "pipe").loc[pipe_dict["pipetype"]]
+        supply_temperature_k = producer_dict["supply_temperature"] + 273.15
+        elevation_lookup = {}
+        for gdf in gdf_dict.values():
+            elevation_lookup.update(build_elevation_lookup_from_gdf(gdf))
+
+        def coords_of(gdf):
+            return [[(c[0], c[1]) for c in line.coords] for line in gdf.geometry]
+
+        def junctions(all_line_coords):
+            unique = list(set(coord for coords in all_line_coords for coord in coords))
+            return {
+                coords: pp.create_junction(
+                    net,
+                    pn_bar=1.05,
+                    tfluid_k=supply_temperature_k,
+                    height_m=elevation_lookup.get(coords, 0.0),
+                    name=f"Junction {i}",
+                    geodata=coords,
+                )
+                for i, coords in enumerate(unique)
+            }
+
+        flow, ret = coords_of(gdf_dict["flow_line"]), coords_of(gdf_dict["return_line"])
+        junction_dict_vl, junction_dict_rl = junctions(flow), junctions(ret)
+        for all_line_coords, gdf, junction_dict, line_type in (
+            (flow, gdf_dict["flow_line"], junction_dict_vl, "flow line"),
+            (ret, gdf_dict["return_line"], junction_dict_rl, "return line"),
+        ):
+            for i, (coords, length_m) in enumerate(zip(all_line_coords, gdf.geometry.length, strict=True)):
+                common = {
+                    "from_junction": junction_dict[coords[0]],
+                    "to_junction": junction_dict[coords[1]],
+                    "length_km": length_m / 1000,
+                    "k_mm": pipe_dict["k_mm"],
+                    "name": f"{line_type} {i}",
+                    "geodata": coords,
+                    "sections": 5,
+                    "text_k": 283,
+                }
+                if pipe_dict["pipe_creation_mode"] == "diameter":
+                    pp.create_pipe_from_parameters(
+                        net,
+                        diameter_m=properties["inner_diameter_mm"] / 1000,
+                        u_w_per_m2k=resolve_pipe_u_w_per_m2k(properties),
+                        **common,
+                    )
+                else:
+                    pp.create_pipe(net, std_type=pipe_dict["pipetype"], **common)
+
+        junction_dict = {**junction_dict_vl, **junction_dict_rl}
+        qext_w = consumer_dict["qext_w"]
+        treturn_k = consumer_dict["return_temperature_heat_consumer"] + 273.15
+        for i, (coords, q, t) in enumerate(zip(coords_of(gdf_dict["heat_consumer"]), qext_w, treturn_k, strict=True)):
+            pp.create_heat_consumer(
+                net,
+                from_junction=junction_dict[coords[0]],
+                to_junction=junction_dict[coords[1]],
+                loss_coefficient=0,
+                qext_w=q,
+                treturn_k=t,
+                name=f"heat consumer {i}",
+            )
+        return net
+
+    @pytest.mark.parametrize("pipe_creation_mode", ["type", "diameter"])
+    def test_tables_match_the_per_element_build(self, monkeypatch, pipe_creation_mode):
+        import pandas as pd
+
+        from districtheatingsim.net_simulation_pandapipes import pp_net_initialisation_geojson as module
+
+        class _Built(Exception):
+            pass
+
+        def capture(net):
+            # Stop right after element creation, before the pipes are reoriented and sized
+            built["net"] = net
+            raise _Built
+
+        built = {}
+        monkeypatch.setattr(module, "orient_pipes_from_producer", capture)
+        inputs = self._inputs(pipe_creation_mode)
+        with pytest.raises(_Built):
+            module.create_network(*inputs)
+        expected = self._loop_build(*inputs)
+
+        for table in ("junction", "junction_geodata", "pipe", "pipe_geodata", "heat_consumer"):
+            pd.testing.assert_frame_equal(built["net"][table], expected[table], obj=table)
+
+    def test_coordinate_noise_is_merged(self, caplog):
+        from districtheatingsim.net_simulation_pandapipes.pp_net_initialisation_geojson import create_network
+
+        gdf_dict, *rest = self._inputs("type")
+        # Start of the return line 1 -> 0 and the consumer end at node 3 off by CRS-transform noise
+        gdf_dict["return_line"].loc[0, "geometry"] = LineString([(51.0, 1.0 + 1e-7, 102.0), (1.0, 1.0, 100.0)])
+        gdf_dict["heat_consumer"].loc[1, "geometry"] = LineString([(50.0 + 1e-7, 40.0, 101.0), (51.0, 41.0, 101.0)])
+        with caplog.at_level("WARNING"):
+            net = create_network(gdf_dict, *rest)
+
+        assert len(net.junction) == 8
+        assert "2 junction cluster(s) within 0.01 m merged" in caplog.text
+        assert net.res_heat_consumer["mdot_from_kg_per_s"].gt(0).all()
+
+
 # ---------------------------------------------------------------------------
 # network_geojson_schema: elevation_start_m / elevation_end_m
 # ---------------------------------------------------------------------------
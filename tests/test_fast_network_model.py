@@ -0,0 +1,163 @@
+"""
+Unit tests for the quasi-static network model of the simplified time series (``fast_network_model.py``).
+"""
+
+import numpy as np
+import pandapipes as pp
+import pytest
+
+from districtheatingsim.net_simulation_pandapipes.fast_network_model import FastNetworkModel, _spanning_tree
+
+
+def _pipe_net(supply_pipes, return_pipes, consumers, n_junctions=8):
+    """Unsolved net with a pressure pump between junction 1 (return) and 0 (flow)."""
+    net = pp.create_empty_network(fluid="water")
+    pp.create_junctions(net, n_junctions, pn_bar=1.0, tfluid_k=350.0)
+    pp.create_circ_pump_const_pressure(net, 1, 0, p_flow_bar=4, plift_bar=1.5, t_flow_k=350.0)
+    for a, b in supply_pipes + return_pipes:
+        pp.create_pipe(net, a, b, std_type="ISOPLUS_DRE100_2x", length_km=0.1)
+    for a, b in consumers:
+        pp.create_heat_consumer(net, a, b, qext_w=1e5, treturn_k=320.0)
+    return net
+
+
+class TestSpanningTree:
+    def test_breadth_first_order_and_parents(self):
+        adjacency = {0: [(0, 1), (1, 2)], 1: [(0, 0), (2, 3)], 2: [(1, 0)], 3: [(2, 1)]}
+        order, parent = _spanning_tree(0, adjacency)
+        assert order == [0, 1, 2, 3]
+        assert parent == {0: -1, 1: 0, 2: 1, 3: 2}
+
+    def test_loop_raises(self):
+        adjacency = {0: [(0, 1), (2, 2)], 1: [(0, 0), (1, 2)], 2: [(1, 1), (2, 0)]}
+        with pytest.raises(ValueError, match="meshed"):
+            _spanning_tree(0, adjacency)
+
+
+class TestTopology:
+    def test_meshed_supply_raises(self):
+        net = _pipe_net([(0, 2), (2, 4), (0, 4)], [(3, 1)], [(4, 3)])
+        with pytest.raises(ValueError, match="meshed"):
+            FastNetworkModel(net)
+
+    def test_supply_connected_to_return_raises(self):
+        net = _pipe_net([(0, 2)], [(3, 1), (2, 3)], [(2, 3)])
+        with pytest.raises(ValueError, match="separate trees"):
+            FastNetworkModel(net)
+
+    def test_unconnected_consumer_raises(self):
+        net = _pipe_net([(0, 2)], [(3, 1)], [(2, 3), (5, 6)])
+        with pytest.raises(ValueError, match="not connected"):
+            FastNetworkModel(net)
+
+
+@pytest.mark.slow
+class TestFastNetworkModel:
+    N_STEPS = 12
+
+    @classmethod
+    def _inputs(cls):
+        qext = np.column_stack([np.linspace(500e3, 20e3, cls.N_STEPS), np.linspace(200e3, 10e3, cls.N_STEPS)])
+        return qext, np.linspace(85.0, 70.0, cls.N_STEPS), np.array([55.0, 60.0])
+
+    def test_energy_balance(self, solved_two_consumer_net):
+        qext, supply, treturn = self._inputs()
+        results = FastNetworkModel(solved_two_consumer_net()).simulate(qext, supply, treturn[None, :])
+
+        pump = results.pump_results["Heizentrale Haupteinspeisung"][0]
+        np.testing.assert_allclose(pump["qext_kW"], qext.sum(axis=1) / 1000 + results.heat_loss_kW, rtol=1e-3)
+        assert np.all(results.pipe_heat_loss_w > 0)
+        # Lower flow, longer residence time: the relative loss grows at part load
+        relative_loss = results.heat_loss_kW / pump["qext_kW"]
+        assert np.all(np.diff(relative_loss) > 0)
+        np.testing.assert_allclose(results.consumer_mass_flow_kg_s.sum(axis=1), pump["mass_flow"])
+        # Bad point at exactly the controller's target
+        np.testing.assert_allclose(results.consumer_dp_bar.min(axis=1), 1.0)
+
+    def test_standby_without_demand(self, solved_two_consumer_net):
+        _, supply, treturn = self._inputs()
+        results = FastNetworkModel(solved_two_consumer_net()).simulate(np.zeros((3, 2)), supply[:3], treturn[None, :])
+        pump = results.pump_results["Heizentrale Haupteinspeisung"][0]
+        np.testing.assert_array_equal(pump["deltap"], 1.5)
+        np.testing.assert_array_equal(pump["flow_pressure"], 3.5)
+        np.testing.assert_array_equal(pump["qext_kW"], 0.0)
+
+    def test_pipe_mass_flows_of_the_design_state(self, solved_two_consumer_net):
+        net = solved_two_consumer_net()
+        flows = FastNetworkModel(net).pipe_mass_flows(net.res_heat_consumer.mdot_from_kg_per_s.to_numpy())
+        np.testing.assert_allclose(flows, net.res_pipe.mdot_from_kg_per_s, rtol=1e-6)
+
+    def test_matches_pipeflow_time_series(self, solved_two_consumer_net):
+        from pandapipes.timeseries import run_time_series
+        from pandapower.timeseries import OutputWriter
+
+        from districtheatingsim.net_simulation_pandapipes import pp_net_time_series_simulation as ts
+
+        qext, supply, treturn = self._inputs()
+        net = solved_two_consumer_net()
+        results = FastNetworkModel(net).simulate(qext, supply, treturn[None, :])
+
+        steps = range(self.N_STEPS)
+        ts.install_heat_consumer_profile_controller(net, qext.T, steps, 0, self.N_STEPS, treturn)
+        ts.update_heat_generator_supply_temperature_controller(net, supply, steps, 0, self.N_STEPS)
+        log_variables = ts.create_log_variables(net) + [("res_pipe", "mdot_from_kg_per_s")]
+        ow = OutputWriter(net, steps, output_path=None, log_variables=log_variables)
+        run_time_series.run_timeseries(net, steps, mode="bidirectional", iter=100, alpha=0.5)
+        reference = ts.calculate_results(net, ow.np_results)["Heizentrale Haupteinspeisung"][0]
+        pump = results.pump_results["Heizentrale Haupteinspeisung"][0]
+
+        np.testing.assert_allclose(
+            results.pipe_mass_flow_kg_s, ow.np_results["res_pipe.mdot_from_kg_per_s"], atol=0.05, rtol=0.01
+        )
+        np.testing.assert_allclose(pump["return_temp"], reference["return_temp"], atol=0.5)
+        np.testing.assert_allclose(pump["return_pressure"], reference["return_pressure"], atol=1e-6)
+        # The controller accepts the bad point anywhere within its tolerance of 0.2 bar
+        np.testing.assert_allclose(pump["deltap"], reference["deltap"], atol=0.2)
+        assert pump["qext_kW"].sum() == pytest.approx(reference["qext_kW"].sum(), rel=0.01)
+
+
+def _radial_net(n_junctions=500, n_consumers=250, load_w=40e3, seed=0):
+    """Random radial net (2 · n_junctions pipes) as in ``examples/benchmark_fast_network_model.py``, solved once."""
+    from districtheatingsim.net_simulation_pandapipes.controllers import BadPointPressureLiftController
+
+    rng = np.random.default_rng(seed)
+    parent = np.array([-1] + [int(rng.integers(0, i)) for i in range(1, n_junctions)])
+    consumer_nodes = rng.choice(np.arange(1, n_junctions), n_consumers, replace=False)
+    design_flow = np.zeros(n_junctions)
+    for node in consumer_nodes:
+        while node >= 0:
+            design_flow[node] += load_w / (4180 * 30)
+            node = parent[node]
+
+    net = pp.create_empty_network(fluid="water")
+    supply = pp.create_junctions(net, n_junctions + 1, pn_bar=1.05, tfluid_k=358.15)
+    ret = pp.create_junctions(net, n_junctions + 1, pn_bar=1.05, tfluid_k=328.15)
+    pp.create_circ_pump_const_pressure(net, ret[-1], supply[-1], p_flow_bar=6, plift_bar=4, t_flow_k=358.15)
+    pipe_types = [(32, 0.036), (50, 0.0539), (80, 0.0825), (125, 0.1325), (200, 0.2101), (300, 0.3127)]
+    for node in range(n_junctions):
+        # Smallest pipe type with at most 1.5 m/s at design load
+        dn = next((dn for dn, d in pipe_types if design_flow[node] / (1000 * np.pi * d**2 / 4) < 1.5), 300)
+        length_km = rng.uniform(0.02, 0.08)
+        for a, b in ((supply[parent[node]], supply[node]), (ret[node], ret[parent[node]])):
+            pp.create_pipe(net, a, b, std_type=f"ISOPLUS_DRE{dn}_2x", length_km=length_km, k_mm=0.1, text_k=283)
+    for node in consumer_nodes:
+        pp.create_heat_consumer(net, supply[node], ret[node], qext_w=load_w, treturn_k=328.15)
+    pp.pipeflow(net, mode="bidirectional", iter=100)
+    net.controller.loc[len(net.controller)] = [BadPointPressureLiftController(net), True, -1, -1, False, False]
+    return net
+
+
+@pytest.mark.slow
+class TestFastNetworkModelBudget:
+    def test_full_year_of_a_thousand_pipes(self):
+        net = _radial_net()
+        hours = np.arange(8760)
+        season = 0.55 + 0.45 * np.cos(2 * np.pi * hours / 8760)
+        rng = np.random.default_rng(1)
+        qext = 40e3 * np.clip(season[:, None] * rng.uniform(0.6, 1.2, (8760, 250)), 0.02, 1.0)
+        model = FastNetworkModel(net)
+        assert len(net.pipe) == 1000
+
+        # Best of three runs: the budget is about the model, not about a busy CI machine
+        seconds = min(model.simulate(qext, 70.0 + 15.0 * season).seconds for _ in range(3))
+        assert seconds < 1.0
@@ -0,0 +1,143 @@
+"""
+Unit tests for the per-project comparison KPI index (``kpi_index.py``).
+
+The index caches the processed dashboard KPIs in SQLite keyed by each source
+file's ``(mtime_ns, size)``; these tests check hits, invalidation on change and
+the never-raising save hooks.
+"""
+
+import json
+import os
+import sqlite3
+
+import pytest
+
+from districtheatingsim.gui.ComparisonTab import kpi_index
+from districtheatingsim.gui.ComparisonTab.kpi_index import (
+    INDEX_FILENAME,
+    KPIIndex,
+    open_kpi_index,
+    record_energy_system_save,
+    record_network_save,
+)
+
+
+def _write_results(variant, filename, wgk_gesamt):
+    erg = variant / "Ergebnisse"
+    erg.mkdir(parents=True, exist_ok=True)
+    path = erg / filename
+    path.write_text(json.dumps({"results": {"WGK_Gesamt": wgk_gesamt, "Wärmemengen": [100.0]}}), encoding="utf-8")
+    return path
+
+
+def _write_net_config(variant, length):
+    net_dir = variant / "Wärmenetz"
+    net_dir.mkdir(parents=True, exist_ok=True)
+    path = net_dir / "Konfiguration Netzinitialisierung.json"
+    path.write_text(json.dumps({"kpi_results": {"Trassenlänge Wärmenetz [m]": length}}), encoding="utf-8")
+    return path
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+
+
+@pytest.fixture
+def variant(tmp_path):
+    return tmp_path / "Variante 1"
+
+
+class TestConfigKpis:
+    def test_second_lookup_is_served_from_index(self, tmp_path, variant, monkeypatch):
+        _write_results(variant, "Ergebnisse.json", 99.987)
+        with KPIIndex(str(tmp_path)) as index:
+            assert index.config_kpis(str(variant), "Ergebnisse.json")["WGK_Gesamt"] == 99.99
+
+        # A fresh index instance must not re-process the unchanged file.
+        calls = []
+        monkeypatch.setattr(kpi_index, "process_variant_results", lambda r: calls.append(r) or {})
+        with KPIIndex(str(tmp_path)) as index:
+            assert index.config_kpis(str(variant), "Ergebnisse.json")["WGK_Gesamt"] == 99.99
+            assert (index.hits, index.misses) == (1, 0)
+        assert calls == []
+        assert (tmp_path / INDEX_FILENAME).exists()
+
+    def test_changed_file_is_reprocessed(self, tmp_path, variant):
+        path = _write_results(variant, "Ergebnisse.json", 50.0)
+        with KPIIndex(str(tmp_path)) as index:
+            index.config_kpis(str(variant), "Ergebnisse.json")
+            _write_results(variant, "Ergebnisse.json", 60.0)
+            _bump_mtime(path)
+            assert index.config_kpis(str(variant), "Ergebnisse.json")["WGK_Gesamt"] == 60.0
+            assert index.misses == 2
+
+    def test_missing_file_raises(self, tmp_path, variant):
+        with KPIIndex(str(tmp_path)) as index, pytest.raises(FileNotFoundError):
+            index.config_kpis(str(variant), "Ergebnisse.json")
+
+
+class TestVariantConfigs:
+    def test_new_config_file_invalidates_listing(self, tmp_path, variant):
+        _write_results(variant, "Ergebnisse.json", 1.0)
+        with KPIIndex(str(tmp_path)) as index:
+            assert index.variant_configs(str(variant)) == [("Standard", "Ergebnisse.json")]
+            _write_results(variant, "Ergebnisse_B.json", 2.0)
+            _bump_mtime(variant / "Ergebnisse")
+            assert [fn for _, fn in index.variant_configs(str(variant))] == ["Ergebnisse.json", "Ergebnisse_B.json"]
+
+    def test_variant_without_results_is_empty(self, tmp_path, variant):
+        with KPIIndex(str(tmp_path)) as index:
+            assert index.variant_configs(str(variant)) == []
+
+
+class TestNetworkKpis:
+    def test_cached_and_invalidated(self, tmp_path, variant):
+        path = _write_net_config(variant, 1000.0)
+        with KPIIndex(str(tmp_path)) as index:
+            assert index.network_kpis(str(variant))["Trassenlänge"] == 1000.0
+            assert index.network_kpis(str(variant))["Trassenlänge"] == 1000.0
+            assert index.hits == 1
+            _write_net_config(variant, 2500.0)
+            _bump_mtime(path)
+            assert index.network_kpis(str(variant))["Trassenlänge"] == 2500.0
+
+    def test_missing_config_returns_zeros(self, tmp_path, variant):
+        with KPIIndex(str(tmp_path)) as index:
+            assert index.network_kpis(str(variant))["Trassenlänge"] == 0
+
+
+class TestSaveHooks:
+    def test_record_energy_system_save_primes_index(self, tmp_path, variant):
+        path = _write_results(variant, "Ergebnisse_A.json", 42.0)
+        record_energy_system_save(str(path))
+        with KPIIndex(str(tmp_path)) as index:
+            assert index.config_kpis(str(variant), "Ergebnisse_A.json")["WGK_Gesamt"] == 42.0
+            assert index.hits == 1
+
+    def test_record_network_save_primes_index(self, tmp_path, variant):
+        _write_net_config(variant, 321.0)
+        record_network_save(str(variant))
+        with KPIIndex(str(tmp_path)) as index:
+            assert index.network_kpis(str(variant))["Trassenlänge"] == 321.0
+            assert index.hits == 1
+
+    def test_hooks_never_raise(self, tmp_path):
+        record_energy_system_save(str(tmp_path / "nope" / "Ergebnisse" / "Ergebnisse.json"))
+        record_network_save(str(tmp_path / "nope" / "missing"))
+
+
+class TestUnavailableIndex:
+    def test_open_in_missing_folder_returns_none(self, tmp_path):
+        assert open_kpi_index(str(tmp_path / "nope")) is None
+
+    def test_read_only_index_serves_uncached(self, tmp_path, variant):
+        _write_results(variant, "Ergebnisse.json", 12.0)
+        index = open_kpi_index(str(tmp_path))
+        index.close()
+        index._conn = sqlite3.connect(f"file:{index.path}?mode=ro", uri=True)
+        try:
+            assert index.config_kpis(str(variant), "Ergebnisse.json")["WGK_Gesamt"] == 12.0
+            assert index.variant_configs(str(variant)) == [("Standard", "Ergebnisse.json")]
+        finally:
+            index.close()
@@ -0,0 +1,138 @@
+"""
+Unit tests for the life-cycle-cost-optimal pipe sizing (``lcc_pipe_sizing.py``).
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from districtheatingsim.net_simulation_pandapipes.lcc_pipe_sizing import (
+    LccParameters,
+    load_classes,
+    optimize_lcc_diameter_types,
+    tree_dynamic_program,
+)
+
+# Root 0 with two subtrees: 0 -> 1 -> {2, 3 -> 4}, 0 -> 5
+_TREE = [(1, 0, 0), (5, 1, 0), (2, 2, 1), (3, 3, 1), (4, 4, 3)]
+_PARENT_BRANCH = {1: None, 5: None, 2: 0, 3: 0, 4: 3}
+
+
+def _brute_force(cost, steps, budget):
+    """Cheapest choice by enumeration; every root-to-node path within the budget."""
+    best, best_choice = np.inf, None
+    for choice in itertools.product(range(cost.shape[1]), repeat=cost.shape[0]):
+        used = {}
+        for node, branch, _ in _TREE:
+            above = 0 if _PARENT_BRANCH[node] is None else used[_PARENT_BRANCH[node]]
+            used[branch] = above + steps[branch, choice[branch]]
+        if max(used.values()) <= budget:
+            total = sum(cost[b, o] for b, o in enumerate(choice))
+            if total < best:
+                best, best_choice = total, choice
+    return best, best_choice
+
+
+def _year_profile(n_hours=8760):
+    """Heat demand of the two consumers of the ring fixture, design load in the first hour."""
+    shape = 0.1 + 0.9 * np.cos(np.linspace(0.0, 1.0, n_hours) * np.pi) ** 2
+    return np.column_stack([500e3 * shape, 200e3 * shape])
+
+
+class TestTreeDynamicProgram:
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_brute_force(self, seed):
+        rng = np.random.default_rng(seed)
+        cost = rng.uniform(1.0, 10.0, (5, 3))
+        steps = rng.integers(0, 5, (5, 3))
+        cost[rng.integers(0, 5), rng.integers(0, 3)] = np.inf
+        budget = 8
+        expected, _ = _brute_force(cost, steps, budget)
+        chosen = tree_dynamic_program(_TREE, cost, steps, budget)
+        assert sum(cost[b, o] for b, o in chosen.items()) == pytest.approx(expected)
+
+    def test_infeasible_budget(self):
+        cost = np.ones((5, 2))
+        steps = np.full((5, 2), 3)
+        with pytest.raises(ValueError, match="pressure loss"):
+            tree_dynamic_program(_TREE, cost, steps, 8)
+
+
+class TestLoadClasses:
+    def test_classes_keep_the_peak_and_the_energy(self):
+        rng = np.random.default_rng(0)
+        qext = rng.uniform(0.0, 1e5, (100, 3))
+        supply = np.linspace(90.0, 70.0, 100)
+        class_qext, class_supply, class_return, hours, cubic_factor = load_classes(qext, supply, None, 10)
+
+        assert len(hours) == 10 and hours.sum() == 100 and hours[0] == 1
+        np.testing.assert_allclose(class_qext[0], qext[qext.sum(axis=1).argmax()])
+        np.testing.assert_allclose(hours @ class_qext, qext.sum(axis=0))
+        assert hours @ class_supply == pytest.approx(supply.sum())
+        assert class_return is None
+        assert cubic_factor[0] == pytest.approx(1.0) and (cubic_factor >= 1.0 - 1e-12).all()
+
+
+class TestParameters:
+    def test_from_economic_parameters(self, economic_parameters):
+        parameters = LccParameters.from_economic_parameters(economic_parameters, v_max=1.5)
+        assert parameters.electricity_price_eur_per_mwh == economic_parameters["electricity_price"]
+        assert parameters.time_period_years == economic_parameters["time_period"]
+        assert parameters.v_max == 1.5
+        # The annuity factors are linear: 1 € investment, 1 € energy cost per year
+        assert 0.0 < parameters.capital_factor() < 1.0
+        assert parameters.energy_factor() > 0.0
+
+
+@pytest.mark.slow
+class TestLccSizing:
+    def test_without_energy_cost_the_smallest_bores_meeting_v_max(self, solved_two_consumer_net):
+        from districtheatingsim.net_simulation_pandapipes.resource_registry import pipe_catalog
+
+        net = solved_two_consumer_net()
+        parameters = LccParameters(heat_price_eur_per_mwh=0.0, electricity_price_eur_per_mwh=0.0, v_max=1.5)
+        result = optimize_lcc_diameter_types(net, _year_profile(), 85.0, parameters=parameters)
+
+        catalog = pipe_catalog(net, "P235GH/PUR/PEHD")
+        pipes = result.pipes
+        assert (pipes["peak_velocity_m_per_s"] <= 1.5).all()
+        for _, row in pipes.iterrows():
+            smaller = catalog.neighbor(row["std_type"], larger=False)
+            smaller_mm = catalog.properties(smaller)[0]
+            assert row["peak_velocity_m_per_s"] * (row["inner_diameter_mm"] / smaller_mm) ** 2 > 1.5
+        assert (net.pipe["std_type"] == pipes["std_type"]).all()
+        assert (net.res_pipe["v_mean_m_per_s"].abs() <= 1.5 + 1e-3).all()
+
+    def test_breakdown_and_energy_prices(self, solved_two_consumer_net):
+        profile = _year_profile()
+        default = optimize_lcc_diameter_types(solved_two_consumer_net(), profile, 85.0, verify=False)
+        pipes = default.pipes
+        np.testing.assert_allclose(
+            pipes["total_eur_per_a"],
+            pipes["capital_eur_per_a"] + pipes["heat_loss_eur_per_a"] + pipes["pump_eur_per_a"],
+        )
+        assert default.total_eur_per_a == pytest.approx(pipes["total_eur_per_a"].sum())
+        assert (pipes[["heat_loss_mwh_per_a", "pump_energy_mwh_per_a"]] > 0).all().all()
+
+        parameters = LccParameters(electricity_price_eur_per_mwh=5000.0)
+        pumping = optimize_lcc_diameter_types(
+            solved_two_consumer_net(), profile, 85.0, parameters=parameters, verify=False
+        )
+        assert (pumping.pipes["inner_diameter_mm"] >= pipes["inner_diameter_mm"]).all()
+        assert (pumping.pipes["inner_diameter_mm"] > pipes["inner_diameter_mm"]).any()
+
+    def test_pressure_and_velocity_constraints(self, solved_two_consumer_net):
+        # Supply pipes 0 -> 1 -> 2 and return pipes 3 -> 4 -> 5 form the paths to the far consumer
+        profile = _year_profile()
+        parameters = LccParameters(max_path_loss_bar=0.2)
+        result = optimize_lcc_diameter_types(
+            solved_two_consumer_net(), profile, 85.0, parameters=parameters, verify=False
+        )
+        dp = result.pipes["peak_dp_bar"]
+        assert dp[[0, 1, 2]].sum() <= 0.1 and dp[[3, 4, 5]].sum() <= 0.1
+
+        with pytest.raises(ValueError, match="v_max"):
+            optimize_lcc_diameter_types(
+                solved_two_consumer_net(), profile, 85.0, parameters=LccParameters(v_max=1e-3), verify=False
+            )
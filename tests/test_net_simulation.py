@@ -526,6 +526,67 @@ class TestSecondaryProducerRoundTrip:
         assert rebuilt == [SecondaryProducer(index=3, load_percentage=10.0)]
 
 
+class TestProducerResults:
+    """Producer results stacked into one producer x parameter x time array for KPIs and plots."""
+
+    @staticmethod
+    def _network_data(**values):
+        import dataclasses
+
+        from districtheatingsim.net_simulation_pandapipes.NetworkDataClass import NetworkGenerationData
+
+        required = {
+            field.name: None
+            for field in dataclasses.fields(NetworkGenerationData)
+            if field.default is dataclasses.MISSING and field.default_factory is dataclasses.MISSING
+        }
+        return NetworkGenerationData(**{**required, **values})
+
+    @staticmethod
+    def _pump_results(n_steps=6):
+        from districtheatingsim.net_simulation_pandapipes.NetworkDataClass import PRODUCER_PARAMETERS
+
+        main = {parameter: np.full(n_steps, float(i + 1)) for i, parameter in enumerate(PRODUCER_PARAMETERS)}
+        secondary = {"qext_kW": np.full(n_steps, 10.0), "mass_flow": np.full(n_steps, 2.0), "deltap": np.ones(n_steps)}
+        return {"Heizentrale Haupteinspeisung": {0: main}, "weitere Einspeisung": {0: secondary}}
+
+    def test_stacked_in_pump_results_order(self):
+        from districtheatingsim.net_simulation_pandapipes.NetworkDataClass import ProducerResults
+
+        producers = ProducerResults.from_pump_results(self._pump_results())
+        assert producers.labels == [("Heizentrale Haupteinspeisung", 0), ("weitere Einspeisung", 0)]
+        assert producers.values.shape == (2, 7, 6)
+        np.testing.assert_array_equal(producers.parameter("qext_kW")[:, 0], [1.0, 10.0])
+        # A parameter the producer does not report stays NaN
+        assert np.isnan(producers.parameter("flow_temp")[1]).all()
+        assert ProducerResults.from_pump_results({}).values.shape == (0, 7, 0)
+
+    def test_kpis_and_plot_series(self):
+        n_steps = 6
+        data = self._network_data(
+            pump_results=self._pump_results(n_steps),
+            waerme_ges_kW=np.full(8, 5.0),
+            strombedarf_ges_kW=np.zeros(8),
+            yearly_time_steps=np.arange(8),
+            start_time_step=1,
+            end_time_step=1 + n_steps,
+        )
+        results = data.calculate_results()
+        assert results["Jahreswärmeerzeugung [MWh]"] == pytest.approx((1.0 + 10.0) * n_steps / 1000)
+        # (mdot / 1000) * (dp * 100) / 1000 per step: main 2 kg/s at 3 bar, secondary 2 kg/s at 1 bar
+        assert results["Pumpenstrom [MWh]"] == pytest.approx((0.6 + 0.2) * n_steps / 1000)
+
+        data.prepare_plot_data()
+        plot_data = data.plot_data
+        assert len(plot_data) == 1 + 2 * 7
+        np.testing.assert_array_equal(plot_data["Massenstrom weitere Einspeisung 1"]["data"], np.full(n_steps, 2.0))
+        assert plot_data["Vorlaufdruck Heizentrale Haupteinspeisung 1"]["axis"] == "right"
+        # One simulated time axis shared by every series
+        time_axes = {id(entry["time"]) for entry in plot_data.values()}
+        assert len(time_axes) == 1
+        np.testing.assert_array_equal(plot_data["Wärmeerzeugung weitere Einspeisung 1"]["time"], np.arange(1, 7))
+
+
 class TestKmrToIsoplus:
     """Legacy KMR pipe names map to their ISOPLUS successors (pandapipes >=0.14)."""
 
@@ -634,33 +695,67 @@ class TestNetworkInitialization:
     """
 
     @staticmethod
-    def _build_and_init():
+    def _build(reversed_pipes=()):
+        """Tiny net; the pipes in ``reversed_pipes`` are digitized against the flow."""
         import pandapipes as pp
-        from pandapipes.control.run_control import run_control
-
-        from districtheatingsim.net_simulation_pandapipes.utilities import (
-            correct_flow_directions,
-            create_controllers,
-            init_diameter_types,
-        )
 
         net = pp.create_empty_network(fluid="water")
         st = 85 + 273.15
         coords = [(0, 10), (0, 0), (10, 0), (60, 0), (85, 0), (85, 10), (60, 10), (10, 10)]
         j = [pp.create_junction(net, pn_bar=1.05, tfluid_k=st, geodata=c) for c in coords]
         pp.create_circ_pump_const_pressure(net, j[0], j[1], p_flow_bar=4, plift_bar=1.5, t_flow_k=st, type="auto")
-        for a, b, length in [(1, 2, 0.01), (2, 3, 0.05), (3, 4, 0.025)]:
-            pp.create_pipe(net, j[a], j[b], std_type="ISOPLUS_DRE100_2x", length_km=length, k_mm=0.1)
-        pp.create_heat_consumer(net, j[4], j[5], qext_w=500000, treturn_k=55 + 273.15)
-        pp.create_heat_consumer(net, j[3], j[6], qext_w=200000, treturn_k=60 + 273.15)
-        for a, b, length in [(5, 6, 0.25), (6, 7, 0.05), (7, 0, 0.01)]:
+        ends = [(1, 2, 0.01), (2, 3, 0.05), (3, 4, 0.025), (5, 6, 0.25), (6, 7, 0.05), (7, 0, 0.01)]
+        for index, (a, b, length) in enumerate(ends):
+            if index in reversed_pipes:
+                a, b = b, a
             pp.create_pipe(net, j[a], j[b], std_type="ISOPLUS_DRE100_2x", length_km=length, k_mm=0.1)
+            if index == 2:
+                pp.create_heat_consumer(net, j[4], j[5], qext_w=500000, treturn_k=55 + 273.15)
+                pp.create_heat_consumer(net, j[3], j[6], qext_w=200000, treturn_k=60 + 273.15)
+        return net
 
-        pp.pipeflow(net, mode="bidirectional", iter=100)
+    @classmethod
+    def _build_and_init(cls, reversed_pipes=()):
+        # The create_network sequence: orient, controllers, design solve and sizing, flow check
+        from districtheatingsim.net_simulation_pandapipes.utilities import (
+            correct_flow_directions,
+            create_controllers,
+            init_diameter_types,
+            orient_pipes_from_producer,
+        )
+
+        net = cls._build(reversed_pipes)
+        orient_pipes_from_producer(net)
         net = create_controllers(net, np.array([500000, 200000]), 85, None, np.array([55, 60]), None)
-        run_control(net, mode="bidirectional", iter=100)
+        net = init_diameter_types(net, v_max_pipe=1.5, k=0.1)
+        return correct_flow_directions(net)
+
+    def test_reversed_pipes_are_oriented_before_the_first_solve(self):
+        from districtheatingsim.net_simulation_pandapipes.utilities import orient_pipes_from_producer
+
+        expected = self._build()
+        net = self._build(reversed_pipes=(0, 2, 4))
+        assert orient_pipes_from_producer(net) == 3
+        assert net.pipe[["from_junction", "to_junction"]].equals(expected.pipe[["from_junction", "to_junction"]])
+        assert orient_pipes_from_producer(net) == 0
+
+        initialized = self._build_and_init(reversed_pipes=(0, 2, 4))
+        assert np.all(initialized.res_pipe.v_mean_m_per_s > 0)
+        assert list(initialized.pipe.std_type) == list(self._build_and_init().pipe.std_type)
+
+    def test_reverse_flow_left_by_a_loop_is_swapped(self):
+        import pandapipes as pp
+
+        from districtheatingsim.net_simulation_pandapipes.utilities import correct_flow_directions
+
+        net = self._build_and_init()
+        # Closes a supply loop; digitized against the flow it feeds from junction 3 back to 2
+        pp.create_pipe(net, 3, 2, std_type="ISOPLUS_DRE100_2x", length_km=0.1, k_mm=0.1)
+        pp.pipeflow(net, mode="bidirectional", iter=100)
+        assert net.res_pipe.v_mean_m_per_s.iloc[-1] < 0
         net = correct_flow_directions(net)
-        return init_diameter_types(net, v_max_pipe=1.5, k=0.1)
+        assert list(net.pipe.iloc[-1][["from_junction", "to_junction"]]) == [2, 3]
+        assert np.all(net.res_pipe.v_mean_m_per_s >= 0)
 
     def test_init_converges_and_selects_isoplus(self):
         net = self._build_and_init()
@@ -717,6 +812,80 @@ class TestNetworkInitialization:
         assert kpis["Pumpenstrom [MWh]"] is None  # no pump_results yet
         assert nd.kpi_results is kpis  # cached on the object
 
+    def test_radial_sizing_matches_iterative_optimization(self):
+        import copy
+
+        from districtheatingsim.net_simulation_pandapipes.utilities import optimize_diameter_types
+
+        net = self._build_and_init()
+        iterative = optimize_diameter_types(copy.deepcopy(net), v_max=1.0, k=0.1, method="iterative")
+        radial = optimize_diameter_types(net, v_max=1.0, k=0.1, method="radial")
+        assert list(radial.pipe.std_type) == list(iterative.pipe.std_type)
+        assert np.all(np.abs(radial.res_pipe.v_mean_m_per_s) <= 1.0)
+
+    def test_meshed_network_falls_back_to_iterative(self):
+        import pandapipes as pp
+
+        from districtheatingsim.net_simulation_pandapipes.utilities import optimize_diameter_types
+
+        net = self._build_and_init()
+        pp.create_pipe(net, 1, 4, std_type="ISOPLUS_DRE100_2x", length_km=0.1, k_mm=0.1)  # closes a supply loop
+        with pytest.raises(ValueError, match="meshed"):
+            optimize_diameter_types(net, v_max=1.0, k=0.1, method="radial")
+        net = optimize_diameter_types(net, v_max=1.0, k=0.1)
+        assert net.pipe["optimized"].all()
+        assert np.all(np.abs(net.res_pipe.v_mean_m_per_s) <= 1.0)
+
+    def test_continuous_sizing_meets_the_velocity_limit_with_few_solves(self, caplog):
+        import logging
+        import re
+
+        from districtheatingsim.net_simulation_pandapipes.utilities import optimize_diameter_parameters
+
+        net = self._build_and_init()
+        with caplog.at_level(logging.INFO):
+            optimize_diameter_parameters(net, v_max=1.5, dx=0.001, safety_factor=1.5)
+        (iterations, calls) = re.findall(r"completed in (\d+) iterations, (\d+) pipeflow calls", caplog.text)[0]
+        assert int(iterations) <= 3 and int(calls) <= 12
+
+        vdot = np.abs(net.res_pipe.vdot_m3_per_s.to_numpy())
+        diameter = net.pipe.inner_diameter_mm.to_numpy() / 1000
+        assert np.all(vdot / (np.pi * diameter**2 / 4) <= 1.0 + 1e-9)
+        # Smallest diameter on the 1 mm grid: one step less would exceed the limit
+        assert np.all(vdot / (np.pi * (diameter - 0.001) ** 2 / 4) > 1.0)
+
+    @staticmethod
+    def _optimize(net, method, caplog):
+        import copy
+        import logging
+        import re
+
+        from districtheatingsim.net_simulation_pandapipes.utilities import optimize_diameter_types
+
+        caplog.clear()
+        with caplog.at_level(logging.INFO):
+            result = optimize_diameter_types(copy.deepcopy(net), v_max=1.0, k=0.1, method=method)
+        (calls,) = re.findall(r"Total optimization time: .*, (\d+) pipeflow calls", caplog.text)
+        return result, int(calls)
+
+    def test_batched_optimization_matches_iterative(self, caplog):
+        net = self._build_and_init()
+        iterative, iterative_calls = self._optimize(net, "iterative", caplog)
+        batched, batched_calls = self._optimize(net, "batch", caplog)
+        assert list(batched.pipe.std_type) == list(iterative.pipe.std_type)
+        assert batched_calls < iterative_calls
+
+    def test_batched_optimization_of_a_meshed_network(self, caplog):
+        import pandapipes as pp
+
+        net = self._build_and_init()
+        pp.create_pipe(net, 1, 4, std_type="ISOPLUS_DRE100_2x", length_km=0.1, k_mm=0.1)  # closes a supply loop
+        _, iterative_calls = self._optimize(net, "iterative", caplog)
+        batched, batched_calls = self._optimize(net, "batch", caplog)
+        # The order of the downsizing decides which local optimum a loop ends in, so only the limit is pinned
+        assert np.all(np.abs(batched.res_pipe.v_mean_m_per_s) <= 1.0)
+        assert batched_calls < iterative_calls
+
 
 class TestAvailablePlotParameters:
     """Plotly-free data layer extracted from interactive_network_plot (BACKLOG B1/B3):
@@ -906,6 +1075,15 @@ class TestPipePlotData:
         # hover has no parameter line when uncoloured
         assert "Geschwindigkeit [m/s]:" not in data.segments[0].hover_text
 
+    def test_pipe_with_unknown_junction_is_skipped(self):
+        from districtheatingsim.net_simulation_pandapipes.plot_data import pipe_plot_data
+
+        net, junctions = self._net_and_junctions()
+        net.pipe.loc[1, "to_junction"] = 7
+        data = pipe_plot_data(net, junctions, parameter="v_mean_m_per_s")
+        assert [seg.idx for seg in data.segments] == [0]
+        assert (data.vmin, data.vmax) == (1.5, 2.5)
+
 
 class TestHeatConsumerPlotData:
     """Heat-consumer polyline extraction (Plotly-free data layer, B1/B3)."""
@@ -16,6 +16,7 @@ from districtheatingsim.net_generation.network_connectivity import (
     check_geojson_connectivity,
     check_network_connectivity,
     feature_groups_from_geojson,
+    merge_near_points,
     snap_geojson_endpoints,
     snap_network_endpoints,
 )
@@ -90,6 +91,49 @@ class TestDisconnections:
         assert rep.ok is False
 
 
+class TestMergeNearPoints:
+    def test_clusters_match_pairwise_distances(self):
+        import numpy as np
+
+        rng = np.random.default_rng(0)
+        points = [tuple(p) for p in rng.uniform(0.0, 20.0, (300, 2)).tolist()]
+        points += points[:10]  # duplicates make their coordinate the representative
+        mapping, clusters = merge_near_points(points, 0.5)
+
+        # Brute force: union every pair within the tolerance
+        label = {p: p for p in points}
+
+        def find(p):
+            while label[p] != p:
+                p = label[p]
+            return p
+
+        for i, p in enumerate(points):
+            for q in points[i + 1 :]:
+                if (p[0] - q[0]) ** 2 + (p[1] - q[1]) ** 2 <= 0.25:
+                    label[find(p)] = find(q)
+        for p in points:
+            for q in points:
+                assert (mapping[p] == mapping[q]) == (find(p) == find(q))
+        assert all(len(cluster.members) > 1 for cluster in clusters)
+
+    def test_chain_and_representative(self):
+        points = [(0.0, 0.0), (0.4, 0.0), (0.4, 0.0), (0.8, 0.0), (5.0, 0.0)]
+        mapping, clusters = merge_near_points(points, 0.5)
+        assert {mapping[p] for p in points[:4]} == {(0.4, 0.0)}  # most frequent coordinate
+        assert mapping[(5.0, 0.0)] == (5.0, 0.0)
+        assert [cluster.members for cluster in clusters] == [[(0.0, 0.0), (0.4, 0.0), (0.8, 0.0)]]
+        assert merge_near_points(points, 0.0)[1] == []
+
+    def test_merge_tolerance_of_the_check(self):
+        # Floating-point noise from a CRS transform: generation merges it into one junction
+        net = _healthy()
+        net["flow_lines"] = [[_A, _B], [(10.0, 1e-7), _C]]
+        assert check_network_connectivity(**net).ok is False
+        report = check_network_connectivity(**net, merge_tolerance=0.01)
+        assert report.ok is True and report.near_miss_clusters == []
+
+
 class TestSnap:
     def test_snap_repairs_near_miss_and_recheck_ok(self):
         net = _healthy()
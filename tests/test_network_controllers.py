@@ -0,0 +1,135 @@
+"""
+Unit tests for the array-based network controllers (``controllers.py``), on hand-written result tables.
+"""
+
+import numpy as np
+import pandapipes as pp
+import pandas as pd
+from pandapower.timeseries import DFData
+
+from districtheatingsim.constants import KELVIN_OFFSET
+from districtheatingsim.net_simulation_pandapipes.controllers import (
+    BadPointPressureLiftController,
+    MinimumSupplyTemperatureController,
+)
+
+
+def _net(qext_w, p_from=None, p_to=None, t_from_c=None):
+    """Net with one heat consumer per ``qext_w`` entry and a result table instead of a pipeflow."""
+    n = len(qext_w)
+    net = pp.create_empty_network(fluid="water")
+    junctions = pp.create_junctions(net, 2 * n, pn_bar=1.0, tfluid_k=350.0)
+    pp.create_heat_consumers(net, junctions[:n], junctions[n:], qext_w=qext_w, treturn_k=320.0)
+    _set_results(net, np.full(n, 5.0) if p_from is None else p_from, np.full(n, 3.0) if p_to is None else p_to)
+    if t_from_c is not None:
+        _set_temperatures(net, t_from_c)
+    return net
+
+
+def _set_results(net, p_from, p_to):
+    net.res_heat_consumer = pd.DataFrame(
+        {"p_from_bar": p_from, "p_to_bar": p_to, "t_from_k": 350.0, "t_to_k": 320.0, "mdot_from_kg_per_s": 1.0},
+        index=net.heat_consumer.index,
+    )
+
+
+def _set_temperatures(net, t_from_c):
+    net.res_heat_consumer["t_from_k"] = np.asarray(t_from_c, dtype=float) + KELVIN_OFFSET
+
+
+class TestWorstPoint:
+    def test_lowest_dp_among_active_consumers(self):
+        net = _net([1e4, 0.0, 2e4, 3e4], p_from=[5.0, 4.0, 4.5, 6.0], p_to=[3.0, 3.9, 3.0, 3.0])
+        ctrl = BadPointPressureLiftController(net)
+        # Consumer 1 has the lowest Δp but no demand
+        assert ctrl.calculate_worst_point(net) == (1.5, 2)
+        assert ctrl.heat_consumer_idx == 2
+
+    def test_no_active_consumer(self):
+        net = _net([0.0, 0.0])
+        assert BadPointPressureLiftController(net).calculate_worst_point(net) == (0, -1)
+
+    def test_without_results(self):
+        net = _net([1e4, 2e4])
+        net.res_heat_consumer = net.res_heat_consumer.iloc[:0]
+        assert BadPointPressureLiftController(net).calculate_worst_point(net) == (0, -1)
+
+
+class TestMinimumSupplyTemperatureController:
+    MIN_SUPPLY = np.array([70.0, 75.0, 60.0])
+
+    def _controller(self, net, **kwargs):
+        ctrl = MinimumSupplyTemperatureController(
+            net, heat_consumer_idx=net.heat_consumer.index.to_numpy(), min_supply_temperature=self.MIN_SUPPLY, **kwargs
+        )
+        ctrl.time_step(net, 0)
+        return ctrl
+
+    def test_per_consumer_convergence_mask(self):
+        net = _net([1e4, 1e4, 1e4], t_from_c=[72.0, 70.0, 65.0])
+        ctrl = self._controller(net)
+        assert not ctrl.is_converged(net)  # no history yet: nobody is stable
+        _set_temperatures(net, [72.5, 70.5, 65.5])
+        assert not ctrl.is_converged(net)
+        np.testing.assert_array_equal(ctrl.converged, [True, False, True])
+
+        ctrl.control_step(net)
+        np.testing.assert_array_equal(net.heat_consumer["treturn_k"], [320.0, 321.0, 320.0])
+        np.testing.assert_array_equal(ctrl.iteration, [0, 1, 0])
+
+    def test_matches_one_controller_per_consumer(self):
+        net_batch = _net([1e4, 1e4, 1e4], t_from_c=[72.0, 70.0, 65.0])
+        net_single = _net([1e4, 1e4, 1e4], t_from_c=[72.0, 70.0, 65.0])
+        batch = self._controller(net_batch, tolerance=0.5, max_iterations=4)
+        singles = [
+            MinimumSupplyTemperatureController(net_single, i, min_supply_temperature=t, tolerance=0.5, max_iterations=4)
+            for i, t in enumerate(self.MIN_SUPPLY)
+        ]
+        for ctrl in singles:
+            ctrl.time_step(net_single, 0)
+
+        rng = np.random.default_rng(0)
+        for _ in range(8):
+            t_from_c = rng.uniform(58.0, 78.0, 3)
+            for net in (net_batch, net_single):
+                _set_temperatures(net, t_from_c)
+            if not batch.is_converged(net_batch):
+                batch.control_step(net_batch)
+            single_converged = [ctrl.is_converged(net_single) for ctrl in singles]
+            for ctrl, converged in zip(singles, single_converged, strict=True):
+                if not converged:
+                    ctrl.control_step(net_single)
+            np.testing.assert_array_equal(batch.converged, single_converged)
+            np.testing.assert_array_equal(net_batch.heat_consumer["treturn_k"], net_single.heat_consumer["treturn_k"])
+
+    def test_time_step_restores_return_temperatures_and_reads_profiles(self):
+        net = _net([1e4, 1e4, 1e4], t_from_c=[50.0, 50.0, 50.0])
+        names = ["a", "b", "c"]
+        ctrl = self._controller(net, profile_name=names)
+        ctrl.data_source = DFData(pd.DataFrame([[61.0, 62.0, 63.0]] * 2, columns=names))
+        ctrl.is_converged(net)
+        ctrl.control_step(net)
+        assert (net.heat_consumer["treturn_k"] == 321.0).all()
+
+        ctrl.time_step(net, 1)
+        assert (net.heat_consumer["treturn_k"] == 320.0).all()
+        np.testing.assert_array_equal(ctrl.min_supply_temperature, [61.0, 62.0, 63.0])
+        assert len(ctrl.previous_temperatures) == 0 and not ctrl.converged.any()
+
+    def test_standby(self):
+        net = _net([0.0, 0.0, 0.0], t_from_c=[50.0, 50.0, 50.0])
+        assert self._controller(net).is_converged(net)
+
+    def test_pickled_single_consumer_controller_is_upgraded(self):
+        net = _net([1e4, 1e4], t_from_c=[60.0, 60.0])
+        ctrl = MinimumSupplyTemperatureController(net, heat_consumer_idx=1, min_supply_temperature=65.0)
+        legacy_state = {
+            k: v for k, v in ctrl.__dict__.items() if k not in ("element_index", "profile_name", "converged")
+        }
+        ctrl = MinimumSupplyTemperatureController.__new__(MinimumSupplyTemperatureController)
+        ctrl.__setstate__(legacy_state)  # as unpickling a net saved with the one-consumer controller
+
+        ctrl.time_step(net, 0)
+        ctrl.is_converged(net)
+        ctrl.control_step(net)
+        np.testing.assert_array_equal(net.heat_consumer["treturn_k"], [320.0, 321.0])
@@ -10,6 +10,8 @@ with ``KeyError: 'feature_type'`` (dialog) or silently imported nothing (map).
 
 import json
 
+import pandas as pd
+
 from districtheatingsim.net_generation.network_geojson_schema import NetworkGeoJSONSchema
 
 
@@ -95,3 +97,83 @@ class TestReadNetworkGdf:
         )
         gdf = NetworkGeoJSONSchema.read_network_gdf(path)
         assert list(gdf["feature_type"]) == [NetworkGeoJSONSchema.FEATURE_TYPE_FLOW]
+
+
+class TestReadSplitNetwork:
+    _URN = {"type": "name", "properties": {"name": "urn:ogc:def:crs:EPSG::25833"}}
+
+    def _geojson(self):
+        features = [
+            _feature({"feature_type": NetworkGeoJSONSchema.FEATURE_TYPE_FLOW, "segment_id": "flow_1"}),
+            _feature(
+                {"layer_name": "Rücklauf", "calculated": {"diameter_mm": 80.0}},
+                coords=((0.0, 0.0, 101.5), (1.0, 1.0, 102.0), (2.0, 1.0, 102.5)),
+            ),
+            _feature({"feature_type": NetworkGeoJSONSchema.FEATURE_TYPE_BUILDING, "building_data": {"ID": 7}}),
+            _feature({"feature_type": NetworkGeoJSONSchema.FEATURE_TYPE_BUILDING, "segment_id": None}),
+            _feature({"layer_name": "Sonstiges"}),
+        ]
+        return {"type": "FeatureCollection", "crs": self._URN, "metadata": {"version": "2.0"}, "features": features}
+
+    @staticmethod
+    def _assert_layers_equal(expected, actual):
+        for left, right in zip(expected, actual, strict=True):
+            assert len(left) == len(right) and left.crs == right.crs
+            assert set(left.columns) == set(right.columns)
+            assert left.geometry.geom_equals_exact(right.geometry, 0.0).all()
+            for column in left.columns.drop("geometry"):
+                # from_features fills a missing property with NaN, the column arrays with None
+                values = [
+                    [None if pd.api.types.is_scalar(value) and pd.isna(value) else value for value in frame[column]]
+                    for frame in (left, right)
+                ]
+                assert values[0] == values[1]
+
+    def test_matches_split_to_legacy_format(self, tmp_path):
+        path = tmp_path / "Wärmenetz.geojson"
+        geojson = self._geojson()
+        path.write_text(json.dumps(geojson), encoding="utf-8")
+        expected = NetworkGeoJSONSchema.split_to_legacy_format(NetworkGeoJSONSchema.ensure_feature_types(geojson))
+        layers = NetworkGeoJSONSchema.read_split_network(str(path))
+
+        self._assert_layers_equal(expected[:3], layers[:3])
+        assert layers[1].geometry.has_z.all() and layers[1]["calculated"][0] == {"diameter_mm": 80.0}
+        # An empty layer still has a geometry column for the downstream coordinate extraction
+        assert len(layers[3]) == 0 and layers[3].geometry.name == "geometry"
+
+    def test_members_after_the_features_are_read(self, tmp_path):
+        path = tmp_path / "Wärmenetz.geojson"
+        geojson = self._geojson()
+        # The crs member follows the features, so it is known only after streaming them
+        reordered = {"type": "FeatureCollection", "features": geojson["features"], "crs": geojson["crs"]}
+        path.write_text(json.dumps(reordered, indent=1), encoding="utf-8")
+        header = {}
+        features = list(NetworkGeoJSONSchema.iter_features(str(path), header))
+        assert features == geojson["features"]
+        assert header == {"type": "FeatureCollection", "crs": self._URN}
+        assert NetworkGeoJSONSchema.read_split_network(str(path))[0].crs.to_epsg() == 25833
+
+    def test_sidecar_is_read_until_the_geojson_changes(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "Wärmenetz.geojson")
+        NetworkGeoJSONSchema.export_to_file(self._geojson(), path)
+        sidecar = NetworkGeoJSONSchema.sidecar_path(path)
+        expected = NetworkGeoJSONSchema.read_split_network(path, use_sidecar=False)
+
+        def no_json(*args, **kwargs):
+            raise AssertionError("the GeoJSON was parsed")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(NetworkGeoJSONSchema, "iter_features", no_json)
+            self._assert_layers_equal(expected, NetworkGeoJSONSchema.read_split_network(path))
+
+        # Editing the GeoJSON makes the sidecar stale: the file is parsed and the sidecar rewritten
+        geojson = self._geojson()
+        geojson["features"] = geojson["features"][:1]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(geojson, f)
+        layers = NetworkGeoJSONSchema.read_split_network(path)
+        assert [len(layer) for layer in layers] == [1, 0, 0, 0]
+        with monkeypatch.context() as patch:
+            patch.setattr(NetworkGeoJSONSchema, "iter_features", no_json)
+            assert [len(layer) for layer in NetworkGeoJSONSchema.read_split_network(path)] == [1, 0, 0, 0]
+        assert sidecar.endswith(".geojson.parquet")
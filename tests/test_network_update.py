@@ -0,0 +1,244 @@
+"""
+Unit tests for the incremental network update of ``initialize_geojson``: input signature,
+controller update and patching a built net when only loads or temperatures change.
+"""
+
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from districtheatingsim.net_simulation_pandapipes.pp_net_initialisation_geojson import (
+    changed_network_inputs,
+    network_input_signature,
+)
+
+# Supply main with one branch, return lines offset by (1, 1), consumers at the two ends
+_NODES = {0: (0.0, 0.0), 1: (50.0, 0.0), 2: (100.0, 0.0), 3: (50.0, 40.0)}
+_EDGES = [(0, 1), (1, 2), (1, 3)]
+
+
+def _shifted(node):
+    x, y = _NODES[node]
+    return (x + 1.0, y + 1.0)
+
+
+def _write_geojson(path, nodes=_NODES):
+    features = []
+
+    def line(feature_type, coords):
+        geometry = {"type": "LineString", "coordinates": [list(c) for c in coords]}
+        features.append({"type": "Feature", "properties": {"feature_type": feature_type}, "geometry": geometry})
+
+    for a, b in _EDGES:
+        line("network_line_flow", [nodes[a], nodes[b]])
+        line("network_line_return", [_shifted(b), _shifted(a)])
+    for node in (2, 3):
+        line("building_connection", [nodes[node], _shifted(node)])
+    line("generator_connection", [_shifted(0), nodes[0]])
+    crs = {"type": "name", "properties": {"name": "urn:ogc:def:crs:EPSG::25833"}}
+    path.write_text(json.dumps({"type": "FeatureCollection", "crs": crs, "features": features}), encoding="utf-8")
+
+
+def _write_demand(path, peak_kw=(50.0, 30.0)):
+    hours = 24
+    steps = [str(np.datetime64("2021-01-01T00:00") + np.timedelta64(h, "h")) for h in range(hours)]
+    shape = 0.5 + 0.5 * np.cos(np.arange(hours) / hours * 2 * np.pi)
+    data = {}
+    for i, peak in enumerate(peak_kw):
+        demand = (peak * shape).tolist()
+        data[str(i)] = {
+            "VLT_max": 70.0,
+            "RLT_max": 50.0,
+            "zeitschritte": steps,
+            "wärme": demand,
+            "heizwärme": demand,
+            "warmwasserwärme": [0.0] * hours,
+            "vorlauftemperatur": [70.0] * hours,
+            "rücklauftemperatur": [50.0] * hours,
+            "max_last": list(peak_kw),
+        }
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def _network_data(geojson_path, demand_path, **overrides):
+    from districtheatingsim.net_simulation_pandapipes.NetworkDataClass import NetworkGenerationData
+
+    arguments = dict(
+        import_type="geoJSON",
+        network_geojson_path=str(geojson_path),
+        heat_demand_json_path=str(demand_path),
+        netconfiguration="Niedertemperaturnetz",
+        supply_temperature_control="Statisch",
+        max_supply_temperature_heat_generator=85.0,
+        min_supply_temperature_heat_generator=70.0,
+        max_air_temperature_heat_generator=15.0,
+        min_air_temperature_heat_generator=-12.0,
+        flow_pressure_pump=4.0,
+        lift_pressure_pump=1.5,
+        min_supply_temperature_building_checked=False,
+        min_supply_temperature_building=None,
+        fixed_return_temperature_heat_consumer_checked=False,
+        fixed_return_temperature_heat_consumer=None,
+        dT_RL=5.0,
+        building_temperature_checked=False,
+        pipetype="ISOPLUS_DRE100_2x",
+        diameter_optimization_pipe_checked=False,
+        max_velocity_pipe=1.5,
+        material_filter_pipe="P235GH/PUR/PEHD",
+        k_mm_pipe=0.1,
+        main_producer_location_index=0,
+        secondary_producers=[],
+    )
+    arguments.update(overrides)
+    return NetworkGenerationData(**arguments)
+
+
+class TestNetworkInputSignature:
+    @staticmethod
+    def _signature(
+        geojson_path, qext_w=(50e3, 30e3), supply_temperature=85.0, lift_pressure=1.5, pipetype="A", optimized=False
+    ):
+        data = SimpleNamespace(
+            network_geojson_path=str(geojson_path),
+            junction_tolerance_m=0.01,
+            diameter_optimization_pipe_checked=optimized,
+        )
+        consumer_dict = {
+            "qext_w": np.array(qext_w),
+            "min_supply_temperature_heat_consumer": np.zeros(2),
+            "return_temperature_heat_consumer": np.array([55.0, 50.0]),
+        }
+        pipe_dict = {"pipetype": pipetype, "v_max_pipe": 1.5, "material_filter": "M", "k_mm": 0.1}
+        producer_dict = {
+            "supply_temperature": supply_temperature,
+            "flow_pressure_pump": 4.0,
+            "lift_pressure_pump": lift_pressure,
+            "main_producer_location_index": 0,
+            "secondary_producers": [],
+        }
+        return network_input_signature(data, consumer_dict, pipe_dict, producer_dict)
+
+    def test_each_input_changes_its_category(self, tmp_path):
+        path = tmp_path / "net.geojson"
+        _write_geojson(path)
+        base = self._signature(path)
+        assert set(base) == {"geometry", "loads", "temperatures", "producers"}
+        assert changed_network_inputs(None, base) == set(base)
+        assert changed_network_inputs(base, self._signature(path)) == set()
+        assert changed_network_inputs(base, self._signature(path, qext_w=(60e3, 30e3))) == {"loads"}
+        assert changed_network_inputs(base, self._signature(path, supply_temperature=80.0)) == {"temperatures"}
+        assert changed_network_inputs(base, self._signature(path, lift_pressure=2.0)) == {"producers"}
+        assert changed_network_inputs(base, self._signature(path, pipetype="B")) == {"geometry"}
+        assert changed_network_inputs(base, self._signature(path, optimized=True)) == {"geometry"}
+
+        moved = {**_NODES, 3: (50.0, 45.0)}
+        _write_geojson(path, moved)
+        assert changed_network_inputs(base, self._signature(path)) == {"geometry"}
+
+
+@pytest.mark.slow
+class TestIncrementalInitialization:
+    @staticmethod
+    def _initialize(data):
+        from districtheatingsim.net_simulation_pandapipes.pp_net_initialisation_geojson import initialize_geojson
+
+        return initialize_geojson(data)
+
+    def test_load_change_patches_the_net(self, tmp_path):
+        geojson_path, demand_path = tmp_path / "net.geojson", tmp_path / "demand.json"
+        _write_geojson(geojson_path)
+        _write_demand(demand_path)
+        first = self._initialize(_network_data(geojson_path, demand_path))
+        assert not first.incremental_update
+        sized = first.net.pipe[["std_type", "inner_diameter_mm"]].copy()
+        n_controllers = len(first.net.controller)
+
+        # Higher loads and a lower supply temperature: a patched copy of the net, new boundary values
+        _write_demand(demand_path, peak_kw=(80.0, 30.0))
+        second = _network_data(geojson_path, demand_path, max_supply_temperature_heat_generator=80.0)
+        second.reuse_network(first)
+        second = self._initialize(second)
+        net = second.net
+        assert second.incremental_update and net is not first.net
+        np.testing.assert_allclose(first.net.heat_consumer["qext_w"], [50e3, 30e3])
+        np.testing.assert_allclose(net.heat_consumer["qext_w"], [80e3, 30e3])
+        assert net.circ_pump_pressure.at[0, "t_flow_k"] == pytest.approx(80.0 + 273.15)
+        assert len(net.controller) == n_controllers
+        # Only pipes above the velocity limit were enlarged
+        assert (net.res_pipe["v_mean_m_per_s"].abs() <= 1.5).all()
+        assert (net.pipe["inner_diameter_mm"] >= sized["inner_diameter_mm"]).all()
+        assert (net.pipe["std_type"] != sized["std_type"]).any()
+
+        # Same loads as a fresh build of the new inputs
+        fresh = self._initialize(_network_data(geojson_path, demand_path, max_supply_temperature_heat_generator=80.0))
+        np.testing.assert_allclose(
+            net.res_heat_consumer["mdot_from_kg_per_s"], fresh.net.res_heat_consumer["mdot_from_kg_per_s"], rtol=1e-2
+        )
+
+    def test_failed_update_keeps_the_previous_net(self, tmp_path, monkeypatch):
+        from districtheatingsim.net_simulation_pandapipes import pp_net_initialisation_geojson
+
+        geojson_path, demand_path = tmp_path / "net.geojson", tmp_path / "demand.json"
+        _write_geojson(geojson_path)
+        _write_demand(demand_path)
+        first = self._initialize(_network_data(geojson_path, demand_path))
+        pipes = first.net.pipe.copy()
+
+        def fail(net, *args, **kwargs):
+            raise ValueError("not converged")
+
+        monkeypatch.setattr(pp_net_initialisation_geojson, "validate_net_results", fail)
+        _write_demand(demand_path, peak_kw=(120.0, 30.0))
+        second = _network_data(geojson_path, demand_path)
+        second.reuse_network(first)
+        with pytest.raises(ValueError, match="not converged"):
+            self._initialize(second)
+        np.testing.assert_allclose(first.net.heat_consumer["qext_w"], [50e3, 30e3])
+        assert first.net.pipe.equals(pipes)
+
+    def test_geometry_change_rebuilds_the_net(self, tmp_path):
+        geojson_path, demand_path = tmp_path / "net.geojson", tmp_path / "demand.json"
+        _write_geojson(geojson_path)
+        _write_demand(demand_path)
+        first = self._initialize(_network_data(geojson_path, demand_path))
+
+        _write_geojson(geojson_path, {**_NODES, 3: (50.0, 45.0)})
+        second = _network_data(geojson_path, demand_path)
+        second.reuse_network(first)
+        second = self._initialize(second)
+        assert not second.incremental_update and second.net is not first.net
+        assert second.net.pipe["length_km"].sum() > first.net.pipe["length_km"].sum()
+
+
+class TestUpdateControllers:
+    def test_setpoints_are_replaced_in_place(self):
+        import pandapipes as pp
+        from pandapower.control.controller.const_control import ConstControl
+
+        from districtheatingsim.net_simulation_pandapipes.controllers import (
+            BadPointPressureLiftController,
+            MinimumSupplyTemperatureController,
+        )
+        from districtheatingsim.net_simulation_pandapipes.utilities import create_controllers, update_controllers
+
+        net = pp.create_empty_network(fluid="water")
+        j = [pp.create_junction(net, pn_bar=1.05, tfluid_k=358.15) for _ in range(6)]
+        pp.create_circ_pump_const_pressure(net, j[0], j[1], p_flow_bar=4, plift_bar=1.5, t_flow_k=358.15)
+        pp.create_heat_consumer(net, j[2], j[3], qext_w=50e3, treturn_k=328.15)
+        pp.create_heat_consumer(net, j[4], j[5], qext_w=30e3, treturn_k=323.15)
+        create_controllers(net, np.array([50e3, 30e3]), 85.0, None, np.array([55.0, 50.0]))
+        constant = [ctrl for ctrl in net.controller["object"] if isinstance(ctrl, ConstControl)]
+        # A time series sets the per-consumer controllers out of service
+        net.controller.loc[net.controller.index[:2], "in_service"] = False
+
+        update_controllers(net, np.array([70e3, 20e3]), 80.0, np.array([60.0, 60.0]), np.array([50.0, 45.0]))
+        objects = list(net.controller["object"])
+        assert [ctrl for ctrl in objects if isinstance(ctrl, ConstControl)] == constant
+        assert net.controller["in_service"].all() and net.controller.index.is_unique
+        assert sum(isinstance(ctrl, BadPointPressureLiftController) for ctrl in objects) == 1
+        assert sum(isinstance(ctrl, MinimumSupplyTemperatureController) for ctrl in objects) == 1
+        setpoints = {ctrl.profile_name: ctrl.data_source.df.iloc[0, 0] for ctrl in constant}
+        assert setpoints["qext_w_0"] == 70e3 and setpoints["treturn_k_1"] == pytest.approx(318.15)
+        assert setpoints["supply_temperature"] == pytest.approx(353.15)
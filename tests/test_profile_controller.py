@@ -0,0 +1,146 @@
+"""
+Unit tests for the batch heat-consumer profile controller (``HeatConsumerProfileController``).
+"""
+
+import numpy as np
+import pandapipes as pp
+import pandas as pd
+import pytest
+from pandapower.control.controller.const_control import ConstControl
+from pandapower.timeseries import DFData
+
+from districtheatingsim.constants import KELVIN_OFFSET
+from districtheatingsim.net_simulation_pandapipes import pp_net_time_series_simulation as ts
+from districtheatingsim.net_simulation_pandapipes.controllers import (
+    HeatConsumerProfileController,
+    MinimumSupplyTemperatureController,
+)
+
+
+def _consumer_net(n=3):
+    """Net with ``n`` heat consumers and the consumer controllers of create_controllers (no pipeflow)."""
+    net = pp.create_empty_network(fluid="water")
+    junctions = pp.create_junctions(net, 2 * n, pn_bar=1.0, tfluid_k=350.0)
+    pp.create_heat_consumers(net, junctions[:n], junctions[n:], qext_w=1e4, treturn_k=320.0)
+    for i in range(n):
+        for variable, value in (("qext_w", 1e4), ("treturn_k", 320.0)):
+            ConstControl(
+                net,
+                element="heat_consumer",
+                variable=variable,
+                element_index=i,
+                data_source=DFData(pd.DataFrame({f"{variable}_{i}": [value]})),
+                profile_name=f"{variable}_{i}",
+            )
+    ctrl = MinimumSupplyTemperatureController(net, heat_consumer_idx=net.heat_consumer.index.to_numpy())
+    net.controller.loc[ctrl.index] = pd.Series(
+        {"object": ctrl, "in_service": True, "order": -1, "level": -1, "initial_run": False, "recycle": False}
+    )
+    return net
+
+
+class TestInstallHeatConsumerProfileController:
+    def test_writes_one_row_per_time_step(self):
+        net = _consumer_net()
+        qext = np.arange(30, dtype=float).reshape(3, 10) * 100.0
+        ctrl = ts.install_heat_consumer_profile_controller(net, qext, range(4), 2, 6, np.array([50.0, 55.0, 60.0]))
+
+        ctrl.time_step(net, 3)
+        np.testing.assert_array_equal(net.heat_consumer["qext_w"], qext[:, 5])
+        np.testing.assert_array_equal(net.heat_consumer["treturn_k"], np.array([50.0, 55.0, 60.0]) + KELVIN_OFFSET)
+
+    def test_replaces_per_consumer_controllers(self):
+        net = _consumer_net()
+        ts.install_heat_consumer_profile_controller(net, np.ones((3, 5)), range(5), 0, 5, np.ones((3, 5)))
+        ts.install_heat_consumer_profile_controller(net, np.ones((3, 5)), range(5), 0, 5, np.ones((3, 5)))
+
+        objects = net.controller["object"]
+        batch = [i for i, c in objects.items() if isinstance(c, HeatConsumerProfileController)]
+        assert len(batch) == 1  # a second install replaces the first
+        assert net.controller.at[batch[0], "order"] < net.controller["order"].drop(batch).min()
+        const = [i for i, c in objects.items() if isinstance(c, ConstControl)]
+        assert len(const) == 6 and not net.controller.loc[const, "in_service"].any()
+
+    def test_per_consumer_updates_reactivate_const_controls(self):
+        net = _consumer_net()
+        ts.install_heat_consumer_profile_controller(net, np.ones((3, 5)), range(5), 0, 5, np.ones((3, 5)))
+        ts.update_heat_consumer_qext_controller(net, np.ones((3, 5)), range(5), 0, 5)
+        ts.update_heat_consumer_return_temperature_controller(net, np.ones((3, 5)), range(5), 0, 5)
+
+        objects = net.controller["object"]
+        assert not any(isinstance(c, HeatConsumerProfileController) for c in objects)
+        const = [i for i, c in objects.items() if isinstance(c, ConstControl)]
+        assert net.controller.loc[const, "in_service"].all()
+
+    def test_return_temperature_controllers_kept_without_profiles(self):
+        net = _consumer_net()
+        ts.install_heat_consumer_profile_controller(net, np.ones((3, 5)), range(5), 0, 5)
+        active = net.controller[net.controller["in_service"]]["object"]
+        assert sorted(c.variable for c in active if isinstance(c, ConstControl)) == ["treturn_k"] * 3
+
+    def test_min_supply_temperature_fed_to_controllers(self):
+        net = _consumer_net()
+        min_supply = [70.0, np.array([65.0]), np.arange(5, dtype=float) + 60.0]
+        ctrl = ts.install_heat_consumer_profile_controller(
+            net, np.ones((3, 5)), range(5), 0, 5, min_supply_temperature_heat_consumer=min_supply
+        )
+        ctrl.time_step(net, 4)
+        (temperature_ctrl,) = [c for c in net.controller["object"] if isinstance(c, MinimumSupplyTemperatureController)]
+        np.testing.assert_array_equal(temperature_ctrl.min_supply_temperature, [70.0, 65.0, 64.0])
+        assert temperature_ctrl.data_source is None
+
+    def test_min_supply_temperature_fed_to_single_consumer_controllers(self):
+        net = _consumer_net()
+        net.controller.drop(index=net.controller.index[-1], inplace=True)
+        for i in range(3):
+            ctrl = MinimumSupplyTemperatureController(net, heat_consumer_idx=i)
+            net.controller.loc[ctrl.index] = pd.Series(
+                {"object": ctrl, "in_service": True, "order": -1, "level": -1, "initial_run": False, "recycle": False}
+            )
+        ctrl = ts.install_heat_consumer_profile_controller(
+            net, np.ones((3, 5)), range(5), 0, 5, min_supply_temperature_heat_consumer=[70.0, 65.0, 60.0]
+        )
+        ctrl.time_step(net, 0)
+        temperature_ctrls = [c for c in net.controller["object"] if isinstance(c, MinimumSupplyTemperatureController)]
+        assert [c.min_supply_temperature for c in temperature_ctrls] == [70.0, 65.0, 60.0]
+
+    def test_profile_length_mismatch_raises(self):
+        with pytest.raises(ValueError, match="time steps"):
+            ts.install_heat_consumer_profile_controller(_consumer_net(), np.ones((3, 5)), range(8), 0, 8)
+
+    def test_consumer_count_mismatch_raises(self):
+        with pytest.raises(ValueError, match="consumers"):
+            ts.install_heat_consumer_profile_controller(_consumer_net(), np.ones((2, 5)), range(5), 0, 5)
+
+
+@pytest.mark.slow
+class TestProfileControllerTimeSeries:
+    """The batch controller must reproduce the per-consumer ConstControl run bit for bit."""
+
+    @pytest.mark.parametrize("min_supply", [None, np.array([75.0, 80.0])])
+    def test_matches_const_controls(self, solved_two_consumer_net, min_supply):
+        from pandapipes.timeseries import run_time_series
+        from pandapower.timeseries import OutputWriter
+
+        steps, start, end = range(4), 1, 5
+        rng = np.random.default_rng(1)
+        qext = np.vstack([rng.uniform(2e5, 5e5, 6), rng.uniform(1e5, 2e5, 6)])
+        treturn = np.vstack([np.linspace(50, 58, 6), np.linspace(55, 60, 6)])
+
+        results = []
+        for batch in (False, True):
+            net = solved_two_consumer_net(min_supply)
+            if batch:
+                ts.install_heat_consumer_profile_controller(net, qext, steps, start, end, treturn, min_supply)
+            else:
+                ts.update_heat_consumer_qext_controller(net, qext, steps, start, end)
+                if min_supply is not None:
+                    ts.update_heat_consumer_temperature_controller(net, min_supply, steps, start, end)
+                ts.update_heat_consumer_return_temperature_controller(net, treturn, steps, start, end)
+            ts.update_heat_generator_supply_temperature_controller(net, np.full(6, 85.0), steps, start, end)
+            ow = OutputWriter(net, steps, output_path=None, log_variables=ts.create_log_variables(net))
+            run_time_series.run_timeseries(net, steps, mode="bidirectional", iter=100, alpha=0.5)
+            results.append(ow.np_results)
+
+        for key, expected in results[0].items():
+            np.testing.assert_array_equal(results[1][key], expected, err_msg=key)
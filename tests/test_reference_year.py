@@ -0,0 +1,85 @@
+"""
+Unit tests for the TRY import and its content-hash cache (``utilities/test_reference_year.py``).
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from districtheatingsim.utilities import test_reference_year as try_module
+from districtheatingsim.utilities.test_reference_year import TRY_CACHE_DIRNAME, clear_TRY_cache, import_TRY
+
+_TRY_FILE = (
+    Path(__file__).resolve().parents[1]
+    / "src"
+    / "districtheatingsim"
+    / "data"
+    / "TRY"
+    / "TRY_511676144222"
+    / "TRY2015_511676144222_Jahr.dat"
+)
+
+
+@pytest.fixture
+def try_file(tmp_path):
+    """A private copy of the bundled TRY file with an empty process cache."""
+    clear_TRY_cache()
+    path = tmp_path / "Klimadaten" / _TRY_FILE.name
+    path.parent.mkdir()
+    shutil.copy(_TRY_FILE, path)
+    yield str(path)
+    clear_TRY_cache()
+
+
+class TestImportTRYCache:
+    def test_cached_matches_uncached(self, try_file):
+        cached = import_TRY(try_file)
+        uncached = import_TRY(try_file, use_cache=False)
+        assert len(cached) == 5
+        for c, u in zip(cached, uncached, strict=True):
+            assert c.dtype == u.dtype
+            np.testing.assert_array_equal(c, u)
+        assert len(cached[0]) == 8760
+
+    def test_arrays_are_shared_and_read_only(self, try_file):
+        first = import_TRY(try_file)
+        second = import_TRY(try_file)
+        assert first[0] is second[0]
+        with pytest.raises(ValueError):
+            first[0][0] = 99.0
+
+    def test_disk_cache_skips_parsing(self, try_file, monkeypatch):
+        expected = import_TRY(try_file)[0]
+        assert len(os.listdir(os.path.join(os.path.dirname(try_file), TRY_CACHE_DIRNAME))) == 1
+
+        clear_TRY_cache()  # a fresh process only has the .npy
+        monkeypatch.setattr(try_module, "_parse_TRY", lambda f: pytest.fail("TRY file was re-parsed"))
+        np.testing.assert_array_equal(import_TRY(try_file)[0], expected)
+
+    def test_changed_content_is_reparsed(self, try_file):
+        original = import_TRY(try_file)[0].copy()
+        with open(try_file, encoding="utf-8") as f:
+            lines = f.readlines()
+        # First data row (after the 34 header lines): raise the 6-char temperature field.
+        row = lines[34]
+        lines[34] = row[:25] + f"{float(row[25:31]) + 10.0:6.1f}" + row[31:]
+        with open(try_file, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+
+        updated = import_TRY(try_file)[0]
+        assert updated[0] == pytest.approx(original[0] + 10.0)
+        np.testing.assert_array_equal(updated[1:], original[1:])
+
+    def test_unwritable_cache_dir_still_returns_data(self, try_file, monkeypatch):
+        def _deny(*args, **kwargs):
+            raise PermissionError("read-only")
+
+        monkeypatch.setattr(try_module.os, "makedirs", _deny)
+        assert len(import_TRY(try_file)[0]) == 8760
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            import_TRY(str(tmp_path / "missing.dat"))
@@ -0,0 +1,108 @@
+"""
+Unit tests for the process-wide resource registry (COP field, pipe catalog).
+"""
+
+import numpy as np
+import pandapipes as pp
+import pytest
+
+from districtheatingsim.net_simulation_pandapipes.pipe_std_types import ISOPLUS_MATERIAL
+from districtheatingsim.net_simulation_pandapipes.resource_registry import (
+    clear_registry,
+    load_cop_table,
+    pipe_catalog,
+    registry_stats,
+)
+from districtheatingsim.net_simulation_pandapipes.utilities import (
+    _insulation_grade,
+    build_diameter_ladders,
+    neighbor_std_type,
+    select_std_type_within_grade,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry():
+    clear_registry()
+    yield
+    clear_registry()
+
+
+class TestCopTable:
+    def test_default_table_loaded_once(self):
+        first = load_cop_table()
+        second = load_cop_table()
+        assert first is second
+        assert first.ndim == 2 and first.shape[0] > 1 and first.shape[1] > 1
+        stats = registry_stats()["cop_table"]
+        assert (stats.loads, stats.hits) == (1, 1)
+        assert stats.load_seconds > 0
+
+    def test_table_is_read_only(self):
+        with pytest.raises(ValueError):
+            load_cop_table()[0, 0] = 1.0
+
+    def test_edited_file_is_reloaded(self, tmp_path):
+        path = tmp_path / "cop.csv"
+        path.write_text(";35;55\n0;4.0;3.0\n10;5.0;3.5\n", encoding="utf-8")
+        assert load_cop_table(str(path))[1, 1] == 4.0
+        path.write_text(";35;55\n0;4.5;3.0\n10;5.0;3.5\n", encoding="utf-8")
+        assert load_cop_table(str(path))[1, 1] == 4.5
+        assert registry_stats()["cop_table"].loads == 2
+
+
+class TestPipeCatalog:
+    def test_cached_per_material(self):
+        first = pipe_catalog(material=ISOPLUS_MATERIAL)
+        assert pipe_catalog(pp.create_empty_network(fluid="water"), ISOPLUS_MATERIAL) is first
+        assert pipe_catalog(material=None) is not first
+        stats = registry_stats()["pipe_catalog"]
+        assert (stats.loads, stats.hits) == (2, 1)
+
+    def test_unknown_material_raises(self):
+        with pytest.raises(ValueError, match="No standard pipe types"):
+            pipe_catalog(material="Unobtainium")
+
+    def test_custom_std_type_gets_own_catalog(self):
+        net = pp.create_empty_network(fluid="water")
+        default = pipe_catalog(net, ISOPLUS_MATERIAL)
+        pp.create_std_type(
+            net,
+            "pipe",
+            "ISOPLUS_DRE999_STD",
+            {"inner_diameter_mm": 999.0, "outer_diameter_mm": 1200.0, "material": ISOPLUS_MATERIAL, "u_w_per_mk": 1.0},
+        )
+        custom = pipe_catalog(net, ISOPLUS_MATERIAL)
+        assert custom is not default
+        assert custom.ladders["STD"][-1] == "ISOPLUS_DRE999_STD"
+
+    def test_lookups_match_reference_helpers(self):
+        catalog = pipe_catalog(material=ISOPLUS_MATERIAL)
+        ladders = build_diameter_ladders(catalog.table)
+        assert catalog.ladders == ladders
+
+        for name in catalog.table.index:
+            for larger in (True, False):
+                assert catalog.neighbor(name, larger=larger) == neighbor_std_type(name, ladders, larger=larger)
+
+        diameters = catalog.table["inner_diameter_mm"].to_numpy()
+        probes = np.concatenate([diameters, diameters + 0.5, [0.0, diameters.max() + 100.0]])
+        for grade in [*ladders, "unknown"]:
+            for required in probes:
+                expected = select_std_type_within_grade(catalog.table, grade, required)
+                chosen = catalog.select_within_grade(grade, required)
+                if grade in ladders:
+                    assert chosen == expected
+                else:  # full-catalog fallback: grades share bores, so compare the diameter
+                    assert catalog.properties(chosen)[0] == catalog.properties(expected)[0]
+
+    def test_properties_and_unknown_type(self):
+        catalog = pipe_catalog(material=ISOPLUS_MATERIAL)
+        name = catalog.ladders["STD"][0]
+        inner_diameter_mm, u_w_per_m2k = catalog.properties(name)
+        assert inner_diameter_mm == catalog.table.at[name, "inner_diameter_mm"]
+        assert u_w_per_m2k > 0
+        assert _insulation_grade(name) == "STD"
+        assert catalog.neighbor("not-a-pipe", larger=True) is None
+        with pytest.raises(KeyError):
+            catalog.properties("not-a-pipe")
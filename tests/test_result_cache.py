@@ -0,0 +1,140 @@
+"""
+Unit tests for the content-addressed cache of time series results (``result_cache.py``).
+"""
+
+import os
+
+import numpy as np
+import pandapipes as pp
+import pandas as pd
+import pytest
+
+from districtheatingsim.net_simulation_pandapipes import pp_net_time_series_simulation as ts
+from districtheatingsim.net_simulation_pandapipes.result_cache import ResultCache
+
+
+def _net(qext_w=(1e4, 2e4), length_km=0.1):
+    """Two heat consumers on a short pipe, with a heat demand profile controller (no pipeflow)."""
+    net = pp.create_empty_network(fluid="water")
+    j = pp.create_junctions(net, 4, pn_bar=1.0, tfluid_k=350.0)
+    pp.create_pipe_from_parameters(net, j[0], j[1], length_km=length_km, diameter_m=0.1)
+    pp.create_heat_consumers(net, [j[1], j[1]], [j[2], j[3]], qext_w=list(qext_w), treturn_k=320.0)
+    ts.install_heat_consumer_profile_controller(net, np.tile(np.asarray(qext_w)[:, None], 3), range(3), 0, 3)
+    return net
+
+
+def _solved(net):
+    """Stand-in for a run: result tables and the controlled columns of the last step."""
+    net.res_junction = pd.DataFrame({"p_bar": [1.0, 0.9, 0.8, 0.8], "t_k": 350.0}, index=net.junction.index)
+    net.heat_consumer["qext_w"] = [5e3, 6e3]
+    return {"res_junction.t_k": np.full((3, 4), 350.0)}
+
+
+class TestKey:
+    def test_same_inputs_same_key(self, tmp_path):
+        cache = ResultCache(str(tmp_path))
+        assert cache.key(_net(), mode="bidirectional") == cache.key(_net(), mode="bidirectional")
+
+    def test_ignores_names_and_controlled_columns(self, tmp_path):
+        cache = ResultCache(str(tmp_path))
+        key = cache.key(_net())
+        net = _net()
+        net.junction["name"] = ["a", "b", "c", "d"]
+        net.junction["tfluid_k"] = 330.0  # start value of the solver
+        net.heat_consumer["qext_w"] = 0.0  # left over by an earlier run, set from the profile every step
+        assert cache.key(net) == key
+
+    def test_inputs_change_the_key(self, tmp_path):
+        cache = ResultCache(str(tmp_path))
+        key = cache.key(_net(), mode="bidirectional")
+        assert cache.key(_net(length_km=0.2), mode="bidirectional") != key
+        assert cache.key(_net(qext_w=(1e4, 3e4)), mode="bidirectional") != key
+        assert cache.key(_net(), mode="hydraulics") != key
+        net = _net()
+        net.heat_consumer["deltat_k"] = 25.0
+        assert cache.key(net, mode="bidirectional") != key
+
+
+class TestStore:
+    def test_round_trip_restores_results_into_the_net(self, tmp_path):
+        cache = ResultCache(str(tmp_path))
+        net = _net()
+        key = cache.key(net)
+        assert cache.load(key, net) is None
+
+        np_results = _solved(net)
+        cache.store(key, np_results, net)
+
+        fresh = _net()
+        results = cache.load(key, fresh)
+        np.testing.assert_array_equal(results["res_junction.t_k"], np_results["res_junction.t_k"])
+        pd.testing.assert_frame_equal(fresh.res_junction, net.res_junction)
+        np.testing.assert_array_equal(fresh.heat_consumer["qext_w"], [5e3, 6e3])
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = ResultCache(str(tmp_path))
+        net = _net()
+        np_results = _solved(net)
+        for key in ("a", "b", "c"):
+            cache.store(key, np_results, net)
+        entry_size = cache.entries()[0][1]
+        os.utime(os.path.join(str(tmp_path), "a.npz"), (0, 0))
+        os.utime(os.path.join(str(tmp_path), "a.pkl"), (0, 0))
+        os.utime(os.path.join(str(tmp_path), "b.npz"), (1, 1))
+        os.utime(os.path.join(str(tmp_path), "b.pkl"), (1, 1))
+
+        cache.max_bytes = 2 * entry_size
+        cache.evict()
+        assert [key for key, _, _ in cache.entries()] == ["b", "c"]
+        assert cache.size_bytes() == 2 * entry_size
+
+        cache.max_bytes = 0
+        cache.store("d", np_results, net)  # the new entry stays even beyond the limit
+        assert [key for key, _, _ in cache.entries()] == ["d"]
+
+    def test_broken_entry_is_a_miss(self, tmp_path):
+        cache = ResultCache(str(tmp_path))
+        net = _net()
+        cache.store("a", _solved(net), net)
+        with open(os.path.join(str(tmp_path), "a.pkl"), "wb") as f:
+            f.write(b"not a pickle")
+        assert cache.load("a", net) is None
+        assert cache.entries() == []
+
+
+@pytest.mark.slow
+class TestCachedTimeSeries:
+    N_STEPS = 4
+
+    @classmethod
+    def _prepared_net(cls, net):
+        steps = range(cls.N_STEPS)
+        qext = np.column_stack([np.linspace(500e3, 50e3, cls.N_STEPS), np.linspace(200e3, 20e3, cls.N_STEPS)])
+        ts.install_heat_consumer_profile_controller(net, qext.T, steps, 0, cls.N_STEPS, np.array([55.0, 60.0]))
+        ts.update_heat_generator_supply_temperature_controller(
+            net, np.linspace(85.0, 70.0, cls.N_STEPS), steps, 0, cls.N_STEPS
+        )
+        return net
+
+    def test_rerun_of_a_simulated_net_hits(self, solved_two_consumer_net, tmp_path):
+        from pandapipes.timeseries import run_time_series
+        from pandapower.timeseries import OutputWriter
+
+        cache = ResultCache(str(tmp_path))
+        net = self._prepared_net(solved_two_consumer_net())
+        key = cache.key(net, mode="bidirectional")
+        ow = OutputWriter(net, range(self.N_STEPS), output_path=None, log_variables=ts.create_log_variables(net))
+        run_time_series.run_timeseries(net, range(self.N_STEPS), mode="bidirectional", iter=100, alpha=0.5)
+        cache.store(key, ow.np_results, net)
+
+        # The controllers left the pump set points and the last heat demand in the net
+        rerun = self._prepared_net(net)
+        assert cache.key(rerun, mode="bidirectional") == key
+        other = self._prepared_net(solved_two_consumer_net())
+        assert cache.key(other, mode="bidirectional") == key  # another variant with the same network
+
+        results = cache.load(key, other)
+        for name, expected in ow.np_results.items():
+            np.testing.assert_array_equal(results[name], expected, err_msg=name)
+        pd.testing.assert_frame_equal(other.res_heat_consumer, net.res_heat_consumer)
+        pd.testing.assert_frame_equal(other.circ_pump_pressure, net.circ_pump_pressure)
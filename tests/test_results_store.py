@@ -0,0 +1,134 @@
+"""
+Unit tests for the columnar (Parquet) network results store (``results_store.py``).
+"""
+
+import json
+import os
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from districtheatingsim.net_simulation_pandapipes.pp_net_time_series_simulation import (
+    import_results_csv,
+    save_results_csv,
+)
+from districtheatingsim.net_simulation_pandapipes.results_store import (
+    RESULTS_STORE_SCHEMA_VERSION,
+    load_results,
+    load_results_parquet,
+    read_net_result,
+    read_pump_series,
+    read_results_layout,
+    results_parquet_path,
+    save_results_parquet,
+)
+
+N_STEPS = 48
+PARAMS = ("mass_flow", "flow_pressure", "return_pressure", "deltap", "return_temp", "flow_temp", "qext_kW")
+
+
+@pytest.fixture
+def results():
+    rng = np.random.default_rng(0)
+    time_steps = np.arange("2021-01-01T00", "2021-01-03T00", dtype="datetime64[h]")
+    pump_results = {
+        "Heizentrale Haupteinspeisung": {0: {p: rng.random(N_STEPS) for p in PARAMS}},
+        "weitere Einspeisung": {
+            0: {p: rng.random(N_STEPS) for p in PARAMS},
+            1: {p: rng.random(N_STEPS) for p in PARAMS},
+        },
+    }
+    net_results = {"res_junction.t_k": rng.random((N_STEPS, 5)), "heat_consumer.qext_w": rng.random((N_STEPS, 3))}
+    return time_steps, rng.random(N_STEPS), rng.random(N_STEPS), pump_results, net_results
+
+
+class TestRoundTrip:
+    def test_matches_csv_import(self, tmp_path, results):
+        time_steps, heat, power, pumps, net_results = results
+        csv_path = str(tmp_path / "Lastgang.csv")
+        save_results_csv(time_steps, heat, power, pumps, csv_path)
+        save_results_parquet(results_parquet_path(csv_path), time_steps, heat, power, pumps, net_results)
+
+        from_csv = import_results_csv(csv_path)
+        from_parquet = load_results_parquet(results_parquet_path(csv_path))
+
+        np.testing.assert_array_equal(from_parquet[0], time_steps.astype("datetime64[s]"))
+        np.testing.assert_allclose(from_parquet[1], from_csv[1])
+        np.testing.assert_allclose(from_parquet[2], from_csv[2])
+        assert from_parquet[3].keys() == from_csv[3].keys()
+        for pump_type, pumps_by_idx in from_csv[3].items():
+            assert from_parquet[3][pump_type].keys() == pumps_by_idx.keys()
+            for idx, params in pumps_by_idx.items():
+                for param, values in params.items():
+                    np.testing.assert_allclose(from_parquet[3][pump_type][idx][param], values)
+
+    def test_net_results_round_trip(self, tmp_path, results):
+        time_steps, heat, power, pumps, net_results = results
+        path = str(tmp_path / "r.parquet")
+        save_results_parquet(path, time_steps, heat, power, pumps, net_results)
+        np.testing.assert_array_equal(read_net_result(path, "res_junction.t_k"), net_results["res_junction.t_k"])
+        np.testing.assert_array_equal(
+            read_net_result(path, "heat_consumer.qext_w", elements=[2]), net_results["heat_consumer.qext_w"][:, [2]]
+        )
+        with pytest.raises(KeyError):
+            read_net_result(path, "res_pipe.v_mean_m_per_s")
+
+
+class TestSelectiveReads:
+    def test_read_single_pump_series(self, tmp_path, results):
+        time_steps, heat, power, pumps, _ = results
+        path = str(tmp_path / "r.parquet")
+        save_results_parquet(path, time_steps, heat, power, pumps)
+        series = read_pump_series(path, "weitere Einspeisung", 1, "flow_temp")
+        np.testing.assert_array_equal(series, pumps["weitere Einspeisung"][1]["flow_temp"])
+        with pytest.raises(KeyError):
+            read_pump_series(path, "weitere Einspeisung", 7, "flow_temp")
+
+    def test_layout_from_footer(self, tmp_path, results):
+        time_steps, heat, power, pumps, net_results = results
+        path = str(tmp_path / "r.parquet")
+        save_results_parquet(path, time_steps, heat, power, pumps, net_results)
+        layout = read_results_layout(path)
+        assert layout["schema_version"] == RESULTS_STORE_SCHEMA_VERSION
+        assert sorted(layout["pumps"]["weitere Einspeisung"]) == ["0", "1"]
+        assert layout["net_results"] == {"res_junction.t_k": 5, "heat_consumer.qext_w": 3}
+
+
+class TestValidation:
+    def test_length_mismatch_raises(self, tmp_path, results):
+        time_steps, heat, power, pumps, _ = results
+        with pytest.raises(ValueError, match="expected"):
+            save_results_parquet(str(tmp_path / "r.parquet"), time_steps, heat[:-1], power, pumps)
+
+    def test_newer_schema_version_rejected(self, tmp_path):
+        path = str(tmp_path / "r.parquet")
+        layout = {"schema_version": RESULTS_STORE_SCHEMA_VERSION + 1, "pumps": {}, "net_results": {}}
+        table = pa.table({"time": [0]}).replace_schema_metadata(
+            {b"districtheatingsim.results": json.dumps(layout).encode()}
+        )
+        pq.write_table(table, path)
+        with pytest.raises(ValueError, match="schema version"):
+            read_results_layout(path)
+
+    def test_foreign_parquet_rejected(self, tmp_path):
+        path = str(tmp_path / "r.parquet")
+        pq.write_table(pa.table({"x": [1.0]}), path)
+        with pytest.raises(ValueError, match="not a DistrictHeatingSim results store"):
+            read_results_layout(path)
+
+
+class TestLoadResults:
+    def test_prefers_parquet_unless_csv_is_newer(self, tmp_path, results):
+        time_steps, heat, power, pumps, _ = results
+        csv_path = str(tmp_path / "Lastgang.csv")
+        save_results_csv(time_steps, heat, power, pumps, csv_path)
+        parquet_path = results_parquet_path(csv_path)
+        save_results_parquet(parquet_path, time_steps, heat * 2, power, pumps)
+
+        np.testing.assert_allclose(load_results(csv_path)[1], heat * 2)
+
+        st = os.stat(parquet_path)
+        os.utime(csv_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+        np.testing.assert_allclose(load_results(csv_path)[1], heat)
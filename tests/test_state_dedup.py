@@ -0,0 +1,126 @@
+"""
+Unit tests for the load-state deduplication of the time series (``state_dedup.py``).
+"""
+
+import numpy as np
+import pytest
+
+from districtheatingsim.net_simulation_pandapipes.pp_net_time_series_simulation import (
+    thermohydraulic_time_series_net,
+)
+from districtheatingsim.net_simulation_pandapipes.state_dedup import (
+    StateDedupReport,
+    StateDedupSettings,
+    max_result_deviation,
+    run_time_series_deduplicated,
+    state_signatures,
+)
+
+
+class TestStateSignatures:
+    def test_groups_in_time_order(self):
+        qext = np.array([[3.0, 1.0], [1.0, 1.0], [3.0, 1.0], [1.0, 1.0], [2.0, 0.0]])
+        representatives, group = state_signatures([(qext, 0.0)])
+        np.testing.assert_array_equal(representatives, [0, 1, 4])
+        np.testing.assert_array_equal(group, [0, 1, 0, 1, 2])
+
+    def test_quantization_merges_close_states(self):
+        qext = np.array([[1000.0], [1100.0], [1600.0]])
+        supply = np.array([80.0, 80.1, 80.0])
+        assert len(state_signatures([(qext, 0.0), (supply, 0.0)])[0]) == 3
+        representatives, group = state_signatures([(qext, 1000.0), (supply, 0.5)])
+        np.testing.assert_array_equal(representatives, [0, 2])
+        np.testing.assert_array_equal(group, [0, 0, 1])
+
+    def test_every_input_splits_groups(self):
+        qext = np.ones((4, 2))
+        supply = np.array([80.0, 80.0, 85.0, 85.0])
+        treturn = np.array([[50.0, 50.0], [55.0, 50.0], [50.0, 50.0], [50.0, 50.0]])
+        representatives, _ = state_signatures([(qext, 0.0), (supply, 0.5), (treturn, 0.5)])
+        np.testing.assert_array_equal(representatives, [0, 1, 2])
+
+
+class TestReport:
+    def test_hit_rate(self):
+        settings = StateDedupSettings()
+        assert StateDedupReport(n_steps=10, n_solved=4, settings=settings).hit_rate == pytest.approx(0.6)
+        assert StateDedupReport(n_steps=0, n_solved=0, settings=settings).hit_rate == 0.0
+
+    def test_max_result_deviation(self):
+        reference = {"res_junction.t_k": np.zeros((3, 2)), "res_junction.p_bar": np.ones((3, 2))}
+        results = {"res_junction.t_k": np.zeros((3, 2)), "res_junction.p_bar": np.ones((3, 2))}
+        results["res_junction.t_k"][2, 1] = -0.25
+        assert max_result_deviation(results, reference) == {"res_junction.t_k": 0.25, "res_junction.p_bar": 0.0}
+
+
+class TestValidation:
+    def test_time_steps_must_start_at_zero(self):
+        with pytest.raises(ValueError, match="range"):
+            run_time_series_deduplicated(None, range(2, 5), [], np.zeros((3, 1)), 80.0)
+
+    def test_input_length_must_match(self):
+        with pytest.raises(ValueError, match="expected 4"):
+            run_time_series_deduplicated(None, range(4), [], np.zeros((3, 1)), 80.0)
+
+    def test_not_combinable_with_chunks(self):
+        with pytest.raises(ValueError, match="cannot be combined"):
+            thermohydraulic_time_series_net(None, chunk_size=4, state_dedup=StateDedupSettings())
+
+
+@pytest.mark.slow
+class TestDeduplicatedRun:
+    # Three load states, repeated: 0 1 2 0 1 2 0 1 2
+    N_STEPS = 9
+
+    @classmethod
+    def _prepared_net(cls, solved_two_consumer_net):
+        from districtheatingsim.net_simulation_pandapipes import pp_net_time_series_simulation as ts
+
+        pattern = np.array([[450e3, 150e3], [300e3, 180e3], [200e3, 120e3]])
+        qext = np.tile(pattern, (cls.N_STEPS // 3, 1)).T
+        steps = range(cls.N_STEPS)
+
+        net = solved_two_consumer_net()
+        controller = ts.install_heat_consumer_profile_controller(
+            net, qext, steps, 0, cls.N_STEPS, np.array([55.0, 60.0])
+        )
+        ts.update_heat_generator_supply_temperature_controller(net, np.full(cls.N_STEPS, 85.0), steps, 0, cls.N_STEPS)
+        return net, controller, ts.create_log_variables(net)
+
+    def test_matches_full_run(self, solved_two_consumer_net):
+        from pandapipes.timeseries import run_time_series
+        from pandapower.timeseries import OutputWriter
+
+        net, _, log_variables = self._prepared_net(solved_two_consumer_net)
+        ow = OutputWriter(net, range(self.N_STEPS), output_path=None, log_variables=log_variables)
+        run_time_series.run_timeseries(net, range(self.N_STEPS), mode="bidirectional", iter=100, alpha=0.5)
+        full = ow.np_results
+
+        net, controller, log_variables = self._prepared_net(solved_two_consumer_net)
+        results, report = run_time_series_deduplicated(
+            net,
+            range(self.N_STEPS),
+            log_variables,
+            controller.qext_w,
+            85.0,
+            return_temperature=controller.treturn_k,
+            settings=StateDedupSettings(qext_step_w=0.0, temperature_step_k=0.0),
+            mode="bidirectional",
+            iter=100,
+            alpha=0.5,
+        )
+
+        assert (report.n_steps, report.n_solved) == (9, 3)
+        assert report.hit_rate == pytest.approx(2 / 3)
+        assert results.keys() == full.keys()
+        for key, expected in full.items():
+            assert results[key].shape == expected.shape
+            np.testing.assert_array_equal(results[key][:3], expected[:3])  # representatives = first occurrences
+            np.testing.assert_array_equal(results[key][3:6], results[key][:3])
+        deviation = max_result_deviation(results, full)
+        assert deviation.keys() == full.keys()
+        # Temperatures and flows depend on the load state only; pressures also on the pump set point
+        # the bad-point controller carried over from the previous step.
+        assert deviation["res_junction.t_k"] < 1e-6
+        assert deviation["res_heat_consumer.vdot_m3_per_s"] < 1e-6
+        assert max(deviation.values()) < 0.1
@@ -0,0 +1,182 @@
+"""
+Unit tests for the representative-hour surrogate time series (``surrogate_time_series.py``).
+"""
+
+import numpy as np
+import pytest
+
+from districtheatingsim.net_simulation_pandapipes.surrogate_time_series import (
+    SurrogateReport,
+    SurrogateSettings,
+    fit_surfaces,
+    run_time_series_surrogate,
+    select_representative_steps,
+    surrogate_report_path,
+)
+
+
+def _load_profiles(n_steps=200, seed=3):
+    rng = np.random.default_rng(seed)
+    # Load floor of 25 %: near zero load the return temperature collapses, which no smooth surface follows.
+    season = 0.25 + 0.375 * (1.0 + np.cos(np.linspace(0, 2 * np.pi, n_steps)))
+    qext = np.column_stack([4e5 * season, 1.5e5 * season]) * rng.uniform(0.8, 1.2, (n_steps, 2))
+    supply = 70.0 + 15.0 * season
+    return qext, supply
+
+
+class TestRepresentativeSteps:
+    def test_includes_extremes_and_is_sorted(self):
+        qext, supply = _load_profiles()
+        steps = select_representative_steps(qext, supply, 10)
+        total = qext.sum(axis=1)
+        assert np.argmax(total) in steps and np.argmin(total) in steps
+        assert np.all(np.diff(steps) > 0)
+        assert 2 < len(steps) <= 12
+
+    def test_deterministic_per_seed(self):
+        qext, supply = _load_profiles()
+        np.testing.assert_array_equal(
+            select_representative_steps(qext, supply, 10, seed=1), select_representative_steps(qext, supply, 10, seed=1)
+        )
+
+    def test_all_steps_when_k_covers_range(self):
+        qext, supply = _load_profiles(n_steps=5)
+        np.testing.assert_array_equal(select_representative_steps(qext, supply, 5), np.arange(5))
+
+
+class TestFitSurfaces:
+    def test_reproduces_quadratic_responses(self):
+        qext, supply = _load_profiles()
+        total = qext.sum(axis=1)
+        exact = {
+            "res_circ_pump_pressure.mdot_from_kg_per_s": (total / (4.18e3 * (supply - 50.0)))[:, None],
+            "res_junction.t_k": np.column_stack([supply + 273.15, 1e-5 * total + 0.1 * supply]),
+            "res_heat_consumer.vdot_m3_per_s": 1e-9 * qext**2 + 1e-8 * qext,
+            "heat_consumer.qext_w": qext,
+        }
+        # A quadratic target is reproduced exactly once there are enough training steps.
+        quadratic = {key: exact[key] for key in ("res_junction.t_k", "res_heat_consumer.vdot_m3_per_s")}
+        train = select_representative_steps(qext, supply, 20)
+        results = fit_surfaces(train, {key: values[train] for key, values in quadratic.items()}, qext, supply)
+        for key, expected in quadratic.items():
+            np.testing.assert_allclose(results[key], expected, rtol=1e-6, atol=1e-9, err_msg=key)
+
+        # Smooth non-polynomial responses are approximated; the demand input is passed through.
+        results = fit_surfaces(train, {key: values[train] for key, values in exact.items()}, qext, supply)
+        mass_flow = exact["res_circ_pump_pressure.mdot_from_kg_per_s"]
+        assert np.max(np.abs(results["res_circ_pump_pressure.mdot_from_kg_per_s"] - mass_flow)) < 0.05 * mass_flow.max()
+        np.testing.assert_array_equal(results["heat_consumer.qext_w"], qext)
+
+    def test_static_supply_temperature(self):
+        qext, _ = _load_profiles()
+        supply = np.full(len(qext), 80.0)
+        target = {"res_junction.p_bar": (3.0 + 1e-12 * qext.sum(axis=1) ** 2)[:, None]}
+        train = np.arange(0, len(qext), 10)
+        results = fit_surfaces(train, {"res_junction.p_bar": target["res_junction.p_bar"][train]}, qext, supply)
+        np.testing.assert_allclose(results["res_junction.p_bar"], target["res_junction.p_bar"], rtol=1e-9)
+
+    def test_few_steps_fit_a_plane(self):
+        qext, supply = _load_profiles()
+        plane = (2.0 + 1e-6 * qext.sum(axis=1) - 0.01 * supply)[:, None]
+        curved = plane + (1e-12 * qext.sum(axis=1) ** 2)[:, None]
+        train = select_representative_steps(qext, supply, 6)
+        assert len(train) < 12
+        train_results = {"res_junction.p_bar": plane[train], "res_junction.t_k": curved[train]}
+        results = fit_surfaces(train, train_results, qext, supply)
+        np.testing.assert_allclose(results["res_junction.p_bar"], plane, rtol=1e-9)
+        assert not np.allclose(results["res_junction.t_k"], curved, rtol=1e-6)
+
+
+class TestValidation:
+    def test_time_steps_must_start_at_zero(self):
+        with pytest.raises(ValueError, match="range"):
+            run_time_series_surrogate(None, range(2, 5), [], np.zeros((3, 1)), 80.0)
+
+    def test_input_length_must_match(self):
+        with pytest.raises(ValueError, match="expected 4"):
+            run_time_series_surrogate(None, range(4), [], np.zeros((3, 1)), 80.0)
+
+    def test_needs_at_least_one_state(self):
+        with pytest.raises(ValueError, match="n_states"):
+            run_time_series_surrogate(None, range(3), [], np.zeros((3, 1)), 80.0, SurrogateSettings(n_states=0))
+
+
+class TestReportFile:
+    def test_save_and_load_next_to_results(self, tmp_path):
+        report = SurrogateReport(
+            n_steps=100,
+            representative_steps=np.array([0, 40, 99]),
+            validation_steps=np.array([7, 61]),
+            solve_seconds=1.5,
+            validation_error={"res_junction.t_k": 0.25},
+            validation_rmse={"res_junction.t_k": 0.1},
+        )
+        path = surrogate_report_path(str(tmp_path / "Lastgang.csv"))
+        assert path == str(tmp_path / "Lastgang_surrogate.json")
+
+        report.save(path)
+        loaded = SurrogateReport.load(path)
+        np.testing.assert_array_equal(loaded.representative_steps, report.representative_steps)
+        np.testing.assert_array_equal(loaded.validation_steps, report.validation_steps)
+        assert loaded.validation_error == report.validation_error
+        assert loaded.validation_rmse == report.validation_rmse
+        assert (loaded.n_steps, loaded.n_solved, loaded.solve_seconds) == (100, 5, 1.5)
+
+
+@pytest.mark.slow
+class TestSurrogateRun:
+    N_STEPS = 40
+
+    @classmethod
+    def _prepared_net(cls, solved_two_consumer_net):
+        from districtheatingsim.net_simulation_pandapipes import pp_net_time_series_simulation as ts
+        from districtheatingsim.net_simulation_pandapipes.surrogate_time_series import PIPE_LOG_VARIABLES
+
+        qext, supply = _load_profiles(cls.N_STEPS)
+        steps = range(cls.N_STEPS)
+        net = solved_two_consumer_net()
+        controller = ts.install_heat_consumer_profile_controller(
+            net, qext.T, steps, 0, cls.N_STEPS, np.array([55.0, 60.0])
+        )
+        ts.update_heat_generator_supply_temperature_controller(net, supply, steps, 0, cls.N_STEPS)
+        return net, controller, supply, ts.create_log_variables(net) + PIPE_LOG_VARIABLES
+
+    def test_reconstructs_full_run(self, solved_two_consumer_net):
+        from pandapipes.timeseries import run_time_series
+        from pandapower.timeseries import OutputWriter
+
+        from districtheatingsim.net_simulation_pandapipes.pp_net_time_series_simulation import calculate_results
+
+        net, _, _, log_variables = self._prepared_net(solved_two_consumer_net)
+        ow = OutputWriter(net, range(self.N_STEPS), output_path=None, log_variables=log_variables)
+        run_time_series.run_timeseries(net, range(self.N_STEPS), mode="bidirectional", iter=100, alpha=0.5)
+        full = ow.np_results
+
+        net, controller, supply, log_variables = self._prepared_net(solved_two_consumer_net)
+        results, report = run_time_series_surrogate(
+            net,
+            range(self.N_STEPS),
+            log_variables,
+            controller.qext_w,
+            supply,
+            settings=SurrogateSettings(n_states=8, n_validation=4),
+            mode="bidirectional",
+            iter=100,
+            alpha=0.5,
+        )
+
+        assert results.keys() == full.keys()
+        assert all(results[key].shape == full[key].shape for key in full)
+        assert report.n_steps == self.N_STEPS
+        assert len(report.validation_steps) == 4
+        assert not np.isin(report.validation_steps, report.representative_steps).any()
+        assert report.validation_error.keys() == full.keys()
+        assert report.validation_error["heat_consumer.qext_w"] == 0.0
+
+        pump = calculate_results(net, results)["Heizentrale Haupteinspeisung"][0]
+        reference = calculate_results(net, full)["Heizentrale Haupteinspeisung"][0]
+        # The surfaces see the total demand only, not its split between the consumers.
+        for name in ("mass_flow", "qext_kW"):
+            np.testing.assert_allclose(pump[name], reference[name], atol=0.05 * reference[name].max(), err_msg=name)
+        np.testing.assert_allclose(pump["return_temp"], reference["return_temp"], atol=1.0)
+        assert pump["qext_kW"].sum() == pytest.approx(reference["qext_kW"].sum(), rel=0.01)
@@ -0,0 +1,99 @@
+"""
+Unit tests for the streaming result export (``utilities/table_export.py``).
+"""
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from districtheatingsim.net_simulation_pandapipes.pp_net_time_series_simulation import (
+    import_results_csv,
+    save_results_csv,
+)
+from districtheatingsim.utilities.table_export import infer_export_format, open_csv, write_columns
+
+
+def _columns(n=1416):
+    rng = np.random.default_rng(0)
+    return {
+        "Zeit": np.datetime64("2024-01-01T00", "h") + np.arange(n).astype("timedelta64[h]"),
+        "Wärme_kW": rng.random(n) * 100.0,
+        "Anzahl": np.arange(n),
+    }
+
+
+class TestWriteColumns:
+    def test_csv_is_byte_identical_to_dataframe_export(self, tmp_path):
+        columns = _columns()
+        expected, streamed = tmp_path / "expected.csv", tmp_path / "streamed.csv"
+        pd.DataFrame(columns).to_csv(
+            expected, sep=";", index=False, encoding="utf-8-sig", date_format="%Y-%m-%d %H:%M:%S"
+        )
+        write_columns(columns, str(streamed), chunk_rows=500, date_format="%Y-%m-%d %H:%M:%S")
+        assert streamed.read_bytes() == expected.read_bytes()
+
+    @pytest.mark.parametrize("suffix", [".csv.gz", ".csv.zst"])
+    def test_compressed_round_trip(self, tmp_path, suffix):
+        columns = _columns()
+        path = tmp_path / f"results{suffix}"
+        write_columns(columns, str(path), chunk_rows=500)
+        with open_csv(str(path)) as f:
+            data = pd.read_csv(f, sep=";")
+        assert list(data.columns) == list(columns)
+        np.testing.assert_allclose(data["Wärme_kW"], columns["Wärme_kW"])
+
+    def test_parquet_one_row_group_per_chunk(self, tmp_path):
+        columns = _columns()
+        path = tmp_path / "results.parquet"
+        write_columns(columns, str(path), chunk_rows=500)
+        parquet = pq.ParquetFile(path)
+        assert parquet.metadata.num_row_groups == 3
+        table = parquet.read()
+        assert table.num_rows == 1416
+        np.testing.assert_array_equal(table.column("Anzahl").to_numpy(), columns["Anzahl"])
+
+    def test_empty_columns_still_write_header(self, tmp_path):
+        path = tmp_path / "empty.csv"
+        write_columns({"a": np.array([]), "b": np.array([])}, str(path))
+        assert path.read_text(encoding="utf-8-sig").strip() == "a;b"
+
+    def test_invalid_input_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="differ in length"):
+            write_columns({"a": np.zeros(3), "b": np.zeros(4)}, str(tmp_path / "x.csv"))
+        with pytest.raises(ValueError, match="chunk_rows"):
+            write_columns({"a": np.zeros(3)}, str(tmp_path / "x.csv"), chunk_rows=0)
+        with pytest.raises(ValueError, match="compression"):
+            write_columns({"a": np.zeros(3)}, str(tmp_path / "x.csv"), compression="bz2")
+
+    def test_format_inference(self):
+        assert infer_export_format("a.csv") == ("csv", None)
+        assert infer_export_format("a.csv.gz") == ("csv", "gzip")
+        assert infer_export_format("a.CSV.ZST") == ("csv", "zstd")
+        assert infer_export_format("a.parquet") == ("parquet", None)
+        assert infer_export_format("a.csv", compression="zstd") == ("csv", "zstd")
+
+
+class TestSaveResultsCsv:
+    @pytest.mark.parametrize("name", ["results.csv", "results.csv.zst"])
+    def test_round_trip(self, tmp_path, name):
+        n = 48
+        time_steps = np.datetime64("2024-01-01T00", "s") + np.arange(n).astype("timedelta64[h]")
+        heat, power = np.linspace(100.0, 200.0, n), np.linspace(5.0, 10.0, n)
+        pump = {
+            key: np.full(n, value)
+            for value, key in enumerate(
+                ("qext_kW", "mass_flow", "deltap", "flow_temp", "return_temp", "flow_pressure", "return_pressure"), 1
+            )
+        }
+        pump_results = {"Heizentrale Haupteinspeisung": {0: pump}}
+
+        path = str(tmp_path / name)
+        save_results_csv(time_steps, heat, power, pump_results, path, chunk_rows=10)
+        loaded_time, loaded_heat, loaded_power, loaded_pumps = import_results_csv(path)
+
+        np.testing.assert_array_equal(loaded_time.astype("datetime64[s]"), time_steps)
+        np.testing.assert_allclose(loaded_heat, heat)
+        np.testing.assert_allclose(loaded_power, power)
+        for key, values in pump.items():
+            np.testing.assert_allclose(loaded_pumps["Heizentrale Haupteinspeisung"][0][key], values)
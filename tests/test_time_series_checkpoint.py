@@ -0,0 +1,184 @@
+"""
+Unit tests for checkpoint and resume of time series runs (``time_series_checkpoint.py``).
+"""
+
+import json
+import os
+
+import numpy as np
+import pandapipes as pp
+import pytest
+from pandapower.control.basic_controller import Controller
+
+from districtheatingsim.net_simulation_pandapipes.time_series_checkpoint import (
+    CHECKPOINT_VERSION,
+    checkpoint_key,
+    checkpoint_path,
+    read_checkpoint,
+    remove_checkpoint,
+    run_time_series_checkpointed,
+)
+
+
+def _net():
+    net = pp.create_empty_network(fluid="water")
+    j = pp.create_junctions(net, 3, pn_bar=1.0, tfluid_k=350.0)
+    pp.create_pipe_from_parameters(net, j[0], j[1], length_km=0.1, diameter_m=0.1)
+    pp.create_pipe_from_parameters(net, j[1], j[2], length_km=0.2, diameter_m=0.08)
+    return net
+
+
+class TestCheckpointFiles:
+    def test_checkpoint_path(self):
+        assert checkpoint_path("Lastgang/Lastgang.csv") == "Lastgang/Lastgang_checkpoint"
+
+    def test_key_depends_on_inputs(self):
+        def key_net():
+            net = _net()
+            net.pipe["std_type"] = "ISOPLUS_DRE100_2x"
+            pp.create_heat_consumer(net, 1, 2, qext_w=50e3, treturn_k=328.15)
+            return net
+
+        profile, mass_flow = np.linspace(0.0, 1.0, 8), np.full((8, 1), 2.0)
+
+        def key(net, profile=profile, mass_flow=mass_flow, mode="bidirectional"):
+            return checkpoint_key(
+                net, profile=profile, producer_mass_flow=mass_flow, pipeflow={"mode": mode, "iter": 100}
+            )
+
+        net = key_net()
+        reference = key(net)
+        assert reference == key(key_net())
+        assert reference != key(net, profile=np.linspace(0.0, 1.0, 7))
+        assert reference != key(net, mass_flow=np.full((8, 1), 2.5))
+        assert reference != key(net, mode="sequential")
+
+        net.pipe.loc[0, "std_type"] = "ISOPLUS_DRE100_1x"
+        assert reference != key(net)
+        net = key_net()
+        net.heat_consumer.loc[0, "treturn_k"] = 323.15
+        assert reference != key(net)
+        net = key_net()
+        net.pipe.loc[0, "inner_diameter_mm"] = 125.0
+        assert reference != key(net)
+
+    def test_read_and_remove(self, tmp_path):
+        directory = str(tmp_path / "run_checkpoint")
+        assert read_checkpoint(directory) is None
+        os.makedirs(directory)
+        with open(os.path.join(directory, "checkpoint.json"), "w", encoding="utf-8") as f:
+            json.dump({"version": CHECKPOINT_VERSION + 1}, f)
+        assert read_checkpoint(directory) is None  # other layout version
+
+        for name in ("segment_000000_000003.npz", "state_000003.pkl", "notes.txt"):
+            open(os.path.join(directory, name), "wb").close()
+        remove_checkpoint(directory)
+        assert os.listdir(directory) == ["notes.txt"]
+        os.remove(os.path.join(directory, "notes.txt"))
+        remove_checkpoint(directory)
+        assert not os.path.exists(directory)
+
+    def test_invalid_segment_length(self, tmp_path):
+        with pytest.raises(ValueError, match="every"):
+            run_time_series_checkpointed(_net(), range(4), [], str(tmp_path), every=0)
+
+
+class _Crash(Controller):
+    """Raises at ``crash_at`` while armed (a class flag, so a pickled copy is disarmed with it)."""
+
+    armed = False
+
+    def __init__(self, net, crash_at: int):
+        super().__init__(net, order=-5, level=-1, initial_run=False)
+        self.crash_at = crash_at
+
+    def time_step(self, net, time_step):
+        if _Crash.armed and time_step == self.crash_at:
+            raise RuntimeError("simulated crash")
+        return time_step
+
+    def is_converged(self, net):
+        return True
+
+
+@pytest.mark.slow
+class TestCheckpointedRun:
+    N_STEPS = 8
+
+    @classmethod
+    def _prepared_net(cls, solved_two_consumer_net):
+        from districtheatingsim.net_simulation_pandapipes import pp_net_time_series_simulation as ts
+        from districtheatingsim.net_simulation_pandapipes.adaptive_pipeflow import AdaptivePipeflow
+
+        net = solved_two_consumer_net()
+        steps = range(cls.N_STEPS)
+        rng = np.random.default_rng(3)
+        qext = np.column_stack([rng.uniform(50e3, 500e3, cls.N_STEPS), rng.uniform(20e3, 200e3, cls.N_STEPS)])
+        ts.install_heat_consumer_profile_controller(net, qext.T, steps, 0, cls.N_STEPS, np.array([55.0, 60.0]))
+        ts.update_heat_generator_supply_temperature_controller(
+            net, np.linspace(85.0, 70.0, cls.N_STEPS), steps, 0, cls.N_STEPS
+        )
+        _Crash(net, crash_at=5)
+        solver = AdaptivePipeflow()
+        solver.attach(net)
+        return net, solver, ts.create_log_variables(net)
+
+    def test_resumed_run_matches_uninterrupted_run(self, solved_two_consumer_net, tmp_path):
+        from pandapipes.timeseries import run_time_series
+        from pandapower.timeseries import OutputWriter
+
+        from districtheatingsim.net_simulation_pandapipes.time_series_telemetry import TelemetryRecorder
+
+        run_kwargs = {"mode": "bidirectional", "iter": 100, "alpha": 0.5}
+        net, solver, log_variables = self._prepared_net(solved_two_consumer_net)
+        ow = OutputWriter(net, range(self.N_STEPS), output_path=None, log_variables=log_variables)
+        run_time_series.run_timeseries(net, range(self.N_STEPS), run=solver, **run_kwargs)
+        reference = ow.np_results
+
+        directory = str(tmp_path / "checkpoint")
+        net, solver, log_variables = self._prepared_net(solved_two_consumer_net)
+        recorder = TelemetryRecorder()
+        recorder.attach(net)
+        _Crash.armed = True
+        try:
+            with pytest.raises(RuntimeError, match="simulated crash"):
+                run_time_series_checkpointed(
+                    net, range(self.N_STEPS), log_variables, directory, every=3, solver=solver, recorder=recorder,
+                    **run_kwargs,
+                )  # fmt: skip
+        finally:
+            _Crash.armed = False
+        assert read_checkpoint(directory)["done"] == 3
+
+        # A new session: fresh network and solver, state comes from the checkpoint
+        net, solver, log_variables = self._prepared_net(solved_two_consumer_net)
+        recorder = TelemetryRecorder()
+        recorder.attach(net)
+        results, net, solver, report = run_time_series_checkpointed(
+            net, range(self.N_STEPS), log_variables, directory, every=3, solver=solver, recorder=recorder, **run_kwargs
+        )
+        recorder.detach(net)
+
+        assert report.resumed_from == 3 and report.checkpoints == 2
+        assert results.keys() == reference.keys()
+        for key, expected in reference.items():
+            np.testing.assert_array_equal(results[key], expected, err_msg=key)
+        np.testing.assert_array_equal(recorder.report().time_steps, np.arange(3, self.N_STEPS))
+        assert any(ctrl.solver is solver for ctrl in net.controller["object"] if hasattr(ctrl, "solver"))
+        assert not os.path.exists(directory)
+
+    def test_checkpoint_of_other_inputs_is_discarded(self, solved_two_consumer_net, tmp_path):
+        directory = str(tmp_path / "checkpoint")
+        run_kwargs = {"mode": "bidirectional", "iter": 100, "alpha": 0.5}
+        net, solver, log_variables = self._prepared_net(solved_two_consumer_net)
+        run_time_series_checkpointed(
+            net, range(self.N_STEPS), log_variables, directory, every=4, key="a", keep=True, solver=solver, **run_kwargs
+        )
+        assert read_checkpoint(directory)["done"] == self.N_STEPS
+
+        net, solver, log_variables = self._prepared_net(solved_two_consumer_net)
+        _, _, _, report = run_time_series_checkpointed(
+            net, range(self.N_STEPS), log_variables, directory, every=4, key="b", keep=True, solver=solver, **run_kwargs
+        )
+        assert report.resumed_from is None and report.checkpoints == 2
+        assert read_checkpoint(directory)["key"] == "b"
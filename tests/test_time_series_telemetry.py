@@ -0,0 +1,151 @@
+"""
+Unit tests for the convergence and timing telemetry of time series runs (``time_series_telemetry.py``).
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from districtheatingsim.net_simulation_pandapipes.time_series_telemetry import (
+    TelemetryRecorder,
+    TimeSeriesTelemetry,
+    telemetry_path,
+)
+
+
+class _Net(dict):
+    """Stand-in for the ``net.get("_internal_results")`` lookup of the recording pipeflow."""
+
+
+def _solve(net, iterations=4, residual=1e-6):
+    net["_internal_results"] = {"iterations_bidirectional": iterations, "residual_norm_bidirectional": residual}
+
+
+def _fail(net):
+    raise RuntimeError("pipeflow did not converge")
+
+
+class TestTelemetryRecorder:
+    def test_records_steps_rounds_and_unconverged_controllers(self):
+        recorder = TelemetryRecorder()
+        run = recorder.wrap(_solve)
+        net = _Net()
+
+        recorder._start_step(3)
+        recorder._start_round()
+        run(net)
+        recorder._start_round()
+        recorder._end_step()
+
+        recorder._start_step(4)
+        for _ in range(3):
+            recorder._start_round()
+            recorder._step["adjusting"]["ctrl #1"] += 1
+            recorder._step["round"].add("ctrl #1")
+            run(net)
+        recorder._end_step()
+
+        telemetry = recorder.report()
+        np.testing.assert_array_equal(telemetry.time_steps, [3, 4])
+        np.testing.assert_array_equal(telemetry.solves, [1, 3])
+        np.testing.assert_array_equal(telemetry.iterations, [4, 12])
+        np.testing.assert_array_equal(telemetry.control_rounds, [2, 3])
+        np.testing.assert_array_equal(telemetry.converged, [True, False])
+        assert telemetry.adjusting == ["", "ctrl #1 ×3"]
+        assert telemetry.unconverged == ["", "ctrl #1"]
+        assert np.all(telemetry.seconds >= 0)
+
+    def test_step_that_raised_is_reported(self):
+        recorder = TelemetryRecorder()
+        run = recorder.wrap(_fail)
+        recorder._start_step(7)
+        recorder._start_round()
+        with pytest.raises(RuntimeError):
+            run(_Net())
+
+        telemetry = recorder.report()
+        np.testing.assert_array_equal(telemetry.time_steps, [7])
+        assert not telemetry.converged[0]
+        assert np.isnan(telemetry.residuals[0])
+        summary = telemetry.summary(offset=100)
+        assert summary["Nicht konvergierte Zeitschritte"] == 1
+        assert summary["Erste nicht konvergierte Zeitschritte"] == "107"
+
+    def test_empty(self):
+        telemetry = TelemetryRecorder().report()
+        assert telemetry.total_seconds == 0.0
+        assert telemetry.summary() == {}
+
+
+class TestTimeSeriesTelemetry:
+    def _telemetry(self):
+        return TimeSeriesTelemetry(
+            time_steps=np.array([0, 1, 2]),
+            seconds=np.array([0.1, 0.5, 0.2]),
+            solves=np.array([1, 4, 2]),
+            iterations=np.array([5, 40, 9]),
+            control_rounds=np.array([1, 10, 2]),
+            residuals=np.array([1e-7, 0.3, 1e-6]),
+            converged=np.array([True, False, True]),
+            adjusting=["", "BadPoint #2 ×9", "BadPoint #2 ×1"],
+            unconverged=["", "BadPoint #2", ""],
+        )
+
+    def test_summary(self):
+        summary = self._telemetry().summary(offset=10)
+        assert summary["Pipeflow-Aufrufe"] == 7
+        assert summary["Newton-Iterationen"] == 54
+        assert summary["max. Reglerschleifen je Zeitschritt"] == 10
+        assert summary["Langsamster Zeitschritt"] == "11 (0.50 s)"
+        np.testing.assert_array_equal(self._telemetry().slowest_steps(2), [1, 2])
+
+    @pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+    def test_save_round_trip(self, tmp_path, suffix):
+        path = tmp_path / f"telemetry{suffix}"
+        telemetry = self._telemetry()
+        telemetry.save(str(path))
+        if suffix == ".parquet":
+            table = pd.read_parquet(path)
+        else:
+            table = pd.read_csv(path, sep=";", keep_default_na=False)
+        assert list(table.columns) == list(telemetry.columns())
+        np.testing.assert_array_equal(table["iterations"], telemetry.iterations)
+        np.testing.assert_allclose(table["residual"], telemetry.residuals)
+        assert list(table["unconverged"]) == telemetry.unconverged
+
+    def test_telemetry_path(self):
+        assert telemetry_path("Lastgang/Lastgang.csv") == "Lastgang/Lastgang_telemetry.csv"
+
+
+@pytest.mark.slow
+class TestTelemetryTimeSeries:
+    N_STEPS = 4
+
+    def test_time_series_run(self, solved_two_consumer_net):
+        import pandapipes as pp
+        from pandapipes.timeseries import run_time_series
+
+        from districtheatingsim.net_simulation_pandapipes import pp_net_time_series_simulation as ts
+
+        net = solved_two_consumer_net()
+        steps = range(self.N_STEPS)
+        qext = np.column_stack([np.linspace(500e3, 50e3, self.N_STEPS), np.linspace(200e3, 20e3, self.N_STEPS)])
+        ts.install_heat_consumer_profile_controller(net, qext.T, steps, 0, self.N_STEPS, np.array([55.0, 60.0]))
+        ts.update_heat_generator_supply_temperature_controller(
+            net, np.linspace(85.0, 70.0, self.N_STEPS), steps, 0, self.N_STEPS
+        )
+        n_controllers = len(net.controller)
+
+        recorder = TelemetryRecorder()
+        recorder.attach(net)
+        assert len(net.controller) == n_controllers + 1
+        run_time_series.run_timeseries(net, steps, mode="bidirectional", iter=100, run=recorder.wrap(pp.pipeflow))
+        recorder.detach(net)
+
+        telemetry = recorder.report()
+        np.testing.assert_array_equal(telemetry.time_steps, np.arange(self.N_STEPS))
+        assert np.all(telemetry.solves >= 1) and np.all(telemetry.iterations > 0)
+        assert np.all(telemetry.control_rounds >= 1)
+        assert telemetry.converged.all()
+        assert len(net.controller) == n_controllers
+        assert not any("control_step" in vars(ctrl) for ctrl in net.controller["object"])